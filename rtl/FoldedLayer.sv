@@ -0,0 +1,189 @@
+`include "../include/width.svh"
+
+// Time-multiplexed Layer: PARALLELISM multipliers are reused over IN_N*OUT_N/PARALLELISM cycles
+// instead of instantiating IN_N*OUT_N of them.
+//
+// PARALLELISM must either divide IN_N (the lanes split the dot product of one neuron into
+// IN_N/PARALLELISM chunks) or be a multiple of IN_N that divides IN_N*OUT_N (PARALLELISM/IN_N
+// neurons are computed per cycle). Every step adds the products of one chunk to a local
+// accumulator per neuron; the last chunk goes through Clamper and ReLU into out_vec.
+//
+// Handshake: a computation starts on a clock edge that samples start high while the layer is
+// idle. in_vec, weights and biases must stay stable until done, which is high for the one
+// cycle after the last step; out_vec holds the result from then on until the next run
+// overwrites it. Keeping start high chains runs back-to-back.
+//
+// With ZERO_SKIP the multipliers are operand-isolated (PreActivation ZERO_GATING) and every
+// chunk whose products are all zero for the neurons of the group (a zero input, such as a
+// ReLU output of the previous layer, or a pruned weight in every lane) is skipped: a group takes
+// as many steps as it has chunks with a non-zero product, but at least one, which adds the bias.
+// A run then takes between GROUPS and IN_N*OUT_N/PARALLELISM cycles, depending on the data.
+module FoldedLayer #(
+  parameter int IN_N = `N,  // Input vector dimensionality
+  parameter int OUT_N = `N,  // Output vector dimensionality
+  parameter int DATA_WIDTH = `DATA_WIDTH,  // Data width
+  parameter int ACC_WIDTH = `ACC_WIDTH,  // Accumulator width
+  parameter int PARALLELISM = IN_N,  // Multipliers (MACs) in the array
+  parameter int ZERO_SKIP = 0  // Skip the chunks without a non-zero product
+) (
+  input  logic                                    clk,      // System clock
+  input  logic                                    rst_n,    // Asynchronous reset (active low)
+  input  logic                                    start,    // Start a computation when idle
+  input  logic signed [      IN_N*DATA_WIDTH-1:0] in_vec,   // Packed input vector (bus)
+  input  logic signed [OUT_N*IN_N*DATA_WIDTH-1:0] weights,  // Flattened weights
+  input  logic signed [     OUT_N*DATA_WIDTH-1:0] biases,   // Flattened biases
+  output logic                                    busy,     // A computation is in progress
+  output logic                                    done,     // out_vec was completed on the last edge
+  output logic signed [     OUT_N*DATA_WIDTH-1:0] out_vec   // Packed output vector (bus)
+);
+  localparam int LANES = PARALLELISM < IN_N ? PARALLELISM : IN_N;  // Products per neuron and step
+  localparam int GROUP = PARALLELISM / LANES;  // Neurons per step
+  localparam int CHUNKS = IN_N / LANES;  // Steps per neuron
+  localparam int GROUPS = OUT_N / GROUP;  // Neuron groups per run
+  localparam int CHUNK_W = CHUNKS > 1 ? $clog2(CHUNKS) : 1;
+  localparam int GROUP_W = GROUPS > 1 ? $clog2(GROUPS) : 1;
+
+  initial begin
+    if (IN_N % LANES != 0 || PARALLELISM % LANES != 0 || OUT_N % GROUP != 0) begin
+      $fatal(1, "PARALLELISM=%0d must divide IN_N=%0d or be a multiple of it dividing IN_N*OUT_N=%0d",
+             PARALLELISM, IN_N, IN_N * OUT_N);
+    end
+  end
+
+  logic [CHUNK_W-1:0] chunk;  // Chunk after the first step of the group
+  logic [GROUP_W-1:0] group;  // Group of neurons processed in this step
+  logic first;  // This step is the first of its group
+  logic [CHUNK_W-1:0] cur;  // Chunk of the inputs processed in this step
+  logic [CHUNK_W-1:0] next_chunk;  // Chunk of the next step of the group
+  logic [CHUNKS-1:0] live;  // Chunks with a non-zero product for the group
+  logic step;  // A step is executed on the next edge
+  logic last_chunk;
+  logic last_step;
+
+  // Without ZERO_SKIP every chunk is live and the group steps through all of them in order
+  always_comb begin
+    for (int c = 0; c < CHUNKS; c++) begin
+      live[c] = ZERO_SKIP == 0;
+      for (int k = 0; k < GROUP * LANES; k++) begin
+        if (in_vec[(c*LANES+k%LANES)*DATA_WIDTH+:DATA_WIDTH] != '0 &&
+            weights[((32'(group)*GROUP+k/LANES)*IN_N+c*LANES+k%LANES)*DATA_WIDTH+:DATA_WIDTH] != '0) begin
+          live[c] = 1'b1;
+        end
+      end
+    end
+
+    // The first step of a group takes its first live chunk (chunk 0 when none is)
+    cur = first ? '0 : chunk;
+    if (first) begin
+      for (int c = CHUNKS - 1; c >= 0; c--) begin
+        if (live[c]) cur = CHUNK_W'(c);
+      end
+    end
+
+    last_chunk = 1'b1;
+    next_chunk = cur;
+    for (int c = CHUNKS - 1; c >= 0; c--) begin
+      if (live[c] && c > 32'(cur)) begin
+        last_chunk = 1'b0;
+        next_chunk = CHUNK_W'(c);
+      end
+    end
+  end
+
+  assign step = busy || start;
+  assign last_step = last_chunk && group == GROUP_W'(GROUPS - 1);
+
+  // The inputs of this step
+  logic signed [LANES*DATA_WIDTH-1:0] x_chunk;
+  assign x_chunk = in_vec[cur*LANES*DATA_WIDTH+:LANES*DATA_WIDTH];
+
+  logic signed [ACC_WIDTH-1:0] acc[GROUP];  // Partial sums of the neurons in the group
+  logic signed [ACC_WIDTH-1:0] acc_next[GROUP];
+  logic signed [DATA_WIDTH-1:0] relu_out[GROUP];
+
+  genvar g;
+  generate
+    for (g = 0; g < GROUP; g++) begin : gen_macs
+      logic signed [ACC_WIDTH-1:0] partial;  // Chunk dot product, plus the bias on the first chunk
+      logic signed [DATA_WIDTH-1:0] clamped;
+      int neuron;
+
+      assign neuron = group * GROUP + g;
+
+      PreActivation #(
+        .N          (LANES),
+        .DATA_WIDTH (DATA_WIDTH),
+        .ACC_WIDTH  (ACC_WIDTH),
+        .ZERO_GATING(ZERO_SKIP)
+      ) u_mac (
+        .clk  (clk),
+        .rst_n(rst_n),
+        .en   (1'b1),
+        .int4 (1'b0),
+        .x    (x_chunk),
+        .w    (weights[(neuron*IN_N+cur*LANES)*DATA_WIDTH+:LANES*DATA_WIDTH]),
+        .b    (first ? biases[neuron*DATA_WIDTH+:DATA_WIDTH] : '0),
+        .pre  (partial)
+      );
+
+      assign acc_next[g] = first ? partial : acc[g] + partial;
+
+      Clamper #(
+        .DATA_WIDTH(DATA_WIDTH),
+        .ACC_WIDTH (ACC_WIDTH)
+      ) u_clamp (
+        .in (acc_next[g]),
+        .out(clamped)
+      );
+
+      ReLU #(
+        .DATA_WIDTH(DATA_WIDTH)
+      ) u_act (
+        .in (clamped),
+        .out(relu_out[g])
+      );
+
+      always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+          acc[g] <= '0;
+        end else if (step) begin
+          acc[g] <= acc_next[g];
+        end
+      end
+    end
+  endgenerate
+
+  // Write each neuron group once its last chunk is accumulated
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      out_vec <= '0;
+    end else if (step && last_chunk) begin
+      for (int k = 0; k < GROUP; k++) begin
+        out_vec[(group*GROUP+k)*DATA_WIDTH+:DATA_WIDTH] <= relu_out[k];
+      end
+    end
+  end
+
+  // Step counters and handshake
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      busy  <= 1'b0;
+      done  <= 1'b0;
+      chunk <= '0;
+      group <= '0;
+      first <= 1'b1;
+    end else begin
+      done <= step && last_step;
+      if (step) begin
+        busy  <= !last_step;
+        chunk <= next_chunk;
+        first <= last_chunk;
+        if (last_step) begin
+          group <= '0;
+        end else if (last_chunk) begin
+          group <= group + 1'b1;
+        end
+      end
+    end
+  end
+endmodule
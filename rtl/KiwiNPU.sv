@@ -13,25 +13,49 @@ module KiwiNPU #(
   parameter [NUM_LAYERS*8-1:0] LAYER_SIZES = `LAYER_SIZES,
 
   // Bit-width for each datum (we’ll multiply this by the layer sizes when slicing/packing).
-  parameter integer DATA_WIDTH = `DATA_WIDTH
+  parameter integer DATA_WIDTH = `DATA_WIDTH,
+
+  // Adder tree pipeline registers of every layer; each layer then takes PIPE_STAGES + 1 cycles.
+  parameter integer PIPE_STAGES = 0,
+
+  // Weight/bias banks packed side by side in weights_flat/biases_flat, bank 0 in the LSBs.
+  parameter integer BANKS = 1,
+
+  // Input vectors (lanes) computed per beat against the same weights, lane 0 in the LSBs of
+  // in_vec and out_vec; every layer has one Perceptron per lane and neuron.
+  parameter integer BATCH = 1
 ) (
   input wire clk,   // System clock
   input wire rst_n, // Asynchronous reset (active low)
 
-  // Flattened “in_vec”: layer0 has get_layer_size(0) elements, each DATA_WIDTH bits.
+  // Bank computing the input in in_vec. It travels down the pipeline with the data, so every
+  // inference uses one bank in all layers however the bank changes between inputs.
+  input wire [$clog2(BANKS > 1 ? BANKS : 2) - 1 : 0] bank,
+
+  // Valid/ready handshake of in_vec (AXI-Stream style): an input is accepted on an edge with
+  // both high. in_ready is low only while out_ready is low and every layer holds a result.
+  input  wire in_valid,
+  output wire in_ready,
+
+  // Flattened “in_vec”: layer0 has get_layer_size(0) elements per lane, each DATA_WIDTH bits.
   // Since get_layer_size(0) now returns a 32-bit integer, Verilator sees a 32-bit expression here.
-  input wire signed [get_layer_size(0)*DATA_WIDTH - 1 : 0] in_vec,
+  input wire signed [BATCH*get_layer_size(0)*DATA_WIDTH - 1 : 0] in_vec,
 
-  // Flat-packed weights for layers 1..(NUM_LAYERS-1):
+  // Flat-packed weights for layers 1..(NUM_LAYERS-1), per bank:
   //   total bits = ∑_{j=1..NUM_LAYERS-1} [ get_layer_size(j)*get_layer_size(j-1)*DATA_WIDTH ]
-  input wire signed [calc_weights_bits() - 1 : 0] weights_flat,
+  input wire signed [BANKS*calc_weights_bits() - 1 : 0] weights_flat,
 
-  // Flat-packed biases for layers 1..(NUM_LAYERS-1):
+  // Flat-packed biases for layers 1..(NUM_LAYERS-1), per bank:
   //   total bits = ∑_{j=1..NUM_LAYERS-1} [ get_layer_size(j)*DATA_WIDTH ]
-  input wire signed [calc_biases_bits() - 1 : 0] biases_flat,
+  input wire signed [BANKS*calc_biases_bits() - 1 : 0] biases_flat,
+
+  // Valid/ready handshake of out_vec: a result leaves on an edge with both high. Every layer
+  // passes its valid bits along its pipeline registers and stalls while the next layer does.
+  output wire out_valid,
+  input  wire out_ready,
 
-  // Final “out_vec”: layer(NUM_LAYERS-1) has get_layer_size(NUM_LAYERS-1) elements × DATA_WIDTH bits
-  output wire signed [get_layer_size(NUM_LAYERS-1)*DATA_WIDTH - 1 : 0] out_vec
+  // Final “out_vec”: layer(NUM_LAYERS-1) has get_layer_size(NUM_LAYERS-1) elements × DATA_WIDTH bits per lane
+  output wire signed [BATCH*get_layer_size(NUM_LAYERS-1)*DATA_WIDTH - 1 : 0] out_vec
 );
 
   function integer get_layer_size;
@@ -133,10 +157,11 @@ module KiwiNPU #(
   //   1) Call get_layer_size(), which now returns a 32-bit integer.
   //   2) Compute IN_WIDTH, OUT_WIDTH, WEIGHT_SZ, BIAS_SZ.
   //   3) Call weight_offset(j)/bias_offset(j) directly (pure functions).
-  //   4) Slice out exactly those bits from weights_flat and biases_flat.
-  //   5) Hook this layer’s “input” to in_vec (if j==1) or previous out.
+  //   4) Slice out exactly those bits from the bank of the layer input in weights_flat and
+  //      biases_flat; the bank follows the data through PIPE_STAGES + 1 registers per layer.
+  //   5) Hook this layer’s “input” and handshake to in_vec (if j==1) or previous out.
   //   6) Instantiate Layer (all overrides are 32-bit now).
-  //   7) If j==(NUM_LAYERS-1), drive top‐level out_vec.
+  //   7) If j==(NUM_LAYERS-1), drive top‐level out_vec and its handshake.
   //--------------------------------------------------------------------------
   genvar j;
   generate
@@ -147,8 +172,8 @@ module KiwiNPU #(
       localparam integer LSIZE_OUT = get_layer_size(j);
 
       // 2) Compute per-layer bit‐widths.
-      localparam integer IN_WIDTH = LSIZE_IN * DATA_WIDTH;
-      localparam integer OUT_WIDTH = LSIZE_OUT * DATA_WIDTH;
+      localparam integer IN_WIDTH = BATCH * LSIZE_IN * DATA_WIDTH;
+      localparam integer OUT_WIDTH = BATCH * LSIZE_OUT * DATA_WIDTH;
       localparam integer WEIGHT_SZ = LSIZE_IN * LSIZE_OUT * DATA_WIDTH;
       localparam integer BIAS_SZ = LSIZE_OUT * DATA_WIDTH;
 
@@ -156,21 +181,48 @@ module KiwiNPU #(
       localparam integer OFFSET_WEIGHTS = weight_offset(j);
       localparam integer OFFSET_BIAS = bias_offset(j);
 
-      // 4) Slice out exactly WEIGHT_SZ bits and BIAS_SZ bits.
+      // 4) Slice out exactly WEIGHT_SZ bits and BIAS_SZ bits of the bank of layer_in.
       wire signed [IN_WIDTH   - 1 : 0] layer_in;
       wire signed [OUT_WIDTH  - 1 : 0] layer_out;
+      wire                             layer_in_valid;
+      wire                             layer_in_ready;  // The layer advances on this edge
+      wire                             layer_out_valid;
+      wire                             layer_out_ready;
+      wire        [$bits(bank) - 1 : 0] layer_bank;
+      reg         [$bits(bank) - 1 : 0] bank_q     [PIPE_STAGES + 1];  // layer_bank along the layer
+
+      if (BANKS == 1) begin
+        assign layer_bank = '0;
+      end else if (j == 1) begin
+        assign layer_bank = bank;
+      end else begin
+        assign layer_bank = gen_layers[j-1].bank_q[PIPE_STAGES];
+      end
+
+      always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+          for (integer k = 0; k <= PIPE_STAGES; k = k + 1) bank_q[k] <= '0;
+        end else if (layer_in_ready) begin
+          bank_q[0] <= layer_bank;
+          for (integer k = 1; k <= PIPE_STAGES; k = k + 1) bank_q[k] <= bank_q[k-1];
+        end
+      end
 
       wire signed [ WEIGHT_SZ - 1 : 0] layer_weights;
-      assign layer_weights = weights_flat[OFFSET_WEIGHTS+:WEIGHT_SZ];
+      assign layer_weights = weights_flat[layer_bank*calc_weights_bits()+OFFSET_WEIGHTS+:WEIGHT_SZ];
 
       wire signed [BIAS_SZ   - 1 : 0] layer_biases;
-      assign layer_biases = biases_flat[OFFSET_BIAS+:BIAS_SZ];
+      assign layer_biases = biases_flat[layer_bank*calc_biases_bits()+OFFSET_BIAS+:BIAS_SZ];
 
-      // 5) Wire this layer’s “input”:
+      // 5) Wire this layer’s “input”; the previous layer stalls while this one does:
       if (j == 1) begin
-        assign layer_in = in_vec;
+        assign layer_in       = in_vec;
+        assign layer_in_valid = in_valid;
+        assign in_ready       = layer_in_ready;
       end else begin
-        assign layer_in = gen_layers[j-1].layer_out;
+        assign layer_in                        = gen_layers[j-1].layer_out;
+        assign layer_in_valid                  = gen_layers[j-1].layer_out_valid;
+        assign gen_layers[j-1].layer_out_ready = layer_in_ready;
       end
 
       // 6) Instantiate Layer; all parameters (IN_N, OUT_N) are now 32-bit integers,
@@ -179,19 +231,27 @@ module KiwiNPU #(
         .IN_N      (LSIZE_IN),
         .OUT_N     (LSIZE_OUT),
         .DATA_WIDTH(DATA_WIDTH),
-        .ACC_WIDTH (DATA_WIDTH * 2 + $clog2(LSIZE_IN))
+        .ACC_WIDTH  (DATA_WIDTH * 2 + $clog2(LSIZE_IN)),
+        .PIPE_STAGES(PIPE_STAGES),
+        .BATCH      (BATCH)
       ) u_layer_inst (
-        .clk    (clk),
-        .rst_n  (rst_n),
-        .in_vec (layer_in),
-        .weights(layer_weights),
-        .biases (layer_biases),
-        .out_vec(layer_out)
+        .clk      (clk),
+        .rst_n    (rst_n),
+        .in_valid (layer_in_valid),
+        .in_ready (layer_in_ready),
+        .in_vec   (layer_in),
+        .weights  (layer_weights),
+        .biases   (layer_biases),
+        .out_valid(layer_out_valid),
+        .out_ready(layer_out_ready),
+        .out_vec  (layer_out)
       );
 
-      // 7) For the final layer, drive top‐level out_vec.
+      // 7) For the final layer, drive top‐level out_vec and its handshake.
       if (j == NUM_LAYERS - 1) begin
-        assign out_vec = layer_out;
+        assign out_vec         = layer_out;
+        assign out_valid       = layer_out_valid;
+        assign layer_out_ready = out_ready;
       end
 
     end
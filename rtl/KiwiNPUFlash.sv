@@ -0,0 +1,205 @@
+`include "../include/width.svh"
+
+// KiwiNPU with its weights and biases in an on-chip register file loaded from SPI flash.
+//
+// The flash image holds the weights_flat image at FLASH_BASE followed by the biases_flat image,
+// each little-endian (byte 0 holding bits [7:0]) and padded to whole 32-bit words; it is what
+// Network.flash_image and scripts/kiwinpu_import.py write. WeightLoader reads it through SPIMemIO
+// into one of two banks of the register file: into bank 0 after reset, and into the bank not
+// serving inferences (the shadow bank) on every load pulse, while the active bank keeps serving
+// back-to-back inferences. No input is accepted (in_ready stays low) until the load after reset
+// completes, and load pulses are ignored until then; loaded reports the last load and drops again
+// while a shadow bank is loaded, so it does not gate inferences once they have started. When
+// shadow_ready is high the shadow bank holds a whole image, and a swap pulse makes it the active
+// bank from the next accepted input on: the bank travels down the pipeline with every input, so
+// inferences in flight finish on the bank they started with and no cycle is lost. The previous
+// bank becomes the shadow bank and stays ready until the next load pulse. With QSPI the flash is
+// read with the quad I/O command (EBh) and DUMMY_CYCLES dummy clocks, otherwise with the
+// single-line read command (03h).
+module KiwiNPUFlash #(
+  parameter integer NUM_LAYERS = `NUM_LAYERS,  // Number of layers, the input vector included
+  parameter [NUM_LAYERS*8-1:0] LAYER_SIZES = `LAYER_SIZES,  // One byte per layer size, layer 0 first
+  parameter integer DATA_WIDTH = `DATA_WIDTH,  // Data width
+  parameter integer PIPE_STAGES = 0,  // Adder tree pipeline registers of every layer
+  parameter integer FLASH_BASE = 0,  // Flash address of the image (24 bits)
+  parameter bit QSPI = 1'b0,  // Read the flash over four lines
+  parameter integer DUMMY_CYCLES = 8  // Dummy clocks of a quad I/O read (0 to 15)
+) (
+  input  logic                                                     clk,           // System clock
+  input  logic                                                     rst_n,         // Asynchronous reset (active low)
+  input  logic                                                     load,          // Load the shadow bank after boot
+  output logic                                                     loaded,        // The last load is complete
+  input  logic                                                     swap,          // Swap the active and shadow banks
+  output logic                                                     shadow_ready,  // The shadow bank is loaded
+  input  logic                                                     in_valid,      // in_vec holds an input
+  output logic                                                     in_ready,      // The input is accepted on this edge
+  input  logic signed [           get_layer_size(0)*DATA_WIDTH-1:0] in_vec,        // Packed input vector
+  output logic                                                     out_valid,     // out_vec holds a result
+  input  logic                                                     out_ready,     // The consumer takes the result
+  output logic signed [get_layer_size(NUM_LAYERS-1)*DATA_WIDTH-1:0] out_vec,       // Packed output vector
+
+  output logic flash_csb,     // Flash chip select (active low)
+  output logic flash_clk,     // Flash clock
+  output logic flash_io0_oe,  // Flash I/O output enables
+  output logic flash_io1_oe,
+  output logic flash_io2_oe,
+  output logic flash_io3_oe,
+  output logic flash_io0_do,  // Flash I/O outputs
+  output logic flash_io1_do,
+  output logic flash_io2_do,
+  output logic flash_io3_do,
+  input  logic flash_io0_di,  // Flash I/O inputs
+  input  logic flash_io1_di,
+  input  logic flash_io2_di,
+  input  logic flash_io3_di
+);
+  function integer get_layer_size;
+    input integer idx;
+    begin
+      get_layer_size = {24'd0, LAYER_SIZES[(NUM_LAYERS-1-idx)*8+:8]};
+    end
+  endfunction
+
+  // Bits of weights_flat (weights) or biases_flat (!weights), as KiwiNPU sizes them
+  function integer image_bits;
+    input weights;
+    integer sum;
+    integer j;
+    begin
+      sum = 0;
+      for (j = 1; j < NUM_LAYERS; j = j + 1) begin
+        sum = sum + get_layer_size(j) * (weights ? get_layer_size(j - 1) : 1) * DATA_WIDTH;
+      end
+      image_bits = sum;
+    end
+  endfunction
+
+  localparam integer WEIGHT_BITS = image_bits(1'b1);
+  localparam integer BIAS_BITS = image_bits(1'b0);
+  localparam integer WEIGHT_WORDS = (WEIGHT_BITS + 31) / 32;
+  localparam integer BIAS_WORDS = (BIAS_BITS + 31) / 32;
+  localparam integer BANK_BITS = (WEIGHT_WORDS + BIAS_WORDS) * 32;  // Register file bits per bank
+
+  logic        mem_valid;
+  logic        mem_ready;
+  logic [23:0] mem_addr;
+  logic [31:0] mem_rdata;
+  logic [ 3:0] cfgreg_we;
+  logic [31:0] cfgreg_di;
+  logic        configured;  // The flash read mode was written after reset
+  logic        active;  // Bank serving inferences
+  logic        shadow_loading;  // The shadow bank is being loaded
+  logic        booted;  // The load after reset completed
+  logic        serving;  // Inputs and load pulses are accepted
+  logic        shadow_load;  // A load pulse that starts loading the shadow bank
+  logic        npu_in_ready;  // The KiwiNPU accepts an input
+
+  logic [2*BANK_BITS-1:0] image;  // Both banks, bank 0 in the LSBs
+
+  // SPIMemIO comes out of reset in single-line mode; switch it to quad I/O once
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      configured <= 1'b0;
+    end else begin
+      configured <= 1'b1;
+    end
+  end
+
+  // Sticky, unlike loaded, which drops while the shadow bank is loaded
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      booted <= 1'b0;
+    end else if (loaded) begin
+      booted <= 1'b1;
+    end
+  end
+
+  assign serving     = booted || loaded;
+  assign in_ready    = serving && npu_in_ready;
+  // A load during the load after reset would retarget it to bank 1 and leave bank 0 half written
+  assign shadow_load = load && serving;
+
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      active         <= 1'b0;
+      shadow_loading <= 1'b0;
+      shadow_ready   <= 1'b0;
+    end else if (shadow_load) begin
+      shadow_loading <= 1'b1;
+      shadow_ready   <= 1'b0;
+    end else if (shadow_loading) begin
+      if (loaded) begin
+        shadow_loading <= 1'b0;
+        shadow_ready   <= 1'b1;
+      end
+    end else if (swap && shadow_ready) begin
+      active <= !active;
+    end
+  end
+
+  assign cfgreg_we = QSPI && !configured ? 4'b0100 : 4'b0000;
+  assign cfgreg_di = {9'b0, 1'b0, QSPI, 1'b0, 4'(DUMMY_CYCLES), 16'b0};  // ddr, qspi, cont, dummy
+
+  SPIMemIO flash (
+    .clk         (clk),
+    .resetn      (rst_n),
+    .valid       (mem_valid),
+    .ready       (mem_ready),
+    .addr        (mem_addr),
+    .rdata       (mem_rdata),
+    .flash_csb   (flash_csb),
+    .flash_clk   (flash_clk),
+    .flash_io0_oe(flash_io0_oe),
+    .flash_io1_oe(flash_io1_oe),
+    .flash_io2_oe(flash_io2_oe),
+    .flash_io3_oe(flash_io3_oe),
+    .flash_io0_do(flash_io0_do),
+    .flash_io1_do(flash_io1_do),
+    .flash_io2_do(flash_io2_do),
+    .flash_io3_do(flash_io3_do),
+    .flash_io0_di(flash_io0_di),
+    .flash_io1_di(flash_io1_di),
+    .flash_io2_di(flash_io2_di),
+    .flash_io3_di(flash_io3_di),
+    .cfgreg_we   (cfgreg_we),
+    .cfgreg_di   (cfgreg_di),
+    .cfgreg_do   ()
+  );
+
+  WeightLoader #(
+    .WORDS     (WEIGHT_WORDS + BIAS_WORDS),
+    .FLASH_BASE(FLASH_BASE),
+    .BANKS     (2)
+  ) loader (
+    .clk      (clk),
+    .rst_n    (rst_n),
+    .load     (shadow_load),
+    .bank     (!active),
+    .mem_valid(mem_valid),
+    .mem_ready(mem_ready),
+    .mem_addr (mem_addr),
+    .mem_rdata(mem_rdata),
+    .loaded   (loaded),
+    .image    (image)
+  );
+
+  KiwiNPU #(
+    .NUM_LAYERS (NUM_LAYERS),
+    .LAYER_SIZES(LAYER_SIZES),
+    .DATA_WIDTH (DATA_WIDTH),
+    .PIPE_STAGES(PIPE_STAGES),
+    .BANKS      (2)
+  ) npu (
+    .clk         (clk),
+    .rst_n       (rst_n),
+    .bank        (active),
+    .in_valid    (in_valid && serving),
+    .in_ready    (npu_in_ready),
+    .in_vec      (in_vec),
+    .weights_flat({image[BANK_BITS+:WEIGHT_BITS], image[WEIGHT_BITS-1:0]}),
+    .biases_flat ({image[BANK_BITS+WEIGHT_WORDS*32+:BIAS_BITS], image[WEIGHT_WORDS*32+:BIAS_BITS]}),
+    .out_valid   (out_valid),
+    .out_ready   (out_ready),
+    .out_vec     (out_vec)
+  );
+endmodule
@@ -1,34 +1,70 @@
 `include "../include/width.svh"
 
+// OUT_N Perceptrons sharing in_vec, with an AXI-Stream style valid/ready handshake.
+//
+// With BATCH > 1 every beat carries BATCH input vectors (lanes, lane 0 in the LSBs of in_vec and
+// out_vec) computed against the same weights and biases: every lane has its own OUT_N
+// Perceptrons, so one weight bus value serves BATCH inferences.
+//
+// An input is accepted on a clock edge with in_valid and in_ready high and its result is
+// presented on out_vec with out_valid high PIPE_STAGES + 1 accepting edges later; it leaves on
+// an edge with out_valid and out_ready high. A valid bit travels alongside every pipeline
+// register. The whole pipeline advances together whenever its output is empty or being taken,
+// so in_ready is !out_valid || out_ready and one input is accepted per cycle while the consumer
+// keeps out_ready high.
 module Layer #(
   parameter int IN_N = `N,  // Input vector dimensionality
   parameter int OUT_N = `N,  // Output vector dimensionality
   parameter int DATA_WIDTH = `DATA_WIDTH,  // Data width
-  parameter int ACC_WIDTH = `ACC_WIDTH  // Accumulator width
+  parameter int ACC_WIDTH = `ACC_WIDTH,  // Accumulator width
+  parameter int PIPE_STAGES = 0,  // Adder tree pipeline registers (latency is PIPE_STAGES + 1)
+  parameter int BATCH = 1  // Input vectors (lanes) per beat
 ) (
-  input  logic                                    clk,      // System clock
-  input  logic                                    rst_n,    // Asynchronous reset (active low)
-  input  logic signed [      IN_N*DATA_WIDTH-1:0] in_vec,   // Packed input vector (bus)
-  input  logic signed [OUT_N*IN_N*DATA_WIDTH-1:0] weights,  // Flattened weights
-  input  logic signed [     OUT_N*DATA_WIDTH-1:0] biases,   // Flattened biases
-  output logic signed [     OUT_N*DATA_WIDTH-1:0] out_vec   // Packed output vector (bus)
+  input  logic                                     clk,        // System clock
+  input  logic                                     rst_n,      // Asynchronous reset (active low)
+  input  logic                                     in_valid,   // in_vec holds an input
+  output logic                                     in_ready,   // The input is accepted on this edge
+  input  logic signed [ BATCH*IN_N*DATA_WIDTH-1:0] in_vec,     // Packed input vectors (bus)
+  input  logic signed [ OUT_N*IN_N*DATA_WIDTH-1:0] weights,    // Flattened weights
+  input  logic signed [      OUT_N*DATA_WIDTH-1:0] biases,     // Flattened biases
+  output logic                                     out_valid,  // out_vec holds a result
+  input  logic                                     out_ready,  // The consumer takes the result
+  output logic signed [BATCH*OUT_N*DATA_WIDTH-1:0] out_vec     // Packed output vectors (bus)
 );
-  // Unpack input vector
-  genvar i;
+  logic [PIPE_STAGES:0] valid_q;  // Valid bits of the pipeline registers, the output last
+
+  assign in_ready  = !out_valid || out_ready;
+  assign out_valid = valid_q[PIPE_STAGES];
+
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      valid_q <= '0;
+    end else if (in_ready) begin
+      valid_q <= (PIPE_STAGES + 1)'({valid_q, in_valid});
+    end
+  end
+
+  // One Perceptron per lane and neuron; the lanes of a neuron share its weights and bias
+  genvar i, l;
   generate
-    for (i = 0; i < OUT_N; i++) begin : gen_neurons
-      Perceptron #(
-        .N         (IN_N),
-        .DATA_WIDTH(DATA_WIDTH),
-        .ACC_WIDTH (ACC_WIDTH)
-      ) u_neuron (
-        .clk  (clk),
-        .rst_n(rst_n),
-        .x    (in_vec),
-        .w    (weights[i*IN_N*DATA_WIDTH+:IN_N*DATA_WIDTH]),
-        .b    (biases[i*DATA_WIDTH+:DATA_WIDTH]),
-        .y    (out_vec[i*DATA_WIDTH+:DATA_WIDTH])
-      );
+    for (l = 0; l < BATCH; l++) begin : gen_lanes
+      for (i = 0; i < OUT_N; i++) begin : gen_neurons
+        Perceptron #(
+          .N         (IN_N),
+          .DATA_WIDTH(DATA_WIDTH),
+          .ACC_WIDTH  (ACC_WIDTH),
+          .PIPE_STAGES(PIPE_STAGES)
+        ) u_neuron (
+          .clk  (clk),
+          .rst_n(rst_n),
+          .en   (in_ready),
+          .int4 (1'b0),
+          .x    (in_vec[l*IN_N*DATA_WIDTH+:IN_N*DATA_WIDTH]),
+          .w    (weights[i*IN_N*DATA_WIDTH+:IN_N*DATA_WIDTH]),
+          .b    (biases[i*DATA_WIDTH+:DATA_WIDTH]),
+          .y    (out_vec[(l*OUT_N+i)*DATA_WIDTH+:DATA_WIDTH])
+        );
+      end
     end
   endgenerate
 endmodule
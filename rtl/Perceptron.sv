@@ -1,12 +1,25 @@
 `include "../include/width.svh"
 
+// y follows x, w and b after PIPE_STAGES + 1 clock edges with en high: PIPE_STAGES in the
+// PreActivation adder tree and one in the output register. While en is low the pipeline holds.
+//
+// With INT4_PACKING, int4 switches to the packed mode of PreActivation: x and w carry two signed
+// DATA_WIDTH/2-bit elements per slot, so the N multipliers compute a 2N-element dot product, and
+// y saturates to the DATA_WIDTH/2-bit range. int4 follows x, w and b down the pipeline. Layer
+// ties int4 low, so the packed mode is only reachable from a standalone Perceptron.
 module Perceptron #(
   parameter int N = `N,  // Data dimensionality
   parameter int DATA_WIDTH = `DATA_WIDTH,  // Data width
-  parameter int ACC_WIDTH = `ACC_WIDTH  // Accumulator width
+  parameter int ACC_WIDTH = `ACC_WIDTH,  // Accumulator width
+  parameter int PIPE_STAGES = 0,  // Pipeline registers in the PreActivation adder tree
+  parameter int INT4_PACKING = 0  // Support two DATA_WIDTH/2-bit elements per slot
 ) (
   input  logic                           clk,    // System clock
   input  logic                           rst_n,  // Asynchronous reset (active low)
+  input  logic                           en,     // Clock enable of the pipeline registers
+  // verilator lint_off UNUSEDSIGNAL
+  input  logic                           int4,   // Two packed elements per slot (INT4_PACKING)
+  // verilator lint_on UNUSEDSIGNAL
   input  logic signed [N*DATA_WIDTH-1:0] x,      // packed input vector
   input  logic signed [N*DATA_WIDTH-1:0] w,      // packed weights
   input  logic signed [  DATA_WIDTH-1:0] b,      // bias
@@ -26,18 +39,25 @@ module Perceptron #(
   // Pipeline registers for each stage
   logic signed [ ACC_WIDTH-1:0] pre;  // Pre-activation value
   logic signed [DATA_WIDTH-1:0] pre_clamped;  // Clamped pre-activation value
+  logic signed [DATA_WIDTH-1:0] act_in;  // Clamped value of the selected precision
   logic signed [DATA_WIDTH-1:0] relu_out;  // ReLU output
 
   // Pipeline stage 1: Pre-activation calculation
   PreActivation #(
-    .N         (N),
-    .DATA_WIDTH(DATA_WIDTH),
-    .ACC_WIDTH (ACC_WIDTH)
+    .N           (N),
+    .DATA_WIDTH  (DATA_WIDTH),
+    .ACC_WIDTH   (ACC_WIDTH),
+    .PIPE_STAGES (PIPE_STAGES),
+    .INT4_PACKING(INT4_PACKING)
   ) pre_activation (
-    .x  (x),
-    .w  (w),
-    .b  (b),
-    .pre(pre)
+    .clk  (clk),
+    .rst_n(rst_n),
+    .en   (en),
+    .int4 (int4),
+    .x    (x),
+    .w    (w),
+    .b    (b),
+    .pre  (pre)
   );
 
   // Pipeline stage 2: Clamp and apply activation function
@@ -49,10 +69,45 @@ module Perceptron #(
     .out(pre_clamped)
   );
 
+  // Packed INT4 results saturate to the half width, sign-extended back to DATA_WIDTH
+  generate
+    if (INT4_PACKING != 0) begin : gen_int4
+      logic signed [DATA_WIDTH/2-1:0] pre_clamped4;
+      logic int4_pre;  // int4 of the value leaving the PreActivation
+
+      Clamper #(
+        .DATA_WIDTH(DATA_WIDTH / 2),
+        .ACC_WIDTH (ACC_WIDTH)
+      ) clamp4 (
+        .in (pre),
+        .out(pre_clamped4)
+      );
+
+      // The mode of the value in the adder tree registers
+      if (PIPE_STAGES > 0) begin : gen_mode_regs
+        logic [PIPE_STAGES-1:0] int4_q;
+        always_ff @(posedge clk or negedge rst_n) begin
+          if (!rst_n) begin
+            int4_q <= '0;
+          end else if (en) begin
+            int4_q <= PIPE_STAGES'({int4_q, int4});
+          end
+        end
+        assign int4_pre = int4_q[PIPE_STAGES-1];
+      end else begin : gen_mode_wire
+        assign int4_pre = int4;
+      end
+
+      assign act_in = int4_pre ? DATA_WIDTH'(pre_clamped4) : pre_clamped;
+    end else begin : gen_int8
+      assign act_in = pre_clamped;
+    end
+  endgenerate
+
   ReLU #(
     .DATA_WIDTH(DATA_WIDTH)
   ) act (
-    .in (pre_clamped),
+    .in (act_in),
     .out(relu_out)
   );
 
@@ -60,7 +115,7 @@ module Perceptron #(
   always_ff @(posedge clk or negedge rst_n) begin
     if (!rst_n) begin
       y <= '0;
-    end else begin
+    end else if (en) begin
       y <= relu_out;
     end
   end
@@ -1,19 +1,68 @@
 `include "../include/width.svh"
 
+// Dot product plus bias as a balanced adder tree over the N products and the bias.
+//
+// The tree has LEVELS = $clog2(N + 1) adder levels. PIPE_STAGES registers are spread evenly
+// over the boundaries between the multipliers and the adder levels; stages beyond LEVELS
+// register the result. pre follows x, w and b after PIPE_STAGES clock edges with en high
+// (combinationally when PIPE_STAGES is 0, in which case clk, rst_n and en are unused); while en
+// is low every register holds its value.
+//
+// With ZERO_GATING every multiplier is operand-isolated: both of its operands are forced to zero
+// while either x[i] or w[i] is zero, so a product that is zero anyway does not toggle the
+// multiplier when the other operand changes. pre is the same as without it.
+//
+// With INT4_PACKING, int4 selects the precision at run time (int4 is unused otherwise). While int4
+// is low the datapath is the DATA_WIDTH one. While it is high every slot of x and w packs two
+// signed DATA_WIDTH/2-bit elements, element 2i in the low half of slot i, and the multiplier of
+// slot i computes the dot product of both pairs instead, so pre is the dot product of 2N elements
+// plus b. Both pairs share the one multiplier of the slot: they are packed a guard gap apart into
+// its operands, which widens them from DATA_WIDTH to 3*DATA_WIDTH/2 + 2 bits, so the build is
+// larger than a native DATA_WIDTH one (scripts/bench_int4.py reports both). Layer and FoldedLayer
+// tie int4 low, so KiwiNPU does not use the packed mode yet.
 module PreActivation #(
   parameter int N = `N,  // Data dimensionality
   parameter DATA_WIDTH = `DATA_WIDTH,  // Data width
-  parameter int ACC_WIDTH = `ACC_WIDTH  // Accumulator width
+  parameter int ACC_WIDTH = `ACC_WIDTH,  // Accumulator width
+  parameter int PIPE_STAGES = 0,  // Pipeline registers (clock cycles of latency)
+  parameter int ZERO_GATING = 0,  // Isolate the multipliers of zero operands
+  parameter int INT4_PACKING = 0  // Support two DATA_WIDTH/2-bit elements per slot
 ) (
-  input  logic signed [N*DATA_WIDTH-1:0] x,   // First vector (packed)
-  input  logic signed [N*DATA_WIDTH-1:0] w,   // Second vector (packed)
-  input  logic signed [  DATA_WIDTH-1:0] b,   // Bias vector
-  output logic signed [   ACC_WIDTH-1:0] pre  // Pre-activation result
+  // verilator lint_off UNUSEDSIGNAL
+  input  logic                          clk,    // System clock
+  input  logic                          rst_n,  // Asynchronous reset (active low)
+  input  logic                          en,     // Clock enable of the pipeline registers
+  input  logic                          int4,   // Two packed elements per slot (INT4_PACKING)
+  // verilator lint_on UNUSEDSIGNAL
+  input  logic signed [N*DATA_WIDTH-1:0] x,      // First vector (packed)
+  input  logic signed [N*DATA_WIDTH-1:0] w,      // Second vector (packed)
+  input  logic signed [  DATA_WIDTH-1:0] b,      // Bias vector
+  output logic signed [   ACC_WIDTH-1:0] pre     // Pre-activation result
 );
-  logic signed [DATA_WIDTH-1:0] x_arr                     [N];
-  logic signed [DATA_WIDTH-1:0] w_arr                     [N];
-  logic signed [ ACC_WIDTH-1:0] dp;  // Dot product result
-  genvar gi;
+  localparam int LEVELS = $clog2(N + 1);  // Adder levels over the products and the bias
+  localparam int TREE_STAGES = PIPE_STAGES < LEVELS ? PIPE_STAGES : LEVELS;  // Registers inside the tree
+  localparam int OUT_STAGES = PIPE_STAGES - TREE_STAGES;  // Registers after the root
+  localparam int H = DATA_WIDTH / 2;  // Width of a packed element
+  localparam int S = 2 * H + 1;  // Spacing of the packed elements: the width of a pair dot product
+  localparam int MW = S + H + 1;  // Width of the multiplier operands with INT4_PACKING
+
+  initial begin
+    if (INT4_PACKING != 0 && DATA_WIDTH % 2 != 0) begin
+      $fatal(1, "INT4_PACKING needs an even DATA_WIDTH, got %0d", DATA_WIDTH);
+    end
+  end
+
+  // Whether the outputs of tree level `level` (0: the products) are registered
+  function automatic bit registered(int level);
+    registered = 1'b0;
+    for (int k = 1; k <= TREE_STAGES; k++) begin
+      if ((k * (LEVELS + 1)) / (TREE_STAGES + 1) - 1 == level) registered = 1'b1;
+    end
+  endfunction
+
+  logic signed [DATA_WIDTH-1:0] x_arr[N];
+  logic signed [DATA_WIDTH-1:0] w_arr[N];
+  genvar gi, gl;
   generate
     for (gi = 0; gi < N; gi++) begin
       assign x_arr[gi] = x[gi*DATA_WIDTH+:DATA_WIDTH];
@@ -21,11 +70,88 @@ module PreActivation #(
     end
   endgenerate
 
-  always_comb begin
-    dp = '0;
-    for (int i = 0; i < N; i++) begin
-      dp += x_arr[i] * w_arr[i];
+  // Level 0 holds the products, the sign-extended bias and zero padding; every node of level
+  // l > 0 adds two nodes of level l - 1, so level LEVELS is the root
+  generate
+    for (gl = 0; gl <= LEVELS; gl++) begin : gen_level
+      for (gi = 0; gi < (1 << (LEVELS - gl)); gi++) begin : gen_node
+        logic signed [ACC_WIDTH-1:0] sum;  // Combinational value
+        logic signed [ACC_WIDTH-1:0] node;  // Value seen by the next level
+
+        if (gl > 0) begin : gen_add
+          assign sum = gen_level[gl-1].gen_node[2*gi].node + gen_level[gl-1].gen_node[2*gi+1].node;
+        end else if (gi < N) begin : gen_product
+          logic signed [DATA_WIDTH-1:0] x_op;  // Multiplier operands
+          logic signed [DATA_WIDTH-1:0] w_op;
+
+          if (ZERO_GATING != 0) begin : gen_isolated
+            logic zero;  // Either operand is zero
+            assign zero = x_arr[gi] == '0 || w_arr[gi] == '0;
+            assign x_op = zero ? '0 : x_arr[gi];
+            assign w_op = zero ? '0 : w_arr[gi];
+          end else begin : gen_direct
+            assign x_op = x_arr[gi];
+            assign w_op = w_arr[gi];
+          end
+
+          if (INT4_PACKING != 0) begin : gen_packed
+            // In INT4 mode X = x1 << S + x0 and W = w0 << S + w1, so X * W is
+            // x1*w0 << 2S + (x0*w0 + x1*w1) << S + x0*w1 and bits [2S-1:S] of the product hold the
+            // pair dot product, less one when x0*w1 is negative (its sign is bit S-1)
+            logic signed [H-1:0] x0, x1, w0, w1;
+            logic signed [MW-1:0] x_mul, w_mul;  // Operands of the shared multiplier
+            logic signed [2*S-1:0] prod;
+            logic signed [S-1:0] dot;
+            assign x0    = x_op[H-1:0];
+            assign x1    = x_op[DATA_WIDTH-1:H];
+            assign w0    = w_op[H-1:0];
+            assign w1    = w_op[DATA_WIDTH-1:H];
+            assign x_mul = int4 ? {x1[H-1], x1, {S{1'b0}}} + {{(MW - H) {x0[H-1]}}, x0}
+                                : {{(MW - DATA_WIDTH) {x_op[DATA_WIDTH-1]}}, x_op};
+            assign w_mul = int4 ? {w0[H-1], w0, {S{1'b0}}} + {{(MW - H) {w1[H-1]}}, w1}
+                                : {{(MW - DATA_WIDTH) {w_op[DATA_WIDTH-1]}}, w_op};
+            assign prod  = x_mul * w_mul;
+            assign dot   = prod[2*S-1:S] + S'(prod[S-1]);
+            assign sum   = int4 ? ACC_WIDTH'(dot) : ACC_WIDTH'(prod);
+          end else begin : gen_mult
+            assign sum = x_op * w_op;
+          end
+        end else if (gi == N) begin : gen_bias
+          assign sum = {{(ACC_WIDTH - DATA_WIDTH) {b[DATA_WIDTH-1]}}, b};
+        end else begin : gen_pad
+          assign sum = '0;
+        end
+
+        if (gl < LEVELS && registered(gl)) begin : gen_reg
+          always_ff @(posedge clk or negedge rst_n) begin
+            if (!rst_n) begin
+              node <= '0;
+            end else if (en) begin
+              node <= sum;
+            end
+          end
+        end else begin : gen_wire
+          assign node = sum;
+        end
+      end
     end
-    pre = dp + {{(ACC_WIDTH-DATA_WIDTH){b[DATA_WIDTH-1]}}, b};  // Add sign-extended bias to dot product
-  end
+  endgenerate
+
+  // Remaining stages register the root
+  generate
+    if (OUT_STAGES == 0) begin : gen_out_wire
+      assign pre = gen_level[LEVELS].gen_node[0].node;
+    end else begin : gen_out_regs
+      logic signed [ACC_WIDTH-1:0] pre_q[OUT_STAGES];
+      always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+          for (int k = 0; k < OUT_STAGES; k++) pre_q[k] <= '0;
+        end else if (en) begin
+          pre_q[0] <= gen_level[LEVELS].gen_node[0].node;
+          for (int k = 1; k < OUT_STAGES; k++) pre_q[k] <= pre_q[k-1];
+        end
+      end
+      assign pre = pre_q[OUT_STAGES-1];
+    end
+  endgenerate
 endmodule
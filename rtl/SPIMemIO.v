@@ -493,7 +493,7 @@ module SPIMemIO_Xfer (
 
           if (flash_clk) begin
             next_obuffer = {obuffer[3:0], 4'b0000};
-            next_count   = count - {2'b00, |count, 1'b0};
+            next_count   = count - {1'b0, |count, 2'b00};
           end else begin
             next_ibuffer = {ibuffer[3:0], flash_io3_di, flash_io2_di, flash_io1_di, flash_io0_di};
           end
@@ -513,7 +513,7 @@ module SPIMemIO_Xfer (
 
           next_obuffer = {obuffer[3:0], 4'b0000};
           next_ibuffer = {ibuffer[3:0], flash_io3_di, flash_io2_di, flash_io1_di, flash_io0_di};
-          next_count   = count - {2'b00, |count, 1'b0};
+          next_count   = count - {1'b0, |count, 2'b00};
 
           next_fetch   = (next_count == 0);
         end
@@ -526,7 +526,7 @@ module SPIMemIO_Xfer (
 
           if (flash_clk) begin
             next_obuffer = {obuffer[5:0], 2'b00};
-            next_count   = count - {3'b000, |count};
+            next_count   = count - {2'b00, |count, 1'b0};
           end else begin
             next_ibuffer = {ibuffer[5:0], flash_io1_di, flash_io0_di};
           end
@@ -0,0 +1,64 @@
+// Streams a WORDS-word image from flash through the SPIMemIO read port into a register file.
+//
+// The register file holds BANKS images side by side, bank 0 in the LSBs. Word k of the image
+// is read from FLASH_BASE + 4*k and lands in image[32*k +: 32] of the bank being loaded, so
+// the image bytes are stored little-endian. Loading starts into bank 0 when reset is released
+// and into bank on every cycle load is high; loaded goes high once the last word is written
+// and stays high until the next load. The other banks keep their contents meanwhile.
+module WeightLoader #(
+  parameter int WORDS = 1,  // 32-bit words in the image
+  parameter int FLASH_BASE = 0,  // Flash address of word 0 (24 bits)
+  parameter int BANKS = 1  // Images in the register file
+) (
+  input  logic                                     clk,        // System clock
+  input  logic                                     rst_n,      // Asynchronous reset (active low)
+  input  logic                                     load,       // Restart loading from word 0
+  // verilator lint_off UNUSEDSIGNAL
+  input  logic [$clog2(BANKS > 1 ? BANKS : 2)-1:0] bank,       // Bank to load, sampled with load
+  // verilator lint_on UNUSEDSIGNAL
+  output logic                                     mem_valid,  // SPIMemIO read request
+  input  logic                                     mem_ready,  // SPIMemIO read data valid
+  output logic [                             23:0] mem_addr,   // SPIMemIO read address
+  input  logic [                             31:0] mem_rdata,  // SPIMemIO read data
+  output logic                                     loaded,     // The whole image is in the register file
+  output logic [               BANKS*WORDS*32-1:0] image       // Register file
+);
+  localparam int WORD_W = WORDS > 1 ? $clog2(WORDS) : 1;
+  localparam int BANK_W = $bits(bank);
+
+  logic [WORD_W-1:0] word;  // Word being read
+  logic [BANK_W-1:0] target;  // Bank being loaded
+  logic last_word;
+
+  assign mem_addr  = 24'(FLASH_BASE) + {22'(word), 2'b00};
+  assign last_word = word == WORD_W'(WORDS - 1);
+
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      mem_valid <= 1'b1;
+      loaded    <= 1'b0;
+      word      <= '0;
+      target    <= '0;
+    end else if (load) begin
+      mem_valid <= 1'b1;
+      loaded    <= 1'b0;
+      word      <= '0;
+      target    <= BANKS > 1 ? bank : '0;
+    end else if (mem_valid && mem_ready) begin
+      if (last_word) begin
+        mem_valid <= 1'b0;
+        loaded    <= 1'b1;
+      end else begin
+        word <= word + 1'b1;
+      end
+    end
+  end
+
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      image <= '0;
+    end else if (mem_valid && mem_ready && !load) begin
+      image[(target*WORDS+32'(word))*32+:32] <= mem_rdata;
+    end
+  end
+endmodule
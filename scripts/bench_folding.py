@@ -0,0 +1,90 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+# ]
+# ///
+"""Report FoldedLayer throughput against its MAC count for every valid folding factor.
+
+Every ``PARALLELISM`` runs the ``folded_layer_back_to_back`` cocotb test of
+``tb/test_folded_layer.py`` in its own ``pytest`` process. The test chains ``NUM_STREAM_TESTS``
+runs with ``start`` held high and appends one JSON line to ``BENCH_REPORT``. The fully parallel
+``Layer`` corresponds to ``PARALLELISM = N * OUT_N`` (one inference per cycle).
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import typer
+from sweep import run_bench
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+CLOCK_HZ = 100e6  # Clock of the cocotb testbench
+
+app = typer.Typer()
+
+
+def valid_parallelisms(n: int, out_n: int) -> list[int]:
+    """Folding factors ``FoldedLayer`` accepts: divisors of ``n`` and multiples of it dividing ``n * out_n``."""
+    return [p for p in range(1, n + 1) if n % p == 0] + [n * g for g in range(2, out_n + 1) if out_n % g == 0]
+
+
+def run_parallelism(
+    parallelism: int, n: int, out_n: int, data_width: int, num_runs: int, sim: str, report: Path
+) -> bool:
+    """Run the back-to-back test at one folding factor, appending its result to ``report``."""
+    parameters = {
+        "N": n,
+        "OUT_N": out_n,
+        "DATA_WIDTH": data_width,
+        "PARALLELISM": parallelism,
+        "ZERO_SKIP": 0,
+        "NUM_STREAM_TESTS": num_runs,
+    }
+    return run_bench("test_folded_layer", "folded_layer_back_to_back", parameters, sim, report)
+
+
+@app.command()
+def bench(
+    n: int = typer.Option(8, help="Inputs of the layer"),
+    out_n: int = typer.Option(8, help="Outputs of the layer"),
+    data_width: int = typer.Option(8, help="Bit width of activations and weights"),
+    parallelism: list[int] = typer.Option([], help="Folding factors to run; every valid one if empty"),
+    num_runs: int = typer.Option(200, help="Runs chained back-to-back per folding factor"),
+    sim: str = typer.Option("verilator", help="Simulator to run"),
+    report: str = typer.Option("", help="Optional path of a JSON report with every result"),
+):
+    """
+    Report cycles per inference and inferences per second against the MAC count of every folding factor.
+    """
+    valid = valid_parallelisms(n, out_n)
+    invalid = sorted(set(parallelism) - set(valid))
+    if invalid:
+        raise typer.BadParameter(f"Invalid PARALLELISM {invalid} for N={n}, OUT_N={out_n}; valid: {valid}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = Path(tmp) / "bench.jsonl"
+        for p in parallelism or valid:
+            print(f"Benchmarking PARALLELISM={p}", flush=True)
+            if not run_parallelism(p, n, out_n, data_width, num_runs, sim, lines):
+                raise typer.Exit(code=1)
+        results = [json.loads(line) for line in lines.read_text().splitlines()]
+
+    full = n * out_n
+    print(f"\nFoldedLayer N={n}, OUT_N={out_n}, DATA_WIDTH={data_width} at {CLOCK_HZ / 1e6:.0f} MHz")
+    print(f"{'MACs':>6}{'of Layer':>10}{'cycles/inference':>18}{'inferences/s':>14}{'inferences/s/MAC':>18}")
+    for result in results:
+        inferences_per_second = CLOCK_HZ / result["cycles_per_inference"]
+        print(
+            f"{result['macs']:>6}{result['macs'] / full:>10.1%}{result['cycles_per_inference']:>18.2f}"
+            f"{inferences_per_second:>14.3e}{inferences_per_second / result['macs']:>18.3e}"
+        )
+
+    if report:
+        Path(report).write_text(json.dumps(results, indent=2))
+        print(f"Report written to {report}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,97 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "cocotb>=2.0.1",
+# ]
+# ///
+"""Compare a Perceptron with the packed INT4 mode against a native DATA_WIDTH build.
+
+Both builds (``INT4_PACKING`` 0 and 1) run the ``perceptron_throughput`` cocotb test of
+``tb/test_perceptron.py`` in their own ``pytest`` process. The test streams vectors back-to-back
+in every mode of the build and appends the measured multiply-accumulates per cycle to
+``BENCH_REPORT``. When ``yosys`` is on the ``PATH``, every build is also synthesized with the
+generic ``synth`` flow and its cell count reported as the area. The packed build is a design
+point of its own: its multipliers take operands a guard gap wider than ``DATA_WIDTH`` to fit both
+element pairs, so it is larger than the native one.
+"""
+
+import json
+import math
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import typer
+from kiwinpu_dse import TARGETS, yosys_script
+from sweep import run_bench
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+SOURCES = ["Perceptron.sv", "PreActivation.sv", "Clamper.sv", "ReLU.sv"]
+
+app = typer.Typer()
+
+
+def run_build(int4_packing: int, n: int, data_width: int, sim: str, report: Path) -> bool:
+    """Run the throughput test of one build, appending one result per mode to ``report``."""
+    parameters = {"N": n, "DATA_WIDTH": data_width, "PIPE_STAGES": 0, "INT4_PACKING": int4_packing}
+    return run_bench("test_perceptron", "perceptron_throughput", parameters, sim, report)
+
+
+def synth_cells(int4_packing: int, n: int, data_width: int, workdir: Path) -> int | None:
+    """Cell count of the build after generic Yosys synthesis, or ``None`` without Yosys."""
+    if shutil.which("yosys") is None:
+        return None
+    stat = workdir / f"stat_{int4_packing}.json"
+    params = {
+        "N": n,
+        "DATA_WIDTH": data_width,
+        "ACC_WIDTH": 2 * data_width + math.ceil(math.log2(n)),
+        "INT4_PACKING": int4_packing,
+    }
+    script = yosys_script("Perceptron", SOURCES, params, TARGETS["generic"][0], stat)
+    subprocess.run(["yosys", "-q", "-p", script], check=True, capture_output=True, text=True)
+    return json.loads(stat.read_text())["design"]["num_cells"]
+
+
+@app.command()
+def bench(
+    n: int = typer.Option(8, help="Slots (multipliers) of the Perceptron"),
+    data_width: int = typer.Option(8, help="Bit width of a slot; packed elements are half as wide"),
+    sim: str = typer.Option("verilator", help="Simulator to run"),
+    report: str = typer.Option("", help="Optional path of a JSON report with every result"),
+):
+    """
+    Report MACs per cycle of every mode and the area of both builds.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = Path(tmp) / "bench.jsonl"
+        cells = {}
+        for int4_packing in (0, 1):
+            print(f"Benchmarking INT4_PACKING={int4_packing}", flush=True)
+            if not run_build(int4_packing, n, data_width, sim, lines):
+                raise typer.Exit(code=1)
+            cells[int4_packing] = synth_cells(int4_packing, n, data_width, Path(tmp))
+        results = [json.loads(line) for line in lines.read_text().splitlines()]
+
+    print(f"\n{'build':<16}{'mode':>6}{'II':>6}{'MACs/cycle':>12}{'cells':>8}{'MACs/cycle/kcell':>18}")
+    for result in results:
+        area = cells[result["int4_packing"]]
+        build = "int4 packing" if result["int4_packing"] else f"native int{data_width}"
+        result["cells"] = area
+        print(
+            f"{build:<16}{result['mode']:>6}{result['initiation_interval']:>6.2f}{result['macs_per_cycle']:>12.2f}"
+            + (f"{area:>8}{result['macs_per_cycle'] / area * 1e3:>18.2f}" if area else f"{'-':>8}{'-':>18}")
+        )
+    if None in cells.values():
+        print("yosys was not found on the PATH; install it to compare the areas")
+
+    if report:
+        Path(report).write_text(json.dumps(results, indent=2))
+        print(f"Report written to {report}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,82 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+# ]
+# ///
+"""Benchmark KiwiNPU inference throughput for a list of layer configurations.
+
+Every configuration runs the ``kiwinpu_benchmark`` cocotb test of ``tb/test_kiwinpu.py`` in its
+own ``pytest`` process, with ``LAYER_SIZES`` and ``BATCH`` passed through the environment. The
+test streams ``NUM_BENCH_TESTS`` beats of ``BATCH`` inferences back-to-back and appends one JSON
+line to ``BENCH_REPORT``. The multipliers of all lanes (MACs) stand in for the area, so the
+inferences per cycle per MAC show what extra lanes buy.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import typer
+from sweep import run_bench
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+
+app = typer.Typer()
+
+
+def run_config(layer_sizes: str, data_width: int, batch: int, num_inferences: int, sim: str, report: Path) -> bool:
+    """Run the benchmark for one layer configuration and lane count, appending its result to ``report``."""
+    parameters = {
+        "LAYER_SIZES": layer_sizes,
+        "DATA_WIDTH": data_width,
+        "BATCH": batch,
+        "NUM_BENCH_TESTS": num_inferences,
+    }
+    return run_bench("test_kiwinpu", "kiwinpu_benchmark", parameters, sim, report)
+
+
+@app.command()
+def bench(
+    layer_sizes: list[str] = typer.Option(
+        ["4,8,4", "8,16,8", "16,16,16,16"], help="Comma-separated neurons per layer, layer 0 being the input"
+    ),
+    data_width: int = typer.Option(8, help="Bit width of activations and weights"),
+    batch: list[int] = typer.Option([1], help="Input vectors (lanes) processed per beat"),
+    num_inferences: int = typer.Option(2000, help="Number of beats streamed per configuration"),
+    sim: str = typer.Option("verilator", help="Simulator to run"),
+    report: str = typer.Option("", help="Optional path of a JSON report with every result"),
+):
+    """
+    Report inferences per cycle against MACs and per simulated and wall-clock second for every
+    layer configuration and lane count.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = Path(tmp) / "bench.jsonl"
+        for sizes in layer_sizes:
+            for lanes in batch:
+                print(f"Benchmarking LAYER_SIZES={sizes} BATCH={lanes}", flush=True)
+                if not run_config(sizes, data_width, lanes, num_inferences, sim, lines):
+                    raise typer.Exit(code=1)
+        results = [json.loads(line) for line in lines.read_text().splitlines()]
+
+    print(
+        f"\n{'LAYER_SIZES':<20}{'DATA_WIDTH':>11}{'BATCH':>6}{'II':>6}{'inferences/cycle':>17}{'MACs':>7}"
+        f"{'inferences/cycle/MAC':>21}{'inferences/sim-s':>18}{'inferences/wall-s':>19}"
+    )
+    for result in results:
+        print(
+            f"{','.join(map(str, result['layer_sizes'])):<20}{result['data_width']:>11}{result['batch']:>6}"
+            f"{result['initiation_interval']:>6.2f}{result['inferences_per_cycle']:>17.2f}{result['macs']:>7}"
+            f"{result['inferences_per_cycle'] / result['macs']:>21.2e}{result['inferences_per_sim_second']:>18.3e}"
+            f"{result['inferences_per_wall_second']:>19.1f}"
+        )
+
+    if report:
+        Path(report).write_text(json.dumps(results, indent=2))
+        print(f"Report written to {report}")
+
+
+if __name__ == "__main__":
+    app()
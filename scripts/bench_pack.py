@@ -0,0 +1,93 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "cocotb>=2.0.1",
+# ]
+# ///
+"""Microbenchmark the batch ``pack_batch``/``unpack_batch`` helpers in ``tb/utils.py``.
+
+Each helper is timed against the per-element shift loops the testbenches used before, for
+element widths 4/8/16 and bus sizes up to tens of thousands of bits (``KiwiNPU.weights_flat``
+is ``N*N*NUM_LAYERS*DATA_WIDTH`` bits wide).
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import typer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tb"))
+from utils import get_signed_value, pack_batch, unpack_batch
+
+app = typer.Typer()
+
+
+def pack_loop(rows: list[list[int]], width: int) -> list[int]:
+    """Reference: shift-and-OR every element into the packed integer."""
+    packed = []
+    for values in rows:
+        result = 0
+        for val in reversed(values):
+            result = (result << width) | (val & ((1 << width) - 1))
+        packed.append(result)
+    return packed
+
+
+def unpack_loop(packed_values: list[int], num_values: int, width: int) -> list[list[int]]:
+    """Reference: shift the whole packed integer once per element."""
+    mask = (1 << width) - 1
+    return [[get_signed_value((p >> (i * width)) & mask, width) for i in range(num_values)] for p in packed_values]
+
+
+def _best_time(func, repeat: int) -> float:
+    number = 1
+    while timeit.timeit(func, number=number) < 0.05:
+        number *= 2
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+@app.command()
+def bench(
+    widths: list[int] = typer.Option([4, 8, 16], help="Element bit widths"),
+    bus_bits: list[int] = typer.Option([64, 512, 4096, 32768, 65536], help="Packed bus widths in bits"),
+    batch: int = typer.Option(64, help="Number of packed values per call"),
+    repeat: int = typer.Option(5, help="Timing repetitions (best is reported)"),
+):
+    """
+    Print per-value pack/unpack times of the loop and batch implementations.
+    """
+    rng = np.random.default_rng(0)
+
+    print(f"batch={batch}, times are per packed value")
+    print(
+        f"{'width':>6}{'bus bits':>10}{'pack loop [us]':>16}{'pack batch [us]':>17}{'speedup':>9}"
+        f"{'unpack loop [us]':>18}{'unpack batch [us]':>19}{'speedup':>9}"
+    )
+    for width in widths:
+        for bits in bus_bits:
+            n = bits // width
+            values = rng.integers(-(1 << (width - 1)), 1 << (width - 1), size=(batch, n))
+            rows = values.tolist()
+            packed = pack_batch(values, width)
+            assert packed == pack_loop(rows, width)
+            assert (unpack_batch(packed, n, width) == values).all()
+
+            times = [
+                _best_time(lambda: pack_loop(rows, width), repeat),
+                _best_time(lambda: pack_batch(values, width), repeat),
+                _best_time(lambda: unpack_loop(packed, n, width), repeat),
+                _best_time(lambda: unpack_batch(packed, n, width), repeat),
+            ]
+            pack_loop_us, pack_batch_us, unpack_loop_us, unpack_batch_us = (t / batch * 1e6 for t in times)
+            print(
+                f"{width:>6}{bits:>10}{pack_loop_us:>16.1f}{pack_batch_us:>17.1f}{pack_loop_us / pack_batch_us:>8.1f}x"
+                f"{unpack_loop_us:>18.1f}{unpack_batch_us:>19.1f}{unpack_loop_us / unpack_batch_us:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    app()
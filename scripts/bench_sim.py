@@ -0,0 +1,253 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+# ]
+# ///
+"""Benchmark the cocotb simulations of every DUT and keep a history of the results.
+
+Each (DUT, simulator, size) point runs the DUT's functional test through ``pytest`` with
+``PERF_REPORT`` set, so ``tb/perf.py`` cold-builds the DUT, times the test and an idle run of
+the same simulated length. ``PIPE_STAGES``, ``INT4_PACKING`` and ``BATCH`` are pinned to 0, 0
+and 1 unless the size sets them, so the runner builds only the configuration the point names.
+From those timings the suite derives:
+
+- ``build_time``: seconds to build the DUT from scratch;
+- ``startup_time``: seconds the simulator and the Python test module take to start;
+- ``cycles_per_second``: simulated clock cycles (evaluations for combinational DUTs) per
+  wall-clock second of the test;
+- ``overhead_per_vector``: wall-clock microseconds the Python side spends per test vector,
+  i.e. the test time beyond the idle run, divided by the number of vectors.
+
+Runs are appended to a JSON history file. Every metric is compared with the last run of the
+same host in the history (or with ``--baseline``) and changes for the worse beyond
+``--threshold`` are flagged as regressions. Points run one at a time so they do not compete
+for the CPU.
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import typer
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+CLOCK_PERIOD_NS = 10  # Clock period of the clocked testbenches (tb/perf.py)
+
+# Functional test timed for every DUT and the sizes it is benchmarked at
+DUTS = {
+    "ReLU": {
+        "module": "test_relu",
+        "testcase": "relu_test",
+        "clocked": False,
+        "sizes": [{"DATA_WIDTH": 8}, {"DATA_WIDTH": 16}],
+    },
+    "Clamper": {
+        "module": "test_clamper",
+        "testcase": "clamper_test",
+        "clocked": False,
+        "sizes": [{"DATA_WIDTH": 8, "N": 4}, {"DATA_WIDTH": 16, "N": 16}],
+    },
+    "PreActivation": {
+        "module": "test_preactivation",
+        "testcase": "preactivation_test",
+        "clocked": False,
+        "sizes": [{"DATA_WIDTH": 8, "N": 4}, {"DATA_WIDTH": 8, "N": 16}],
+    },
+    "Perceptron": {
+        "module": "test_perceptron",
+        "testcase": "perceptron_test",
+        "clocked": True,
+        "sizes": [{"DATA_WIDTH": 8, "N": 4}, {"DATA_WIDTH": 8, "N": 16}],
+    },
+    "Layer": {
+        "module": "test_layer",
+        "testcase": "test_layer_random",
+        "clocked": True,
+        "sizes": [{"DATA_WIDTH": 8, "N": 4, "OUT_N": 4}, {"DATA_WIDTH": 8, "N": 16, "OUT_N": 16}],
+    },
+    "KiwiNPU": {
+        "module": "test_kiwinpu",
+        "testcase": "kiwinpu_test",
+        "clocked": True,
+        "sizes": [{"DATA_WIDTH": 8, "LAYER_SIZES": "4,8,4"}, {"DATA_WIDTH": 8, "LAYER_SIZES": "8,16,4"}],
+    },
+}
+
+# Direction in which each metric gets worse
+METRICS = {
+    "build_time": "higher",
+    "startup_time": "higher",
+    "cycles_per_second": "lower",
+    "overhead_per_vector": "higher",
+}
+
+# Executable that has to be on the PATH for each simulator
+SIMULATOR_BINARIES = {"icarus": "iverilog", "verilator": "verilator"}
+
+app = typer.Typer()
+
+
+def point_name(dut: str, sim: str, size: dict) -> str:
+    """Stable identifier of a benchmark point, used to match runs across the history."""
+    return "_".join([dut, sim, *(f"{name}{value}" for name, value in size.items())])
+
+
+def run_point(dut: str, sim: str, size: dict, num_vectors: int, log_dir: Path) -> dict:
+    """Benchmark one DUT at one size on one simulator and derive its metrics."""
+    config = DUTS[dut]
+    name = point_name(dut, sim, size)
+    result = {"name": name, "dut": dut, "sim": sim, "size": size}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "perf.jsonl"
+        env = {
+            **os.environ,
+            "SIM": sim,
+            # Coverage-directed tests stop early unless uniform cases fill up to exactly num_vectors
+            "NUM_TESTS": str(num_vectors),
+            "MIN_TESTS": str(num_vectors),
+            # Runners build every variant they cover unless these are set; the size overrides them
+            "PIPE_STAGES": "0",
+            "INT4_PACKING": "0",
+            "BATCH": "1",
+            "PERF_REPORT": str(report),
+            "PERF_TESTCASE": config["testcase"],
+            **{key: str(value) for key, value in size.items()},
+        }
+        with open(log_dir / f"{name}.log", "w") as log:
+            proc = subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", f"tb/{config['module']}.py"],
+                cwd=PROJ_PATH,
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        if proc.returncode != 0 or not report.exists():
+            return {**result, "passed": False}
+        record = json.loads(report.read_text().splitlines()[-1])
+
+    test_time = sum(testcase["wall_time"] for testcase in record["testcases"].values())
+    cycles = record["sim_time_ns"] / CLOCK_PERIOD_NS if config["clocked"] else num_vectors
+    return {
+        **result,
+        "passed": all(testcase["passed"] for testcase in record["testcases"].values()),
+        "num_vectors": num_vectors,
+        "build_time": record["build_time"],
+        "startup_time": max(record["run_time"] - test_time, 0.0),
+        "cycles_per_second": cycles / max(test_time, 1e-3),
+        "overhead_per_vector": max(test_time - record["idle_wall_time"], 0.0) / num_vectors * 1e6,
+    }
+
+
+def find_regressions(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """Compare every metric with the baseline run and describe the ones that got worse beyond ``threshold``."""
+    previous = {result["name"]: result for result in baseline if result.get("passed")}
+    regressions = []
+    for result in results:
+        before = previous.get(result["name"])
+        if not result.get("passed") or before is None:
+            continue
+        for metric, worse in METRICS.items():
+            old, new = before[metric], result[metric]
+            if old <= 0:
+                continue
+            change = (new - old) / old
+            if (worse == "higher" and change > threshold) or (worse == "lower" and -change > threshold):
+                regressions.append(f"{result['name']}: {metric} {old:.4g} -> {new:.4g} ({change:+.0%})")
+    return regressions
+
+
+def git_commit() -> str | None:
+    """Return the current commit, if the project is a git checkout."""
+    proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJ_PATH, capture_output=True, text=True)
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+@app.command()
+def bench(
+    dut: list[str] = typer.Option(list(DUTS), help="DUTs to benchmark"),
+    sim: list[str] = typer.Option(["icarus", "verilator"], help="Simulators to benchmark"),
+    num_vectors: int = typer.Option(1000, help="Test vectors per point"),
+    history: str = typer.Option("sim_build/bench/history.json", help="JSON history file the run is appended to"),
+    baseline: str = typer.Option("", help="JSON history whose last run is the baseline; the history itself if empty"),
+    threshold: float = typer.Option(0.15, help="Relative change for the worse that is flagged as a regression"),
+):
+    """
+    Benchmark every DUT, append the results to the history and flag regressions against the baseline.
+    """
+    unknown = sorted(set(dut) - set(DUTS))
+    if unknown:
+        raise typer.BadParameter(f"Unknown DUTs: {', '.join(unknown)}")
+
+    history_path = (PROJ_PATH / history).resolve()
+    log_dir = history_path.parent / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    runs = json.loads(history_path.read_text()) if history_path.exists() else []
+
+    results = []
+    start = time.perf_counter()
+    for sim_name in sim:
+        if shutil.which(SIMULATOR_BINARIES.get(sim_name, sim_name)) is None:
+            print(f"Skipping {sim_name}: {SIMULATOR_BINARIES.get(sim_name, sim_name)} is not installed")
+            continue
+        for dut_name in dut:
+            for size in DUTS[dut_name]["sizes"]:
+                result = run_point(dut_name, sim_name, size, num_vectors, log_dir)
+                results.append(result)
+                print(f"{'PASS' if result['passed'] else 'FAIL'} {result['name']}", flush=True)
+    total_time = time.perf_counter() - start
+
+    print(f"\n{'point':<44}{'build [s]':>10}{'startup [s]':>12}{'cycles/s':>11}{'overhead [us/vec]':>19}")
+    for result in results:
+        if not result["passed"]:
+            print(f"{result['name']:<44}{'FAILED':>10}")
+            continue
+        print(
+            f"{result['name']:<44}{result['build_time']:>10.1f}{result['startup_time']:>12.1f}"
+            f"{result['cycles_per_second']:>11.3g}{result['overhead_per_vector']:>19.1f}"
+        )
+
+    host = platform.node()
+    if baseline:
+        baseline_runs = json.loads(Path(baseline).read_text())
+    else:
+        # Timings from other machines are not comparable
+        baseline_runs = [run for run in runs if run["host"] == host]
+    regressions = find_regressions(results, baseline_runs[-1]["results"], threshold) if baseline_runs else []
+
+    runs.append(
+        {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "host": host,
+            "num_vectors": num_vectors,
+            "wall_time": total_time,
+            "results": results,
+        }
+    )
+    history_path.write_text(json.dumps(runs, indent=2))
+    print(f"\nRun {len(runs)} appended to {history_path} ({total_time:.0f}s)")
+
+    if not baseline_runs:
+        print("No baseline yet: this run becomes the baseline")
+    elif regressions:
+        print(f"\n{len(regressions)} regressions beyond {threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    else:
+        print(f"No regressions beyond {threshold:.0%}")
+
+    if regressions or not all(result["passed"] for result in results):
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
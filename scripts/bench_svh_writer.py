@@ -0,0 +1,101 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "jinja2>=3.1.2",
+# ]
+# ///
+"""Benchmark wall time and peak RSS of the SVH test case writers as ``num_tests`` grows.
+
+Every measurement runs in a freshly spawned process so that ``ru_maxrss`` reflects only
+that run. The ``stream`` mode writes the header chunk by chunk, exactly like the generator
+CLIs; the ``in-memory`` mode renders the whole header into one string before writing it,
+which is what the writers did before they were made to stream.
+"""
+
+import multiprocessing as mp
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import kiwinpu_generate
+import perceptron_generate
+import typer
+
+app = typer.Typer()
+
+
+def _write_kiwinpu(num_tests: int, n: int, out_n: int, data_width: int, output_file: Path, stream: bool) -> None:
+    if stream:
+        chunks = kiwinpu_generate.iter_test_chunks(data_width, n, out_n, num_tests, seed=0)
+    else:
+        chunks = [{"start": 0, **kiwinpu_generate.generate_test_arrays(data_width, n, out_n, num_tests, seed=0)}]
+    parts = kiwinpu_generate.iter_test_cases_svh(chunks, "kiwinpu", data_width, n, out_n, num_tests)
+    with open(output_file, "w") as f:
+        if stream:
+            for text in parts:
+                f.write(text)
+        else:
+            f.write("".join(parts))
+
+
+def _write_perceptron(num_tests: int, n: int, data_width: int, output_file: Path, stream: bool) -> None:
+    chunk_size = None if stream else max(num_tests, 1)
+    chunks = perceptron_generate.iter_test_chunks(data_width, n, num_tests, seed=0, chunk_size=chunk_size)
+    parts = perceptron_generate.iter_test_cases_svh(chunks, data_width, n, num_tests)
+    with open(output_file, "w") as f:
+        if stream:
+            for text in parts:
+                f.write(text)
+        else:
+            f.write("".join(parts))
+
+
+def _measure(generator: str, mode: str, num_tests: int, n: int, out_n: int, data_width: int, queue) -> None:
+    """Run one writer in this (fresh) process and report time, peak RSS and file size."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = Path(tmp) / f"{generator}_testcases.svh"
+        start = time.perf_counter()
+        if generator == "kiwinpu":
+            _write_kiwinpu(num_tests, n, out_n, data_width, output_file, mode == "stream")
+        else:
+            _write_perceptron(num_tests, n, data_width, output_file, mode == "stream")
+        elapsed = time.perf_counter() - start
+        size = output_file.stat().st_size
+    peak_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, peak_rss_kib, size))
+
+
+@app.command()
+def bench(
+    sizes: list[int] = typer.Option([1_000, 10_000, 100_000], help="Values of num_tests to benchmark"),
+    n: int = typer.Option(16, help="Input vector dimensionality"),
+    out_n: int = typer.Option(16, help="Output vector dimensionality (kiwinpu only)"),
+    data_width: int = typer.Option(8, help="Bit width of input vectors and weights"),
+    modes: list[str] = typer.Option(["stream", "in-memory"], help="Writer modes to compare"),
+):
+    """
+    Print time and peak RSS of both SVH writers for each ``num_tests`` in ``sizes``.
+    """
+    ctx = mp.get_context("spawn")
+
+    print(f"N={n}, OUT_N={out_n}, DATA_WIDTH={data_width}")
+    print(f"{'generator':<11}{'mode':<11}{'num_tests':>10}{'time [s]':>11}{'peak RSS [MiB]':>16}{'output [MiB]':>14}")
+    for generator in ("kiwinpu", "perceptron"):
+        for mode in modes:
+            for num_tests in sizes:
+                queue = ctx.Queue()
+                proc = ctx.Process(target=_measure, args=(generator, mode, num_tests, n, out_n, data_width, queue))
+                proc.start()
+                elapsed, peak_rss_kib, size = queue.get()
+                proc.join()
+                print(
+                    f"{generator:<11}{mode:<11}{num_tests:>10}{elapsed:>11.2f}"
+                    f"{peak_rss_kib / 1024:>16.1f}{size / 2**20:>14.1f}"
+                )
+
+
+if __name__ == "__main__":
+    app()
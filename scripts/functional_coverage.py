@@ -0,0 +1,269 @@
+"""Functional coverage of the ``PreActivation``/``Clamper``/``ReLU`` datapath and stimulus steered by it.
+
+A ``Coverage`` model holds bins over the pre-activation value ``dot(x, w) + b`` of every output:
+
+- the ``Clamper`` saturation boundaries ``MAX_VAL`` and ``MIN_VAL``, each exactly and ±1;
+- the ``ReLU`` threshold: -1, 0 and 1;
+- the extremes the accumulator can reach;
+- per output, whether it saturates high, saturates low or stays in range.
+
+For a dot product it also holds operand bins for every element ``i`` of the multiplier slots:
+
+- the sign quadrant of the product ``x[i] * w[i]``, both operands nonzero;
+- ``x[i]`` zero and ``w[i]`` zero;
+- ``x[i]`` at ``MIN_VAL`` and ``w[i]`` at ``MIN_VAL``.
+
+``directed_cases`` draws test cases aimed at an uncovered bin each, solving for weights and a
+bias that put the pre-activation on a target value, and pinning the operands of an element
+inside an operand bin, until every bin is hit. Cases that would hit no new bin are not emitted
+while coverage is open, so it closes within a few dozen vectors where uniform random ones take
+orders of magnitude more. Uniform random cases then follow up to ``min_cases``, so a regression
+never runs the directed cases alone.
+
+    coverage = Coverage.for_dot(data_width=8, n=4, out_n=4)
+    for x, w, b in directed_cases(coverage, n=4, rng=np.random.default_rng(0), max_cases=1000, min_cases=32):
+        ...  # x: (lanes, n), w: (out_n, n), b: (out_n,)
+    print(coverage.summary())
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Failed attempts after which a bin counts as unreachable
+MAX_ATTEMPTS = 20
+
+
+@dataclass
+class Bin:
+    """Pre-activation values ``low..high`` of one output, or of any output when ``output`` is ``None``."""
+
+    name: str
+    low: int
+    high: int
+    output: int | None = None
+    hits: int = 0
+
+
+@dataclass
+class OperandBin:
+    """Operand pairs ``x[element]`` in ``x_low..x_high`` with ``w[element]`` in ``w_low..w_high``, of any output."""
+
+    name: str
+    element: int
+    x_low: int
+    x_high: int
+    w_low: int
+    w_high: int
+    hits: int = 0
+
+
+@dataclass
+class Coverage:
+    """Coverage bins over pre-activation values in ``acc_min..acc_max`` and over the operands of ``n`` elements."""
+
+    data_width: int
+    acc_min: int  # Lowest pre-activation value reachable
+    acc_max: int  # Highest pre-activation value reachable
+    out_n: int = 1  # Outputs sampled together
+    n: int = 0  # Elements with operand bins
+    bins: list[Bin] = field(init=False)
+    operand_bins: list[OperandBin] = field(init=False)
+    unreachable: list[Bin] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        max_val = (1 << (self.data_width - 1)) - 1
+        min_val = -max_val - 1
+        points = {
+            "MAX_VAL-1": max_val - 1,
+            "MAX_VAL": max_val,
+            "MAX_VAL+1": max_val + 1,
+            "MIN_VAL+1": min_val + 1,
+            "MIN_VAL": min_val,
+            "MIN_VAL-1": min_val - 1,
+            "-1": -1,
+            "0": 0,
+            "1": 1,
+            "ACC max": self.acc_max,
+            "ACC min": self.acc_min,
+        }
+        self.bins = [Bin(name, value, value) for name, value in points.items() if self.acc_min <= value <= self.acc_max]
+        for j in range(self.out_n):
+            self.bins += [
+                Bin(f"out{j} saturates high", max_val + 1, self.acc_max, j),
+                Bin(f"out{j} saturates low", self.acc_min, min_val - 1, j),
+                Bin(f"out{j} in range", min_val, max_val, j),
+            ]
+        self.operand_bins = []
+        for i in range(self.n):
+            self.operand_bins += [
+                OperandBin(f"x[{i}]<0,w[{i}]<0", i, min_val, -1, min_val, -1),
+                OperandBin(f"x[{i}]<0,w[{i}]>0", i, min_val, -1, 1, max_val),
+                OperandBin(f"x[{i}]>0,w[{i}]<0", i, 1, max_val, min_val, -1),
+                OperandBin(f"x[{i}]>0,w[{i}]>0", i, 1, max_val, 1, max_val),
+                OperandBin(f"x[{i}]=0", i, 0, 0, min_val, max_val),
+                OperandBin(f"w[{i}]=0", i, min_val, max_val, 0, 0),
+                OperandBin(f"x[{i}]=MIN_VAL", i, min_val, min_val, min_val, max_val),
+                OperandBin(f"w[{i}]=MIN_VAL", i, min_val, max_val, min_val, min_val),
+            ]
+
+    @classmethod
+    def for_dot(cls, data_width: int, n: int, out_n: int = 1) -> "Coverage":
+        """Coverage of ``dot(x, w) + b`` over ``n`` signed ``data_width``-bit elements, with operand bins."""
+        max_val = (1 << (data_width - 1)) - 1
+        min_val = -max_val - 1
+        return cls(data_width, n * min_val * max_val + min_val, n * min_val * min_val + max_val, out_n, n)
+
+    @property
+    def uncovered(self) -> list[Bin]:
+        """Pre-activation bins not hit yet."""
+        return [b for b in self.bins if not b.hits]
+
+    @property
+    def uncovered_operands(self) -> list[OperandBin]:
+        """Operand bins not hit yet."""
+        return [b for b in self.operand_bins if not b.hits]
+
+    @property
+    def closed(self) -> bool:
+        """Whether every reachable bin has been hit."""
+        return not self.uncovered and not self.uncovered_operands
+
+    def sample(self, pre, x=None, w=None) -> int:
+        """Record the pre-activation values ``pre`` of shape ``(..., out_n)``; return the number of newly hit bins.
+
+        ``x`` and ``w`` are the operands behind them, broadcastable to one shape ``(..., n)``,
+        e.g. ``x[:, None]`` and ``w[None]`` for lanes of inputs against the weights of every output.
+        """
+        pre = np.asarray(pre, dtype=np.int64).reshape(-1, self.out_n)
+        new = 0
+        for b in self.bins:
+            values = pre if b.output is None else pre[:, b.output]
+            hits = int(np.count_nonzero((values >= b.low) & (values <= b.high)))
+            new += hits > 0 and not b.hits
+            b.hits += hits
+        if x is not None and self.operand_bins:
+            x, w = (np.asarray(a, dtype=np.int64).reshape(-1, self.n) for a in np.broadcast_arrays(x, w))
+            for b in self.operand_bins:
+                xs, ws = x[:, b.element], w[:, b.element]
+                hits = int(np.count_nonzero((xs >= b.x_low) & (xs <= b.x_high) & (ws >= b.w_low) & (ws <= b.w_high)))
+                new += hits > 0 and not b.hits
+                b.hits += hits
+        return new
+
+    def summary(self) -> str:
+        """Covered bins and the names of the missing ones."""
+        total = len(self.bins) + len(self.operand_bins)
+        missing = self.uncovered + self.uncovered_operands
+        text = f"{total - len(missing)}/{total} coverage bins hit"
+        if missing:
+            text += f", missing: {', '.join(b.name for b in missing)}"
+        if self.unreachable:
+            text += f", unreachable: {', '.join(b.name for b in self.unreachable)}"
+        return text
+
+
+def steer(target: int, x, n: int, data_width: int, rng: np.random.Generator):
+    """Return ``(x, w, b)`` with ``dot(x, w) + b == target``, or ``None`` when the bias cannot absorb the rest.
+
+    ``x`` is drawn with magnitudes that can reach ``target`` unless it is given. ``w`` is then
+    chosen greedily, every element taking an equal share of what is left, and ``b`` takes the
+    remainder.
+    """
+    max_val = (1 << (data_width - 1)) - 1
+    min_val = -max_val - 1
+    b0 = int(rng.integers(min_val // 2, max_val // 2 + 1))
+    if x is None:
+        share = abs(target - b0) / n
+        low = min(max(1, int(np.ceil(share / -min_val))), -min_val)
+        high = max(low, min(-min_val, int(share)))
+        x = -rng.integers(low, high + 1, n)
+        # Negating both operands of a product keeps it, unless one of them is MIN_VAL
+        x = np.where((x > min_val) & (rng.random(n) < 0.5), -x, x)
+    x = np.asarray(x, dtype=np.int64)
+
+    w = np.zeros(n, dtype=np.int64)
+    rest = target - b0
+    for i in range(n):
+        if x[i] == 0:
+            w[i] = rng.integers(min_val, max_val + 1)
+            continue
+        w[i] = np.clip(round(rest / (n - i) / x[i]), min_val, max_val)
+        rest -= int(x[i] * w[i])
+    b = b0 + rest
+    if not min_val <= b <= max_val:
+        return None
+    return x, w, b
+
+
+def directed_values(coverage: Coverage, rng: np.random.Generator, max_cases: int, min_cases: int = 0) -> Iterator[int]:
+    """Yield a pre-activation value in an uncovered bin until ``coverage`` closes or ``max_cases`` are yielded.
+
+    Once coverage closes, uniformly random values in ``acc_min..acc_max`` follow until
+    ``min_cases`` values have been yielded.
+    """
+    for i in range(max_cases):
+        if coverage.closed:
+            if i >= min_cases:
+                return
+            value = int(rng.integers(coverage.acc_min, coverage.acc_max + 1))
+        else:
+            aim = coverage.uncovered[rng.integers(len(coverage.uncovered))]
+            value = int(rng.integers(aim.low, aim.high + 1))
+        coverage.sample(np.full(coverage.out_n, value))
+        yield value
+
+
+def directed_cases(
+    coverage: Coverage, n: int, rng: np.random.Generator, max_cases: int, lanes: int = 1, min_cases: int = 0
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield test cases that hit uncovered bins of ``coverage`` until it closes or ``max_cases`` are yielded.
+
+    Every case is ``x`` of shape ``(lanes, n)``, ``w`` of shape ``(out_n, n)`` and ``b`` of shape
+    ``(out_n,)``. While pre-activation bins are open, one output aims at an uncovered one and
+    picks ``x`` of lane 0; the others aim at their own uncovered bins with that ``x``. After that,
+    every element with an uncovered operand bin gets its ``x`` of lane 0 and its weights of every
+    output pinned inside one. The other lanes share the weights and draw their inputs uniformly.
+    Once coverage closes, uniformly random cases follow until ``min_cases`` cases have been
+    yielded.
+    """
+    max_val = (1 << (coverage.data_width - 1)) - 1
+    min_val = -max_val - 1
+    attempts = {id(b): 0 for b in coverage.bins}
+    emitted = 0
+    while emitted < max_cases:
+        if coverage.closed and emitted >= min_cases:
+            return
+        outputs = rng.permutation(coverage.out_n)
+        x = None
+        w = rng.integers(min_val, max_val + 1, (coverage.out_n, n))
+        b = rng.integers(min_val, max_val + 1, coverage.out_n)
+        for j in outputs:
+            aims = [a for a in coverage.uncovered if a.output in (None, j)]
+            if not aims:
+                continue
+            aim = aims[rng.integers(len(aims))]
+            case = steer(int(rng.integers(aim.low, aim.high + 1)), x, n, coverage.data_width, rng)
+            if case is None:
+                attempts[id(aim)] += 1
+                if attempts[id(aim)] >= MAX_ATTEMPTS:
+                    coverage.bins.remove(aim)
+                    coverage.unreachable.append(aim)
+                continue
+            x, w[j], b[j] = case
+        if x is None:
+            if coverage.uncovered:
+                continue
+            x = rng.integers(min_val, max_val + 1, n)
+            for i in range(n):
+                aims = [a for a in coverage.uncovered_operands if a.element == i]
+                if aims:
+                    aim = aims[rng.integers(len(aims))]
+                    x[i] = rng.integers(aim.x_low, aim.x_high + 1)
+                    w[:, i] = rng.integers(aim.w_low, aim.w_high + 1, coverage.out_n)
+
+        lanes_x = np.vstack([x, rng.integers(min_val, max_val + 1, (lanes - 1, n))])
+        if coverage.sample(lanes_x @ w.T + b, lanes_x[:, None], w[None]) or coverage.closed:
+            emitted += 1
+            yield lanes_x, w, b
@@ -0,0 +1,256 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "cocotb>=2.0.1",
+# ]
+# ///
+"""Synthesize a sweep of KiwiNPU configurations with Yosys and report the area/throughput Pareto front.
+
+Every combination of the swept ``LAYER_SIZES``, ``DATA_WIDTH``, ``PIPE_STAGES`` and ``BATCH``
+values is synthesized for every ``--target`` in a process pool: ``generic`` runs the generic
+``synth`` flow, the ``cst/`` boards (Basys-3 and Zybo Z7, both 7-series parts) run
+``synth_xilinx``. ``stat`` gives the cell, LUT, flip-flop and DSP counts and ``ltp`` the logic
+depth, from which the critical path, fmax and the inferences per second at fmax are estimated.
+The Pareto front is built from the fmax throughput, so pipelining that shortens the critical
+path pays off; the inferences per second at the target clock are reported next to it.
+Configurations ``kiwisim.estimate`` predicts above ``--max-cells`` are screened out before
+synthesis.
+
+Results are cached in ``sim_build/dse`` keyed by a hash of the RTL, the headers, the parameters
+and the synthesis script, so repeated sweeps only synthesize new points and points of targets
+sharing a script are synthesized once. The generic results can be written as calibration data
+for ``scripts/kiwinpu_estimate.py --calibrate``.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import typer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tb"))
+from kiwisim import Config, estimate
+from utils import layer_sizes_parameter
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+SOURCES = ["KiwiNPU.sv", "Layer.sv", "Perceptron.sv", "PreActivation.sv", "Clamper.sv", "ReLU.sv"]
+CACHE_DIR = PROJ_PATH / "sim_build" / "dse"
+
+# Synthesis command, constraints file (None: OpenLane's CLOCK_PERIOD) and first-order delay of
+# one logic level in ns of every target; both boards are 7-series parts
+TARGETS = {
+    "generic": ("synth -flatten", None, 0.3),
+    "basys3": ("synth_xilinx -family xc7 -flatten", "Basys-3-Master.xdc", 0.6),
+    "zybo-z7": ("synth_xilinx -family xc7 -flatten", "Zybo-Z7-Master.xdc", 0.6),
+}
+
+app = typer.Typer()
+
+
+def clock_period_ns(target: str) -> float:
+    """Clock period of a target: the system clock of its board file, or ``CLOCK_PERIOD`` of ``config.json``."""
+    constraints = TARGETS[target][1]
+    if constraints is None:
+        return json.loads((PROJ_PATH / "config.json").read_text())["CLOCK_PERIOD"]
+    match = re.search(
+        r"create_clock .*-name sys_clk_pin -period ([\d.]+)", (PROJ_PATH / "cst" / constraints).read_text()
+    )
+    return float(match.group(1))
+
+
+def yosys_script(top: str, sources: list[str], params: dict, synth: str, stat: Path) -> str:
+    """Yosys commands synthesizing ``top`` from ``rtl/`` with ``params`` and writing its statistics to ``stat``."""
+    return (
+        f"read_verilog -sv -I {PROJ_PATH / 'include'} {' '.join(str(PROJ_PATH / 'rtl' / f) for f in sources)}; "
+        f"chparam {' '.join(f'-set {k} {v}' for k, v in params.items())} {top}; "
+        f"{synth} -top {top}; tee -q -o {stat} stat -json"
+    )
+
+
+def point_script(point: dict, stat: Path, ltp: Path) -> str:
+    """Yosys commands synthesizing ``point`` and writing its statistics and longest path."""
+    params = {
+        "NUM_LAYERS": len(point["layer_sizes"]),
+        "LAYER_SIZES": layer_sizes_parameter(point["layer_sizes"]),
+        "DATA_WIDTH": point["data_width"],
+        "PIPE_STAGES": point["pipe_stages"],
+        "BATCH": point["batch"],
+    }
+    # Vendor flip-flops are not known to ltp as such, so they are deselected to cut the paths
+    ffs = "" if point["target"] == "generic" else " t:FD* %n"
+    script = yosys_script("KiwiNPU", SOURCES, params, TARGETS[point["target"]][0], stat)
+    return f"{script}; tee -q -o {ltp} ltp -noff{ffs}"
+
+
+def point_key(point: dict) -> str:
+    """Hash the RTL, the headers, the parameters and the synthesis script of ``point``."""
+    description = {name: value for name, value in point.items() if name != "target"}
+    digest = hashlib.sha256(json.dumps({**description, "synth": TARGETS[point["target"]][0]}, sort_keys=True).encode())
+    for path in [PROJ_PATH / "rtl" / f for f in SOURCES] + sorted((PROJ_PATH / "include").glob("*.svh")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def synthesize(point: dict, key: str) -> dict:
+    """Synthesize ``point`` and cache its resource counts and logic depth under ``key``."""
+    with tempfile.TemporaryDirectory() as tmp:
+        stat, ltp = Path(tmp) / "stat.json", Path(tmp) / "ltp.txt"
+        start = time.perf_counter()
+        proc = subprocess.run(
+            ["yosys", "-q", "-p", point_script(point, stat, ltp)], capture_output=True, text=True, cwd=tmp
+        )
+        if proc.returncode != 0:
+            return {**point, "key": key, "error": (proc.stdout + proc.stderr)[-2000:]}
+        cells = json.loads(stat.read_text())["design"]
+        by_type = cells.get("num_cells_by_type", {})
+        result = {
+            "key": key,
+            "cells": cells["num_cells"],
+            "luts": sum(n for t, n in by_type.items() if t.startswith("LUT")),
+            "ffs": sum(n for t, n in by_type.items() if t.startswith("FD") or "DFF" in t),
+            "dsps": sum(n for t, n in by_type.items() if t.startswith("DSP")),
+            "depth": int(re.search(r"length=(\d+)", ltp.read_text()).group(1)),
+            "synth_seconds": time.perf_counter() - start,
+            "yosys": subprocess.run(["yosys", "-V"], capture_output=True, text=True).stdout.strip(),
+        }
+    # Written atomically so that an interrupted sweep never leaves a truncated result behind
+    cached = CACHE_DIR / f"{key}.json"
+    tmp_file = cached.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(result, indent=2))
+    tmp_file.replace(cached)
+    return {**point, **result}
+
+
+def throughput(point: dict, result: dict) -> dict:
+    """Critical path from the logic depth and sustained inferences per second at fmax and at the target clock."""
+    path_ns = result["depth"] * TARGETS[point["target"]][2]
+    period = clock_period_ns(point["target"])
+    return {
+        "critical_path_ns": path_ns,
+        "fmax_mhz": 1e3 / path_ns,
+        "clock_period_ns": period,
+        "inferences_per_second": point["batch"] * 1e9 / path_ns,
+        "target_inferences_per_second": point["batch"] * 1e9 / max(period, path_ns),
+    }
+
+
+def pareto_front(results: list[dict]) -> list[dict]:
+    """Results of one target no other result beats in area, DSPs and throughput together."""
+
+    def dominates(a: dict, b: dict) -> bool:
+        no_worse = a["area"] <= b["area"] and a["dsps"] <= b["dsps"]
+        no_worse = no_worse and a["inferences_per_second"] >= b["inferences_per_second"]
+        better = a["area"] < b["area"] or a["dsps"] < b["dsps"]
+        return no_worse and (better or a["inferences_per_second"] > b["inferences_per_second"])
+
+    return [r for r in results if not any(dominates(other, r) for other in results)]
+
+
+@app.command()
+def explore(
+    layer_sizes: list[str] = typer.Option(["4,8,4"], help="Comma-separated neurons per layer, layer 0 being the input"),
+    data_width: list[int] = typer.Option([8], help="Bit width of activations and weights"),
+    pipe_stages: list[int] = typer.Option([0], help="Adder tree registers of every Layer"),
+    batch: list[int] = typer.Option([1], help="Input vectors (lanes) processed per beat"),
+    target: list[str] = typer.Option(list(TARGETS), help="Synthesis targets"),
+    max_cells: float = typer.Option(0, help="Skip configurations kiwisim.estimate puts above this many cells"),
+    jobs: int = typer.Option(os.cpu_count() or 1, help="Number of syntheses run in parallel"),
+    calibration_data: str = typer.Option("", help="Path to write the generic results for kiwinpu_estimate.py"),
+    report: str = typer.Option("sim_build/dse/report.json", help="Path of the JSON report with every result"),
+):
+    """
+    Synthesize every new point of the sweep in a process pool and print the Pareto front of each target.
+    """
+    unknown = sorted(set(target) - set(TARGETS))
+    if unknown:
+        raise typer.BadParameter(f"Unknown targets: {', '.join(unknown)}")
+
+    points = []
+    for sizes, dw, stages, lanes, tgt in itertools.product(layer_sizes, data_width, pipe_stages, batch, target):
+        config = Config(tuple(int(size) for size in sizes.split(",")), dw, stages, lanes)
+        if max_cells and estimate(config).cells > max_cells:
+            continue
+        points.append(
+            {
+                "target": tgt,
+                "layer_sizes": list(config.layer_sizes),
+                "data_width": dw,
+                "pipe_stages": stages,
+                "batch": lanes,
+            }
+        )
+    print(f"{len(points)} points after the analytical screen")
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    keys = [point_key(point) for point in points]
+    new = {key: point for key, point in zip(keys, points, strict=True) if not (CACHE_DIR / f"{key}.json").exists()}
+    if new and shutil.which("yosys") is None:
+        print(f"yosys was not found on the PATH; {len(new)} points are not cached", file=sys.stderr)
+        raise typer.Exit(code=1)
+
+    print(f"Synthesizing {len(new)} new points on {jobs} workers, {len(points) - len(new)} cached")
+    failed = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(synthesize, point, key) for key, point in new.items()]
+        for i, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            if "error" in result:
+                failed.append(result)
+            print(f"[{i}/{len(new)}] {'FAIL' if 'error' in result else 'DONE'} {result['key']}", flush=True)
+    for result in failed:
+        print(f"\n{result['key']} {result['target']} {result['layer_sizes']}:\n{result['error']}", file=sys.stderr)
+
+    results = []
+    for key, point in zip(keys, points, strict=True):
+        cached = CACHE_DIR / f"{key}.json"
+        if cached.exists():
+            result = {**point, **json.loads(cached.read_text())}
+            result.update(throughput(point, result), area=result["cells" if point["target"] == "generic" else "luts"])
+            results.append(result)
+
+    for tgt in target:
+        front = pareto_front([r for r in results if r["target"] == tgt])
+        for result in front:
+            result["pareto"] = True
+        print(
+            f"\n{tgt} Pareto front (area: {'cells' if tgt == 'generic' else 'LUTs'})\n"
+            f"{'LAYER_SIZES':<16}{'DW':>4}{'PIPE':>5}{'BATCH':>6}{'cells':>9}{'LUTs':>8}{'FFs':>8}{'DSPs':>6}"
+            f"{'depth':>6}{'path ns':>8}{'fmax MHz':>9}{'inferences/s':>13}{'at target':>11}"
+        )
+        for r in sorted(front, key=lambda r: r["area"]):
+            print(
+                f"{','.join(map(str, r['layer_sizes'])):<16}{r['data_width']:>4}{r['pipe_stages']:>5}{r['batch']:>6}"
+                f"{r['cells']:>9}{r['luts']:>8}{r['ffs']:>8}{r['dsps']:>6}{r['depth']:>6}"
+                f"{r['critical_path_ns']:>8.2f}{r['fmax_mhz']:>9.1f}{r['inferences_per_second']:>13.3e}"
+                f"{r['target_inferences_per_second']:>11.3e}"
+            )
+
+    if calibration_data:
+        fields = ("layer_sizes", "data_width", "pipe_stages", "batch", "cells", "critical_path_ns")
+        generic = [{name: r[name] for name in fields} for r in results if r["target"] == "generic"]
+        Path(calibration_data).write_text(json.dumps(generic, indent=2))
+        print(f"\nCalibration data for {len(generic)} points written to {calibration_data}")
+
+    report_path = PROJ_PATH / report
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(results, indent=2))
+    print(f"Report written to {report_path}")
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
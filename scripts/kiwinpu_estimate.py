@@ -0,0 +1,125 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "cocotb>=2.0.1",
+# ]
+# ///
+"""Estimate the area, critical path and throughput of KiwiNPU configurations without synthesis.
+
+Every combination of the swept ``LAYER_SIZES``, ``DATA_WIDTH``, ``PIPE_STAGES``, ``BATCH`` and
+``BANKS`` values is run through the analytical model of ``kiwisim.estimate``; without
+``--layer-sizes``/``--data-width`` the values of ``include/width.svh`` are used. Configurations
+over ``--max-cells`` or missing ``CLOCK_PERIOD`` (``--meet-timing``) are pruned, and the rest are
+ranked by inferences per second per thousand cells.
+
+The model coefficients default to the generic Yosys calibration of ``kiwisim.Calibration``. They
+come from ``--calibration`` instead (a file written with ``--save-calibration``) or are refitted
+to the synthesis results of ``--calibrate``: a JSON list of objects with the ``Config`` fields,
+``cells`` and, optionally, ``critical_path_ns``.
+"""
+
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tb"))
+from kiwisim import Calibration, Config, estimate
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+# OpenLane clock period of the design, in ns
+CLOCK_PERIOD_NS = json.loads((PROJ_PATH / "config.json").read_text())["CLOCK_PERIOD"]
+
+app = typer.Typer()
+
+
+def load_results(path: Path) -> list[tuple[Config, float, float | None]]:
+    """Read synthesis results as ``(config, cells, critical_path_ns)`` tuples."""
+    results = []
+    for result in json.loads(path.read_text()):
+        config = Config(**{name: result[name] for name in Config.__dataclass_fields__ if name in result})
+        results.append((config, result["cells"], result.get("critical_path_ns")))
+    return results
+
+
+@app.command()
+def explore(
+    header: str = typer.Option(str(PROJ_PATH / "include" / "width.svh"), help="Header with the default parameters"),
+    layer_sizes: list[str] = typer.Option([], help="Comma-separated neurons per layer, layer 0 being the input"),
+    data_width: list[int] = typer.Option([], help="Bit width of activations and weights"),
+    pipe_stages: list[int] = typer.Option([0], help="Adder tree registers of every Layer"),
+    batch: list[int] = typer.Option([1], help="Input vectors (lanes) processed per beat"),
+    banks: list[int] = typer.Option([1], help="Weight/bias banks"),
+    clock_period: float = typer.Option(CLOCK_PERIOD_NS, help="CLOCK_PERIOD in ns"),
+    calibration: str = typer.Option("", help="Calibration JSON written by --save-calibration"),
+    calibrate: str = typer.Option("", help="JSON list of synthesis results to fit the calibration to"),
+    save_calibration: str = typer.Option("", help="Path to write the calibration used"),
+    max_cells: float = typer.Option(0, help="Prune configurations estimated above this many cells (0: keep all)"),
+    meet_timing: bool = typer.Option(False, help="Prune configurations whose critical path exceeds CLOCK_PERIOD"),
+    top: int = typer.Option(20, help="Number of configurations printed"),
+    report: str = typer.Option("", help="Optional path of a JSON report with every kept configuration"),
+):
+    """
+    Rank every configuration of the sweep by estimated inferences per second per kcell.
+    """
+    default = Config.from_header(header)
+    sizes = [tuple(int(size) for size in s.split(",")) for s in layer_sizes] or [default.layer_sizes]
+    model = Calibration.load(calibration) if calibration else Calibration()
+    if calibrate:
+        model = model.fit(load_results(Path(calibrate)))
+    if save_calibration:
+        model.save(save_calibration)
+
+    start = time.perf_counter()
+    estimates = [
+        estimate(Config(*point), model)
+        for point in itertools.product(sizes, data_width or [default.data_width], pipe_stages, batch, banks)
+    ]
+    elapsed = time.perf_counter() - start
+    print(f"Estimated {len(estimates)} configurations in {elapsed * 1e3:.1f} ms ({len(estimates) / elapsed:.0f}/s)")
+
+    kept = [
+        e
+        for e in estimates
+        if (not max_cells or e.cells <= max_cells) and (not meet_timing or e.meets_timing(clock_period))
+    ]
+    kept.sort(key=lambda e: e.inferences_per_second(clock_period) / e.cells, reverse=True)
+    print(f"{len(kept)} kept at CLOCK_PERIOD={clock_period:g} ns")
+
+    print(
+        f"\n{'LAYER_SIZES':<16}{'DW':>4}{'PIPE':>5}{'BATCH':>6}{'BANKS':>6}{'MACs':>7}{'reg bits':>10}"
+        f"{'weights bits':>13}{'biases bits':>12}{'depth':>6}{'latency':>8}{'kcells':>9}{'path ns':>8}"
+        f"{'fmax MHz':>9}{'inferences/s':>13}{'inf/s/kcell':>12}"
+    )
+    for e in kept[:top]:
+        c = e.config
+        rate = e.inferences_per_second(clock_period)
+        print(
+            f"{','.join(map(str, c.layer_sizes)):<16}{c.data_width:>4}{c.pipe_stages:>5}{c.batch:>6}{c.banks:>6}"
+            f"{e.macs:>7}{e.register_bits:>10}{e.weights_flat_bits:>13}{e.biases_flat_bits:>12}{e.tree_depth:>6}"
+            f"{e.latency:>8}{e.cells / 1e3:>9.1f}{e.critical_path_ns:>8.2f}{e.fmax_mhz:>9.1f}{rate:>13.3e}"
+            f"{rate / e.cells * 1e3:>12.3e}" + ("" if e.meets_timing(clock_period) else "  (misses timing)")
+        )
+
+    if report:
+        results = [
+            {
+                **vars(e),
+                "config": vars(e.config),
+                "fmax_mhz": e.fmax_mhz,
+                "meets_timing": e.meets_timing(clock_period),
+                "inferences_per_second": e.inferences_per_second(clock_period),
+            }
+            for e in kept
+        ]
+        Path(report).write_text(json.dumps(results, indent=2))
+        print(f"Report written to {report}")
+
+
+if __name__ == "__main__":
+    app()
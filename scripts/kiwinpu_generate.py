@@ -10,181 +10,385 @@
 import math
 import os
 import random
+from collections.abc import Iterable, Iterator
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import typer
+from functional_coverage import Coverage, directed_cases
 from jinja2 import Template
 
 app = typer.Typer()
 
 
-def generate_test_cases(
-    module_name: str,
+class OutputFormat(str, Enum):
+    """How the generated test cases are handed to the testbench."""
+
+    svh = "svh"  # init_*_test_cases() function in an SVH header
+    mem = "mem"  # $readmemh vector files plus .npy sidecars
+
+
+# Number of test vector elements formatted per streamed chunk of the SVH header
+CHUNK_ELEMENTS = 1 << 16
+
+HEADER_TEMPLATE = Template(
+    """// Auto-generated test cases for {{ module_name }}
+// DATA_WIDTH={{ data_width }}, ACC_WIDTH={{ acc_width }}, N={{ n }}, OUT_N={{ out_n }}, NUM_TESTS={{ num_tests }}
+// THIS IS A HEADER FILE - DO NOT ATTEMPT TO COMPILE DIRECTLY
+
+`ifndef {{ module_name.upper() }}_TESTCASES_SVH
+`define {{ module_name.upper() }}_TESTCASES_SVH
+
+localparam int NUM_{{ module_name.upper() }}_TEST = {{ num_tests }};
+
+// Test vectors
+logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_x[NUM_{{ module_name.upper() }}_TEST][{{ n }}];
+logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_w[NUM_{{ module_name.upper() }}_TEST][{{ n }}][{{ out_n }}];
+logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_b[NUM_{{ module_name.upper() }}_TEST][{{ out_n }}];
+logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_expected[NUM_{{ module_name.upper() }}_TEST][{{ out_n }}];
+
+// Initialize test cases
+function void init_{{ module_name }}_test_cases();
+""",
+    keep_trailing_newline=True,
+)
+
+
+def draw_test_vectors(
     data_width: int,
     n: int,
     out_n: int,
     num_tests: int,
-    seed: int | None = None,
-) -> list[dict[str, Any]]:
-    """Generate test cases for a module."""
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Draw uniformly random stimulus for every test case into int64 arrays from the global RNG.
+
+    Returns ``x`` with shape ``(num_tests, n)``, ``w`` with shape ``(num_tests, n, out_n)``
+    and ``b`` with shape ``(num_tests, out_n)``. The global RNG stream is consumed one test
+    case at a time, so chunked generation is bit-identical to drawing all test cases at once
+    for a given seed.
+    """
     min_val: int = -(2 ** (data_width - 1))
     max_val: int = 2 ** (data_width - 1) - 1
-    data_width + data_width + math.ceil(math.log2(n))
 
+    x = np.zeros((num_tests, n), dtype=np.int64)
+    w = np.zeros((num_tests, n, out_n), dtype=np.int64)
+    b = np.zeros((num_tests, out_n), dtype=np.int64)
+
+    for i in range(num_tests):
+        x[i] = np.random.randint(min_val, max_val + 1, size=n)
+        w[i] = np.random.randint(min_val, max_val + 1, size=(n, out_n))
+        b[i] = np.random.randint(min_val, max_val + 1, size=out_n)
+
+    return x, w, b
+
+
+def draw_directed_vectors(
+    data_width: int, n: int, out_n: int, max_tests: int, seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, Coverage]:
+    """Draw coverage-directed test cases until every coverage bin is hit or ``max_tests`` are drawn.
+
+    Returns ``x``, ``w`` and ``b`` shaped like :func:`draw_test_vectors` and the coverage they
+    reach, with a saturation direction bin per output.
+    """
+    coverage = Coverage.for_dot(data_width, n, out_n)
+    cases = list(directed_cases(coverage, n, np.random.default_rng(seed), max_tests))
+    x = np.array([x[0] for x, _, _ in cases], dtype=np.int64).reshape(-1, n)
+    w = np.array([w.T for _, w, _ in cases], dtype=np.int64).reshape(-1, n, out_n)
+    b = np.array([b for _, _, b in cases], dtype=np.int64).reshape(-1, out_n)
+    return x, w, b, coverage
+
+
+def golden_model(x: np.ndarray, w: np.ndarray, b: np.ndarray, data_width: int) -> dict[str, np.ndarray]:
+    """Compute reference outputs for a batch of test vectors in one vectorized pass.
+
+    Mirrors ``PreActivation`` (dot product plus sign-extended bias), ``Clamper`` (saturation
+    to the signed DATA_WIDTH range) and ``ReLU``. Returns per-output ``dot_products``,
+    ``pre`` and ``expected`` arrays, each with shape ``(num_tests, out_n)``.
+    """
+    max_out_val = (1 << (data_width - 1)) - 1
+    min_out_val = -(1 << (data_width - 1))
+
+    dot_products = np.einsum("tn,tnk->tk", x, w)
+    b_acc_width = np.where(b < 0, b | ((-1) << data_width), b)
+    pre = np.clip(dot_products + b_acc_width, min_out_val, max_out_val)
+    expected = np.maximum(pre, 0)
+
+    return {"dot_products": dot_products, "pre": pre, "expected": expected}
+
+
+def generate_test_arrays(
+    data_width: int,
+    n: int,
+    out_n: int,
+    num_tests: int,
+    seed: int | None = None,
+    directed: tuple[np.ndarray, np.ndarray, np.ndarray, Coverage] | None = None,
+) -> dict[str, np.ndarray]:
+    """Generate test vectors and their expected outputs as whole arrays.
+
+    The coverage-directed test cases come first (``directed``, as drawn by
+    :func:`draw_directed_vectors`, or drawn here); once their coverage closes, the remaining
+    test cases are uniformly random.
+    """
     if seed is not None:
         random.seed(seed)
         np.random.seed(seed)
 
-    test_cases: list[dict[str, Any]] = []
-
-    for i in range(num_tests):
-        strategy = i % 5
-
-        if strategy == 0:
-            # Random values
-            x = np.random.randint(min_val, max_val + 1, size=n)
-            w = np.random.randint(min_val, max_val + 1, size=(n, out_n))
-            b = np.random.randint(min_val, max_val + 1, size=out_n)
-        elif strategy == 1:
-            # Small values
-            small_min = max(min_val // 4, -32)
-            small_max = min(max_val // 4, 31)
-            x = np.random.randint(small_min, small_max + 1, size=n)
-            w = np.random.randint(small_min, small_max + 1, size=(n, out_n))
-            b = np.random.randint(small_min, small_max + 1, size=out_n)
-        elif strategy == 2:
-            # Positive/negative mix
-            x = np.random.randint(0, max_val // 2 + 1, size=n)
-            w = np.random.randint(min_val // 2, 1, size=(n, out_n))
-            b = np.random.randint(min_val // 2, max_val // 2 + 1, size=out_n)
-        elif strategy == 3:
-            # Bias-driven tests
-            x = np.zeros(n, dtype=int)
-            w = np.zeros((n, out_n), dtype=int)
-            b = np.array([np.random.choice([min_val, max_val]) for _ in range(out_n)])
-        else:
-            # Edge cases
-            choices = np.array([min_val, max_val])
-            x = np.array([np.random.choice(choices) for _ in range(n)])
-            w = np.array([[np.random.choice(choices) for _ in range(out_n)] for _ in range(n)])
-            b = np.array([np.random.choice(choices) for _ in range(out_n)])
-
-        # Calculate expected outputs
-        expected_outputs = []
-        for k in range(out_n):
-            dot_product = int(np.dot(x, w[:, k]))
-            b_acc_width = b[k] | ((-1) << data_width) if b[k] < 0 else b[k]
-            acc_with_bias = dot_product + b_acc_width
-
-            max_out_val = (1 << (data_width - 1)) - 1
-            min_out_val = -(1 << (data_width - 1))
-
-            pre = max(min(acc_with_bias, max_out_val), min_out_val)
-            expected = max(0, pre)
-            expected_outputs.append(expected)
-
-        test_cases.append(
-            {
-                "x": x.tolist(),
-                "w": w.tolist(),
-                "b": b.tolist(),
-                "pre": pre,
-                "expected": expected_outputs,
-                "name": f"random_{i + 1}",
-            }
-        )
-
-    return test_cases
+    x, w, b, _ = directed or draw_directed_vectors(data_width, n, out_n, num_tests, seed)
+    if len(x) < num_tests:
+        rest = draw_test_vectors(data_width, n, out_n, num_tests - len(x))
+        x, w, b = (np.concatenate(pair) for pair in zip((x, w, b), rest, strict=True))
+    return {"x": x, "w": w, "b": b, **golden_model(x, w, b, data_width)}
 
 
-def write_test_cases_svh(
-    test_cases: list[dict[str, Any]],
-    module_name: str,
+def iter_test_chunks(
     data_width: int,
     n: int,
     out_n: int,
-    output_file: str,
-):
-    """Write test cases to SystemVerilog header file."""
+    num_tests: int,
+    seed: int | None = None,
+    chunk_size: int | None = None,
+    directed: tuple[np.ndarray, np.ndarray, np.ndarray, Coverage] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Generate test arrays in chunks of at most ``chunk_size`` test cases.
+
+    Yields the same arrays as :func:`generate_test_arrays` (plus the ``start`` index of the
+    chunk), so memory stays bounded by the chunk size rather than by ``num_tests``. The
+    uniformly random test cases are sampled into the coverage of ``directed``.
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
 
-    # Add custom filter for binary formatting
-    def format_binary(value, width):
-        return format((1 << width) + value if value < 0 else value, f"0{width}b")
+    if chunk_size is None:
+        chunk_size = max(1, CHUNK_ELEMENTS // (n * out_n))
 
-    # Create template with the filter
-    template = Template(
-        """// Auto-generated test cases for {{ module_name }}
-// DATA_WIDTH={{ data_width }}, ACC_WIDTH={{ acc_width }}, N={{ n }}, OUT_N={{ out_n }}, NUM_TESTS={{ num_tests }}
-// THIS IS A HEADER FILE - DO NOT ATTEMPT TO COMPILE DIRECTLY
+    x, w, b, coverage = directed or draw_directed_vectors(data_width, n, out_n, num_tests, seed)
+    if len(x):
+        yield {"start": 0, "x": x, "w": w, "b": b, **golden_model(x, w, b, data_width)}
 
-`ifndef {{ module_name.upper() }}_TESTCASES_SVH
-`define {{ module_name.upper() }}_TESTCASES_SVH
+    for start in range(len(x), num_tests, chunk_size):
+        count = min(chunk_size, num_tests - start)
+        x, w, b = draw_test_vectors(data_width, n, out_n, count)
+        arrays = golden_model(x, w, b, data_width)
+        coverage.sample(arrays["dot_products"] + b, x[:, None], w.transpose(0, 2, 1))
+        yield {"start": start, "x": x, "w": w, "b": b, **arrays}
 
-localparam int NUM_{{ module_name.upper() }}_TEST = {{ num_tests }};
 
-// Test vectors
-logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_x[NUM_{{ module_name.upper() }}_TEST][{{ n }}];
-logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_w[NUM_{{ module_name.upper() }}_TEST][{{ n }}][{{ out_n }}];
-logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_b[NUM_{{ module_name.upper() }}_TEST][{{ out_n }}];
-logic signed [{{ data_width-1 }}:0] {{ module_name }}_test_expected[NUM_{{ module_name.upper() }}_TEST][{{ out_n }}];
+def generate_test_cases(
+    module_name: str,
+    data_width: int,
+    n: int,
+    out_n: int,
+    num_tests: int,
+    seed: int | None = None,
+) -> list[dict[str, Any]]:
+    """Generate test cases for a module."""
+    arrays = generate_test_arrays(data_width, n, out_n, num_tests, seed)
+    columns = {key: value.tolist() for key, value in arrays.items()}
+
+    return [
+        {
+            "x": columns["x"][i],
+            "w": columns["w"][i],
+            "b": columns["b"][i],
+            "dot_products": columns["dot_products"][i],
+            "pre": columns["pre"][i],
+            "expected": columns["expected"][i],
+            "name": f"random_{i + 1}",
+        }
+        for i in range(num_tests)
+    ]
+
+
+def format_binary_array(values: np.ndarray, width: int) -> np.ndarray:
+    """Format signed integers as two's complement binary strings of ``width`` digits.
+
+    Works on whole arrays at once and returns an array of ``str`` with the input's shape.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    unsigned = (values & ((1 << width) - 1)).astype(np.uint64)
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    digits = ((unsigned[..., None] >> shifts) & 1).astype(np.uint8) + ord("0")
+    return np.ascontiguousarray(digits).view(f"S{width}")[..., 0].astype(f"U{width}")
 
-// Initialize test cases
-function void init_{{ module_name }}_test_cases();
-{% for i, test in enumerate(test_cases) %}
-  // Test case {{ i }}: {{ test.name }}
-  {% for j in range(n) %}
-  {{ module_name }}_test_x[{{ i }}][{{ j }}] = {{ data_width }}'b{{ test.x[j]|format_binary(data_width) }};
-  {% endfor %}
-  {% for j in range(n) %}
-    {% for k in range(out_n) %}
-  {{ module_name }}_test_w[{{ i }}][{{ j }}][{{ k }}] = {{ data_width }}'b{{ test.w[j][k]|format_binary(data_width) }};
-    {% endfor %}
-  {% endfor %}
-  {% for k in range(out_n) %}
-  {{ module_name }}_test_b[{{ i }}][{{ k }}] = {{ data_width }}'b{{ test.b[k]|format_binary(data_width) }};
-  {% endfor %}
-  {% for k in range(out_n) %}
-  {{ module_name }}_test_expected[{{ i }}][{{ k }}] = {{ data_width }}'b{{ test.expected[k]|format_binary(data_width) }};
-  {% endfor %}
-  // Test case {{ i }} computation details:
-  {% for k in range(out_n) %}
-  // Output {{ k }}: dot_product={{ test.dot_products[k] }}, pre_activation={{ test.pre }}, post_activation={{ test.expected[k] }}
-  {% endfor %}
-{% endfor %}
-endfunction
 
-`endif // {{ module_name.upper() }}_TESTCASES_SVH
-"""
+def iter_test_cases_svh(
+    chunks: Iterable[dict[str, Any]],
+    module_name: str,
+    data_width: int,
+    n: int,
+    out_n: int,
+    num_tests: int,
+) -> Iterator[str]:
+    """Render the test case header as a stream of text chunks, one per chunk of test cases."""
+    upper = module_name.upper()
+    yield HEADER_TEMPLATE.render(
+        module_name=module_name,
+        data_width=data_width,
+        acc_width=data_width * 2 + math.ceil(math.log2(n)),
+        n=n,
+        out_n=out_n,
+        num_tests=num_tests,
     )
 
-    # Register the filter with the template
-    template.globals["format_binary"] = format_binary
+    literal = f"] = {data_width}'b"
+    x_tails = [f"][{j}{literal}" for j in range(n)]
+    w_tails = [f"][{j}][{k}{literal}" for j in range(n) for k in range(out_n)]
+    k_tails = [f"][{k}{literal}" for k in range(out_n)]
+
+    for chunk in chunks:
+        x_bin = format_binary_array(chunk["x"], data_width).tolist()
+        w_bin = format_binary_array(chunk["w"].reshape(len(chunk["w"]), -1), data_width).tolist()
+        b_bin = format_binary_array(chunk["b"], data_width).tolist()
+        expected_bin = format_binary_array(chunk["expected"], data_width).tolist()
+        dot_products = chunk["dot_products"].tolist()
+        pre = chunk["pre"].tolist()
+        expected = chunk["expected"].tolist()
+
+        lines: list[str] = []
+        for t in range(len(x_bin)):
+            i = chunk["start"] + t
+            lines.append(f"  // Test case {i}: random_{i + 1}\n")
+            prefix = f"  {module_name}_test_x[{i}"
+            lines.extend(f"{prefix}{tail}{bits};\n" for tail, bits in zip(x_tails, x_bin[t]))
+            prefix = f"  {module_name}_test_w[{i}"
+            lines.extend(f"{prefix}{tail}{bits};\n" for tail, bits in zip(w_tails, w_bin[t]))
+            prefix = f"  {module_name}_test_b[{i}"
+            lines.extend(f"{prefix}{tail}{bits};\n" for tail, bits in zip(k_tails, b_bin[t]))
+            prefix = f"  {module_name}_test_expected[{i}"
+            lines.extend(f"{prefix}{tail}{bits};\n" for tail, bits in zip(k_tails, expected_bin[t]))
+            lines.append(f"  // Test case {i} computation details:\n")
+            lines.extend(
+                f"  // Output {k}: dot_product={dot_products[t][k]}, pre_activation={pre[t][k]}, "
+                f"post_activation={expected[t][k]}\n"
+                for k in range(out_n)
+            )
+        yield "".join(lines)
+
+    yield f"endfunction\n\n`endif // {upper}_TESTCASES_SVH\n"
+
 
+def write_test_cases_svh(
+    chunks: Iterable[dict[str, Any]],
+    module_name: str,
+    data_width: int,
+    n: int,
+    out_n: int,
+    num_tests: int,
+    output_file: str,
+):
+    """Write test cases to SystemVerilog header file, streaming one chunk at a time."""
     output_path = Path(output_file)
     output_path.parent.mkdir(exist_ok=True, parents=True)
 
     with open(output_path, "w") as f:
-        f.write(
-            template.render(
-                module_name=module_name,
-                data_width=data_width,
-                acc_width=data_width * 2 + math.ceil(math.log2(n)),
-                n=n,
-                out_n=out_n,
-                num_tests=len(test_cases),
-                test_cases=test_cases,
-            )
-        )
+        for text in iter_test_cases_svh(chunks, module_name, data_width, n, out_n, num_tests):
+            f.write(text)
+
+
+def pack_hex_rows(values: np.ndarray, width: int) -> np.ndarray:
+    """Pack each row of signed integers into one hexadecimal string for ``$readmemh``.
+
+    Element ``j`` of a row occupies bits ``[j*width +: width]`` of the packed word, matching
+    the ``x[i*DATA_WIDTH+:DATA_WIDTH]`` slicing used by the RTL. Returns an array of ``str``
+    with one entry per row.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    rows = values.shape[0]
+    unsigned = (values & ((1 << width) - 1)).astype(np.uint64)
+    bits = ((unsigned[..., None] >> np.arange(width, dtype=np.uint64)) & 1).astype(np.uint8).reshape(rows, -1)
+    num_digits = max(1, -(-bits.shape[1] // 4))
+    bits = np.pad(bits, ((0, 0), (0, num_digits * 4 - bits.shape[1])))
+    nibbles = bits.reshape(rows, num_digits, 4) @ np.array([1, 2, 4, 8], dtype=np.uint8)
+    digits = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)[nibbles[:, ::-1]]
+    return np.ascontiguousarray(digits).view(f"S{num_digits}")[:, 0].astype(f"U{num_digits}")
+
+
+def write_test_cases_mem(
+    chunks: Iterable[dict[str, Any]],
+    module_name: str,
+    data_width: int,
+    n: int,
+    out_n: int,
+    num_tests: int,
+    output_dir: str,
+) -> list[Path]:
+    """Write test cases as ``$readmemh`` vector files with matching ``.npy`` sidecars.
+
+    Each ``<module>_<name>.mem`` file holds one packed word per test case, laid out exactly
+    like the corresponding ``Layer`` port (``in_vec``, ``weights``, ``biases``, ``out_vec``).
+    ``<module>_num_tests.mem`` holds the number of test cases, so the testbench picks up a
+    new vector count without being recompiled. The ``.npy`` files hold the unpacked arrays
+    and can be opened with ``np.load(..., mmap_mode="r")``.
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(exist_ok=True, parents=True)
+
+    shapes = {
+        "x": (num_tests, n),
+        "w": (num_tests, n, out_n),
+        "b": (num_tests, out_n),
+        "expected": (num_tests, out_n),
+    }
+    mem_files = {name: output_path / f"{module_name}_{name}.mem" for name in shapes}
+    npy_files = {name: output_path / f"{module_name}_{name}.npy" for name in shapes}
+    arrays = {
+        name: np.lib.format.open_memmap(npy_files[name], mode="w+", dtype=np.int64, shape=shape)
+        for name, shape in shapes.items()
+    }
+
+    handles = {name: open(path, "w") for name, path in mem_files.items()}
+    try:
+        for chunk in chunks:
+            rows = slice(chunk["start"], chunk["start"] + len(chunk["x"]))
+            # Weights are packed per output neuron: element (j, k) lands at (k*N + j)*DATA_WIDTH
+            packed = {
+                "x": chunk["x"],
+                "w": chunk["w"].transpose(0, 2, 1).reshape(len(chunk["w"]), -1),
+                "b": chunk["b"],
+                "expected": chunk["expected"],
+            }
+            for name, handle in handles.items():
+                arrays[name][rows] = chunk[name]
+                handle.write("\n".join(pack_hex_rows(packed[name], data_width).tolist()) + "\n")
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    for array in arrays.values():
+        array.flush()
+
+    count_file = output_path / f"{module_name}_num_tests.mem"
+    count_file.write_text(f"{num_tests:08x}\n")
 
+    return [count_file, *mem_files.values(), *npy_files.values()]
 
-def write_testbench_sv(module_name: str, data_width: int, n: int, out_n: int, output_file: str):
-    """Write testbench SystemVerilog file."""
+
+def write_testbench_sv(
+    module_name: str,
+    data_width: int,
+    n: int,
+    out_n: int,
+    output_file: str,
+    output_format: str = "svh",
+    vector_dir: str = "include",
+    max_tests: int = 0,
+):
+    """Write testbench SystemVerilog file.
+
+    With ``output_format="mem"`` the testbench loads its vectors at runtime with ``$readmemh``
+    from ``vector_dir`` (overridable with ``+VECTOR_DIR=<dir>``) into memories holding up to
+    ``max_tests`` test cases, instead of including the generated SVH header.
+    """
     template = Template(
         """`timescale 1ns / 1ps
 `include "../include/width.svh"
+{% if output_format == "svh" %}
 `include "../include/{{ module_name }}_testcases.svh"
+{% endif %}
 
 // Function to get layer size must be defined before the module
 function automatic int get_layer_size(int idx);
@@ -201,6 +405,24 @@ module tb_{{ module_name }} ();
   localparam CLK_PERIOD = 10;  // Clock period in ns (100MHz clock)
   localparam PIPELINE_STAGES = 2;  // Number of pipeline stages in the Perceptron
   localparam OUT_N = get_layer_size(1);  // Get LAYER_SIZES[1]
+{% if output_format == "mem" %}
+  localparam MAX_TESTS = {{ max_tests }};  // Capacity of the vector memories
+
+  // Test vectors, loaded at runtime with $readmemh (one packed word per test case)
+  logic        [        `N * `DATA_WIDTH - 1 : 0] test_x                [MAX_TESTS];
+  logic        [OUT_N * `N * `DATA_WIDTH - 1 : 0] test_w                [MAX_TESTS];
+  logic        [    OUT_N * `DATA_WIDTH - 1 : 0] test_b                [MAX_TESTS];
+  logic        [    OUT_N * `DATA_WIDTH - 1 : 0] test_expected         [MAX_TESTS];
+  logic        [                          31 : 0] num_tests             [1];
+  string vector_dir;
+
+  // Declare test bench input/output signals
+  logic sCLK, sRST_N;
+  logic signed [        `N * `DATA_WIDTH - 1 : 0] sX;  // Packed vectors
+  logic signed [OUT_N * `N * `DATA_WIDTH - 1 : 0] sW;  // Packed vectors
+  logic signed [OUT_N * `DATA_WIDTH - 1 : 0] sB, sY;  // Packed vectors
+  logic signed [OUT_N * `DATA_WIDTH - 1 : 0] sY_expected;  // Packed vectors
+{% else %}
 
   // Declare test bench input/output signals
   logic sCLK, sRST_N;
@@ -235,6 +457,7 @@ module tb_{{ module_name }} ();
       sB[i*`DATA_WIDTH+:`DATA_WIDTH] = sB_arr[i];
     end
   end
+{% endif %}
 
   // Instantiate the module
   {{ module_name }} #(
@@ -251,6 +474,11 @@ module tb_{{ module_name }} ();
     .out_vec(sY)
   );
 
+  // Waveform dump controls, set from the plusargs at the end of the module
+  bit    dump_waves;
+  int    wave_from, wave_to;
+  string wave_file;
+
   // Clock generation
   initial begin
     sCLK = 1'b1;  // Start simulation with positive edge
@@ -262,13 +490,32 @@ module tb_{{ module_name }} ();
     // Initialize signals
     sCLK   = 1'b0;
     sRST_N = 1'b0;
+{% if output_format == "mem" %}
+    if (!$value$plusargs("VECTOR_DIR=%s", vector_dir)) vector_dir = "{{ vector_dir }}";
+    $readmemh({vector_dir, "/{{ module_name }}_num_tests.mem"}, num_tests);
+    if ($isunknown(num_tests[0])) $fatal(1, "No test vectors found in %s", vector_dir);
+    if (num_tests[0] > MAX_TESTS) $fatal(1, "%0d test cases exceed MAX_TESTS=%0d", num_tests[0], MAX_TESTS);
+    $readmemh({vector_dir, "/{{ module_name }}_x.mem"}, test_x, 0, num_tests[0] - 1);
+    $readmemh({vector_dir, "/{{ module_name }}_w.mem"}, test_w, 0, num_tests[0] - 1);
+    $readmemh({vector_dir, "/{{ module_name }}_b.mem"}, test_b, 0, num_tests[0] - 1);
+    $readmemh({vector_dir, "/{{ module_name }}_expected.mem"}, test_expected, 0, num_tests[0] - 1);
+{% else %}
     init_{{ module_name }}_test_cases();
+{% endif %}
 
     // Reset for a few clock cycles
     @(posedge sCLK);
     sRST_N = 1'b1;  // Release reset
 
     // Run through all test cases
+{% if output_format == "mem" %}
+    for (int i = 0; i < num_tests[0]; i++) begin
+      // Load packed test vectors
+      sX          = test_x[i];
+      sW          = test_w[i];
+      sB          = test_b[i];
+      sY_expected = test_expected[i];
+{% else %}
     for (int i = 0; i < NUM_{{ module_name.upper() }}_TEST; i++) begin
       // Load test vectors
       for (int j = 0; j < `N; j++) begin
@@ -281,6 +528,11 @@ module tb_{{ module_name }} ();
         sB_arr[j]                               = {{ module_name }}_test_b[i][j];
         sY_expected[j*`DATA_WIDTH+:`DATA_WIDTH] = {{ module_name }}_test_expected[i][j];
       end
+{% endif %}
+
+      // Only dump the requested window of test cases (Verilator ignores $dumpoff and dumps to the end)
+      if (dump_waves && wave_from > 0 && i == wave_from) $dumpvars(0, tb_{{ module_name }});
+      if (dump_waves && wave_to >= 0 && i == wave_to + 1) $dumpoff;
 
       // Wait for clock edge and check results
       for (int stage = 0; stage < PIPELINE_STAGES; stage++) begin
@@ -305,20 +557,36 @@ module tb_{{ module_name }} ();
     $finish();  // Terminate simulation
   end
 
-  // Waveform dump
+  // Waveform dump, off unless +WAVES is given; +WAVE_FROM=/+WAVE_TO= limit it to a window of test cases
   initial begin
-    $dumpfile("tb_{{ module_name }}.vcd");
-    $dumpvars(0, tb_{{ module_name }});
+    dump_waves = $test$plusargs("WAVES");
+    if (!$value$plusargs("WAVE_FROM=%d", wave_from)) wave_from = 0;
+    if (!$value$plusargs("WAVE_TO=%d", wave_to)) wave_to = -1;  // Up to the last test case
+    if (!$value$plusargs("WAVE_FILE=%s", wave_file)) wave_file = "tb_{{ module_name }}.vcd";
+    if (dump_waves) $dumpfile(wave_file);
+    if (dump_waves && wave_from == 0) $dumpvars(0, tb_{{ module_name }});
   end
 endmodule
-"""
+""",
+        trim_blocks=True,
+        lstrip_blocks=True,
     )
 
     output_path = Path(output_file)
     output_path.parent.mkdir(exist_ok=True, parents=True)
 
     with open(output_path, "w") as f:
-        f.write(template.render(module_name=module_name, data_width=data_width, n=n, out_n=out_n))
+        f.write(
+            template.render(
+                module_name=module_name,
+                data_width=data_width,
+                n=n,
+                out_n=out_n,
+                output_format=output_format,
+                vector_dir=vector_dir,
+                max_tests=max_tests,
+            )
+        )
 
 
 @app.command()
@@ -326,36 +594,65 @@ def generate(
     data_width: int = typer.Option(8, help="Bit width of input vectors and weights"),
     n: int = typer.Option(4, help="Input vector dimensionality"),
     out_n: int = typer.Option(4, help="Output vector dimensionality"),
-    num_tests: int = typer.Option(10, help="Number of test cases to generate"),
+    num_tests: int = typer.Option(100, help="Maximum number of test cases (exact with --no-until-covered)"),
     output_dir: str = typer.Option("include", help="Output directory for test cases"),
     tb_dir: str = typer.Option("tb", help="Output directory for testbench"),
     seed: int | None = typer.Option(None, help="Seed for RNG reproducibility"),
+    output_format: OutputFormat = typer.Option(OutputFormat.svh, "--format", help="Test case output format"),
+    max_tests: int = typer.Option(1 << 16, help="Vector memory capacity of the testbench (mem format only)"),
+    until_covered: bool = typer.Option(
+        True, help="Stop once every coverage bin is hit (num_tests is the limit) instead of filling up randomly"
+    ),
+    min_tests: int = typer.Option(32, help="Uniformly random test cases fill up to this many after coverage closes"),
 ):
     """
     Generate testbench and test cases for the KiwiNPU module.
     """
     module_name = "kiwinpu"  # Set default module name
 
-    # Generate test cases
-    test_cases = generate_test_cases(
-        module_name=module_name,
+    # The directed test cases are drawn up front to size the run, then written first
+    directed = draw_directed_vectors(data_width, n, out_n, num_tests, seed)
+    num_directed, coverage = len(directed[0]), directed[3]
+    print(f"{num_directed} coverage-directed test cases: {coverage.summary()}")
+    if until_covered:
+        num_tests = min(num_tests, max(num_directed, min_tests))
+
+    # Generate test cases lazily, one chunk at a time
+    chunks = iter_test_chunks(
         data_width=data_width,
         n=n,
         out_n=out_n,
         num_tests=num_tests,
         seed=seed,
+        directed=directed,
     )
 
-    # Write test cases to SVH file
-    test_cases_file = os.path.join(output_dir, f"{module_name}_testcases.svh")
-    write_test_cases_svh(
-        test_cases=test_cases,
-        module_name=module_name,
-        data_width=data_width,
-        n=n,
-        out_n=out_n,
-        output_file=test_cases_file,
-    )
+    if output_format == OutputFormat.mem:
+        if num_tests > max_tests:
+            raise typer.BadParameter(f"{num_tests} test cases exceed --max-tests={max_tests}")
+
+        # Stream test cases to $readmemh vector files and .npy sidecars
+        vector_files = write_test_cases_mem(
+            chunks=chunks,
+            module_name=module_name,
+            data_width=data_width,
+            n=n,
+            out_n=out_n,
+            num_tests=num_tests,
+            output_dir=output_dir,
+        )
+    else:
+        # Stream test cases to SVH file
+        test_cases_file = os.path.join(output_dir, f"{module_name}_testcases.svh")
+        write_test_cases_svh(
+            chunks=chunks,
+            module_name=module_name,
+            data_width=data_width,
+            n=n,
+            out_n=out_n,
+            num_tests=num_tests,
+            output_file=test_cases_file,
+        )
 
     # Write testbench to SV file
     testbench_file = os.path.join(tb_dir, f"tb_{module_name}.sv")
@@ -365,14 +662,25 @@ def generate(
         n=n,
         out_n=out_n,
         output_file=testbench_file,
+        output_format=output_format.value,
+        vector_dir=output_dir,
+        max_tests=max_tests,
     )
 
     print(f"Successfully generated testbench and test cases for {module_name}")
-    print(f"Test cases file: {test_cases_file}")
-    print(f"Testbench file: {testbench_file}")
-    print("\nAdd the following to your testbench to use these test cases:")
-    print(f'  `include "{test_cases_file}"')
-    print(f"  // And call init_{module_name}_test_cases() in your initial block")
+    print(f"Coverage of all {num_tests} test cases: {coverage.summary()}")
+    if output_format == OutputFormat.mem:
+        print(f"Vector files: {', '.join(str(path) for path in vector_files)}")
+        print(f"Testbench file: {testbench_file}")
+        print("\nThe testbench loads the vectors at runtime with $readmemh; override their location with")
+        print(f"  +VECTOR_DIR=<dir>  (up to {max_tests} test cases without recompiling)")
+    else:
+        print(f"Test cases file: {test_cases_file}")
+        print(f"Testbench file: {testbench_file}")
+        print("\nAdd the following to your testbench to use these test cases:")
+        print(f'  `include "{test_cases_file}"')
+        print(f"  // And call init_{module_name}_test_cases() in your initial block")
+    print("\nWaveforms are only dumped with +WAVES (+WAVE_FROM=/+WAVE_TO= select a window, +WAVE_FILE= the file)")
 
 
 if __name__ == "__main__":
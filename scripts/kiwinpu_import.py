@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "torch>=2.9.1",
+#     "torchao>=0.14.1",
+# ]
+# ///
+"""Quantize an ``nn.Sequential`` of ``Linear``+``ReLU`` layers into KiwiNPU weight/bias images.
+
+KiwiNPU computes ``relu(clamp(x @ W.T + b))`` on DATA_WIDTH integers in every layer and never
+rescales between layers, so the integer output of a layer is the input of the next one as is.
+Layer ``j`` therefore works at scale ``s_j = s_{j-1} * s_w[j]``, where ``s_0`` is the input scale.
+Weights are quantized per tensor with torchao's symmetric affine primitives; the weight scale
+is widened when needed so that the largest positive pre-activation of the calibration batch
+still fits in DATA_WIDTH bits (negative ones are zeroed by the ReLU either way). Biases are
+quantized at the output scale of their layer. Since every layer spends the precision of its
+input and weights on one DATA_WIDTH result, the input and weight scales are then coarsened by
+a coordinate-descent search that minimizes the output error on the calibration batch.
+
+The tool writes to ``--output-dir``:
+
+- ``width.svh``: ``DATA_WIDTH``/``NUM_LAYERS``/``LAYER_SIZES`` defines of the model.
+- ``weights_flat.bin``/``biases_flat.bin``: raw little-endian images, byte 0 holding bits
+  ``[7:0]`` of the ``weights_flat``/``biases_flat`` ports.
+- ``weights_flat.mem``/``biases_flat.mem``: the same images as one ``$readmemh`` word each.
+- ``flash.bin``: both images, each padded to whole 32-bit words, as ``KiwiNPUFlash`` loads them from flash.
+- ``layers.npz``: the quantized integer weights ``w<j>`` and biases ``b<j>`` of every layer.
+- ``model.json``: layer sizes, scales and the accuracy report.
+"""
+
+import itertools
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+import typer
+from torch import nn
+from torchao.quantization.quant_primitives import MappingType, choose_qparams_affine, quantize_affine
+
+app = typer.Typer()
+
+# Supported quantization widths (QUANT_INT* in include/width.svh) and the torch dtypes holding them
+QUANT_DTYPES = {4: torch.int8, 8: torch.int8, 16: torch.int16}
+# Little-endian NumPy dtypes whose raw bytes are already the packed image
+IMAGE_DTYPES = {4: "<i1", 8: "<i1", 16: "<i2"}
+
+HEADER = """`ifndef WIDTH_SVH
+`define WIDTH_SVH
+
+// Generated by scripts/kiwinpu_import.py from {source}
+// Input scale {input_scale:.6g}, output scale {output_scale:.6g}
+
+// Supported quantization widths
+`define QUANT_INT4 4 // 4-bit integer quantization
+`define QUANT_INT8 8 // 8-bit integer quantization
+`define QUANT_INT16 16 // 16-bit integer quantization
+
+// Bit-width for quantized data (e.g. INT8)
+`define DATA_WIDTH {data_width}
+
+// Define number of layers
+`define NUM_LAYERS {num_layers}
+
+// Define layer sizes
+`define LAYER_SIZES {{{layer_sizes}}}
+
+// Define number of inputs
+`define N {n}
+
+// Bit-width for the accumulator
+`define ACC_WIDTH (`DATA_WIDTH*2 + $clog2(`N))
+
+`endif  // WIDTH_SVH
+"""
+
+
+def linear_layers(model: nn.Sequential) -> list[nn.Linear]:
+    """Return the ``Linear`` layers of ``model``, checking that it maps onto KiwiNPU layers."""
+    modules = list(model)
+    layers = []
+    for i, module in enumerate(modules):
+        if isinstance(module, nn.Linear):
+            layers.append(module)
+            followed_by_relu = i + 1 < len(modules) and isinstance(modules[i + 1], nn.ReLU)
+            if not followed_by_relu and i + 1 < len(modules):
+                raise typer.BadParameter(f"Layer {i} ({module}) must be followed by a ReLU")
+        elif not isinstance(module, nn.ReLU):
+            raise typer.BadParameter(f"Layer {i} ({module}) is neither Linear nor ReLU")
+    if not layers:
+        raise typer.BadParameter("The model has no Linear layer")
+    for previous, layer in itertools.pairwise(layers):
+        if previous.out_features != layer.in_features:
+            raise typer.BadParameter(f"{previous} feeds {layer}: sizes do not chain")
+    if not isinstance(modules[-1], nn.ReLU):
+        print("Note: KiwiNPU applies a ReLU after the last Linear layer as well; negative outputs read as 0")
+    return layers
+
+
+def quantize(
+    layers: list[nn.Linear], x: torch.Tensor, data_width: int, multipliers: list[float]
+) -> tuple[float, list[dict[str, torch.Tensor | float]]]:
+    """Quantize the layers for inputs like ``x`` and return the input scale with the integer layers.
+
+    ``multipliers[0]`` coarsens the input scale and ``multipliers[j]`` the weight scale of layer
+    ``j`` beyond the smallest scale that avoids clipping, trading precision in one layer for
+    headroom in the next.
+    """
+    dtype = QUANT_DTYPES[data_width]
+    qmin, qmax = -(1 << (data_width - 1)), (1 << (data_width - 1)) - 1
+    zero_point = torch.zeros(1, dtype=torch.int32)
+
+    input_scale, _ = choose_qparams_affine(x, MappingType.SYMMETRIC, x.shape, dtype, qmin, qmax)
+    input_scale = input_scale * multipliers[0]
+    scale = input_scale
+    activations = x
+    quantized = []
+    with torch.no_grad():
+        for layer, multiplier in zip(layers, multipliers[1:], strict=True):
+            weight = layer.weight.detach().float()
+            bias = layer.bias.detach().float() if layer.bias is not None else torch.zeros(layer.out_features)
+            pre_activation = layer(activations)
+
+            weight_scale, _ = choose_qparams_affine(weight, MappingType.SYMMETRIC, weight.shape, dtype, qmin, qmax)
+            # Without requantization the pre-activation must fit in DATA_WIDTH bits at scale * weight_scale
+            weight_scale = torch.maximum(weight_scale, pre_activation.max().clamp(min=0) / (scale * qmax)) * multiplier
+            scale = scale * weight_scale
+
+            quantized.append(
+                {
+                    "weight": quantize_affine(weight, weight.shape, weight_scale, zero_point, dtype, qmin, qmax),
+                    "bias": quantize_affine(bias, bias.shape, scale, zero_point, dtype, qmin, qmax),
+                    "weight_scale": weight_scale.item(),
+                    "scale": scale.item(),
+                    "clipped_biases": int((torch.round(bias / scale).abs() > qmax).sum()),
+                }
+            )
+            activations = torch.relu(pre_activation)
+    return input_scale.item(), quantized
+
+
+def calibrate(
+    layers: list[nn.Linear], x: torch.Tensor, reference: np.ndarray, data_width: int, rounds: int
+) -> tuple[float, list[dict[str, torch.Tensor | float]]]:
+    """Pick the scale multipliers minimizing the output error on ``x`` by coordinate descent.
+
+    Each multiplier is searched over powers of ``sqrt(2)`` up to ``2**data_width``, one at a
+    time, keeping the others fixed.
+    """
+    grid = [2 ** (k / 2) for k in range(2 * data_width + 1)]
+    multipliers = [1.0] * (len(layers) + 1)
+
+    def error(candidate: list[float]) -> float:
+        input_scale, quantized = quantize(layers, x, data_width, candidate)
+        approximation = integer_model(quantize_input(x, input_scale, data_width), quantized, data_width)
+        return float(np.linalg.norm(approximation * quantized[-1]["scale"] - reference))
+
+    best = error(multipliers)
+    for _ in range(rounds):
+        for i in range(len(multipliers)):
+            for value in grid:
+                candidate = [*multipliers[:i], value, *multipliers[i + 1 :]]
+                candidate_error = error(candidate)
+                if candidate_error < best:
+                    best, multipliers = candidate_error, candidate
+    return quantize(layers, x, data_width, multipliers)
+
+
+def quantize_input(x: torch.Tensor, input_scale: float, data_width: int) -> np.ndarray:
+    """Quantize float inputs to the DATA_WIDTH integers driven on ``in_vec``."""
+    qmin, qmax = -(1 << (data_width - 1)), (1 << (data_width - 1)) - 1
+    return np.clip(np.round(x.numpy() / input_scale), qmin, qmax).astype(np.int64)
+
+
+def pack_image(tensors: list[torch.Tensor], data_width: int) -> np.ndarray:
+    """Concatenate the flattened tensors into one packed little-endian byte image.
+
+    Layer ``j`` starts at element ``weight_offset(j) / DATA_WIDTH`` (``bias_offset`` for
+    biases) and a row-major ``(OUT_N, IN_N)`` weight matrix is already in the order of
+    ``Layer``'s ``weights[i*IN_N*DATA_WIDTH+:IN_N*DATA_WIDTH]`` slices, so the image is the
+    concatenation of the flattened layers. For 8 and 16 bits the element buffer is the image
+    itself, returned as a ``uint8`` view without copying; 4-bit elements are paired into bytes.
+    """
+    flat = np.empty(sum(t.numel() for t in tensors), dtype=IMAGE_DTYPES[data_width])
+    offset = 0
+    for tensor in tensors:
+        # Tensor.numpy() shares the tensor's memory, so this is the only copy of the elements
+        flat[offset : offset + tensor.numel()] = tensor.reshape(-1).numpy()
+        offset += tensor.numel()
+    if data_width != 4:
+        return flat.view(np.uint8)
+
+    nibbles = flat.view(np.uint8) & 0x0F
+    if len(nibbles) % 2:
+        nibbles = np.append(nibbles, np.uint8(0))
+    return nibbles[0::2] | (nibbles[1::2] << 4)
+
+
+def write_mem(path: Path, image: np.ndarray) -> None:
+    """Write an image as a single ``$readmemh`` word, most significant byte first."""
+    path.write_text(image[::-1].tobytes().hex() + "\n")
+
+
+def pad_words(image: np.ndarray) -> np.ndarray:
+    """Pad a ``uint8`` image with zero bytes to a whole number of 32-bit flash words."""
+    return np.pad(image, (0, -len(image) % 4))
+
+
+def integer_model(x: np.ndarray, quantized: list[dict], data_width: int) -> np.ndarray:
+    """Bit-accurate KiwiNPU model: ``relu(clamp(x @ W.T + b))`` for every layer, in int64."""
+    qmin, qmax = -(1 << (data_width - 1)), (1 << (data_width - 1)) - 1
+    for layer in quantized:
+        weight = layer["weight"].numpy().astype(np.int64)
+        bias = layer["bias"].numpy().astype(np.int64)
+        x = np.maximum(np.clip(x @ weight.T + bias, qmin, qmax), 0)
+    return x
+
+
+def accuracy_report(reference: np.ndarray, approximation: np.ndarray) -> dict[str, float]:
+    """Compare the dequantized NPU outputs with the float model outputs."""
+    error = np.abs(approximation - reference)
+    report = {
+        "max_abs_error": float(error.max()),
+        "mean_abs_error": float(error.mean()),
+        "relative_error": float(np.linalg.norm(approximation - reference) / max(np.linalg.norm(reference), 1e-12)),
+    }
+    if reference.shape[1] > 1:
+        report["top1_agreement"] = float((approximation.argmax(axis=1) == reference.argmax(axis=1)).mean())
+    return report
+
+
+def demo_model(layer_sizes: list[int], seed: int) -> nn.Sequential:
+    """Build a randomly initialized ``Linear``+``ReLU`` stack with the given layer sizes."""
+    torch.manual_seed(seed)
+    modules = []
+    for in_features, out_features in itertools.pairwise(layer_sizes):
+        modules += [nn.Linear(in_features, out_features), nn.ReLU()]
+    return nn.Sequential(*modules)
+
+
+@app.command()
+def import_model(
+    model: str = typer.Option("", help="Path of a torch.save()'d nn.Sequential; a random demo model when empty"),
+    layer_sizes: str = typer.Option("4,8,4", help="Layer sizes of the demo model, layer 0 being the input"),
+    data_width: int = typer.Option(8, help="Quantization width (4, 8 or 16)"),
+    calibration: str = typer.Option("", help="Path of a .pt or .npy input batch; uniform [-1, 1) inputs when empty"),
+    batch_size: int = typer.Option(1024, help="Size of the random calibration batch"),
+    rounds: int = typer.Option(2, help="Coordinate-descent rounds of the scale calibration (0 to skip it)"),
+    seed: int = typer.Option(0, help="Seed of the demo model and the random calibration batch"),
+    output_dir: str = typer.Option("sim_build/model", help="Directory for the images, header and report"),
+    header: str = typer.Option("", help="Path of the generated defines; <output-dir>/width.svh when empty"),
+):
+    """
+    Quantize a Linear+ReLU model to DATA_WIDTH and write its KiwiNPU weight/bias images and defines.
+    """
+    if data_width not in QUANT_DTYPES:
+        raise typer.BadParameter(f"DATA_WIDTH must be one of {', '.join(map(str, QUANT_DTYPES))}")
+
+    if model:
+        net = torch.load(model, weights_only=False)
+        if not isinstance(net, nn.Sequential):
+            raise typer.BadParameter(f"{model} holds a {type(net).__name__}, not an nn.Sequential")
+    else:
+        net = demo_model([int(size) for size in layer_sizes.split(",")], seed)
+    net = net.float().eval()
+    layers = linear_layers(net)
+    sizes = [layers[0].in_features] + [layer.out_features for layer in layers]
+    if max(sizes) > 255:
+        raise typer.BadParameter(f"Layer sizes {sizes} do not fit the 8-bit LAYER_SIZES fields")
+
+    if calibration.endswith(".npy"):
+        x = torch.from_numpy(np.load(calibration)).float()
+    elif calibration:
+        x = torch.load(calibration).float()
+    else:
+        x = torch.rand(batch_size, sizes[0], generator=torch.Generator().manual_seed(seed)) * 2 - 1
+
+    with torch.no_grad():
+        reference = torch.relu(net(x)).numpy()
+    input_scale, quantized = calibrate(layers, x, reference, data_width, rounds)
+
+    start = time.perf_counter()
+    weights_image = pack_image([layer["weight"] for layer in quantized], data_width)
+    biases_image = pack_image([layer["bias"] for layer in quantized], data_width)
+    pack_time = time.perf_counter() - start
+
+    # Accuracy of the integer datapath against the float model on the calibration batch
+    output_scale = quantized[-1]["scale"]
+    x_int = quantize_input(x, input_scale, data_width)
+    accuracy = accuracy_report(reference, integer_model(x_int, quantized, data_width) * output_scale)
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    header_path = Path(header) if header else output_path / "width.svh"
+    header_path.write_text(
+        HEADER.format(
+            source=model or f"a random {layer_sizes} demo model",
+            input_scale=input_scale,
+            output_scale=output_scale,
+            data_width=data_width,
+            num_layers=len(sizes),
+            layer_sizes=", ".join(f"8'd{size}" for size in sizes),
+            n=sizes[0],
+        )
+    )
+    weights_image.tofile(output_path / "weights_flat.bin")
+    biases_image.tofile(output_path / "biases_flat.bin")
+    write_mem(output_path / "weights_flat.mem", weights_image)
+    write_mem(output_path / "biases_flat.mem", biases_image)
+    np.concatenate([pad_words(weights_image), pad_words(biases_image)]).tofile(output_path / "flash.bin")
+    np.savez(
+        output_path / "layers.npz",
+        **{f"w{j}": layer["weight"].numpy() for j, layer in enumerate(quantized, start=1)},
+        **{f"b{j}": layer["bias"].numpy() for j, layer in enumerate(quantized, start=1)},
+    )
+    report = {
+        "layer_sizes": sizes,
+        "data_width": data_width,
+        "input_scale": input_scale,
+        "layers": [{key: layer[key] for key in ("weight_scale", "scale", "clipped_biases")} for layer in quantized],
+        "weights_bits": sum(layer["weight"].numel() for layer in quantized) * data_width,
+        "biases_bits": sum(layer["bias"].numel() for layer in quantized) * data_width,
+        "pack_time": pack_time,
+        "accuracy": accuracy,
+    }
+    (output_path / "model.json").write_text(json.dumps(report, indent=2))
+
+    print(f"LAYER_SIZES={sizes}, DATA_WIDTH={data_width}, input scale {input_scale:.6g}")
+    for j, layer in enumerate(report["layers"], start=1):
+        clipped = f", {layer['clipped_biases']} biases clipped" if layer["clipped_biases"] else ""
+        print(f"  layer {j}: weight scale {layer['weight_scale']:.6g}, output scale {layer['scale']:.6g}{clipped}")
+    print(
+        f"Packed {report['weights_bits']} weight bits and {report['biases_bits']} bias bits in {pack_time * 1e3:.2f} ms"
+    )
+    print(f"Quantized vs float on {len(x)} inputs: " + ", ".join(f"{k}={v:.4g}" for k, v in accuracy.items()))
+    print(f"Defines written to {header_path}, images and report to {output_path}")
+
+
+if __name__ == "__main__":
+    app()
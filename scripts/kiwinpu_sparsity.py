@@ -0,0 +1,106 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+#     "numpy>=1.24.0",
+#     "cocotb>=2.0.1",
+# ]
+# ///
+"""Predict the speedup of zero-skipping ``FoldedLayer`` instances for a model and a dataset.
+
+The model is read from the ``weights_flat.bin``/``biases_flat.bin`` images and ``model.json``
+``scripts/kiwinpu_import.py`` writes; the activation dataset is a ``.npy`` array of input
+vectors, integer ones as driven on ``in_vec`` or float ones quantized with the input scale of
+the model. Every vector is run through ``kiwisim``, so the inputs of the later layers are the
+ReLU outputs the hardware sees. For every ``--parallelism`` the tool reports per layer the
+fraction of zero inputs and weights, of products whose multiplier ``ZERO_GATING`` isolates,
+and the cycles per run without and with ``ZERO_SKIP``.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import typer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tb"))
+from kiwisim import Network, analyze_sparsity
+
+app = typer.Typer()
+
+
+def load_model(model_dir: Path) -> tuple[Network, float]:
+    """Slice the weight and bias images of ``model_dir`` into a network; return it with its input scale."""
+    report = json.loads((model_dir / "model.json").read_text())
+    network = Network.from_flat(
+        int.from_bytes((model_dir / "weights_flat.bin").read_bytes(), "little"),
+        int.from_bytes((model_dir / "biases_flat.bin").read_bytes(), "little"),
+        report["layer_sizes"],
+        report["data_width"],
+    )
+    return network, report["input_scale"]
+
+
+def quantize_inputs(x: np.ndarray, input_scale: float, data_width: int) -> np.ndarray:
+    """Return integer inputs as they are and quantize float ones to ``data_width`` bits at ``input_scale``."""
+    if np.issubdtype(x.dtype, np.integer):
+        return x.astype(np.int64)
+    max_val = (1 << (data_width - 1)) - 1
+    return np.clip(np.round(x / input_scale), -max_val - 1, max_val).astype(np.int64)
+
+
+@app.command()
+def analyze(
+    model_dir: str = typer.Argument(..., help="Directory written by scripts/kiwinpu_import.py"),
+    activations: str = typer.Argument(..., help="Input vectors as a (num_vectors, LAYER_SIZES[0]) .npy array"),
+    parallelism: list[int] = typer.Option([1], help="MACs of every FoldedLayer"),
+    report: str = typer.Option("", help="Optional path of a JSON report with every result"),
+):
+    """
+    Report the zeros every layer sees and the speedup zero-skipping achieves on them.
+    """
+    network, input_scale = load_model(Path(model_dir))
+    x = quantize_inputs(np.load(activations), input_scale, network.data_width)
+    if x.ndim != 2 or x.shape[1] != network.layer_sizes[0]:
+        raise typer.BadParameter(f"Expected ({len(x)}, {network.layer_sizes[0]}) inputs, got {x.shape}")
+    print(f"LAYER_SIZES={','.join(map(str, network.layer_sizes))}, DATA_WIDTH={network.data_width}, {len(x)} inputs")
+
+    results = []
+    for macs in parallelism:
+        try:
+            layers = analyze_sparsity(network, x, macs)
+        except ValueError as e:
+            print(f"PARALLELISM={macs}: {e}", file=sys.stderr)
+            continue
+
+        print(
+            f"\nPARALLELISM={macs}\n{'layer':<7}{'IN_N':>6}{'OUT_N':>6}{'zero in':>9}{'zero w':>8}{'gated':>7}"
+            f"{'dense cycles':>14}{'skip cycles':>13}{'speedup':>9}"
+        )
+        for j, layer in enumerate(layers, start=1):
+            print(
+                f"{j:<7}{layer.in_n:>6}{layer.out_n:>6}{layer.activation_zeros:>9.1%}{layer.weight_zeros:>8.1%}"
+                f"{layer.gated_products:>7.1%}{layer.dense_steps:>14}{layer.sparse_steps:>13.2f}{layer.speedup:>9.2f}"
+            )
+        # Layers run one after the other, so the cycles of an inference add up
+        dense = sum(layer.dense_steps for layer in layers)
+        sparse = sum(layer.sparse_steps for layer in layers)
+        print(f"{'total':<19}{'':>24}{dense:>14}{sparse:>13.2f}{dense / sparse:>9.2f}")
+        results.append(
+            {
+                "parallelism": macs,
+                "layers": [{**vars(layer), "speedup": layer.speedup} for layer in layers],
+                "dense_cycles": dense,
+                "sparse_cycles": sparse,
+                "speedup": dense / sparse,
+            }
+        )
+
+    if report:
+        Path(report).write_text(json.dumps(results, indent=2))
+        print(f"Report written to {report}")
+
+
+if __name__ == "__main__":
+    app()
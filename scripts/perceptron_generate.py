@@ -3,166 +3,288 @@
 # dependencies = [
 #     "typer>=0.12.5",
 #     "numpy>=1.24.0",
+#     "jinja2>=3.1.2",
 # ]
 # ///
 import math
 import os
 import random
+from collections.abc import Iterable, Iterator
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import typer
+from functional_coverage import Coverage, directed_cases
+from kiwinpu_generate import format_binary_array  # Shared, so both headers format binary literals alike
 
 app = typer.Typer()
 
 
+class OutputFormat(str, Enum):
+    """How the generated test cases are handed to the testbench."""
+
+    svh = "svh"  # init_perceptron_test_cases() function in an SVH header
+    mem = "mem"  # $readmemh vector files plus .npy sidecars
+
+
+# Number of test vector elements formatted per streamed chunk of the SVH header
+CHUNK_ELEMENTS = 1 << 16
+
+
+def draw_test_vectors(data_width: int, n: int, num_tests: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Draw uniformly random stimulus for ``num_tests`` test cases from the global RNG.
+
+    Returns ``x`` and ``w`` with shape ``(num_tests, n)`` and ``b`` with shape ``(num_tests,)``.
+    The global RNG stream is consumed one test case at a time, so chunked generation is
+    bit-identical to drawing all test cases at once for a given seed.
+    """
+    min_val: int = -(2 ** (data_width - 1))
+    max_val: int = 2 ** (data_width - 1) - 1
+
+    x = np.zeros((num_tests, n), dtype=np.int64)
+    w = np.zeros((num_tests, n), dtype=np.int64)
+    b = np.zeros(num_tests, dtype=np.int64)
+
+    for i in range(num_tests):
+        x[i] = np.random.randint(min_val, max_val + 1, size=n)
+        w[i] = np.random.randint(min_val, max_val + 1, size=n)
+        b[i] = np.random.randint(min_val, max_val + 1)
+
+    return x, w, b
+
+
+def draw_directed_vectors(
+    data_width: int, n: int, max_tests: int, seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, Coverage]:
+    """Draw coverage-directed test cases until every coverage bin is hit or ``max_tests`` are drawn.
+
+    Returns ``x``, ``w`` and ``b`` shaped like :func:`draw_test_vectors` and the coverage they reach.
+    """
+    coverage = Coverage.for_dot(data_width, n)
+    cases = list(directed_cases(coverage, n, np.random.default_rng(seed), max_tests))
+    x = np.array([x[0] for x, _, _ in cases], dtype=np.int64).reshape(-1, n)
+    w = np.array([w[0] for _, w, _ in cases], dtype=np.int64).reshape(-1, n)
+    b = np.array([b[0] for _, _, b in cases], dtype=np.int64)
+    return x, w, b, coverage
+
+
+def golden_model(x: np.ndarray, w: np.ndarray, b: np.ndarray, data_width: int) -> dict[str, np.ndarray]:
+    """Compute dot products, pre-activation and post-activation values for a batch."""
+    # Saturation (quantization)
+    max_out_val = (1 << (data_width - 1)) - 1
+    min_out_val = -(1 << (data_width - 1))
+
+    dot_products = np.einsum("tn,tn->t", x, w)
+    b_acc_width = np.where(b < 0, b | ((-1) << data_width), b)
+    pre = np.clip(dot_products + b_acc_width, min_out_val, max_out_val)
+    expected = np.maximum(pre, 0)
+
+    return {"dot_products": dot_products, "pre": pre, "expected": expected}
+
+
+def iter_test_chunks(
+    data_width: int,
+    n: int,
+    num_tests: int,
+    seed: int | None = None,
+    chunk_size: int | None = None,
+    directed: tuple[np.ndarray, np.ndarray, np.ndarray, Coverage] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Generate test arrays and expected outputs in chunks of at most ``chunk_size`` test cases.
+
+    The first chunk holds the coverage-directed test cases (``directed``, as drawn by
+    :func:`draw_directed_vectors`, or drawn here); once their coverage closes, the remaining
+    test cases are uniformly random and are sampled into the same coverage.
+    """
+    # Initialize random seed if provided
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+
+    if chunk_size is None:
+        chunk_size = max(1, CHUNK_ELEMENTS // n)
+
+    x, w, b, coverage = directed or draw_directed_vectors(data_width, n, num_tests, seed)
+    if len(x):
+        yield {"start": 0, "x": x, "w": w, "b": b, **golden_model(x, w, b, data_width)}
+
+    for start in range(len(x), num_tests, chunk_size):
+        count = min(chunk_size, num_tests - start)
+        x, w, b = draw_test_vectors(data_width, n, count)
+        arrays = golden_model(x, w, b, data_width)
+        coverage.sample(arrays["dot_products"] + b, x, w)
+        yield {"start": start, "x": x, "w": w, "b": b, **arrays}
+
+
+def iter_test_cases_svh(chunks: Iterable[dict[str, Any]], data_width: int, n: int, num_tests: int) -> Iterator[str]:
+    """Render the perceptron test case header as a stream of text chunks."""
+    acc_width: int = data_width + data_width + math.ceil(math.log2(n))
+
+    yield (
+        f"// Auto-generated test cases by {os.path.basename(__file__)}\n"
+        f"// DATA_WIDTH={data_width}, ACC_WIDTH={acc_width}, N={n}, NUM_TESTS={num_tests}\n"
+        "// THIS IS A HEADER FILE - DO NOT ATTEMPT TO COMPILE DIRECTLY\n\n"
+        "`ifndef PERCEPTRON_TESTCASES_SVH\n"
+        "`define PERCEPTRON_TESTCASES_SVH\n\n"
+        f"localparam int NUM_PERCEPTRON_TEST = {num_tests};\n\n"
+        # Write test case arrays
+        "// Test vectors\n"
+        f"logic signed [{data_width - 1}:0] perceptron_test_x[NUM_PERCEPTRON_TEST][{n}];\n"
+        f"logic signed [{data_width - 1}:0] perceptron_test_w[NUM_PERCEPTRON_TEST][{n}];\n"
+        f"logic signed [{data_width - 1}:0] perceptron_test_b[NUM_PERCEPTRON_TEST];\n"
+        f"logic signed [{data_width - 1}:0] perceptron_test_expected[NUM_PERCEPTRON_TEST];\n"
+        "// Initialize test cases\n"
+        "function void init_perceptron_test_cases();\n"
+    )
+
+    literal = f"] = {data_width}'b"
+    tails = [f"][{j}{literal}" for j in range(n)]
+
+    for chunk in chunks:
+        x_bin = format_binary_array(chunk["x"], data_width).tolist()
+        w_bin = format_binary_array(chunk["w"], data_width).tolist()
+        b_bin = format_binary_array(chunk["b"], data_width).tolist()
+        expected_bin = format_binary_array(chunk["expected"], data_width).tolist()
+        dot_products = chunk["dot_products"].tolist()
+        pre = chunk["pre"].tolist()
+        expected = chunk["expected"].tolist()
+
+        lines: list[str] = []
+        for t in range(len(x_bin)):
+            i = chunk["start"] + t
+            lines.append(f"  // Test case {i}: random_{i + 1}\n")
+            # Input vector X and weight vector W
+            lines.extend(f"  perceptron_test_x[{i}{tail}{bits};\n" for tail, bits in zip(tails, x_bin[t]))
+            lines.extend(f"  perceptron_test_w[{i}{tail}{bits};\n" for tail, bits in zip(tails, w_bin[t]))
+            # Bias B and expected output
+            lines.append(f"  perceptron_test_b[{i}{literal}{b_bin[t]};\n")
+            lines.append(f"  perceptron_test_expected[{i}{literal}{expected_bin[t]};\n")
+            # Add a comment showing the computation details
+            lines.append(
+                f"  // dot_product={dot_products[t]}, pre_activation={pre[t]}, post_activation={expected[t]}\n"
+            )
+        yield "".join(lines)
+
+    yield "endfunction\n\n`endif // PERCEPTRON_TESTCASES_SVH\n"
+
+
+def pack_hex_rows(values: np.ndarray, width: int) -> np.ndarray:
+    """Pack each row of signed integers into one hexadecimal string for ``$readmemh``.
+
+    Element ``j`` of a row occupies bits ``[j*width +: width]`` of the packed word.
+    """
+    values = np.asarray(values, dtype=np.int64).reshape(len(values), -1)
+    rows = values.shape[0]
+    unsigned = (values & ((1 << width) - 1)).astype(np.uint64)
+    bits = ((unsigned[..., None] >> np.arange(width, dtype=np.uint64)) & 1).astype(np.uint8).reshape(rows, -1)
+    num_digits = max(1, -(-bits.shape[1] // 4))
+    bits = np.pad(bits, ((0, 0), (0, num_digits * 4 - bits.shape[1])))
+    nibbles = bits.reshape(rows, num_digits, 4) @ np.array([1, 2, 4, 8], dtype=np.uint8)
+    digits = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)[nibbles[:, ::-1]]
+    return np.ascontiguousarray(digits).view(f"S{num_digits}")[:, 0].astype(f"U{num_digits}")
+
+
+def write_test_cases_mem(
+    chunks: Iterable[dict[str, Any]], data_width: int, n: int, num_tests: int, output_dir: Path
+) -> list[Path]:
+    """Write ``$readmemh`` vector files (one packed word per test case) and ``.npy`` sidecars.
+
+    ``perceptron_x.mem`` and ``perceptron_w.mem`` are packed like the ``x``/``w`` ports,
+    ``perceptron_b.mem`` and ``perceptron_expected.mem`` hold one value per line, and
+    ``perceptron_num_tests.mem`` holds the number of test cases.
+    """
+    output_dir.mkdir(exist_ok=True, parents=True)
+
+    shapes = {"x": (num_tests, n), "w": (num_tests, n), "b": (num_tests,), "expected": (num_tests,)}
+    mem_files = {name: output_dir / f"perceptron_{name}.mem" for name in shapes}
+    npy_files = {name: output_dir / f"perceptron_{name}.npy" for name in shapes}
+    arrays = {
+        name: np.lib.format.open_memmap(npy_files[name], mode="w+", dtype=np.int64, shape=shape)
+        for name, shape in shapes.items()
+    }
+
+    handles = {name: open(path, "w") for name, path in mem_files.items()}
+    try:
+        for chunk in chunks:
+            rows = slice(chunk["start"], chunk["start"] + len(chunk["x"]))
+            for name, handle in handles.items():
+                arrays[name][rows] = chunk[name]
+                handle.write("\n".join(pack_hex_rows(chunk[name], data_width).tolist()) + "\n")
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    for array in arrays.values():
+        array.flush()
+
+    count_file = output_dir / "perceptron_num_tests.mem"
+    count_file.write_text(f"{num_tests:08x}\n")
+
+    return [count_file, *mem_files.values(), *npy_files.values()]
+
+
 @app.command()
 def generate(
     data_width: int = 8,
     n: int = 4,
-    num_tests: int = 10,
+    num_tests: int = 100,
     output_file: str = "include/perceptron_testcases.svh",
     seed: int | None = None,
+    output_format: OutputFormat = typer.Option(OutputFormat.svh, "--format"),
+    until_covered: bool = True,
+    min_tests: int = 32,
 ):
     """
     Generate test cases for the perceptron module.
 
     data_width: Bit width of input vectors and weights
     n: Vector dimensionality
-    num_tests: Number of test cases to generate
+    num_tests: Maximum number of test cases to generate (exact with --no-until-covered)
     output_file: Output file path
     seed: Seed for RNG reproducibility
+    output_format: "svh" for an init function in output_file, "mem" for $readmemh vector
+        files (and .npy sidecars) in the directory of output_file
+    until_covered: Stop once the coverage-directed test cases hit every coverage bin, with
+        num_tests as the limit; otherwise fill up to num_tests with uniformly random ones
+    min_tests: With until_covered, uniformly random test cases still fill up to this many
     """
-    min_val: int = -(2 ** (data_width - 1))
-    max_val: int = 2 ** (data_width - 1) - 1
     acc_width: int = data_width + data_width + math.ceil(math.log2(n))
 
-    # Initialize random seed if provided
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
+    # The directed test cases are drawn up front to size the run, then written first
+    directed = draw_directed_vectors(data_width, n, num_tests, seed)
+    num_directed, coverage = len(directed[0]), directed[3]
+    print(f"{num_directed} coverage-directed test cases: {coverage.summary()}")
+    if until_covered:
+        num_tests = min(num_tests, max(num_directed, min_tests))
 
     print(f"Generating {num_tests} perceptron test cases with DATA_WIDTH={data_width}, ACC_WIDTH={acc_width}, N={n}")
 
-    test_cases: list[dict[str, Any]] = []
-
-    # Generate random test cases
-    for i in range(num_tests):
-        # Create test case with different strategies
-        strategy = i % 5  # Five different strategies
-
-        if strategy == 0:
-            # Completely random values
-            x = np.random.randint(min_val, max_val + 1, size=n)
-            w = np.random.randint(min_val, max_val + 1, size=n)
-            b = np.random.randint(min_val, max_val + 1)
-        elif strategy == 1:
-            # Small random values, less likely to overflow
-            small_min = max(min_val // 4, -32)
-            small_max = min(max_val // 4, 31)
-            x = np.random.randint(small_min, small_max + 1, size=n)
-            w = np.random.randint(small_min, small_max + 1, size=n)
-            b = np.random.randint(small_min, small_max + 1)
-        elif strategy == 2:
-            # Positive/negative mix with low probability of overflow
-            x = np.random.randint(0, max_val // 2 + 1, size=n)
-            w = np.random.randint(min_val // 2, 1, size=n)
-            b = np.random.randint(min_val // 2, max_val // 2 + 1)
-        elif strategy == 3:
-            # Bias-driven tests where bias determines output
-            x = np.zeros(n, dtype=int)
-            w = np.zeros(n, dtype=int)
-            # Random large positive or negative bias
-            b = np.random.choice([min_val, max_val])
-        else:
-            # Some values close to limits to test edge cases
-            choices = np.array([min_val, max_val])
-            x = np.array([np.random.choice(choices) for _ in range(n)])
-            w = np.array([np.random.choice(choices) for _ in range(n)])
-            b = np.random.choice(choices)
-
-        # Calculate dot product
-        dot_product = int(np.dot(x, w))
-        b_acc_width = b | ((-1) << data_width) if b < 0 else b
-        acc_with_bias = dot_product + b_acc_width
-
-        # Saturation (quantization)
-        max_out_val = (1 << (data_width - 1)) - 1
-        min_out_val = -(1 << (data_width - 1))
-
-        pre = max(min(acc_with_bias, max_out_val), min_out_val)
-        expected = max(0, pre)
-
-        test_cases.append(
-            {
-                "x": x.tolist(),
-                "w": w.tolist(),
-                "b": b,
-                "pre": pre,  # Pre-activation value
-                "expected": expected,  # Post-activation (ReLU)
-                "name": f"random_{i + 1}",
-            }
-        )
-
-    # Write test cases to SystemVerilog file
     output_path = Path(output_file)
-    output_path.parent.mkdir(exist_ok=True, parents=True)
-
-    with open(output_path, "w") as f:
-        f.write(f"// Auto-generated test cases by {os.path.basename(__file__)}\n")
-        f.write(f"// DATA_WIDTH={data_width}, ACC_WIDTH={acc_width}, N={n}, NUM_TESTS={num_tests}\n")
-        f.write("// THIS IS A HEADER FILE - DO NOT ATTEMPT TO COMPILE DIRECTLY\n\n")
+    chunks = iter_test_chunks(data_width, n, num_tests, seed, directed=directed)
 
-        f.write("`ifndef PERCEPTRON_TESTCASES_SVH\n")
-        f.write("`define PERCEPTRON_TESTCASES_SVH\n\n")
+    if output_format == OutputFormat.mem:
+        # Write vector files, one chunk at a time
+        vector_files = write_test_cases_mem(chunks, data_width, n, num_tests, output_path.parent)
 
-        f.write(f"localparam int NUM_PERCEPTRON_TEST = {len(test_cases)};\n\n")
-
-        # Write test case arrays
-        f.write("// Test vectors\n")
-        f.write(f"logic signed [{data_width - 1}:0] perceptron_test_x[NUM_PERCEPTRON_TEST][{n}];\n")
-        f.write(f"logic signed [{data_width - 1}:0] perceptron_test_w[NUM_PERCEPTRON_TEST][{n}];\n")
-        f.write(f"logic signed [{data_width - 1}:0] perceptron_test_b[NUM_PERCEPTRON_TEST];\n")
-        f.write(f"logic signed [{data_width - 1}:0] perceptron_test_expected[NUM_PERCEPTRON_TEST];\n")
-
-        f.write("// Initialize test cases\n")
-        f.write("function void init_perceptron_test_cases();\n")
-
-        for i, test in enumerate(test_cases):
-            f.write(f"  // Test case {i}: {test['name']}\n")
-
-            # Write input vector X
-            for j in range(n):
-                val = test["x"][j]
-                bin_val = format((1 << data_width) + val if val < 0 else val, f"0{data_width}b")
-                f.write(f"  perceptron_test_x[{i}][{j}] = {data_width}'b{bin_val};\n")
-
-            # Write weight vector W
-            for j in range(n):
-                val = test["w"][j]
-                bin_val = format((1 << data_width) + val if val < 0 else val, f"0{data_width}b")
-                f.write(f"  perceptron_test_w[{i}][{j}] = {data_width}'b{bin_val};\n")
-
-            # Write bias B
-            val = test["b"]
-            bin_val = format((1 << data_width) + val if val < 0 else val, f"0{data_width}b")
-            f.write(f"  perceptron_test_b[{i}] = {data_width}'b{bin_val};\n")
-
-            # Write expected output
-            val = test["expected"]
-            bin_val = format((1 << data_width) + val if val < 0 else val, f"0{data_width}b")
-            f.write(f"  perceptron_test_expected[{i}] = {data_width}'b{bin_val};\n")
+        print(f"Successfully generated {num_tests} test cases to {output_path.parent}")
+        print(f"Coverage of all {num_tests} test cases: {coverage.summary()}")
+        print(f"Vector files: {', '.join(str(path) for path in vector_files)}")
+        print("Load them in your testbench with $readmemh, e.g.:")
+        print('  $readmemh("perceptron_num_tests.mem", num_tests);')
+        print('  $readmemh("perceptron_x.mem", test_x, 0, num_tests[0] - 1);')
+        return
 
-            # Add a comment showing the computation details
-            f.write(
-                f"  // dot_product={int(np.dot(test['x'], test['w']))}, pre_activation={test['pre']}, post_activation={test['expected']}\n"
-            )
+    # Write test cases to SystemVerilog file, one chunk at a time
+    output_path.parent.mkdir(exist_ok=True, parents=True)
 
-        f.write("endfunction\n\n")
-        f.write("`endif // PERCEPTRON_TESTCASES_SVH\n")
+    with open(output_path, "w") as f:
+        for text in iter_test_cases_svh(chunks, data_width, n, num_tests):
+            f.write(text)
 
-    print(f"Successfully generated {len(test_cases)} test cases to {output_file}")
+    print(f"Successfully generated {num_tests} test cases to {output_file}")
+    print(f"Coverage of all {num_tests} test cases: {coverage.summary()}")
     print("Add the following to your testbench to use these test cases:")
     print(f'  `include "{output_file}"')
     print("  // And call init_perceptron_test_cases() in your initial block")
@@ -0,0 +1,164 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer>=0.12.5",
+# ]
+# ///
+"""Run the cocotb test suite over a matrix of (DATA_WIDTH, N, OUT_N, simulator) points.
+
+Every point runs ``pytest`` on one test module in its own process, with the parameters passed
+through the environment. The test modules forward them to ``runner.build(parameters=...)``, so
+each point gets its own hashed build directory under ``sim_build/<Module>``. Points that only
+differ in a parameter a module does not use are run once. Results are aggregated into a single
+table and a JSON report with the wall time of every point.
+"""
+
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import typer
+
+PROJ_PATH = Path(__file__).resolve().parent.parent
+
+# Swept parameters each test module reads from the environment
+MODULE_PARAMETERS = {
+    "test_relu": ("DATA_WIDTH",),
+    "test_clamper": ("DATA_WIDTH", "N"),
+    "test_preactivation": ("DATA_WIDTH", "N"),
+    "test_perceptron": ("DATA_WIDTH", "N"),
+    "test_layer": ("DATA_WIDTH", "N", "OUT_N"),
+    "test_folded_layer": ("DATA_WIDTH", "N", "OUT_N"),
+    "test_kiwinpu": ("DATA_WIDTH",),
+    "test_kiwinpu_flash": ("DATA_WIDTH",),
+}
+
+app = typer.Typer()
+
+
+def sweep_points(
+    modules: list[str], data_widths: list[int], ns: list[int], out_ns: list[int], sims: list[str]
+) -> list[dict]:
+    """Expand the parameter matrix, dropping duplicate points for modules that ignore a parameter."""
+    points = []
+    seen = set()
+    for module, data_width, n, out_n, sim in itertools.product(modules, data_widths, ns, out_ns, sims):
+        values = {"DATA_WIDTH": data_width, "N": n, "OUT_N": out_n}
+        parameters = {name: values[name] for name in MODULE_PARAMETERS[module]}
+        key = (module, sim, tuple(parameters.items()))
+        if key not in seen:
+            seen.add(key)
+            points.append({"module": module, "sim": sim, "parameters": parameters})
+    return points
+
+
+def pytest_command(module: str) -> list[str]:
+    """Command line running the cocotb tests of ``tb/<module>.py`` from ``PROJ_PATH``."""
+    return [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", f"tb/{module}.py"]
+
+
+def run_point(point: dict, num_tests: int, log_dir: Path, cache_size: int) -> dict:
+    """Run one module at one parameter point and return its result with the wall time."""
+    name = "_".join([point["module"], point["sim"], *(f"{k}{v}" for k, v in point["parameters"].items())])
+    env = {
+        **os.environ,
+        "SIM": point["sim"],
+        "NUM_TESTS": str(num_tests),
+        "KIWINPU_BUILD_CACHE_SIZE": str(cache_size),
+        **{key: str(value) for key, value in point["parameters"].items()},
+    }
+    log_file = log_dir / f"{name}.log"
+
+    start = time.perf_counter()
+    with open(log_file, "w") as log:
+        proc = subprocess.run(
+            pytest_command(point["module"]), cwd=PROJ_PATH, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+    wall_time = time.perf_counter() - start
+
+    return {**point, "name": name, "passed": proc.returncode == 0, "wall_time": wall_time, "log": str(log_file)}
+
+
+def run_bench(module: str, test: str, parameters: dict, sim: str, report: Path) -> bool:
+    """Run the benchmark ``test`` of ``tb/<module>.py`` at one parameter point, appending its results to ``report``.
+
+    The parameters are passed through the environment; the output of a failing run is printed.
+    """
+    env = {
+        **os.environ,
+        "SIM": sim,
+        **{key: str(value) for key, value in parameters.items()},
+        "COCOTB_TEST_FILTER": test,
+        "BENCH_REPORT": str(report),
+    }
+    proc = subprocess.run(pytest_command(module), cwd=PROJ_PATH, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(proc.stdout[-4000:], file=sys.stderr)
+    return proc.returncode == 0
+
+
+@app.command()
+def sweep(
+    data_width: list[int] = typer.Option([4, 8, 16], help="DATA_WIDTH values to sweep"),
+    n: list[int] = typer.Option([4, 8], help="Input vector dimensionality (N/IN_N) values to sweep"),
+    out_n: list[int] = typer.Option([4], help="Output vector dimensionality (OUT_N) values to sweep"),
+    sim: list[str] = typer.Option(["verilator"], help="Simulators to sweep"),
+    module: list[str] = typer.Option(list(MODULE_PARAMETERS), help="Test modules to run"),
+    num_tests: int = typer.Option(10, help="Number of test cases per point"),
+    jobs: int = typer.Option(os.cpu_count() or 1, help="Number of points run in parallel"),
+    report: str = typer.Option("sim_build/sweep/report.json", help="Path of the aggregated JSON report"),
+):
+    """
+    Build and run every point of the parameter matrix in a process pool and report the results.
+    """
+    unknown = sorted(set(module) - set(MODULE_PARAMETERS))
+    if unknown:
+        raise typer.BadParameter(f"Unknown test modules: {', '.join(unknown)}")
+
+    report_path = PROJ_PATH / report
+    log_dir = report_path.parent / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    points = sweep_points(module, data_width, n, out_n, sim)
+    # Keep every build of the sweep cached so that re-running it does not rebuild anything
+    cache_size = max(int(os.getenv("KIWINPU_BUILD_CACHE_SIZE", "4")), len(points))
+    print(f"Running {len(points)} points on {jobs} workers")
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_point, point, num_tests, log_dir, cache_size) for point in points]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(
+                f"[{len(results)}/{len(points)}] {'PASS' if result['passed'] else 'FAIL'} {result['name']}", flush=True
+            )
+    total_time = time.perf_counter() - start
+
+    results.sort(key=lambda r: (r["module"], r["sim"], tuple(r["parameters"].values())))
+    print(f"\n{'module':<20}{'sim':<11}{'DATA_WIDTH':>11}{'N':>4}{'OUT_N':>6}{'result':>8}{'wall [s]':>10}")
+    for result in results:
+        parameters = result["parameters"]
+        print(
+            f"{result['module']:<20}{result['sim']:<11}{parameters['DATA_WIDTH']:>11}"
+            f"{parameters.get('N', '-'):>4}{parameters.get('OUT_N', '-'):>6}"
+            f"{'PASS' if result['passed'] else 'FAIL':>8}{result['wall_time']:>10.1f}"
+        )
+
+    num_failed = sum(not result["passed"] for result in results)
+    print(f"\n{len(results) - num_failed} passed, {num_failed} failed in {total_time:.1f}s")
+    report_path.write_text(json.dumps({"wall_time": total_time, "points": results}, indent=2))
+    print(f"Report written to {report_path}")
+
+    if num_failed:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
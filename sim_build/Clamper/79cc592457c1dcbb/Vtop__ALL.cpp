@@ -0,0 +1,11 @@
+// DESCRIPTION: Generated by verilator_includer via makefile
+#define VL_INCLUDE_OPT include
+#include "Vtop.cpp"
+#include "Vtop___024root__0.cpp"
+#include "Vtop__Dpi.cpp"
+#include "Vtop__Trace__0.cpp"
+#include "Vtop___024root__Slow.cpp"
+#include "Vtop___024root__0__Slow.cpp"
+#include "Vtop__Syms__Slow.cpp"
+#include "Vtop__Trace__0__Slow.cpp"
+#include "Vtop__TraceDecls__0__Slow.cpp"
@@ -0,0 +1,49 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(124);
+    // Setup sub module instances
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-9);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_Clamper = new VerilatedScope{this, "Clamper", "Clamper", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_TOP = new VerilatedScope{this, "TOP", "TOP", "<null>", 0, VerilatedScope::SCOPE_OTHER};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_Clamper);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_Clamper->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.Clamper__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_Clamper->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.Clamper__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_Clamper->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.Clamper__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_Clamper->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.Clamper__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_Clamper->varInsert("in", &(TOP.Clamper__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_Clamper->varInsert("out", &(TOP.Clamper__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_TOP->varInsert("in", &(TOP.in), false, VLVT_UINT32, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_TOP->varInsert("out", &(TOP.out), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_Clamper);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_Clamper, __Vscopep_Clamper = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_TOP, __Vscopep_TOP = nullptr);
+    // Tear down sub module instances
+}
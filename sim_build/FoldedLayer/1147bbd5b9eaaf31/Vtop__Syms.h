@@ -0,0 +1,178 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table internal header
+//
+// Internal details; most calling programs do not need this header,
+// unless using verilator public meta comments.
+
+#ifndef VERILATED_VTOP__SYMS_H_
+#define VERILATED_VTOP__SYMS_H_  // guard
+
+#include "verilated.h"
+
+// INCLUDE MODEL CLASS
+
+#include "Vtop.h"
+
+// INCLUDE MODULE CLASSES
+#include "Vtop___024root.h"
+
+// DPI TYPES for DPI Export callbacks (Internal use)
+
+// SYMS CLASS (contains all model state)
+class alignas(VL_CACHE_LINE_BYTES) Vtop__Syms final : public VerilatedSyms {
+  public:
+    // INTERNAL STATE
+    Vtop* const __Vm_modelp;
+    bool __Vm_activity = false;  ///< Used by trace routines to determine change occurred
+    uint32_t __Vm_baseCode = 0;  ///< Used by trace routines when tracing multiple models
+    VlDeleter __Vm_deleter;
+    bool __Vm_didInit = false;
+
+    // MODULE INSTANCE STATE
+    Vtop___024root                 TOP;
+
+    // SCOPE NAMES
+    VerilatedScope* __Vscopep_FoldedLayer;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product__gen_isolated;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_FoldedLayer__unnamedblk1;
+    VerilatedScope* __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2;
+    VerilatedScope* __Vscopep_FoldedLayer__unnamedblk3;
+    VerilatedScope* __Vscopep_FoldedLayer__unnamedblk4;
+    VerilatedScope* __Vscopep_FoldedLayer__unnamedblk5;
+    VerilatedScope* __Vscopep_TOP;
+
+    // SCOPE HIERARCHY
+    VerilatedHierarchy __Vhier;
+
+    // CONSTRUCTORS
+    Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp);
+    ~Vtop__Syms();
+
+    // METHODS
+    const char* name() const { return TOP.vlNamep; }
+};
+
+#endif  // guard
@@ -0,0 +1,12 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Tracing declarations
+
+#include "verilated_fst_c.h"
+
+
+void Vtop___024root__traceDeclTypesSub0(VerilatedFst* tracep) {
+}
+
+void Vtop___024root__trace_decl_types(VerilatedFst* tracep) {
+    Vtop___024root__traceDeclTypesSub0(tracep);
+}
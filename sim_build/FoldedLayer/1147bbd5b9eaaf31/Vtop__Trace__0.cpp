@@ -0,0 +1,310 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Tracing implementation internals
+
+#include "verilated_fst_c.h"
+#include "Vtop__Syms.h"
+
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp);
+
+void Vtop___024root__trace_chg_0(void* voidSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    if (VL_UNLIKELY(!vlSymsp->__Vm_activity)) return;
+    Vtop___024root__trace_chg_0_sub_0((&vlSymsp->TOP), bufp);
+}
+
+void Vtop___024root__trace_chg_dtype____0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp, uint32_t offset, const VlUnpacked<IData/*17:0*/, 4>& __VdtypeVar);
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0_sub_0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode + 0);
+    bufp->chgBit(oldp+0,(vlSelfRef.clk));
+    bufp->chgBit(oldp+1,(vlSelfRef.rst_n));
+    bufp->chgBit(oldp+2,(vlSelfRef.start));
+    bufp->chgIData(oldp+3,(vlSelfRef.in_vec),32);
+    bufp->chgWData(oldp+4,(vlSelfRef.weights),128);
+    bufp->chgIData(oldp+8,(vlSelfRef.biases),32);
+    bufp->chgBit(oldp+9,(vlSelfRef.busy));
+    bufp->chgBit(oldp+10,(vlSelfRef.done));
+    bufp->chgIData(oldp+11,(vlSelfRef.out_vec),32);
+    bufp->chgBit(oldp+12,(vlSelfRef.FoldedLayer__DOT__clk));
+    bufp->chgBit(oldp+13,(vlSelfRef.FoldedLayer__DOT__rst_n));
+    bufp->chgBit(oldp+14,(vlSelfRef.FoldedLayer__DOT__start));
+    bufp->chgIData(oldp+15,(vlSelfRef.FoldedLayer__DOT__in_vec),32);
+    bufp->chgWData(oldp+16,(vlSelfRef.FoldedLayer__DOT__weights),128);
+    bufp->chgIData(oldp+20,(vlSelfRef.FoldedLayer__DOT__biases),32);
+    bufp->chgBit(oldp+21,(vlSelfRef.FoldedLayer__DOT__busy));
+    bufp->chgBit(oldp+22,(vlSelfRef.FoldedLayer__DOT__done));
+    bufp->chgIData(oldp+23,(vlSelfRef.FoldedLayer__DOT__out_vec),32);
+    bufp->chgBit(oldp+24,(vlSelfRef.FoldedLayer__DOT__chunk));
+    bufp->chgBit(oldp+25,(vlSelfRef.FoldedLayer__DOT__group));
+    bufp->chgBit(oldp+26,(vlSelfRef.FoldedLayer__DOT__first));
+    bufp->chgBit(oldp+27,(vlSelfRef.FoldedLayer__DOT__cur));
+    bufp->chgBit(oldp+28,(vlSelfRef.FoldedLayer__DOT__next_chunk));
+    bufp->chgBit(oldp+29,(vlSelfRef.FoldedLayer__DOT__live));
+    bufp->chgBit(oldp+30,(vlSelfRef.FoldedLayer__DOT__step));
+    bufp->chgBit(oldp+31,(vlSelfRef.FoldedLayer__DOT__last_chunk));
+    bufp->chgBit(oldp+32,(vlSelfRef.FoldedLayer__DOT__last_step));
+    bufp->chgIData(oldp+33,(vlSelfRef.FoldedLayer__DOT__x_chunk),32);
+    Vtop___024root__trace_chg_dtype____0(vlSelf, bufp, 34, vlSelfRef.FoldedLayer__DOT__acc);
+    bufp->chgIData(oldp+38,(vlSelfRef.FoldedLayer__DOT__acc_next[0]),18);
+    bufp->chgIData(oldp+39,(vlSelfRef.FoldedLayer__DOT__acc_next[1]),18);
+    bufp->chgIData(oldp+40,(vlSelfRef.FoldedLayer__DOT__acc_next[2]),18);
+    bufp->chgIData(oldp+41,(vlSelfRef.FoldedLayer__DOT__acc_next[3]),18);
+    bufp->chgCData(oldp+42,(vlSelfRef.FoldedLayer__DOT__relu_out[0]),8);
+    bufp->chgCData(oldp+43,(vlSelfRef.FoldedLayer__DOT__relu_out[1]),8);
+    bufp->chgCData(oldp+44,(vlSelfRef.FoldedLayer__DOT__relu_out[2]),8);
+    bufp->chgCData(oldp+45,(vlSelfRef.FoldedLayer__DOT__relu_out[3]),8);
+    bufp->chgIData(oldp+46,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial),18);
+    bufp->chgCData(oldp+47,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped),8);
+    bufp->chgIData(oldp+48,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron),32);
+    bufp->chgCData(oldp+49,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in),8);
+    bufp->chgCData(oldp+50,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out),8);
+    bufp->chgIData(oldp+51,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in),18);
+    bufp->chgCData(oldp+52,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out),8);
+    bufp->chgBit(oldp+53,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__clk));
+    bufp->chgBit(oldp+54,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__rst_n));
+    bufp->chgIData(oldp+55,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x),32);
+    bufp->chgIData(oldp+56,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w),32);
+    bufp->chgCData(oldp+57,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b),8);
+    bufp->chgIData(oldp+58,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre),18);
+    bufp->chgCData(oldp+59,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+60,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+61,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+62,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+63,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+64,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+65,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+66,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+67,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+68,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+69,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+70,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+71,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+72,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+73,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgBit(oldp+74,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+75,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+76,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+77,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+78,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgBit(oldp+79,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+80,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+81,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+82,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+83,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgBit(oldp+84,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+85,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+86,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+87,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+88,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+89,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+90,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+91,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+92,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+93,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+94,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+95,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+96,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+97,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+98,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+99,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+100,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+101,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__partial),18);
+    bufp->chgCData(oldp+102,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__clamped),8);
+    bufp->chgIData(oldp+103,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__neuron),32);
+    bufp->chgCData(oldp+104,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__in),8);
+    bufp->chgCData(oldp+105,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__out),8);
+    bufp->chgIData(oldp+106,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__in),18);
+    bufp->chgCData(oldp+107,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__out),8);
+    bufp->chgBit(oldp+108,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__clk));
+    bufp->chgBit(oldp+109,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__rst_n));
+    bufp->chgIData(oldp+110,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x),32);
+    bufp->chgIData(oldp+111,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w),32);
+    bufp->chgCData(oldp+112,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__b),8);
+    bufp->chgIData(oldp+113,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__pre),18);
+    bufp->chgCData(oldp+114,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+115,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+116,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+117,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+118,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+119,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+120,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+121,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+122,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+123,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+124,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+125,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+126,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+127,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+128,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgBit(oldp+129,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+130,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+131,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+132,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+133,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgBit(oldp+134,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+135,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+136,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+137,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+138,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgBit(oldp+139,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+140,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+141,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+142,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+143,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+144,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+145,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+146,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+147,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+148,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+149,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+150,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+151,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+152,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+153,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+154,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+155,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+156,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__partial),18);
+    bufp->chgCData(oldp+157,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__clamped),8);
+    bufp->chgIData(oldp+158,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__neuron),32);
+    bufp->chgCData(oldp+159,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__in),8);
+    bufp->chgCData(oldp+160,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__out),8);
+    bufp->chgIData(oldp+161,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__in),18);
+    bufp->chgCData(oldp+162,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__out),8);
+    bufp->chgBit(oldp+163,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__clk));
+    bufp->chgBit(oldp+164,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__rst_n));
+    bufp->chgIData(oldp+165,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x),32);
+    bufp->chgIData(oldp+166,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w),32);
+    bufp->chgCData(oldp+167,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__b),8);
+    bufp->chgIData(oldp+168,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__pre),18);
+    bufp->chgCData(oldp+169,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+170,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+171,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+172,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+173,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+174,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+175,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+176,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+177,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+178,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+179,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+180,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+181,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+182,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+183,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgBit(oldp+184,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+185,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+186,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+187,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+188,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgBit(oldp+189,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+190,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+191,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+192,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+193,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgBit(oldp+194,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+195,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+196,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+197,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+198,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+199,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+200,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+201,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+202,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+203,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+204,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+205,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+206,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+207,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+208,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+209,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+210,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+211,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__partial),18);
+    bufp->chgCData(oldp+212,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__clamped),8);
+    bufp->chgIData(oldp+213,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__neuron),32);
+    bufp->chgCData(oldp+214,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__in),8);
+    bufp->chgCData(oldp+215,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__out),8);
+    bufp->chgIData(oldp+216,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__in),18);
+    bufp->chgCData(oldp+217,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__out),8);
+    bufp->chgBit(oldp+218,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__clk));
+    bufp->chgBit(oldp+219,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__rst_n));
+    bufp->chgIData(oldp+220,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x),32);
+    bufp->chgIData(oldp+221,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w),32);
+    bufp->chgCData(oldp+222,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__b),8);
+    bufp->chgIData(oldp+223,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__pre),18);
+    bufp->chgCData(oldp+224,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+225,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+226,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+227,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+228,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+229,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+230,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+231,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+232,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+233,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+234,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+235,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+236,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+237,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+238,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgBit(oldp+239,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+240,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+241,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+242,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+243,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgBit(oldp+244,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+245,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+246,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+247,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+248,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgBit(oldp+249,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->chgCData(oldp+250,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->chgCData(oldp+251,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->chgIData(oldp+252,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+253,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+254,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+255,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+256,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+257,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+258,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+259,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+260,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+261,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+262,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+263,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+264,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+265,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+}
+
+void Vtop___024root__trace_chg_dtype____0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp, uint32_t offset, const VlUnpacked<IData/*17:0*/, 4>& __VdtypeVar) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_dtype____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode +  offset);
+    bufp->chgIData(oldp+0,(__VdtypeVar[0]),18);
+    bufp->chgIData(oldp+1,(__VdtypeVar[1]),18);
+    bufp->chgIData(oldp+2,(__VdtypeVar[2]),18);
+    bufp->chgIData(oldp+3,(__VdtypeVar[3]),18);
+}
+
+void Vtop___024root__trace_cleanup(void* voidSelf, VerilatedFst* /*unused*/) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_cleanup\n"); );
+    // Locals
+    VlUnpacked<CData/*0:0*/, 1> __Vm_traceActivity;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        __Vm_traceActivity[__Vi0] = 0;
+    }
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    vlSymsp->__Vm_activity = false;
+    __Vm_traceActivity[0U] = 0U;
+}
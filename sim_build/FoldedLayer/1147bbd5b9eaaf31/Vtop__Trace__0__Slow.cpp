@@ -0,0 +1,1089 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Tracing implementation internals
+
+#include "verilated_fst_c.h"
+#include "Vtop__Syms.h"
+
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype____0(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction);
+
+VL_ATTR_COLD void Vtop___024root__trace_init_sub__TOP__0(Vtop___024root* vlSelf, VerilatedFst* tracep) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_sub__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const int c = vlSymsp->__Vm_baseCode;
+    VL_TRACE_PUSH_PREFIX(tracep, "$rootio", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+0,0,"clk",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+1,0,"rst_n",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+2,0,"start",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+3,0,"in_vec",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_WIDE(tracep,c+4,0,"weights",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 127,0);
+    VL_TRACE_DECL_BUS(tracep,c+8,0,"biases",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+9,0,"busy",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+10,0,"done",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+11,0,"out_vec",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "FoldedLayer", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"IN_N",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"OUT_N",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+269,0,"PARALLELISM",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"ZERO_SKIP",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+12,0,"clk",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+13,0,"rst_n",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+14,0,"start",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+15,0,"in_vec",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_WIDE(tracep,c+16,0,"weights",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 127,0);
+    VL_TRACE_DECL_BUS(tracep,c+20,0,"biases",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+21,0,"busy",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+22,0,"done",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+23,0,"out_vec",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"LANES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"GROUP",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"CHUNKS",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"GROUPS",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"CHUNK_W",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"GROUP_W",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+24,0,"chunk",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 0,0);
+    VL_TRACE_DECL_BUS(tracep,c+25,0,"group",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 0,0);
+    VL_TRACE_DECL_BIT(tracep,c+26,0,"first",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+27,0,"cur",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 0,0);
+    VL_TRACE_DECL_BUS(tracep,c+28,0,"next_chunk",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 0,0);
+    VL_TRACE_DECL_BUS(tracep,c+29,0,"live",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 0,0);
+    VL_TRACE_DECL_BIT(tracep,c+30,0,"step",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+31,0,"last_chunk",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+32,0,"last_step",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+33,0,"x_chunk",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 31,0);
+
+    Vtop___024root__trace_init_dtype____0(vlSelf, tracep, "acc", 0, c+34, VerilatedTraceSigDirection::NONE);
+    VL_TRACE_PUSH_PREFIX(tracep, "acc_next", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+38+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 17,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "relu_out", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+42+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_macs[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+46,0,"partial",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+47,0,"clamped",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+48,0,"neuron",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_act", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+49,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+50,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_clamp", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+51,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+52,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+271,0,"MIN_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+272,0,"MAX_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_mac", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"N",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+273,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"PIPE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"ZERO_GATING",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+53,0,"clk",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+54,0,"rst_n",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+275,0,"en",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+55,0,"x",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+56,0,"w",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+57,0,"b",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+58,0,"pre",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+276,0,"LEVELS",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"TREE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"OUT_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "x_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+59+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "w_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+63+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+67,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+68,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+69,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+70,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+71,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+72,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+73,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+74,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+75,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+76,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+77,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+78,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+79,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+80,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+81,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+82,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+83,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+84,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+85,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+86,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[4]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+87,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+88,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[5]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[6]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[7]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+89,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+90,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+91,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+92,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+93,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+94,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+95,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+96,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+97,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+98,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+99,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+100,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_macs[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+101,0,"partial",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+102,0,"clamped",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+103,0,"neuron",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_act", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+104,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+105,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_clamp", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+106,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+107,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+271,0,"MIN_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+272,0,"MAX_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_mac", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"N",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+273,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"PIPE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"ZERO_GATING",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+108,0,"clk",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+109,0,"rst_n",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+275,0,"en",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+110,0,"x",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+111,0,"w",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+112,0,"b",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+113,0,"pre",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+276,0,"LEVELS",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"TREE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"OUT_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "x_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+114+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "w_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+118+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+122,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+123,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+124,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+125,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+126,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+127,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+128,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+129,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+130,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+131,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+132,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+133,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+134,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+135,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+136,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+137,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+138,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+139,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+140,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+141,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[4]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+142,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+143,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[5]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[6]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[7]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+144,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+145,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+146,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+147,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+148,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+149,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+150,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+151,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+152,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+153,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+154,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+155,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_macs[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+156,0,"partial",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+157,0,"clamped",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+158,0,"neuron",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_act", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+159,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+160,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_clamp", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+161,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+162,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+271,0,"MIN_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+272,0,"MAX_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_mac", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"N",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+273,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"PIPE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"ZERO_GATING",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+163,0,"clk",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+164,0,"rst_n",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+275,0,"en",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+165,0,"x",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+166,0,"w",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+167,0,"b",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+168,0,"pre",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+276,0,"LEVELS",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"TREE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"OUT_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "x_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+169+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "w_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+173+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+177,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+178,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+179,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+180,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+181,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+182,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+183,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+184,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+185,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+186,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+187,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+188,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+189,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+190,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+191,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+192,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+193,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+194,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+195,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+196,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[4]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+197,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+198,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[5]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[6]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[7]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+199,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+200,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+201,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+202,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+203,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+204,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+205,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+206,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+207,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+208,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+209,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+210,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_macs[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+211,0,"partial",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+212,0,"clamped",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+213,0,"neuron",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_act", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+214,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+215,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_clamp", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+267,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+216,0,"in",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+217,0,"out",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+271,0,"MIN_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+272,0,"MAX_VAL",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "u_mac", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+266,0,"N",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+273,0,"DATA_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+268,0,"ACC_WIDTH",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"PIPE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+270,0,"ZERO_GATING",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BIT(tracep,c+218,0,"clk",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+219,0,"rst_n",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BIT(tracep,c+275,0,"en",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+220,0,"x",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+221,0,"w",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+222,0,"b",-1, VerilatedTraceSigDirection::INPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+223,0,"pre",-1, VerilatedTraceSigDirection::OUTPUT, VerilatedTraceSigKind::WIRE, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+276,0,"LEVELS",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"TREE_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_DECL_BUS(tracep,c+274,0,"OUT_STAGES",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::PARAMETER, VerilatedTraceSigType::INT, 31,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "x_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+224+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "w_arr", VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+228+i*1,0,"",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+232,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+233,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+234,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+235,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+236,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+237,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+238,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+239,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+240,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+241,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+242,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+243,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+244,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+245,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+246,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+247,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+248,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_product", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_isolated", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BIT(tracep,c+249,0,"zero",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC);
+    VL_TRACE_DECL_BUS(tracep,c+250,0,"x_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_DECL_BUS(tracep,c+251,0,"w_iso",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 7,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[4]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+252,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+253,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[5]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[6]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[7]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+254,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+255,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+256,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+257,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+258,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+259,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+277,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[2]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+260,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+261,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[1]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+262,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+263,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_level[3]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_PUSH_PREFIX(tracep, "gen_node[0]", VerilatedTracePrefixType::SCOPE_MODULE, 0, 0);
+    VL_TRACE_DECL_BUS(tracep,c+264,0,"sum",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_DECL_BUS(tracep,c+265,0,"node",-1, VerilatedTraceSigDirection::NONE, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, 17,0);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+    VL_TRACE_POP_PREFIX(tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____0(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction);
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype____0(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root__trace_init_dtype_sub____0(vlSelf, tracep, name, fidx, c, direction);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____0(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype_sub____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    VL_TRACE_PUSH_PREFIX(tracep, name, VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+0+i*1,fidx,"",-1, direction, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 17,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____1(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction);
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype____1(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype____1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root__trace_init_dtype_sub____1(vlSelf, tracep, name, fidx, c, direction);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____1(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype_sub____1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    VL_TRACE_PUSH_PREFIX(tracep, name, VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+0+i*1,fidx,"",-1, direction, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 17,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____2(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction);
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype____2(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype____2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root__trace_init_dtype_sub____2(vlSelf, tracep, name, fidx, c, direction);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____2(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype_sub____2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    VL_TRACE_PUSH_PREFIX(tracep, name, VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+0+i*1,fidx,"",-1, direction, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____3(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction);
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype____3(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype____3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root__trace_init_dtype_sub____3(vlSelf, tracep, name, fidx, c, direction);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____3(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype_sub____3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    VL_TRACE_PUSH_PREFIX(tracep, name, VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+0+i*1,fidx,"",-1, direction, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____4(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction);
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype____4(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype____4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root__trace_init_dtype_sub____4(vlSelf, tracep, name, fidx, c, direction);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_dtype_sub____4(Vtop___024root* vlSelf, VerilatedFst* tracep, const char* name, uint32_t fidx, uint32_t c, VerilatedTraceSigDirection direction) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_dtype_sub____4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    VL_TRACE_PUSH_PREFIX(tracep, name, VerilatedTracePrefixType::ARRAY_UNPACKED, 0, 3);
+    for (int i = 0; i < 4; ++i) {
+        VL_TRACE_DECL_BUS_ARRAY(tracep,c+0+i*1,fidx,"",-1, direction, VerilatedTraceSigKind::VAR, VerilatedTraceSigType::LOGIC, (i + 0), 7,0);
+    }
+    VL_TRACE_POP_PREFIX(tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_init_top(Vtop___024root* vlSelf, VerilatedFst* tracep) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_init_top\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root__trace_init_sub__TOP__0(vlSelf, tracep);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_const_0(void* voidSelf, VerilatedFst::Buffer* bufp);
+VL_ATTR_COLD void Vtop___024root__trace_full_0(void* voidSelf, VerilatedFst::Buffer* bufp);
+void Vtop___024root__trace_chg_0(void* voidSelf, VerilatedFst::Buffer* bufp);
+void Vtop___024root__trace_cleanup(void* voidSelf, VerilatedFst* /*unused*/);
+
+VL_ATTR_COLD void Vtop___024root__trace_register(Vtop___024root* vlSelf, VerilatedFst* tracep) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_register\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    tracep->addConstCb(&Vtop___024root__trace_const_0, 0, vlSelf);
+    tracep->addFullCb(&Vtop___024root__trace_full_0, 0, vlSelf);
+    tracep->addChgCb(&Vtop___024root__trace_chg_0, 0, vlSelf);
+    tracep->addCleanupCb(&Vtop___024root__trace_cleanup, vlSelf);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_const_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp);
+
+VL_ATTR_COLD void Vtop___024root__trace_const_0(void* voidSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_const_0\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    Vtop___024root__trace_const_0_sub_0((&vlSymsp->TOP), bufp);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_const_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_const_0_sub_0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode);
+    bufp->fullIData(oldp+266,(4U),32);
+    bufp->fullIData(oldp+267,(8U),32);
+    bufp->fullIData(oldp+268,(0x00000012U),32);
+    bufp->fullIData(oldp+269,(0x00000010U),32);
+    bufp->fullIData(oldp+270,(1U),32);
+    bufp->fullIData(oldp+271,(0xffffff80U),32);
+    bufp->fullIData(oldp+272,(0x0000007fU),32);
+    bufp->fullIData(oldp+273,(8U),32);
+    bufp->fullIData(oldp+274,(0U),32);
+    bufp->fullBit(oldp+275,(1U));
+    bufp->fullIData(oldp+276,(3U),32);
+    bufp->fullIData(oldp+277,(0U),18);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_full_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp);
+
+VL_ATTR_COLD void Vtop___024root__trace_full_0(void* voidSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_full_0\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    Vtop___024root__trace_full_0_sub_0((&vlSymsp->TOP), bufp);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_full_dtype____0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp, uint32_t offset, const VlUnpacked<IData/*17:0*/, 4>& __VdtypeVar);
+
+VL_ATTR_COLD void Vtop___024root__trace_full_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_full_0_sub_0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode);
+    bufp->fullBit(oldp+0,(vlSelfRef.clk));
+    bufp->fullBit(oldp+1,(vlSelfRef.rst_n));
+    bufp->fullBit(oldp+2,(vlSelfRef.start));
+    bufp->fullIData(oldp+3,(vlSelfRef.in_vec),32);
+    bufp->fullWData(oldp+4,(vlSelfRef.weights),128);
+    bufp->fullIData(oldp+8,(vlSelfRef.biases),32);
+    bufp->fullBit(oldp+9,(vlSelfRef.busy));
+    bufp->fullBit(oldp+10,(vlSelfRef.done));
+    bufp->fullIData(oldp+11,(vlSelfRef.out_vec),32);
+    bufp->fullBit(oldp+12,(vlSelfRef.FoldedLayer__DOT__clk));
+    bufp->fullBit(oldp+13,(vlSelfRef.FoldedLayer__DOT__rst_n));
+    bufp->fullBit(oldp+14,(vlSelfRef.FoldedLayer__DOT__start));
+    bufp->fullIData(oldp+15,(vlSelfRef.FoldedLayer__DOT__in_vec),32);
+    bufp->fullWData(oldp+16,(vlSelfRef.FoldedLayer__DOT__weights),128);
+    bufp->fullIData(oldp+20,(vlSelfRef.FoldedLayer__DOT__biases),32);
+    bufp->fullBit(oldp+21,(vlSelfRef.FoldedLayer__DOT__busy));
+    bufp->fullBit(oldp+22,(vlSelfRef.FoldedLayer__DOT__done));
+    bufp->fullIData(oldp+23,(vlSelfRef.FoldedLayer__DOT__out_vec),32);
+    bufp->fullBit(oldp+24,(vlSelfRef.FoldedLayer__DOT__chunk));
+    bufp->fullBit(oldp+25,(vlSelfRef.FoldedLayer__DOT__group));
+    bufp->fullBit(oldp+26,(vlSelfRef.FoldedLayer__DOT__first));
+    bufp->fullBit(oldp+27,(vlSelfRef.FoldedLayer__DOT__cur));
+    bufp->fullBit(oldp+28,(vlSelfRef.FoldedLayer__DOT__next_chunk));
+    bufp->fullBit(oldp+29,(vlSelfRef.FoldedLayer__DOT__live));
+    bufp->fullBit(oldp+30,(vlSelfRef.FoldedLayer__DOT__step));
+    bufp->fullBit(oldp+31,(vlSelfRef.FoldedLayer__DOT__last_chunk));
+    bufp->fullBit(oldp+32,(vlSelfRef.FoldedLayer__DOT__last_step));
+    bufp->fullIData(oldp+33,(vlSelfRef.FoldedLayer__DOT__x_chunk),32);
+    Vtop___024root__trace_full_dtype____0(vlSelf, bufp, 34, vlSelfRef.FoldedLayer__DOT__acc);
+    bufp->fullIData(oldp+38,(vlSelfRef.FoldedLayer__DOT__acc_next[0]),18);
+    bufp->fullIData(oldp+39,(vlSelfRef.FoldedLayer__DOT__acc_next[1]),18);
+    bufp->fullIData(oldp+40,(vlSelfRef.FoldedLayer__DOT__acc_next[2]),18);
+    bufp->fullIData(oldp+41,(vlSelfRef.FoldedLayer__DOT__acc_next[3]),18);
+    bufp->fullCData(oldp+42,(vlSelfRef.FoldedLayer__DOT__relu_out[0]),8);
+    bufp->fullCData(oldp+43,(vlSelfRef.FoldedLayer__DOT__relu_out[1]),8);
+    bufp->fullCData(oldp+44,(vlSelfRef.FoldedLayer__DOT__relu_out[2]),8);
+    bufp->fullCData(oldp+45,(vlSelfRef.FoldedLayer__DOT__relu_out[3]),8);
+    bufp->fullIData(oldp+46,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial),18);
+    bufp->fullCData(oldp+47,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped),8);
+    bufp->fullIData(oldp+48,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron),32);
+    bufp->fullCData(oldp+49,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in),8);
+    bufp->fullCData(oldp+50,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out),8);
+    bufp->fullIData(oldp+51,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in),18);
+    bufp->fullCData(oldp+52,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out),8);
+    bufp->fullBit(oldp+53,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__clk));
+    bufp->fullBit(oldp+54,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__rst_n));
+    bufp->fullIData(oldp+55,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x),32);
+    bufp->fullIData(oldp+56,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w),32);
+    bufp->fullCData(oldp+57,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b),8);
+    bufp->fullIData(oldp+58,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre),18);
+    bufp->fullCData(oldp+59,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->fullCData(oldp+60,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->fullCData(oldp+61,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->fullCData(oldp+62,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->fullCData(oldp+63,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->fullCData(oldp+64,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->fullCData(oldp+65,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->fullCData(oldp+66,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->fullIData(oldp+67,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+68,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullBit(oldp+69,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+70,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+71,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+72,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+73,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullBit(oldp+74,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+75,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+76,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+77,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+78,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullBit(oldp+79,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+80,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+81,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+82,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->fullIData(oldp+83,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->fullBit(oldp+84,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+85,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+86,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+87,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->fullIData(oldp+88,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->fullIData(oldp+89,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+90,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+91,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+92,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+93,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+94,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullIData(oldp+95,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+96,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+97,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+98,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+99,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+100,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+101,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__partial),18);
+    bufp->fullCData(oldp+102,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__clamped),8);
+    bufp->fullIData(oldp+103,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__neuron),32);
+    bufp->fullCData(oldp+104,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__in),8);
+    bufp->fullCData(oldp+105,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__out),8);
+    bufp->fullIData(oldp+106,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__in),18);
+    bufp->fullCData(oldp+107,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__out),8);
+    bufp->fullBit(oldp+108,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__clk));
+    bufp->fullBit(oldp+109,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__rst_n));
+    bufp->fullIData(oldp+110,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x),32);
+    bufp->fullIData(oldp+111,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w),32);
+    bufp->fullCData(oldp+112,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__b),8);
+    bufp->fullIData(oldp+113,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__pre),18);
+    bufp->fullCData(oldp+114,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->fullCData(oldp+115,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->fullCData(oldp+116,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->fullCData(oldp+117,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->fullCData(oldp+118,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->fullCData(oldp+119,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->fullCData(oldp+120,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->fullCData(oldp+121,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->fullIData(oldp+122,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+123,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullBit(oldp+124,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+125,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+126,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+127,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+128,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullBit(oldp+129,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+130,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+131,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+132,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+133,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullBit(oldp+134,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+135,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+136,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+137,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->fullIData(oldp+138,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->fullBit(oldp+139,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+140,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+141,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+142,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->fullIData(oldp+143,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->fullIData(oldp+144,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+145,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+146,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+147,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+148,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+149,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullIData(oldp+150,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+151,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+152,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+153,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+154,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+155,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+156,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__partial),18);
+    bufp->fullCData(oldp+157,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__clamped),8);
+    bufp->fullIData(oldp+158,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__neuron),32);
+    bufp->fullCData(oldp+159,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__in),8);
+    bufp->fullCData(oldp+160,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__out),8);
+    bufp->fullIData(oldp+161,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__in),18);
+    bufp->fullCData(oldp+162,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__out),8);
+    bufp->fullBit(oldp+163,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__clk));
+    bufp->fullBit(oldp+164,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__rst_n));
+    bufp->fullIData(oldp+165,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x),32);
+    bufp->fullIData(oldp+166,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w),32);
+    bufp->fullCData(oldp+167,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__b),8);
+    bufp->fullIData(oldp+168,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__pre),18);
+    bufp->fullCData(oldp+169,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->fullCData(oldp+170,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->fullCData(oldp+171,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->fullCData(oldp+172,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->fullCData(oldp+173,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->fullCData(oldp+174,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->fullCData(oldp+175,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->fullCData(oldp+176,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->fullIData(oldp+177,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+178,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullBit(oldp+179,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+180,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+181,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+182,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+183,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullBit(oldp+184,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+185,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+186,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+187,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+188,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullBit(oldp+189,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+190,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+191,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+192,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->fullIData(oldp+193,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->fullBit(oldp+194,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+195,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+196,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+197,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->fullIData(oldp+198,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->fullIData(oldp+199,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+200,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+201,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+202,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+203,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+204,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullIData(oldp+205,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+206,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+207,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+208,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+209,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+210,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+211,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__partial),18);
+    bufp->fullCData(oldp+212,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__clamped),8);
+    bufp->fullIData(oldp+213,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__neuron),32);
+    bufp->fullCData(oldp+214,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__in),8);
+    bufp->fullCData(oldp+215,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__out),8);
+    bufp->fullIData(oldp+216,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__in),18);
+    bufp->fullCData(oldp+217,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__out),8);
+    bufp->fullBit(oldp+218,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__clk));
+    bufp->fullBit(oldp+219,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__rst_n));
+    bufp->fullIData(oldp+220,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x),32);
+    bufp->fullIData(oldp+221,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w),32);
+    bufp->fullCData(oldp+222,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__b),8);
+    bufp->fullIData(oldp+223,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__pre),18);
+    bufp->fullCData(oldp+224,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->fullCData(oldp+225,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->fullCData(oldp+226,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[2]),8);
+    bufp->fullCData(oldp+227,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr[3]),8);
+    bufp->fullCData(oldp+228,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->fullCData(oldp+229,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->fullCData(oldp+230,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[2]),8);
+    bufp->fullCData(oldp+231,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr[3]),8);
+    bufp->fullIData(oldp+232,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+233,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullBit(oldp+234,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+235,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+236,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+237,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+238,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullBit(oldp+239,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+240,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+241,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+242,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+243,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullBit(oldp+244,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+245,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+246,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+247,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->fullIData(oldp+248,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->fullBit(oldp+249,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero));
+    bufp->fullCData(oldp+250,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso),8);
+    bufp->fullCData(oldp+251,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso),8);
+    bufp->fullIData(oldp+252,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->fullIData(oldp+253,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->fullIData(oldp+254,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+255,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+256,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+257,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+258,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->fullIData(oldp+259,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->fullIData(oldp+260,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+261,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->fullIData(oldp+262,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->fullIData(oldp+263,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->fullIData(oldp+264,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->fullIData(oldp+265,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+}
+
+VL_ATTR_COLD void Vtop___024root__trace_full_dtype____0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp, uint32_t offset, const VlUnpacked<IData/*17:0*/, 4>& __VdtypeVar) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_full_dtype____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode + offset);
+    bufp->fullIData(oldp+0,(__VdtypeVar[0]),18);
+    bufp->fullIData(oldp+1,(__VdtypeVar[1]),18);
+    bufp->fullIData(oldp+2,(__VdtypeVar[2]),18);
+    bufp->fullIData(oldp+3,(__VdtypeVar[3]),18);
+}
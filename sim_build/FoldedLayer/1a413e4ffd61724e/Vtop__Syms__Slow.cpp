@@ -0,0 +1,821 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(300);
+    // Setup sub module instances
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-9);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_FoldedLayer = new VerilatedScope{this, "FoldedLayer", "FoldedLayer", "FoldedLayer", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0]", "gen_macs[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_act", "u_act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_clamp", "u_clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac", "u_mac", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0]", "gen_level[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[0].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[1].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[2].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[3].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[4]", "gen_node[4]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[5]", "gen_node[5]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[6]", "gen_node[6]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[0].gen_node[7]", "gen_node[7]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[1]", "gen_level[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[1].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[1].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[1].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[1].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[2]", "gen_level[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[2].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[2].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[3]", "gen_level[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.gen_level[3].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1]", "gen_macs[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_act", "u_act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_clamp", "u_clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac", "u_mac", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0]", "gen_level[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[0].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[1].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[2].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[3].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[4]", "gen_node[4]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[5]", "gen_node[5]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[6]", "gen_node[6]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[0].gen_node[7]", "gen_node[7]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[1]", "gen_level[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[1].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[1].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[1].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[1].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[2]", "gen_level[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[2].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[2].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[3]", "gen_level[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[1].u_mac.gen_level[3].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2]", "gen_macs[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_act", "u_act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_clamp", "u_clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac", "u_mac", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0]", "gen_level[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[0].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[1].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[2].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[3].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[4]", "gen_node[4]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[5]", "gen_node[5]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[6]", "gen_node[6]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[0].gen_node[7]", "gen_node[7]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[1]", "gen_level[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[1].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[1].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[1].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[1].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[2]", "gen_level[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[2].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[2].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[3]", "gen_level[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[2].u_mac.gen_level[3].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3]", "gen_macs[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_act", "u_act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_clamp", "u_clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac", "u_mac", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0]", "gen_level[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[0].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[1].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[2].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[3].gen_product", "gen_product", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[4]", "gen_node[4]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[5]", "gen_node[5]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[6]", "gen_node[6]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[0].gen_node[7]", "gen_node[7]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[1]", "gen_level[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[1].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[1].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[1].gen_node[2]", "gen_node[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[1].gen_node[3]", "gen_node[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[2]", "gen_level[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[2].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[2].gen_node[1]", "gen_node[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[3]", "gen_level[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[3].u_mac.gen_level[3].gen_node[0]", "gen_node[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__unnamedblk1 = new VerilatedScope{this, "FoldedLayer.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2 = new VerilatedScope{this, "FoldedLayer.unnamedblk1.unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__unnamedblk3 = new VerilatedScope{this, "FoldedLayer.unnamedblk3", "unnamedblk3", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__unnamedblk4 = new VerilatedScope{this, "FoldedLayer.unnamedblk4", "unnamedblk4", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__unnamedblk5 = new VerilatedScope{this, "FoldedLayer.unnamedblk5", "unnamedblk5", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_TOP = new VerilatedScope{this, "TOP", "TOP", "<null>", 0, VerilatedScope::SCOPE_OTHER};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_FoldedLayer);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk1);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk3);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk4);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk5);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer__unnamedblk1, __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_FoldedLayer->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("CHUNKS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__CHUNKS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("CHUNK_W", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__CHUNK_W))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("GROUP", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__GROUP))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("GROUPS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__GROUPS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("GROUP_W", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__GROUP_W))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("IN_N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__IN_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("LANES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__LANES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("OUT_N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__OUT_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("PARALLELISM", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__PARALLELISM))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("ZERO_SKIP", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__ZERO_SKIP))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("acc", &(TOP.FoldedLayer__DOT__acc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 1, 1 ,0,3 ,17,0);
+    __Vscopep_FoldedLayer->varInsert("acc_next", &(TOP.FoldedLayer__DOT__acc_next), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,17,0);
+    __Vscopep_FoldedLayer->varInsert("biases", &(TOP.FoldedLayer__DOT__biases), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("busy", &(TOP.FoldedLayer__DOT__busy), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("chunk", &(TOP.FoldedLayer__DOT__chunk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_FoldedLayer->varInsert("clk", &(TOP.FoldedLayer__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("cur", &(TOP.FoldedLayer__DOT__cur), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_FoldedLayer->varInsert("done", &(TOP.FoldedLayer__DOT__done), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("first", &(TOP.FoldedLayer__DOT__first), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("group", &(TOP.FoldedLayer__DOT__group), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_FoldedLayer->varInsert("in_vec", &(TOP.FoldedLayer__DOT__in_vec), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("last_chunk", &(TOP.FoldedLayer__DOT__last_chunk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("last_step", &(TOP.FoldedLayer__DOT__last_step), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("live", &(TOP.FoldedLayer__DOT__live), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_FoldedLayer->varInsert("next_chunk", &(TOP.FoldedLayer__DOT__next_chunk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_FoldedLayer->varInsert("out_vec", &(TOP.FoldedLayer__DOT__out_vec), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("relu_out", &(TOP.FoldedLayer__DOT__relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer->varInsert("rst_n", &(TOP.FoldedLayer__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("start", &(TOP.FoldedLayer__DOT__start), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("step", &(TOP.FoldedLayer__DOT__step), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("weights", &(TOP.FoldedLayer__DOT__weights), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_FoldedLayer->varInsert("x_chunk", &(TOP.FoldedLayer__DOT__x_chunk), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__->varInsert("clamped", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__->varInsert("neuron", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__->varInsert("partial", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("H", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__H))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("LEVELS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__LEVELS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("OUT_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__OUT_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("TREE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__TREE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("ZERO_GATING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__ZERO_GATING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("b", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("clk", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("en", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__en), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("int4", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__int4), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("pre", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("rst_n", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("w", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("w_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("x", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("x_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__->varInsert("clamped", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__->varInsert("neuron", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__neuron), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__->varInsert("partial", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__partial), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("H", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__H))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("LEVELS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__LEVELS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("OUT_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__OUT_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("TREE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__TREE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("ZERO_GATING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__ZERO_GATING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("b", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("clk", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("en", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__en), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("int4", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__int4), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("pre", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("rst_n", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("w", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("w_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("x", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac->varInsert("x_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__->varInsert("clamped", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__->varInsert("neuron", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__neuron), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__->varInsert("partial", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__partial), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("H", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__H))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("LEVELS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__LEVELS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("OUT_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__OUT_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("TREE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__TREE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("ZERO_GATING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__ZERO_GATING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("b", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("clk", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("en", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__en), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("int4", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__int4), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("pre", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("rst_n", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("w", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("w_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("x", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac->varInsert("x_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__->varInsert("clamped", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__->varInsert("neuron", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__neuron), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__->varInsert("partial", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__partial), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("H", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__H))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("LEVELS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__LEVELS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("OUT_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__OUT_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("TREE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__TREE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("ZERO_GATING", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__ZERO_GATING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("b", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("clk", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("en", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__en), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("int4", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__int4), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("pre", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("rst_n", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("w", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("w_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("x", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac->varInsert("x_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,3 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("w_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("x_op", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP.FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__unnamedblk1->varInsert("c", &(TOP.FoldedLayer__DOT__unnamedblk1__DOT__c), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2->varInsert("k", &(TOP.FoldedLayer__DOT__unnamedblk1__DOT__unnamedblk2__DOT__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__unnamedblk3->varInsert("c", &(TOP.FoldedLayer__DOT__unnamedblk3__DOT__c), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__unnamedblk4->varInsert("c", &(TOP.FoldedLayer__DOT__unnamedblk4__DOT__c), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__unnamedblk5->varInsert("k", &(TOP.FoldedLayer__DOT__unnamedblk5__DOT__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("biases", &(TOP.biases), false, VLVT_UINT32, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("busy", &(TOP.busy), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("clk", &(TOP.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("done", &(TOP.done), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("in_vec", &(TOP.in_vec), false, VLVT_UINT32, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("out_vec", &(TOP.out_vec), false, VLVT_UINT32, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("rst_n", &(TOP.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("start", &(TOP.start), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("weights", &(TOP.weights), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_FoldedLayer);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk1);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk3);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk4);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk5);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer__unnamedblk1, __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer, __Vscopep_FoldedLayer = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__1__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__2__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__3__KET____u_mac__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__unnamedblk1, __Vscopep_FoldedLayer__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2, __Vscopep_FoldedLayer__unnamedblk1__unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__unnamedblk3, __Vscopep_FoldedLayer__unnamedblk3 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__unnamedblk4, __Vscopep_FoldedLayer__unnamedblk4 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__unnamedblk5, __Vscopep_FoldedLayer__unnamedblk5 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_TOP, __Vscopep_TOP = nullptr);
+    // Tear down sub module instances
+}
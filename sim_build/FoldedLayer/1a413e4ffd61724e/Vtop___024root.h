@@ -0,0 +1,388 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        VL_IN8(clk,0,0);
+        VL_IN8(rst_n,0,0);
+        VL_IN8(start,0,0);
+        VL_OUT8(busy,0,0);
+        VL_OUT8(done,0,0);
+        CData/*0:0*/ FoldedLayer__DOT____Vlvbound_hf3a2e955__1;
+        CData/*0:0*/ FoldedLayer__DOT____Vlvbound_hf3a2e955__0;
+        CData/*0:0*/ FoldedLayer__DOT__clk;
+        CData/*0:0*/ FoldedLayer__DOT__rst_n;
+        CData/*0:0*/ FoldedLayer__DOT__start;
+        CData/*0:0*/ FoldedLayer__DOT__busy;
+        CData/*0:0*/ FoldedLayer__DOT__done;
+        CData/*0:0*/ FoldedLayer__DOT__chunk;
+        CData/*0:0*/ FoldedLayer__DOT__group;
+        CData/*0:0*/ FoldedLayer__DOT__first;
+        CData/*0:0*/ FoldedLayer__DOT__cur;
+        CData/*0:0*/ FoldedLayer__DOT__next_chunk;
+        CData/*0:0*/ FoldedLayer__DOT__live;
+        CData/*0:0*/ FoldedLayer__DOT__step;
+        CData/*0:0*/ FoldedLayer__DOT__last_chunk;
+        CData/*0:0*/ FoldedLayer__DOT__last_step;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__clamped;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__clamped;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__clamped;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__clk;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__rst_n;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__en;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__int4;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__clk;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__rst_n;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__en;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__int4;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__b;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__out;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__in;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__out;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__clk;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__rst_n;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__en;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__int4;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__b;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+    };
+    struct {
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__out;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__in;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__out;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__clk;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__rst_n;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__en;
+        CData/*0:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__int4;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__b;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__out;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__in;
+        CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__out;
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+        VL_IN(in_vec,31,0);
+        VL_INW(weights,127,0,4);
+        VL_IN(biases,31,0);
+        VL_OUT(out_vec,31,0);
+        IData/*31:0*/ FoldedLayer__DOT__in_vec;
+        VlWide<4>/*127:0*/ FoldedLayer__DOT__weights;
+        IData/*31:0*/ FoldedLayer__DOT__biases;
+        IData/*31:0*/ FoldedLayer__DOT__out_vec;
+        IData/*31:0*/ FoldedLayer__DOT__x_chunk;
+        IData/*31:0*/ FoldedLayer__DOT__unnamedblk1__DOT__c;
+        IData/*31:0*/ FoldedLayer__DOT__unnamedblk1__DOT__unnamedblk2__DOT__k;
+        IData/*31:0*/ FoldedLayer__DOT__unnamedblk3__DOT__c;
+        IData/*31:0*/ FoldedLayer__DOT__unnamedblk4__DOT__c;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__partial;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__neuron;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__partial;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__neuron;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__partial;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__neuron;
+        IData/*31:0*/ FoldedLayer__DOT__unnamedblk5__DOT__k;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    };
+    struct {
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__pre;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__in;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__pre;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    };
+    struct {
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__in;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x;
+        IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__pre;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__in;
+        IData/*31:0*/ __VactIterCount;
+    };
+    struct {
+        VlUnpacked<IData/*17:0*/, 4> FoldedLayer__DOT__acc;
+        VlUnpacked<IData/*17:0*/, 4> FoldedLayer__DOT__acc_next;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__relu_out;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__w_arr;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+    };
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__IN_N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__OUT_N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__PARALLELISM = 0x00000010U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__ZERO_SKIP = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__LANES = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__GROUP = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__CHUNKS = 1U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__GROUPS = 1U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__CHUNK_W = 1U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__GROUP_W = 1U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__LEVELS = 3U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__H = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__LEVELS = 3U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__H = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__LEVELS = 3U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_mac__DOT__H = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__2__KET____DOT__u_act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__LEVELS = 3U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_mac__DOT__H = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__3__KET____DOT__u_act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
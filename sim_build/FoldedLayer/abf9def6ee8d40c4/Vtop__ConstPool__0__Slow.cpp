@@ -0,0 +1,99 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Constant pool
+
+#include "verilated.h"
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h6dbe466d_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h81ab3712_0 = {{
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*3:0*/, 128> Vtop__ConstPool__TABLE_ha14fcd12_0 = {{
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 7U, 0x0fU, 1U, 0x0fU, 0x0fU,
+    0x0fU, 1U, 0x0fU, 0x0fU, 0x0fU, 1U, 0x0fU, 0x0fU
+}};
+
+extern const VlUnpacked<CData/*1:0*/, 128> Vtop__ConstPool__TABLE_hdf3f0819_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 2U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 3U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 2U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 3U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_he836ffa2_0 = {{
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U
+}};
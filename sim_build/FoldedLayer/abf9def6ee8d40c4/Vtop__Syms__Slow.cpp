@@ -0,0 +1,127 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(264);
+    // Setup sub module instances
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-9);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_FoldedLayer = new VerilatedScope{this, "FoldedLayer", "FoldedLayer", "FoldedLayer", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__ = new VerilatedScope{this, "FoldedLayer.gen_macs[0]", "gen_macs[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_act", "u_act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_clamp", "u_clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac", "u_mac", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__unnamedblk1 = new VerilatedScope{this, "FoldedLayer.gen_macs[0].u_mac.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_FoldedLayer__unnamedblk1 = new VerilatedScope{this, "FoldedLayer.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_TOP = new VerilatedScope{this, "TOP", "TOP", "<null>", 0, VerilatedScope::SCOPE_OTHER};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_FoldedLayer);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__);
+    __Vhier.add(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk1);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac);
+    __Vhier.add(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__unnamedblk1);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_FoldedLayer->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("CHUNKS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__CHUNKS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("CHUNK_W", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__CHUNK_W))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("GROUP", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__GROUP))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("GROUPS", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__GROUPS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("GROUP_W", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__GROUP_W))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("IN_N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__IN_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("LANES", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__LANES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("OUT_N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__OUT_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("PARALLELISM", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__PARALLELISM))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("acc", &(TOP.FoldedLayer__DOT__acc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 1, 1 ,0,0 ,17,0);
+    __Vscopep_FoldedLayer->varInsert("acc_next", &(TOP.FoldedLayer__DOT__acc_next), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,0 ,17,0);
+    __Vscopep_FoldedLayer->varInsert("biases", &(TOP.FoldedLayer__DOT__biases), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("busy", &(TOP.FoldedLayer__DOT__busy), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("chunk", &(TOP.FoldedLayer__DOT__chunk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_FoldedLayer->varInsert("clk", &(TOP.FoldedLayer__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("done", &(TOP.FoldedLayer__DOT__done), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("group", &(TOP.FoldedLayer__DOT__group), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,1,0);
+    __Vscopep_FoldedLayer->varInsert("in_vec", &(TOP.FoldedLayer__DOT__in_vec), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("last_chunk", &(TOP.FoldedLayer__DOT__last_chunk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("last_step", &(TOP.FoldedLayer__DOT__last_step), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("out_vec", &(TOP.FoldedLayer__DOT__out_vec), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer->varInsert("relu_out", &(TOP.FoldedLayer__DOT__relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 1, 1 ,0,0 ,7,0);
+    __Vscopep_FoldedLayer->varInsert("rst_n", &(TOP.FoldedLayer__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("start", &(TOP.FoldedLayer__DOT__start), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("step", &(TOP.FoldedLayer__DOT__step), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_FoldedLayer->varInsert("weights", &(TOP.FoldedLayer__DOT__weights), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_FoldedLayer->varInsert("x_chunk", &(TOP.FoldedLayer__DOT__x_chunk), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,15,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__->varInsert("clamped", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__->varInsert("neuron", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__->varInsert("partial", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("in", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp->varInsert("out", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("b", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("dp", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("pre", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,17,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("w", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,15,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("w_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("x", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,15,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac->varInsert("x_arr", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,1 ,7,0);
+    __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__unnamedblk1->varInsert("i", &(TOP.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_FoldedLayer__unnamedblk1->varInsert("k", &(TOP.FoldedLayer__DOT__unnamedblk1__DOT__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("biases", &(TOP.biases), false, VLVT_UINT32, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("busy", &(TOP.busy), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("clk", &(TOP.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("done", &(TOP.done), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("in_vec", &(TOP.in_vec), false, VLVT_UINT32, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("out_vec", &(TOP.out_vec), false, VLVT_UINT32, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("rst_n", &(TOP.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("start", &(TOP.start), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("weights", &(TOP.weights), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_FoldedLayer);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_FoldedLayer, __Vscopep_FoldedLayer__unnamedblk1);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac);
+    __Vhier.remove(__Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__unnamedblk1);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer, __Vscopep_FoldedLayer = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__unnamedblk1, __Vscopep_FoldedLayer__gen_macs__BRA__0__KET____u_mac__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_FoldedLayer__unnamedblk1, __Vscopep_FoldedLayer__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_TOP, __Vscopep_TOP = nullptr);
+    // Tear down sub module instances
+}
@@ -0,0 +1,93 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Tracing implementation internals
+
+#include "verilated_fst_c.h"
+#include "Vtop__Syms.h"
+
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp);
+
+void Vtop___024root__trace_chg_0(void* voidSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    if (VL_UNLIKELY(!vlSymsp->__Vm_activity)) return;
+    Vtop___024root__trace_chg_0_sub_0((&vlSymsp->TOP), bufp);
+}
+
+void Vtop___024root__trace_chg_dtype____0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp, uint32_t offset, const VlUnpacked<IData/*17:0*/, 1>& __VdtypeVar);
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0_sub_0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode + 0);
+    bufp->chgBit(oldp+0,(vlSelfRef.clk));
+    bufp->chgBit(oldp+1,(vlSelfRef.rst_n));
+    bufp->chgBit(oldp+2,(vlSelfRef.start));
+    bufp->chgIData(oldp+3,(vlSelfRef.in_vec),32);
+    bufp->chgWData(oldp+4,(vlSelfRef.weights),128);
+    bufp->chgIData(oldp+8,(vlSelfRef.biases),32);
+    bufp->chgBit(oldp+9,(vlSelfRef.busy));
+    bufp->chgBit(oldp+10,(vlSelfRef.done));
+    bufp->chgIData(oldp+11,(vlSelfRef.out_vec),32);
+    bufp->chgBit(oldp+12,(vlSelfRef.FoldedLayer__DOT__clk));
+    bufp->chgBit(oldp+13,(vlSelfRef.FoldedLayer__DOT__rst_n));
+    bufp->chgBit(oldp+14,(vlSelfRef.FoldedLayer__DOT__start));
+    bufp->chgIData(oldp+15,(vlSelfRef.FoldedLayer__DOT__in_vec),32);
+    bufp->chgWData(oldp+16,(vlSelfRef.FoldedLayer__DOT__weights),128);
+    bufp->chgIData(oldp+20,(vlSelfRef.FoldedLayer__DOT__biases),32);
+    bufp->chgBit(oldp+21,(vlSelfRef.FoldedLayer__DOT__busy));
+    bufp->chgBit(oldp+22,(vlSelfRef.FoldedLayer__DOT__done));
+    bufp->chgIData(oldp+23,(vlSelfRef.FoldedLayer__DOT__out_vec),32);
+    bufp->chgBit(oldp+24,(vlSelfRef.FoldedLayer__DOT__chunk));
+    bufp->chgCData(oldp+25,(vlSelfRef.FoldedLayer__DOT__group),2);
+    bufp->chgBit(oldp+26,(vlSelfRef.FoldedLayer__DOT__step));
+    bufp->chgBit(oldp+27,(vlSelfRef.FoldedLayer__DOT__last_chunk));
+    bufp->chgBit(oldp+28,(vlSelfRef.FoldedLayer__DOT__last_step));
+    bufp->chgSData(oldp+29,(vlSelfRef.FoldedLayer__DOT__x_chunk),16);
+    Vtop___024root__trace_chg_dtype____0(vlSelf, bufp, 30, vlSelfRef.FoldedLayer__DOT__acc);
+    bufp->chgIData(oldp+31,(vlSelfRef.FoldedLayer__DOT__acc_next[0]),18);
+    bufp->chgCData(oldp+32,(vlSelfRef.FoldedLayer__DOT__relu_out[0]),8);
+    bufp->chgIData(oldp+33,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial),18);
+    bufp->chgCData(oldp+34,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped),8);
+    bufp->chgIData(oldp+35,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron),32);
+    bufp->chgCData(oldp+36,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in),8);
+    bufp->chgCData(oldp+37,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out),8);
+    bufp->chgIData(oldp+38,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in),18);
+    bufp->chgCData(oldp+39,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out),8);
+    bufp->chgSData(oldp+40,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x),16);
+    bufp->chgSData(oldp+41,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w),16);
+    bufp->chgCData(oldp+42,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b),8);
+    bufp->chgIData(oldp+43,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre),18);
+    bufp->chgCData(oldp+44,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+45,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+46,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+47,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[1]),8);
+    bufp->chgIData(oldp+48,(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp),18);
+}
+
+void Vtop___024root__trace_chg_dtype____0(Vtop___024root* vlSelf, VerilatedFst::Buffer* bufp, uint32_t offset, const VlUnpacked<IData/*17:0*/, 1>& __VdtypeVar) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_dtype____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode +  offset);
+    bufp->chgIData(oldp+0,(__VdtypeVar[0]),18);
+}
+
+void Vtop___024root__trace_cleanup(void* voidSelf, VerilatedFst* /*unused*/) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_cleanup\n"); );
+    // Locals
+    VlUnpacked<CData/*0:0*/, 1> __Vm_traceActivity;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        __Vm_traceActivity[__Vi0] = 0;
+    }
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    vlSymsp->__Vm_activity = false;
+    __Vm_traceActivity[0U] = 0U;
+}
@@ -0,0 +1,109 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    VL_IN8(clk,0,0);
+    VL_IN8(rst_n,0,0);
+    VL_IN8(start,0,0);
+    VL_OUT8(busy,0,0);
+    VL_OUT8(done,0,0);
+    CData/*0:0*/ FoldedLayer__DOT__clk;
+    CData/*0:0*/ FoldedLayer__DOT__rst_n;
+    CData/*0:0*/ FoldedLayer__DOT__start;
+    CData/*0:0*/ FoldedLayer__DOT__busy;
+    CData/*0:0*/ FoldedLayer__DOT__done;
+    CData/*0:0*/ FoldedLayer__DOT__chunk;
+    CData/*1:0*/ FoldedLayer__DOT__group;
+    CData/*0:0*/ FoldedLayer__DOT__step;
+    CData/*0:0*/ FoldedLayer__DOT__last_chunk;
+    CData/*0:0*/ FoldedLayer__DOT__last_step;
+    CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped;
+    CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b;
+    CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out;
+    CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in;
+    CData/*7:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out;
+    CData/*0:0*/ __VstlFirstIteration;
+    CData/*0:0*/ __VstlPhaseResult;
+    CData/*0:0*/ __VicoFirstIteration;
+    CData/*0:0*/ __VicoPhaseResult;
+    CData/*0:0*/ __Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0;
+    CData/*0:0*/ __Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0;
+    CData/*0:0*/ __VactPhaseResult;
+    CData/*0:0*/ __VnbaPhaseResult;
+    SData/*15:0*/ FoldedLayer__DOT__x_chunk;
+    SData/*15:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x;
+    SData/*15:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w;
+    VL_IN(in_vec,31,0);
+    VL_INW(weights,127,0,4);
+    VL_IN(biases,31,0);
+    VL_OUT(out_vec,31,0);
+    IData/*31:0*/ FoldedLayer__DOT__in_vec;
+    VlWide<4>/*127:0*/ FoldedLayer__DOT__weights;
+    IData/*31:0*/ FoldedLayer__DOT__biases;
+    IData/*31:0*/ FoldedLayer__DOT__out_vec;
+    IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial;
+    IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron;
+    IData/*31:0*/ FoldedLayer__DOT__unnamedblk1__DOT__k;
+    IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre;
+    IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp;
+    IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i;
+    IData/*17:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in;
+    IData/*31:0*/ __VactIterCount;
+    VlUnpacked<IData/*17:0*/, 1> FoldedLayer__DOT__acc;
+    VlUnpacked<IData/*17:0*/, 1> FoldedLayer__DOT__acc_next;
+    VlUnpacked<CData/*7:0*/, 1> FoldedLayer__DOT__relu_out;
+    VlUnpacked<CData/*7:0*/, 2> FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr;
+    VlUnpacked<CData/*7:0*/, 2> FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr;
+    VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__IN_N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__OUT_N = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__PARALLELISM = 2U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__LANES = 2U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__GROUP = 1U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__CHUNKS = 2U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__GROUPS = 4U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__CHUNK_W = 1U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__GROUP_W = 2U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__N = 2U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
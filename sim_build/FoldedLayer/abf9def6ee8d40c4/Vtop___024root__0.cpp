@@ -0,0 +1,560 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.FoldedLayer__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.FoldedLayer__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.busy = vlSelfRef.FoldedLayer__DOT__busy;
+    vlSelfRef.done = vlSelfRef.FoldedLayer__DOT__done;
+    vlSelfRef.out_vec = vlSelfRef.FoldedLayer__DOT__out_vec;
+    vlSelfRef.FoldedLayer__DOT__start = vlSelfRef.start;
+    vlSelfRef.FoldedLayer__DOT__last_chunk = vlSelfRef.FoldedLayer__DOT__chunk;
+    vlSelfRef.FoldedLayer__DOT__biases = vlSelfRef.biases;
+    vlSelfRef.FoldedLayer__DOT__weights[0U] = vlSelfRef.weights[0U];
+    vlSelfRef.FoldedLayer__DOT__weights[1U] = vlSelfRef.weights[1U];
+    vlSelfRef.FoldedLayer__DOT__weights[2U] = vlSelfRef.weights[2U];
+    vlSelfRef.FoldedLayer__DOT__weights[3U] = vlSelfRef.weights[3U];
+    vlSelfRef.FoldedLayer__DOT__in_vec = vlSelfRef.in_vec;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron 
+        = vlSelfRef.FoldedLayer__DOT__group;
+    vlSelfRef.FoldedLayer__DOT__step = ((IData)(vlSelfRef.FoldedLayer__DOT__start) 
+                                        | (IData)(vlSelfRef.FoldedLayer__DOT__busy));
+    vlSelfRef.FoldedLayer__DOT__last_step = ((IData)(vlSelfRef.FoldedLayer__DOT__last_chunk) 
+                                             & (3U 
+                                                == (IData)(vlSelfRef.FoldedLayer__DOT__group)));
+    vlSelfRef.FoldedLayer__DOT__x_chunk = (0x0000ffffU 
+                                           & (vlSelfRef.FoldedLayer__DOT__in_vec 
+                                              >> ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                  << 4U)));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b 
+        = (0x000000ffU & ((vlSelfRef.FoldedLayer__DOT__biases 
+                           >> (0x0000001fU & VL_MULS_III(32, (IData)(8U), vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron))) 
+                          & (- (IData)((1U & (~ (IData)(vlSelfRef.FoldedLayer__DOT__chunk)))))));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w 
+        = (0x0000ffffU & (((0U == (0x00000018U & ((
+                                                   VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                                   + 
+                                                   ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                    << 1U)) 
+                                                  << 3U)))
+                            ? 0U : (vlSelfRef.FoldedLayer__DOT__weights
+                                    [(((IData)(0x0000000fU) 
+                                       + (0x00000078U 
+                                          & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                              + ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                 << 1U)) 
+                                             << 3U))) 
+                                      >> 5U)] << ((IData)(0x00000020U) 
+                                                  - 
+                                                  (0x00000018U 
+                                                   & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                                       + 
+                                                       ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                        << 1U)) 
+                                                      << 3U))))) 
+                          | (vlSelfRef.FoldedLayer__DOT__weights
+                             [(3U & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                      + ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                         << 1U)) >> 2U))] 
+                             >> (0x00000018U & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                                 + 
+                                                 ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                  << 1U)) 
+                                                << 3U)))));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x 
+        = vlSelfRef.FoldedLayer__DOT__x_chunk;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[1U] 
+        = (0x000000ffU & ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w) 
+                          >> 8U));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[1U] 
+        = (0x000000ffU & ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x) 
+                          >> 8U));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 2U, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp 
+            = (0x0003ffffU & (vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp 
+                              + VL_MULS_III(18, (0x0003ffffU 
+                                                 & VL_EXTENDS_II(18,8, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr
+                                                                 [
+                                                                 (1U 
+                                                                  & vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i)])), 
+                                            (0x0003ffffU 
+                                             & VL_EXTENDS_II(18,8, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr
+                                                             [
+                                                             (1U 
+                                                              & vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre 
+        = (0x0003ffffU & (vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp 
+                          + ((0x0003ff00U & ((- (IData)(
+                                                        (1U 
+                                                         & ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b) 
+                                                            >> 7U)))) 
+                                             << 8U)) 
+                             | (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b))));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial 
+        = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre;
+    vlSelfRef.FoldedLayer__DOT__acc_next[0U] = (0x0003ffffU 
+                                                & ((IData)(vlSelfRef.FoldedLayer__DOT__chunk)
+                                                    ? 
+                                                   (vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial 
+                                                    + vlSelfRef.FoldedLayer__DOT__acc[0U])
+                                                    : vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in 
+        = vlSelfRef.FoldedLayer__DOT__acc_next[0U];
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,18, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,18, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in)));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped 
+        = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in 
+        = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out 
+        = ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in))))));
+    vlSelfRef.FoldedLayer__DOT__relu_out[0U] = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out;
+}
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VactTriggered[0U] = (QData)((IData)(
+                                                    ((((~ (IData)(vlSelfRef.FoldedLayer__DOT__rst_n)) 
+                                                       & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0)) 
+                                                      << 1U) 
+                                                     | ((IData)(vlSelfRef.FoldedLayer__DOT__clk) 
+                                                        & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0 
+        = vlSelfRef.FoldedLayer__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0 
+        = vlSelfRef.FoldedLayer__DOT__rst_n;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h6dbe466d_0;
+extern const VlUnpacked<CData/*3:0*/, 128> Vtop__ConstPool__TABLE_ha14fcd12_0;
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_he836ffa2_0;
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h81ab3712_0;
+extern const VlUnpacked<CData/*1:0*/, 128> Vtop__ConstPool__TABLE_hdf3f0819_0;
+
+void Vtop___024root___nba_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*6:0*/ __Vtableidx1;
+    __Vtableidx1 = 0;
+    IData/*17:0*/ __VdlyVal__FoldedLayer__DOT__acc__v0;
+    __VdlyVal__FoldedLayer__DOT__acc__v0 = 0;
+    CData/*0:0*/ __VdlySet__FoldedLayer__DOT__acc__v0;
+    __VdlySet__FoldedLayer__DOT__acc__v0 = 0;
+    CData/*0:0*/ __VdlySet__FoldedLayer__DOT__acc__v1;
+    __VdlySet__FoldedLayer__DOT__acc__v1 = 0;
+    // Body
+    __VdlySet__FoldedLayer__DOT__acc__v0 = 0U;
+    __VdlySet__FoldedLayer__DOT__acc__v1 = 0U;
+    if (vlSelfRef.FoldedLayer__DOT__rst_n) {
+        if (vlSelfRef.FoldedLayer__DOT__step) {
+            __VdlyVal__FoldedLayer__DOT__acc__v0 = vlSelfRef.FoldedLayer__DOT__acc_next[0U];
+            __VdlySet__FoldedLayer__DOT__acc__v0 = 1U;
+        }
+    } else {
+        __VdlySet__FoldedLayer__DOT__acc__v1 = 1U;
+    }
+    if (vlSelfRef.FoldedLayer__DOT__rst_n) {
+        if (((IData)(vlSelfRef.FoldedLayer__DOT__step) 
+             & (IData)(vlSelfRef.FoldedLayer__DOT__last_chunk))) {
+            vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k = 0U;
+            while (VL_GTS_III(32, 1U, vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k)) {
+                vlSelfRef.FoldedLayer__DOT__out_vec 
+                    = (((~ ((IData)(0x000000ffU) << 
+                            (0x0000001fU & VL_SHIFTL_III(5,32,32, 
+                                                         ((IData)(vlSelfRef.FoldedLayer__DOT__group) 
+                                                          + vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k), 3U)))) 
+                        & vlSelfRef.FoldedLayer__DOT__out_vec) 
+                       | (0x00000000ffffffffULL & (
+                                                   ((0U 
+                                                     >= 
+                                                     (1U 
+                                                      & vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k))
+                                                     ? vlSelfRef.FoldedLayer__DOT__relu_out
+                                                    [
+                                                    (1U 
+                                                     & vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k)]
+                                                     : 0U) 
+                                                   << 
+                                                   (0x0000001fU 
+                                                    & VL_SHIFTL_III(5,32,32, 
+                                                                    ((IData)(vlSelfRef.FoldedLayer__DOT__group) 
+                                                                     + vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k), 3U)))));
+                vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k 
+                    = ((IData)(1U) + vlSelfRef.FoldedLayer__DOT__unnamedblk1__DOT__k);
+            }
+        }
+    } else {
+        vlSelfRef.FoldedLayer__DOT__out_vec = 0U;
+    }
+    __Vtableidx1 = ((((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                      << 6U) | (((IData)(vlSelfRef.FoldedLayer__DOT__group) 
+                                 << 4U) | ((IData)(vlSelfRef.FoldedLayer__DOT__last_chunk) 
+                                           << 3U))) 
+                    | (((IData)(vlSelfRef.FoldedLayer__DOT__last_step) 
+                        << 2U) | (((IData)(vlSelfRef.FoldedLayer__DOT__step) 
+                                   << 1U) | (IData)(vlSelfRef.FoldedLayer__DOT__rst_n))));
+    vlSelfRef.FoldedLayer__DOT__done = Vtop__ConstPool__TABLE_h6dbe466d_0
+        [__Vtableidx1];
+    if ((2U & Vtop__ConstPool__TABLE_ha14fcd12_0[__Vtableidx1])) {
+        vlSelfRef.FoldedLayer__DOT__busy = Vtop__ConstPool__TABLE_he836ffa2_0
+            [__Vtableidx1];
+    }
+    if ((4U & Vtop__ConstPool__TABLE_ha14fcd12_0[__Vtableidx1])) {
+        vlSelfRef.FoldedLayer__DOT__chunk = Vtop__ConstPool__TABLE_h81ab3712_0
+            [__Vtableidx1];
+    }
+    if ((8U & Vtop__ConstPool__TABLE_ha14fcd12_0[__Vtableidx1])) {
+        vlSelfRef.FoldedLayer__DOT__group = Vtop__ConstPool__TABLE_hdf3f0819_0
+            [__Vtableidx1];
+    }
+    if (__VdlySet__FoldedLayer__DOT__acc__v0) {
+        vlSelfRef.FoldedLayer__DOT__acc[0U] = __VdlyVal__FoldedLayer__DOT__acc__v0;
+    }
+    if (__VdlySet__FoldedLayer__DOT__acc__v1) {
+        vlSelfRef.FoldedLayer__DOT__acc[0U] = 0U;
+    }
+    vlSelfRef.out_vec = vlSelfRef.FoldedLayer__DOT__out_vec;
+    vlSelfRef.done = vlSelfRef.FoldedLayer__DOT__done;
+    vlSelfRef.busy = vlSelfRef.FoldedLayer__DOT__busy;
+    vlSelfRef.FoldedLayer__DOT__step = ((IData)(vlSelfRef.FoldedLayer__DOT__start) 
+                                        | (IData)(vlSelfRef.FoldedLayer__DOT__busy));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron 
+        = vlSelfRef.FoldedLayer__DOT__group;
+    vlSelfRef.FoldedLayer__DOT__last_chunk = vlSelfRef.FoldedLayer__DOT__chunk;
+    vlSelfRef.FoldedLayer__DOT__x_chunk = (0x0000ffffU 
+                                           & (vlSelfRef.FoldedLayer__DOT__in_vec 
+                                              >> ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                  << 4U)));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b 
+        = (0x000000ffU & ((vlSelfRef.FoldedLayer__DOT__biases 
+                           >> (0x0000001fU & VL_MULS_III(32, (IData)(8U), vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron))) 
+                          & (- (IData)((1U & (~ (IData)(vlSelfRef.FoldedLayer__DOT__chunk)))))));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w 
+        = (0x0000ffffU & (((0U == (0x00000018U & ((
+                                                   VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                                   + 
+                                                   ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                    << 1U)) 
+                                                  << 3U)))
+                            ? 0U : (vlSelfRef.FoldedLayer__DOT__weights
+                                    [(((IData)(0x0000000fU) 
+                                       + (0x00000078U 
+                                          & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                              + ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                 << 1U)) 
+                                             << 3U))) 
+                                      >> 5U)] << ((IData)(0x00000020U) 
+                                                  - 
+                                                  (0x00000018U 
+                                                   & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                                       + 
+                                                       ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                        << 1U)) 
+                                                      << 3U))))) 
+                          | (vlSelfRef.FoldedLayer__DOT__weights
+                             [(3U & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                      + ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                         << 1U)) >> 2U))] 
+                             >> (0x00000018U & ((VL_SHIFTL_III(4,32,32, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron, 2U) 
+                                                 + 
+                                                 ((IData)(vlSelfRef.FoldedLayer__DOT__chunk) 
+                                                  << 1U)) 
+                                                << 3U)))));
+    vlSelfRef.FoldedLayer__DOT__last_step = ((IData)(vlSelfRef.FoldedLayer__DOT__last_chunk) 
+                                             & (3U 
+                                                == (IData)(vlSelfRef.FoldedLayer__DOT__group)));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x 
+        = vlSelfRef.FoldedLayer__DOT__x_chunk;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[1U] 
+        = (0x000000ffU & ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w) 
+                          >> 8U));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[1U] 
+        = (0x000000ffU & ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x) 
+                          >> 8U));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 2U, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp 
+            = (0x0003ffffU & (vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp 
+                              + VL_MULS_III(18, (0x0003ffffU 
+                                                 & VL_EXTENDS_II(18,8, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr
+                                                                 [
+                                                                 (1U 
+                                                                  & vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i)])), 
+                                            (0x0003ffffU 
+                                             & VL_EXTENDS_II(18,8, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr
+                                                             [
+                                                             (1U 
+                                                              & vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre 
+        = (0x0003ffffU & (vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp 
+                          + ((0x0003ff00U & ((- (IData)(
+                                                        (1U 
+                                                         & ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b) 
+                                                            >> 7U)))) 
+                                             << 8U)) 
+                             | (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b))));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial 
+        = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre;
+    vlSelfRef.FoldedLayer__DOT__acc_next[0U] = (0x0003ffffU 
+                                                & ((IData)(vlSelfRef.FoldedLayer__DOT__chunk)
+                                                    ? 
+                                                   (vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial 
+                                                    + vlSelfRef.FoldedLayer__DOT__acc[0U])
+                                                    : vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in 
+        = vlSelfRef.FoldedLayer__DOT__acc_next[0U];
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,18, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,18, vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in)));
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped 
+        = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in 
+        = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out 
+        = ((IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in))))));
+    vlSelfRef.FoldedLayer__DOT__relu_out[0U] = vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out;
+}
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__0(vlSelf);
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_vec(VlUnpacked<QData/*63:0*/, 1> &out, const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((0U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    return (0U);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 1> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/FoldedLayer.sv", 15, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/FoldedLayer.sv", 15, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                VL_FATAL_MT("/root/package/rtl/FoldedLayer.sv", 15, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                         + vlSelfRef.__VactIterCount);
+            vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+        } while (vlSelfRef.__VactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (VL_UNLIKELY(((vlSelfRef.clk & 0xfeU)))) {
+        Verilated::overWidthError("clk");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.rst_n & 0xfeU)))) {
+        Verilated::overWidthError("rst_n");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.start & 0xfeU)))) {
+        Verilated::overWidthError("start");
+    }
+}
+#endif  // VL_DEBUG
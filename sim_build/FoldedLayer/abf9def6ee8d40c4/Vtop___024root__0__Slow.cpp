@@ -0,0 +1,235 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0 
+        = vlSelfRef.FoldedLayer__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0 
+        = vlSelfRef.FoldedLayer__DOT__rst_n;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/FoldedLayer.sv", 15, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge FoldedLayer.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(negedge FoldedLayer.rst_n)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    vlSelf->start = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9867861323841650631ull);
+    vlSelf->in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14514620031066118736ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->weights, __VscopeHash, 15258019614976312503ull);
+    vlSelf->biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15469516661481283275ull);
+    vlSelf->busy = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6386567572483775230ull);
+    vlSelf->done = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10296494685231209730ull);
+    vlSelf->out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13025239842288100510ull);
+    vlSelf->FoldedLayer__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12346143025709973425ull);
+    vlSelf->FoldedLayer__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4732102105662455126ull);
+    vlSelf->FoldedLayer__DOT__start = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6842149193686894571ull);
+    vlSelf->FoldedLayer__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6870497427917384148ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->FoldedLayer__DOT__weights, __VscopeHash, 8485715720256222656ull);
+    vlSelf->FoldedLayer__DOT__biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13481770885158842150ull);
+    vlSelf->FoldedLayer__DOT__busy = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10847123894401347785ull);
+    vlSelf->FoldedLayer__DOT__done = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10559799845035300574ull);
+    vlSelf->FoldedLayer__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15893356315816114348ull);
+    vlSelf->FoldedLayer__DOT__chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9925937603247052644ull);
+    vlSelf->FoldedLayer__DOT__group = VL_SCOPED_RAND_RESET_I(2, __VscopeHash, 1569579897281006258ull);
+    vlSelf->FoldedLayer__DOT__step = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17091797090600821614ull);
+    vlSelf->FoldedLayer__DOT__last_chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17322317035995710870ull);
+    vlSelf->FoldedLayer__DOT__last_step = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14975178735522191141ull);
+    vlSelf->FoldedLayer__DOT__x_chunk = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 8738911008116729621ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__acc[__Vi0] = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 7279034149032724354ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__acc_next[__Vi0] = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 9712425473160908937ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__relu_out[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7163112991884301028ull);
+    }
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14674478470017726164ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11392541184990226815ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron = 0;
+    vlSelf->FoldedLayer__DOT__unnamedblk1__DOT__k = 0;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 6990932181704960239ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 9797408386103168346ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17620348948877113570ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 9177233500294024261ull);
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13549770991693620587ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13362751999480458095ull);
+    }
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14291775779894949220ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 5754338370615293206ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11755395853809806753ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 557797633398974231ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10328206440120984758ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
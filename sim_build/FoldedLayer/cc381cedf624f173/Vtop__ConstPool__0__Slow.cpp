@@ -0,0 +1,70 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Constant pool
+
+#include "verilated.h"
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_h24919d23_0 = {{
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_h3df491e7_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_h40e9ab6e_0 = {{
+    1U, 0U, 1U, 0U, 1U, 0U, 1U, 0U,
+    1U, 0U, 1U, 0U, 1U, 0U, 1U, 0U,
+    1U, 0U, 1U, 1U, 1U, 0U, 1U, 1U,
+    1U, 0U, 1U, 1U, 1U, 0U, 1U, 1U,
+    1U, 0U, 1U, 0U, 1U, 0U, 1U, 0U,
+    1U, 0U, 1U, 0U, 1U, 0U, 1U, 0U,
+    1U, 0U, 1U, 1U, 1U, 0U, 1U, 1U,
+    1U, 0U, 1U, 1U, 1U, 0U, 1U, 1U
+}};
+
+extern const VlUnpacked<CData/*4:0*/, 64> Vtop__ConstPool__TABLE_h90590a9c_0 = {{
+    0x1fU, 1U, 0x1fU, 0x0fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x0fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x1fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x1fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x0fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x0fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x1fU, 0x1fU, 1U, 0x1fU, 0x1fU,
+    0x1fU, 1U, 0x1fU, 0x1fU, 0x1fU, 1U, 0x1fU, 0x1fU
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_hd41d9bcd_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 1U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_hdb472427_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U
+}};
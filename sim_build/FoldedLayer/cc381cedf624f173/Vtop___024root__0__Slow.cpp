@@ -0,0 +1,397 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0 
+        = vlSelfRef.FoldedLayer__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0 
+        = vlSelfRef.FoldedLayer__DOT__rst_n;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_initial__TOP(vlSelf);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__en = 1U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__en = 1U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/FoldedLayer.sv", 21, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge FoldedLayer.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(negedge FoldedLayer.rst_n)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    vlSelf->start = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9867861323841650631ull);
+    vlSelf->in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14514620031066118736ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->weights, __VscopeHash, 15258019614976312503ull);
+    vlSelf->biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15469516661481283275ull);
+    vlSelf->busy = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6386567572483775230ull);
+    vlSelf->done = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10296494685231209730ull);
+    vlSelf->out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13025239842288100510ull);
+    vlSelf->FoldedLayer__DOT____Vlvbound_hf3a2e955__1 = 0;
+    vlSelf->FoldedLayer__DOT____Vlvbound_hf3a2e955__0 = 0;
+    vlSelf->FoldedLayer__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12346143025709973425ull);
+    vlSelf->FoldedLayer__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4732102105662455126ull);
+    vlSelf->FoldedLayer__DOT__start = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6842149193686894571ull);
+    vlSelf->FoldedLayer__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6870497427917384148ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->FoldedLayer__DOT__weights, __VscopeHash, 8485715720256222656ull);
+    vlSelf->FoldedLayer__DOT__biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13481770885158842150ull);
+    vlSelf->FoldedLayer__DOT__busy = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10847123894401347785ull);
+    vlSelf->FoldedLayer__DOT__done = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10559799845035300574ull);
+    vlSelf->FoldedLayer__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15893356315816114348ull);
+    vlSelf->FoldedLayer__DOT__chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9925937603247052644ull);
+    vlSelf->FoldedLayer__DOT__group = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1569579897281006258ull);
+    vlSelf->FoldedLayer__DOT__first = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10036363614429325925ull);
+    vlSelf->FoldedLayer__DOT__cur = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17428935982191493947ull);
+    vlSelf->FoldedLayer__DOT__next_chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12805081118232837479ull);
+    vlSelf->FoldedLayer__DOT__live = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5783855419030884808ull);
+    vlSelf->FoldedLayer__DOT__step = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17091797090600821614ull);
+    vlSelf->FoldedLayer__DOT__last_chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17322317035995710870ull);
+    vlSelf->FoldedLayer__DOT__last_step = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14975178735522191141ull);
+    vlSelf->FoldedLayer__DOT__x_chunk = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8738911008116729621ull);
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__acc[__Vi0] = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 7279034149032724354ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__acc_next[__Vi0] = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 9712425473160908937ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__relu_out[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7163112991884301028ull);
+    }
+    vlSelf->FoldedLayer__DOT__unnamedblk1__DOT__c = 0;
+    vlSelf->FoldedLayer__DOT__unnamedblk1__DOT__unnamedblk2__DOT__k = 0;
+    vlSelf->FoldedLayer__DOT__unnamedblk3__DOT__c = 0;
+    vlSelf->FoldedLayer__DOT__unnamedblk4__DOT__c = 0;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__partial = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14674478470017726164ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11392541184990226815ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__neuron = 0;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__partial = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 253040231484818123ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10132152159734628084ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__neuron = 0;
+    vlSelf->FoldedLayer__DOT__unnamedblk5__DOT__k = 0;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8022173749303448942ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7317177807553464819ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__en = 1U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6990932181704960239ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9797408386103168346ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17620348948877113570ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 9177233500294024261ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13549770991693620587ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13362751999480458095ull);
+    }
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17076946562915372480ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 2588539202389775415ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3718595327969056253ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12710861498743215879ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3978724865751664689ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11820056795049353145ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 6137765068494973815ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12879400394792239521ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6636884178892652980ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2199826238508158533ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 411824038299902822ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 4418858398622451125ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10605938059796662843ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12909253207510604516ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15121488064915781582ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 4448810237358264285ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 296724949257401046ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8853174437633461663ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12471437773237089099ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11397220415717856504ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 8403903055246578725ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 1578167804582500285ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 10853525589078114574ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 2661817704064276233ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 330737013380194371ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 15806867310366032480ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 2247224528702548569ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 1219607417857235618ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 1329398175604657321ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 2047150386921971776ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 7286948030598436713ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 15891591054354583514ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 694480324485234066ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 2459559212264567416ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 5754338370615293206ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11755395853809806753ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 557797633398974231ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__0__KET____DOT__u_act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10328206440120984758ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 234630967471732243ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9133239064164704640ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__en = 1U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7451605319981079249ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15830136285658158174ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3360409296264723266ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 4937632673475902431ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18255019268313120983ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6075006426295029885ull);
+    }
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 47003822354379715ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 126203820015002616ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 220839947782113033ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12322197867551599114ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2097231149950962086ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3796106408207928154ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14366282500408064732ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6683590730444674765ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 87186167123114229ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16268857530243398856ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3065210326906413173ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13524253606285217227ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10746285774613867114ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4717864160102612652ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10751876015400599311ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 1435600680911398847ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3240497147045413056ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10139426687740490592ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__x_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11637640881022845322ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__gen_isolated__DOT__w_iso = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6793560171588698861ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 101916203797831681ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17276324923494745452ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13366580527355825364ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 5464453048582054650ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13445280086648073996ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17988709938100419928ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 518155336351020314ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11955121991803322322ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13606726932250832853ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 16609810824080883340ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 10990966116097962027ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 7437275954095551183ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17256705242099782769ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_mac__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14196061063762234876ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 18388298162147905579ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17965059452570111626ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2823378007186762793ull);
+    vlSelf->FoldedLayer__DOT__gen_macs__BRA__1__KET____DOT__u_act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6158939988987043067ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__FoldedLayer__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__FoldedLayer__DOT__rst_n__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
@@ -0,0 +1,116 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Model implementation (design independent parts)
+
+#include "Vtop__pch.h"
+
+//============================================================
+// Constructors
+
+Vtop::Vtop(VerilatedContext* _vcontextp__, const char* _vcname__)
+    : VerilatedModel{*_vcontextp__}
+    , vlSymsp{new Vtop__Syms(contextp(), _vcname__, this)}
+    , clk{vlSymsp->TOP.clk}
+    , rst_n{vlSymsp->TOP.rst_n}
+    , bank{vlSymsp->TOP.bank}
+    , in_valid{vlSymsp->TOP.in_valid}
+    , in_ready{vlSymsp->TOP.in_ready}
+    , out_valid{vlSymsp->TOP.out_valid}
+    , out_ready{vlSymsp->TOP.out_ready}
+    , in_vec{vlSymsp->TOP.in_vec}
+    , weights_flat{vlSymsp->TOP.weights_flat}
+    , biases_flat{vlSymsp->TOP.biases_flat}
+    , out_vec{vlSymsp->TOP.out_vec}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron}
+    , __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron{vlSymsp->TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron}
+    , rootp{&(vlSymsp->TOP)}
+{
+    // Register model with the context
+    contextp()->addModel(this);
+}
+
+Vtop::Vtop(const char* _vcname__)
+    : Vtop(Verilated::threadContextp(), _vcname__)
+{
+}
+
+//============================================================
+// Destructor
+
+Vtop::~Vtop() {
+    delete vlSymsp;
+}
+
+//============================================================
+// Evaluation function
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf);
+#endif  // VL_DEBUG
+void Vtop___024root___eval_static(Vtop___024root* vlSelf);
+void Vtop___024root___eval_initial(Vtop___024root* vlSelf);
+void Vtop___024root___eval_settle(Vtop___024root* vlSelf);
+void Vtop___024root___eval(Vtop___024root* vlSelf);
+
+void Vtop::eval_step() {
+    VL_DEBUG_IF(VL_DBG_MSGF("+++++TOP Evaluate Vtop::eval_step\n"); );
+#ifdef VL_DEBUG
+    // Debug assertions
+    Vtop___024root___eval_debug_assertions(&(vlSymsp->TOP));
+#endif  // VL_DEBUG
+    vlSymsp->__Vm_deleter.deleteAll();
+    if (VL_UNLIKELY(!vlSymsp->__Vm_didInit)) {
+        VL_DEBUG_IF(VL_DBG_MSGF("+ Initial\n"););
+        Vtop___024root___eval_static(&(vlSymsp->TOP));
+        Vtop___024root___eval_initial(&(vlSymsp->TOP));
+        Vtop___024root___eval_settle(&(vlSymsp->TOP));
+        vlSymsp->__Vm_didInit = true;
+    }
+    VL_DEBUG_IF(VL_DBG_MSGF("+ Eval\n"););
+    Vtop___024root___eval(&(vlSymsp->TOP));
+    // Evaluate cleanup
+    Verilated::endOfEval(vlSymsp->__Vm_evalMsgQp);
+}
+
+//============================================================
+// Events and timing
+bool Vtop::eventsPending() { return false; }
+
+uint64_t Vtop::nextTimeSlot() {
+    VL_FATAL_MT(__FILE__, __LINE__, "", "No delays in the design");
+    return 0;
+}
+
+//============================================================
+// Utilities
+
+const char* Vtop::name() const {
+    return vlSymsp->name();
+}
+
+//============================================================
+// Invoke final blocks
+
+void Vtop___024root___eval_final(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop::final() {
+    contextp()->executingFinal(true);
+    Vtop___024root___eval_final(&(vlSymsp->TOP));
+    contextp()->executingFinal(false);
+}
+
+//============================================================
+// Implementations of abstract methods from VerilatedModel
+
+const char* Vtop::hierName() const { return vlSymsp->name(); }
+const char* Vtop::modelName() const { return "Vtop"; }
+unsigned Vtop::threads() const { return 1; }
+void Vtop::prepareClone() const { contextp()->prepareClone(); }
+void Vtop::atClone() const {
+    contextp()->threadPoolpOnClone();
+}
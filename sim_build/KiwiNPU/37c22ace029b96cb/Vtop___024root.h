@@ -0,0 +1,731 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+class Vtop_Perceptron__A12;
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+    // CELLS
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        VL_IN8(clk,0,0);
+        VL_IN8(rst_n,0,0);
+        VL_IN8(bank,0,0);
+        VL_IN8(in_valid,0,0);
+        VL_OUT8(in_ready,0,0);
+        VL_OUT8(out_valid,0,0);
+        VL_IN8(out_ready,0,0);
+        CData/*0:0*/ KiwiNPU__DOT____Vlvbound_h5f6b4e08__0;
+        CData/*0:0*/ KiwiNPU__DOT____Vlvbound_h7236681e__0;
+        CData/*0:0*/ KiwiNPU__DOT____Vlvbound_h99e8e462__0;
+        CData/*0:0*/ KiwiNPU__DOT____Vlvbound_h4e8b1913__0;
+        CData/*0:0*/ KiwiNPU__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__bank;
+        CData/*0:0*/ KiwiNPU__DOT__in_valid;
+        CData/*0:0*/ KiwiNPU__DOT__in_ready;
+        CData/*0:0*/ KiwiNPU__DOT__out_valid;
+        CData/*0:0*/ KiwiNPU__DOT__out_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_bank;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_bank;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+    };
+    struct {
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+    };
+    struct {
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0;
+    };
+    struct {
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+        VL_IN(in_vec,31,0);
+        VL_INW(weights_flat,511,0,16);
+        VL_INW(biases_flat,95,0,3);
+        VL_OUT(out_vec,31,0);
+        IData/*31:0*/ KiwiNPU__DOT__in_vec;
+        VlWide<16>/*511:0*/ KiwiNPU__DOT__weights_flat;
+        VlWide<3>/*95:0*/ KiwiNPU__DOT__biases_flat;
+        IData/*31:0*/ KiwiNPU__DOT__out_vec;
+        IData/*31:0*/ KiwiNPU__DOT__get_layer_size__Vstatic__offset;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__s_km1;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ __VactIterCount;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases;
+    };
+    struct {
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        VlUnpacked<CData/*0:0*/, 1> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q;
+        VlUnpacked<CData/*0:0*/, 1> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+    };
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 1>, false, CData/*0:0*/, 1> __VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q;
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 1>, false, CData/*0:0*/, 1> __VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__NUM_LAYERS = 3U;
+    static constexpr IData/*23:0*/ KiwiNPU__DOT__LAYER_SIZES = 0x00040804U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__BANKS = 1U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__BATCH = 1U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_IN = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_OUT = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__IN_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OUT_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__WEIGHT_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__BIAS_SZ = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_WEIGHTS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_BIAS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_IN = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_OUT = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__IN_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OUT_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__WEIGHT_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__BIAS_SZ = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_WEIGHTS = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_BIAS = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__IN_N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__OUT_N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__BATCH = 1U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__IN_N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__OUT_N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__BATCH = 1U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
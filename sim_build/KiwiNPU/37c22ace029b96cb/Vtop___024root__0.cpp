@@ -0,0 +1,2915 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__bank = vlSelfRef.bank;
+    vlSelfRef.KiwiNPU__DOT__in_valid = vlSelfRef.in_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+        = ((((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+             << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                << 0x00000010U)) | 
+           (((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+             << 8U) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPU__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.KiwiNPU__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.KiwiNPU__DOT__out_ready = vlSelfRef.out_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPU__DOT__biases_flat[0U] = vlSelfRef.biases_flat[0U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[1U] = vlSelfRef.biases_flat[1U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[2U] = vlSelfRef.biases_flat[2U];
+    vlSelfRef.KiwiNPU__DOT__in_vec = vlSelfRef.in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec 
+        = (((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                               << 0x00000018U) | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                                  << 0x00000010U)) 
+                             | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                 << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+            << 0x00000020U) | (QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                 << 0x00000018U) 
+                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                   << 0x00000010U)) 
+                                               | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                   << 8U) 
+                                                  | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y))))));
+    vlSelfRef.KiwiNPU__DOT__weights_flat[0U] = vlSelfRef.weights_flat[0U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[1U] = vlSelfRef.weights_flat[1U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[2U] = vlSelfRef.weights_flat[2U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[3U] = vlSelfRef.weights_flat[3U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[4U] = vlSelfRef.weights_flat[4U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[5U] = vlSelfRef.weights_flat[5U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[6U] = vlSelfRef.weights_flat[6U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[7U] = vlSelfRef.weights_flat[7U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[8U] = vlSelfRef.weights_flat[8U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[9U] = vlSelfRef.weights_flat[9U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[10U] = vlSelfRef.weights_flat[10U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[11U] = vlSelfRef.weights_flat[11U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[12U] = vlSelfRef.weights_flat[12U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[13U] = vlSelfRef.weights_flat[13U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[14U] = vlSelfRef.weights_flat[14U];
+    vlSelfRef.KiwiNPU__DOT__weights_flat[15U] = vlSelfRef.weights_flat[15U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPU__DOT__in_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPU__DOT__out_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases 
+        = (((QData)((IData)(vlSelfRef.KiwiNPU__DOT__biases_flat[1U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPU__DOT__biases_flat[0U])));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPU__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[8U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[9U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[10U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[11U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[12U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[13U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[14U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U] 
+        = vlSelfRef.KiwiNPU__DOT__weights_flat[15U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid;
+    vlSelfRef.KiwiNPU__DOT__out_vec = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready;
+    vlSelfRef.KiwiNPU__DOT__out_valid = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U];
+    vlSelfRef.out_vec = vlSelfRef.KiwiNPU__DOT__out_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.out_valid = vlSelfRef.KiwiNPU__DOT__out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases);
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 8U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 0x00000010U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b 
+        = (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+           >> 0x00000018U);
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U])));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U])));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U])));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U])));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__in_ready = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.in_ready = vlSelfRef.KiwiNPU__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+}
+
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VactTriggered[0U] = (QData)((IData)(
+                                                    ((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n)) 
+                                                           & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0)) 
+                                                          << 5U) 
+                                                         | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk) 
+                                                             & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0))) 
+                                                            << 4U)) 
+                                                        | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n)) 
+                                                              & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0)) 
+                                                             << 3U) 
+                                                            | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0))) 
+                                                               << 2U)) 
+                                                           | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 1U) 
+                                                              | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0)))))) 
+                                                       << 0x00000018U) 
+                                                      | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n)) 
+                                                              & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0)) 
+                                                             << 3U) 
+                                                            | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0))) 
+                                                               << 2U)) 
+                                                           | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 1U) 
+                                                              | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0))))) 
+                                                          << 0x00000014U) 
+                                                         | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0))))) 
+                                                            << 0x00000010U))) 
+                                                     | ((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n)) 
+                                                              & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0)) 
+                                                             << 3U) 
+                                                            | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0))) 
+                                                               << 2U)) 
+                                                           | ((((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0)) 
+                                                               << 1U) 
+                                                              | ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0))))) 
+                                                          << 0x0000000cU) 
+                                                         | ((((((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0))))) 
+                                                            << 8U)) 
+                                                        | (((((((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0))))) 
+                                                            << 4U) 
+                                                           | (((((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0)) 
+                                                                << 3U) 
+                                                               | (((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0))) 
+                                                                  << 2U)) 
+                                                              | ((((~ (IData)(vlSelfRef.KiwiNPU__DOT__rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__rst_n__0)) 
+                                                                  << 1U) 
+                                                                 | ((IData)(vlSelfRef.KiwiNPU__DOT__clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__clk__0))))))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___nba_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1;
+    __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1;
+    __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2;
+    __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2;
+    __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1;
+    __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1;
+    __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2;
+    __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2;
+    __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 = 0;
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready) {
+            vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q.enqueue(0U, 0U);
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k = 1U;
+            while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k)) {
+                vlSelfRef.KiwiNPU__DOT____Vlvbound_h4e8b1913__0 
+                    = ((0U >= (1U & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k 
+                                     - (IData)(1U)))) 
+                       && vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q
+                       [(1U & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k 
+                               - (IData)(1U)))]);
+                if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k))))) {
+                    __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 
+                        = vlSelfRef.KiwiNPU__DOT____Vlvbound_h4e8b1913__0;
+                    __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 
+                        = (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k);
+                    vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1, (IData)(__VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1));
+                }
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k 
+                    = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k);
+            }
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k = 0U;
+        while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k)) {
+            vlSelfRef.KiwiNPU__DOT____Vlvbound_h99e8e462__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k))))) {
+                __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 
+                    = vlSelfRef.KiwiNPU__DOT____Vlvbound_h99e8e462__0;
+                __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 
+                    = (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k);
+                vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2, (IData)(__VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2));
+            }
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k 
+                = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k);
+        }
+    }
+    if (vlSelfRef.KiwiNPU__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready) {
+            vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q.enqueue(0U, 0U);
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k = 1U;
+            while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k)) {
+                vlSelfRef.KiwiNPU__DOT____Vlvbound_h7236681e__0 
+                    = ((0U >= (1U & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k 
+                                     - (IData)(1U)))) 
+                       && vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q
+                       [(1U & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k 
+                               - (IData)(1U)))]);
+                if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k))))) {
+                    __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 
+                        = vlSelfRef.KiwiNPU__DOT____Vlvbound_h7236681e__0;
+                    __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 
+                        = (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k);
+                    vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1, (IData)(__VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1));
+                }
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k 
+                    = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k);
+            }
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k = 0U;
+        while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k)) {
+            vlSelfRef.KiwiNPU__DOT____Vlvbound_h5f6b4e08__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k))))) {
+                __VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 
+                    = vlSelfRef.KiwiNPU__DOT____Vlvbound_h5f6b4e08__0;
+                __VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 
+                    = (1U & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k);
+                vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2, (IData)(__VdlyDim0__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2));
+            }
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k 
+                = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k);
+        }
+    }
+    vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q.commit(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q);
+    vlSelfRef.__VdlyCommitQueueKiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q.commit(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q);
+}
+
+void Vtop___024root___nba_sequent__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready) {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q 
+                = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid;
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+    }
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+}
+
+void Vtop___024root___nba_sequent__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready) {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q 
+                = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid;
+        }
+    } else {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+    }
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPU__DOT__out_valid = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.out_valid = vlSelfRef.KiwiNPU__DOT__out_valid;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+}
+
+void Vtop___024root___nba_comb__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+        = ((((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+             << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                << 0x00000010U)) | 
+           (((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+             << 8U) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPU__DOT__out_vec = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+    vlSelfRef.out_vec = vlSelfRef.KiwiNPU__DOT__out_vec;
+}
+
+void Vtop___024root___nba_sequent__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+}
+
+void Vtop___024root___nba_comb__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPU__DOT__in_ready = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+    vlSelfRef.in_ready = vlSelfRef.KiwiNPU__DOT__in_ready;
+}
+
+void Vtop___024root___nba_comb__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec 
+        = (((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                               << 0x00000018U) | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                                  << 0x00000010U)) 
+                             | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                 << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+            << 0x00000020U) | (QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                 << 0x00000018U) 
+                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                   << 0x00000010U)) 
+                                               | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                   << 8U) 
+                                                  | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+}
+
+void Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((0x00000000000000c0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000000300ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000000c00ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000003000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__4(vlSelf);
+    }
+    if ((0x000000000000000cULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready) {
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q 
+                    = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid;
+            }
+        } else {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+        }
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+    }
+    if ((0x0000000000000030ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready) {
+                vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q 
+                    = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid;
+            }
+        } else {
+            vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+        }
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+            = (1U & ((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                     | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+        vlSelfRef.KiwiNPU__DOT__out_valid = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.out_valid = vlSelfRef.KiwiNPU__DOT__out_valid;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+    }
+    if ((0x000000000000c000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000030000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+    }
+    if ((0x00000000000c0000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000300000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000c00000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+    }
+    if ((0x0000000003000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+    }
+    if ((0x000000000c000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+    }
+    if ((0x0000000030000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000003fc0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+            = ((((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+                 << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                    << 0x00000010U)) 
+               | (((IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+                   << 8U) | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+        vlSelfRef.KiwiNPU__DOT__out_vec = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+        vlSelfRef.out_vec = vlSelfRef.KiwiNPU__DOT__out_vec;
+    }
+    if ((0x000000000000000cULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+    }
+    if ((0x000000000000003cULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+            = (1U & ((~ (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                     | (IData)(vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPU__DOT__in_ready = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+        vlSelfRef.in_ready = vlSelfRef.KiwiNPU__DOT__in_ready;
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x000000003fffc000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_comb__TOP__2(vlSelf);
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_vec(VlUnpacked<QData/*63:0*/, 1> &out, const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((0U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    return (0U);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 1> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                         + vlSelfRef.__VactIterCount);
+            vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+        } while (vlSelfRef.__VactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (VL_UNLIKELY(((vlSelfRef.clk & 0xfeU)))) {
+        Verilated::overWidthError("clk");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.rst_n & 0xfeU)))) {
+        Verilated::overWidthError("rst_n");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.bank & 0xfeU)))) {
+        Verilated::overWidthError("bank");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.in_valid & 0xfeU)))) {
+        Verilated::overWidthError("in_valid");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.out_ready & 0xfeU)))) {
+        Verilated::overWidthError("out_ready");
+    }
+}
+#endif  // VL_DEBUG
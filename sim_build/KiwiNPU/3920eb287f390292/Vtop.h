@@ -0,0 +1,126 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Primary model header
+//
+// This header should be included by all source files instantiating the design.
+// The class here is then constructed to instantiate the design.
+// See the Verilator manual for examples.
+
+#ifndef VERILATED_VTOP_H_
+#define VERILATED_VTOP_H_  // guard
+
+#include "verilated.h"
+#include "svdpi.h"
+
+class Vtop__Syms;
+class Vtop___024root;
+class Vtop_Perceptron__A12;
+class Vtop_Perceptron__N8_A13;
+
+
+// This class is the main interface to the Verilated model
+class alignas(VL_CACHE_LINE_BYTES) Vtop VL_NOT_FINAL : public VerilatedModel {
+  private:
+    // Symbol table holding complete model state (owned by this class)
+    Vtop__Syms* const vlSymsp;
+
+  public:
+
+    // CONSTEXPR CAPABILITIES
+    // Verilated with --trace?
+    static constexpr bool traceCapable = false;
+
+    // PORTS
+    // The application code writes and reads these signals to
+    // propagate new values into/out from the Verilated model.
+    VL_IN8(&clk,0,0);
+    VL_IN8(&rst_n,0,0);
+    VL_IN8(&bank,0,0);
+    VL_IN8(&in_valid,0,0);
+    VL_OUT8(&in_ready,0,0);
+    VL_OUT8(&out_valid,0,0);
+    VL_IN8(&out_ready,0,0);
+    VL_INW(&weights_flat,511,0,16);
+    VL_INW(&biases_flat,95,0,3);
+    VL_IN64(&in_vec,63,0);
+    VL_OUT64(&out_vec,63,0);
+
+    // CELLS
+    // Public to allow access to /* verilator public */ items.
+    // Otherwise the application code can consider these internals.
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* const __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__N8_A13* const __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+
+    // Root instance pointer to allow access to model internals,
+    // including inlined /* verilator public_flat_* */ items.
+    Vtop___024root* const rootp;
+
+    // CONSTRUCTORS
+    /// Construct the model; called by application code
+    /// If contextp is null, then the model will use the default global context
+    /// If name is "", then makes a wrapper with a
+    /// single model invisible with respect to DPI scope names.
+    explicit Vtop(VerilatedContext* contextp, const char* name = "TOP");
+    explicit Vtop(const char* name = "TOP");
+    /// Destroy the model; called (often implicitly) by application code
+    virtual ~Vtop();
+  private:
+    VL_UNCOPYABLE(Vtop);  ///< Copying not allowed
+
+  public:
+    // API METHODS
+    /// Evaluate the model.  Application must call when inputs change.
+    void eval() { eval_step(); }
+    /// Evaluate when calling multiple units/models per time step.
+    void eval_step();
+    /// Evaluate at end of a timestep for tracing, when using eval_step().
+    /// Application must call after all eval() and before time changes.
+    void eval_end_step() {}
+    /// Simulation complete, run final blocks.  Application must call on completion.
+    void final();
+    /// Are there scheduled events to handle?
+    bool eventsPending();
+    /// Returns time at next time slot. Aborts if !eventsPending()
+    uint64_t nextTimeSlot();
+    /// Trace signals in the model; called by application code
+    void trace(VerilatedTraceBaseC* tfp, int levels, int options = 0) { contextp()->trace(tfp, levels, options); }
+    /// Retrieve name of this model instance (as passed to constructor).
+    const char* name() const;
+
+    // Abstract methods from VerilatedModel
+    const char* hierName() const override final;
+    const char* modelName() const override final;
+    unsigned threads() const override final;
+    /// Prepare for cloning the model at the process level (e.g. fork in Linux)
+    /// Release necessary resources. Called before cloning.
+    void prepareClone() const;
+    /// Re-init after cloning the model at the process level (e.g. fork in Linux)
+    /// Re-allocate necessary resources. Called after cloning.
+    void atClone() const;
+  private:
+    // Internal functions - trace registration
+    void traceBaseModel(VerilatedTraceBaseC* tfp, int levels, int options);
+};
+
+#endif  // guard
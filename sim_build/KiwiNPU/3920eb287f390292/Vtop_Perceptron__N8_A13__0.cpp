@@ -0,0 +1,2622 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases);
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.rst_n) {
+        if (vlSelfRef.en) {
+            vlSelfRef.y = vlSelfRef.relu_out;
+        }
+    } else {
+        vlSelfRef.y = 0U;
+    }
+}
+
+void Vtop_Perceptron__N8_A13___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+}
+
+void Vtop_Perceptron__N8_A13___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U])));
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                                  >> 8U));
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                                  >> 0x00000010U));
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                   >> 0x00000018U);
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases);
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U])));
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                                  >> 8U));
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                                  >> 0x00000010U));
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N8_A13* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N8_A13___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.pre_activation__DOT__int4 = vlSelfRef.int4;
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                   >> 0x00000018U);
+    vlSelfRef.w = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U])));
+    vlSelfRef.en = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.x = (((QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U])) 
+                    << 0x00000020U) | (QData)((IData)(vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U])));
+    vlSelfRef.pre_activation__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.pre_activation__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.w));
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 8U)));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000010U)));
+    vlSelfRef.w_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000018U)));
+    vlSelfRef.w_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000020U)));
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000028U)));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000030U)));
+    vlSelfRef.w_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.w 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__w = vlSelfRef.w;
+    vlSelfRef.pre_activation__DOT__en = vlSelfRef.en;
+    vlSelfRef.x_arr[0U] = (0x000000ffU & (IData)(vlSelfRef.x));
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 8U)));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000010U)));
+    vlSelfRef.x_arr[3U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000018U)));
+    vlSelfRef.x_arr[4U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000020U)));
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000028U)));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000030U)));
+    vlSelfRef.x_arr[7U] = (0x000000ffU & (IData)((vlSelfRef.x 
+                                                  >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x = vlSelfRef.x;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.pre_activation__DOT__b));
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__w));
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__w 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & (IData)(vlSelfRef.pre_activation__DOT__x));
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 8U)));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000010U)));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000018U)));
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000020U)));
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000028U)));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000030U)));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (0x000000ffU 
+                                                & (IData)(
+                                                          (vlSelfRef.pre_activation__DOT__x 
+                                                           >> 0x00000038U)));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.pre_activation__DOT__w_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[0U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[1U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[2U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[3U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[4U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[5U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[6U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.pre_activation__DOT__x_arr[7U];
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.pre_activation__DOT__pre = vlSelfRef.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,19, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act_in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__in = vlSelfRef.act_in;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
@@ -0,0 +1,48 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop_Perceptron__N8_A13
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::N;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::PIPE_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::INT4_PACKING;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__N;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__PIPE_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__ZERO_GATING;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__INT4_PACKING;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__LEVELS;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__TREE_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__OUT_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::pre_activation__DOT__H;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::clamp__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::clamp__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::clamp__DOT__MIN_VAL;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::clamp__DOT__MAX_VAL;
+constexpr IData/*31:0*/ Vtop_Perceptron__N8_A13::act__DOT__DATA_WIDTH;
+
+
+void Vtop_Perceptron__N8_A13___ctor_var_reset(Vtop_Perceptron__N8_A13* vlSelf);
+
+Vtop_Perceptron__N8_A13::Vtop_Perceptron__N8_A13() = default;
+Vtop_Perceptron__N8_A13::~Vtop_Perceptron__N8_A13() = default;
+
+void Vtop_Perceptron__N8_A13::ctor(Vtop__Syms* symsp, const char* namep) {
+    vlSymsp = symsp;
+    vlNamep = strdup(Verilated::catName(vlSymsp->name(), namep));
+    // Reset structure values
+    Vtop_Perceptron__N8_A13___ctor_var_reset(this);
+}
+
+void Vtop_Perceptron__N8_A13::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+void Vtop_Perceptron__N8_A13::dtor() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
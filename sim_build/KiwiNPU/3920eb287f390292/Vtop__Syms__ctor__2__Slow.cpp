@@ -0,0 +1,9 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+void Vtop__Syms::Vtop__Syms__ctor__2() {
+    Vtop__Syms__ctor__0();
+    Vtop__Syms__ctor__1();
+}
@@ -0,0 +1,564 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        VL_IN8(clk,0,0);
+        VL_IN8(rst_n,0,0);
+        CData/*0:0*/ KiwiNPU__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    };
+    struct {
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+    };
+    struct {
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+        VL_IN(in_vec,31,0);
+        VL_INW(weights_flat,511,0,16);
+        VL_INW(biases_flat,95,0,3);
+        VL_OUT(out_vec,31,0);
+        IData/*31:0*/ KiwiNPU__DOT__in_vec;
+        VlWide<16>/*511:0*/ KiwiNPU__DOT__weights_flat;
+        VlWide<3>/*95:0*/ KiwiNPU__DOT__biases_flat;
+        IData/*31:0*/ KiwiNPU__DOT__out_vec;
+        IData/*31:0*/ KiwiNPU__DOT__get_layer_size__Vstatic__offset;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__s_km1;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+    };
+    struct {
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__w;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+    };
+    struct {
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*17:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp;
+        IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i;
+        IData/*18:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ __VactIterCount;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr;
+    };
+    struct {
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+    };
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__NUM_LAYERS = 3U;
+    static constexpr IData/*23:0*/ KiwiNPU__DOT__LAYER_SIZES = 0x00040804U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_IN = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_OUT = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__IN_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OUT_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__WEIGHT_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__BIAS_SZ = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_WEIGHTS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_BIAS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_IN = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_OUT = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__IN_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OUT_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__WEIGHT_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__BIAS_SZ = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_WEIGHTS = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_BIAS = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__IN_N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__OUT_N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__IN_N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__OUT_N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
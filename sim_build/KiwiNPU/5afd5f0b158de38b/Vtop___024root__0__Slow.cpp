@@ -0,0 +1,757 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPU__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6532751874159864346ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1742478424908541970ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17897251015886240299ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15586208202128722591ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 514789550500795949ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13408463765750731481ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10680724174772596631ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4684162191132766879ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 11687461658285027376ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15713973834903494983ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3305263118041591338ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3806958282115377501ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14460629766670832452ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6306350784941529936ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7800984428660529765ull);
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_static__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPU__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6532751874159864346ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1742478424908541970ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17897251015886240299ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15586208202128722591ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 514789550500795949ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13408463765750731481ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10680724174772596631ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4684162191132766879ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 11687461658285027376ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15713973834903494983ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3305263118041591338ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3806958282115377501ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14460629766670832452ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6306350784941529936ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7800984428660529765ull);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 4 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 5 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 6 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 7 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 8 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 9 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 10 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 11 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 12 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 13 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 14 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 15 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000010U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 16 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000011U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 17 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000012U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 18 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000013U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 19 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000014U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 20 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000015U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 21 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000016U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 22 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000017U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 23 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.rst_n)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    vlSelf->in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14514620031066118736ull);
+    VL_SCOPED_RAND_RESET_W(512, vlSelf->weights_flat, __VscopeHash, 7281237363156479805ull);
+    VL_SCOPED_RAND_RESET_W(96, vlSelf->biases_flat, __VscopeHash, 4961876817153477982ull);
+    vlSelf->out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13025239842288100510ull);
+    vlSelf->KiwiNPU__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5063780984336332758ull);
+    vlSelf->KiwiNPU__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14090602771392734443ull);
+    vlSelf->KiwiNPU__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1575674597081114644ull);
+    VL_SCOPED_RAND_RESET_W(512, vlSelf->KiwiNPU__DOT__weights_flat, __VscopeHash, 8991633052071420028ull);
+    VL_SCOPED_RAND_RESET_W(96, vlSelf->KiwiNPU__DOT__biases_flat, __VscopeHash, 15604781266724902930ull);
+    vlSelf->KiwiNPU__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 2472900835353944141ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16553416117285054588ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 1622769584364346726ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights, __VscopeHash, 16496043317995005663ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4810044069176435598ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 15041669807583202918ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6248452857584709186ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights, __VscopeHash, 14262982707140251532ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16538731732423511042ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12444810275778615962ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8703963591528304203ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10420251144184843214ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 8796660585539064659ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 7535665318671116516ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4439260106168241426ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11619047873448613361ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10008017346886170174ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3100941282768261505ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1711131077596027589ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11547313990413087639ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18235539677142080475ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13258331955559429012ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7965865961987538967ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14030663464616645358ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1004837980721649033ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5143585381143156827ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15288584976489949033ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4982761856510626577ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9323967203243281335ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 12781557350774586190ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8641157743584661056ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14852023189491394509ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 10867010993325871255ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 788942817090015051ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15296946320881502598ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14060214293957559175ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10142408174524227560ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2003505455577769706ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14716698462719551706ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6513834598245451626ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10864822088623884091ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4554712257140182614ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9659672296962648357ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14053722794442049575ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16305019996465858801ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3336824881394292970ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8870287061645569294ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11829048669557440344ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4672312235143497854ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3302893523831976559ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 46023849532003702ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11608643338366510459ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 914030825273618278ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3697760648366010037ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3323024822242346614ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17090326677502278623ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9818430731307966652ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15593891989535389687ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1953459891989153981ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6156799628669302817ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9731989578209058948ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10579311985713715753ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13571636509758791053ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9506768109311112643ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1664824691704573089ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9142221291955311590ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13433460463693773279ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 1499535054602257040ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3646439214296109220ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13822656555021279546ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6346042933328353927ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1985743140395521542ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10936579003978370401ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14127158988215333001ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12930999705500250028ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16721731670552277911ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13667191946014721573ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13148322660171647486ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8568366104526599168ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16951233877965673674ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8100608649829759345ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14136812521185054652ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13396463497137635086ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14421611668700180425ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1650381877719310478ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11460134137498812965ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8761860467756333766ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1551079389305255181ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7158448073012528270ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 5093085653544154424ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11509030712697307199ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9383585591124512975ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17216474775588071956ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8466018355759450893ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16204561734997904354ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3495334357393045090ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11531198957461014589ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5864056375493330383ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11468409429603230567ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 6079072089465295805ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6207652870490842430ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1832307041950084570ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15026742500320441967ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2187151568113769124ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4594012678397680468ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14957634217498164963ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14437029460857325862ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8935025521895674908ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9322409647168237425ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8803678856965733359ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18405528888669437924ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 1586531872580938123ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1626498659201241137ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3630242525410562425ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6720761440544422606ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 12762054421427732812ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2684268892561638918ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13615104630673321452ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16167112012585661045ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16617115496606662597ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 12416606221683641113ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 5889611186705821976ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1536306874112948730ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14965930289227999968ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11615583227694631768ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14207708880470321892ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13841088296439407086ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13585529263722738764ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15454652873709166415ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15086437259875754483ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14171264833490341969ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13133192612477748867ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16875887132563532046ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3372195176004912656ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4098115289279897889ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10297642973319069871ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3914326612062427778ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10371931284273471722ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5360441027709581608ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3374057473613700169ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11272349920451681911ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17562162474124985596ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 16405911216625748702ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13940004332176317139ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3310229137975897307ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15235155550944216451ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17010269452500396493ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11032648219929808356ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2458253340458243208ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16604783809402653149ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4794146469553806625ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6893716781809815555ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17540945496358397086ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14573660208576373636ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2063655884109606279ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 16820684082255232164ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17302506449499922531ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14043643493640215057ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 550712477736336628ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15221923306820486703ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11016496119951668775ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 6107150448835482350ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5111295388041757296ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15597653921825087931ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11149137867213774177ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 9289820255833771945ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16119639160510846066ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2120668673533853151ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7330343797622222860ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11774061227998988543ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7214606424076072693ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7589050799173590733ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17222090115724380522ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10429327467789472544ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17750210156263198913ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7832436325683385434ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6156443928514165976ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 13554821292133132457ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15274459008056505139ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12379552910336545726ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6977561312491825306ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13250094927105118497ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4215363004253414382ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 4491735230581799821ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17599815403489168268ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17445994654325027101ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17017989155154613690ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11104293284079164246ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1612729037276744644ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1001413507821035176ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14923619905979964924ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7016776448813978970ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8109155939668749341ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4520696913582338881ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 3525434327222442606ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1320262098224249392ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17250718937599774452ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17927723840156910753ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13412915917916284545ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 16051581499737986818ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 8125644607060053454ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13141055094230187293ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5215118201552274399ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14513531689847370272ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11957691073975670559ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 51080849963924089ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11833644172421661369ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4644320068708421777ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4554963410369914056ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 441795654750684467ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12359090332144310288ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4332842937262949055ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6608327772606239688ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9252856290395190447ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4913866292638181060ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6399176345851881480ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13803757562636948527ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2137489865355374507ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16277700460972377844ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8547512916895485170ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13680277071835473061ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3264247103674540920ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 1561360584503170245ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14923796631680913396ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6526598373137947231ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13746381074673889162ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3526382429831632867ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8563856693482875055ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6457643347269875102ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14005900914300586094ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 8308433439124604427ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 2478963433016521275ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6325223070648903362ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16135163407932624007ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14658694082116628764ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10845252921207483142ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2333639575695554838ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8050969336386483161ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2721751205372888818ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2031109593268706193ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16950526248070609693ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7881754887429405361ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5357713817056295192ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 14085873357862175039ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4057377853851341564ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12390803004651693400ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4559341597416578576ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7518040499914632174ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13780486838467391119ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6131804141716296689ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5383070936405510137ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10877163286314298614ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 13986868412477567422ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 5496463542436145765ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16688469382220066681ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15126072694507645667ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16458914351073972041ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13068841055815760143ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6951324567167794725ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17243900241759362303ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10849897655909563127ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4746765392441220736ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9030400568721036891ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13472359952821153172ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16443817067913944095ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 14829058245220856616ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 8291939189010562252ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2777014661671188518ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9388377710606107570ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15737821497240871802ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8878027805708923919ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14394350948857547123ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17240678097039399856ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1714557577302034184ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 13106375179893667582ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 1049633381734583608ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14654964358114863752ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12429467606204577872ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5338453680955422021ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6265492018903005677ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17377776734953022825ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12725759975961297353ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8876006134553428754ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3578535042379693896ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2313336167365250917ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
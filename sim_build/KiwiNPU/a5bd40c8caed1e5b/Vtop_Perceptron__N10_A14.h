@@ -0,0 +1,70 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP_PERCEPTRON__N10_A14_H_
+#define VERILATED_VTOP_PERCEPTRON__N10_A14_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop_Perceptron__N10_A14 final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    CData/*0:0*/ clk;
+    CData/*0:0*/ rst_n;
+    CData/*7:0*/ b;
+    CData/*7:0*/ y;
+    CData/*7:0*/ pre_clamped;
+    CData/*7:0*/ relu_out;
+    CData/*7:0*/ pre_activation__DOT__b;
+    CData/*7:0*/ clamp__DOT__out;
+    CData/*7:0*/ act__DOT__in;
+    CData/*7:0*/ act__DOT__out;
+    VlWide<4>/*127:0*/ x;
+    VlWide<4>/*127:0*/ w;
+    IData/*19:0*/ pre;
+    VlWide<4>/*127:0*/ pre_activation__DOT__x;
+    VlWide<4>/*127:0*/ pre_activation__DOT__w;
+    IData/*19:0*/ pre_activation__DOT__pre;
+    IData/*19:0*/ pre_activation__DOT__dp;
+    IData/*31:0*/ pre_activation__DOT__unnamedblk1__DOT__i;
+    IData/*19:0*/ clamp__DOT__in;
+    VlUnpacked<CData/*7:0*/, 16> x_arr;
+    VlUnpacked<CData/*7:0*/, 16> w_arr;
+    VlUnpacked<CData/*7:0*/, 16> pre_activation__DOT__x_arr;
+    VlUnpacked<CData/*7:0*/, 16> pre_activation__DOT__w_arr;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ N = 0x00000010U;
+    static constexpr IData/*31:0*/ DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ ACC_WIDTH = 0x00000014U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__N = 0x00000010U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__ACC_WIDTH = 0x00000014U;
+    static constexpr IData/*31:0*/ clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ clamp__DOT__ACC_WIDTH = 0x00000014U;
+    static constexpr IData/*31:0*/ clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop_Perceptron__N10_A14();
+    ~Vtop_Perceptron__N10_A14();
+    void ctor(Vtop__Syms* symsp, const char* namep);
+    void dtor();
+    VL_UNCOPYABLE(Vtop_Perceptron__N10_A14);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,4347 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[0U]);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.y = ((IData)(vlSelfRef.rst_n) ? (IData)(vlSelfRef.relu_out)
+                    : 0U);
+}
+
+void Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[0U] 
+                                  >> 8U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[8U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[9U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[10U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[11U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[12U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[13U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[14U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[15U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[0U] 
+                                  >> 0x00000010U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[16U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[17U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[18U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[19U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[20U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[21U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[22U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[23U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[0U] 
+                   >> 0x00000018U);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[24U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[25U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[26U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[27U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[28U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[29U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[30U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[31U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[1U]);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[32U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[33U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[34U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[35U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[36U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[37U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[38U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[39U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[1U] 
+                                  >> 8U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[40U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[41U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[42U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[43U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[44U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[45U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[46U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[47U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[1U] 
+                                  >> 0x00000010U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[48U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[49U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[50U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[51U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[52U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[53U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[54U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[55U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[1U] 
+                   >> 0x00000018U);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[56U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[57U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[58U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[59U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[60U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[61U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[62U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[63U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[2U]);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[64U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[65U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[66U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[67U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[68U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[69U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[70U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[71U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[2U] 
+                                  >> 8U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[72U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[73U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[74U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[75U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[76U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[77U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[78U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[79U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[2U] 
+                                  >> 0x00000010U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[80U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[81U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[82U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[83U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[84U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[85U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[86U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[87U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[2U] 
+                   >> 0x00000018U);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[88U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[89U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[90U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[91U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[92U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[93U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[94U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[95U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
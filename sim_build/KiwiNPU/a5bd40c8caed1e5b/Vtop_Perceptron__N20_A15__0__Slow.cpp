@@ -0,0 +1,44 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop_Perceptron__N20_A15___ctor_var_reset(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->x, __VscopeHash, 9409450202036847209ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->w, __VscopeHash, 2482183445564601373ull);
+    vlSelf->b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16900879642891266615ull);
+    vlSelf->y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11123243248953317070ull);
+    for (int __Vi0 = 0; __Vi0 < 32; ++__Vi0) {
+        vlSelf->x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6993073837475875754ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 32; ++__Vi0) {
+        vlSelf->w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9131122053381400934ull);
+    }
+    vlSelf->pre = VL_SCOPED_RAND_RESET_I(21, __VscopeHash, 5030441938748210240ull);
+    vlSelf->pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3317201933935267813ull);
+    vlSelf->relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17589453413709702011ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->pre_activation__DOT__x, __VscopeHash, 8569219317619434053ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->pre_activation__DOT__w, __VscopeHash, 8960955919027285184ull);
+    vlSelf->pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16063847634226918097ull);
+    vlSelf->pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(21, __VscopeHash, 8673453595209914649ull);
+    for (int __Vi0 = 0; __Vi0 < 32; ++__Vi0) {
+        vlSelf->pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6574967772067896672ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 32; ++__Vi0) {
+        vlSelf->pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1441310708108914510ull);
+    }
+    vlSelf->pre_activation__DOT__dp = VL_SCOPED_RAND_RESET_I(21, __VscopeHash, 10300213523706787953ull);
+    vlSelf->pre_activation__DOT__unnamedblk1__DOT__i = 0;
+    vlSelf->clamp__DOT__in = VL_SCOPED_RAND_RESET_I(21, __VscopeHash, 7798333535249344728ull);
+    vlSelf->clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10867968380403618745ull);
+    vlSelf->act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13528716278640066619ull);
+    vlSelf->act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5764329140672425732ull);
+}
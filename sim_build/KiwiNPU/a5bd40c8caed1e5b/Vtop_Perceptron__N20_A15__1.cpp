@@ -0,0 +1,1384 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[3U]);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[96U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[97U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[98U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[99U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[100U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[101U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[102U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[103U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[3U] 
+                                  >> 8U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[104U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[105U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[106U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[107U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[108U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[109U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[110U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[111U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (0x000000ffU & (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[3U] 
+                                  >> 0x00000010U));
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[112U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[113U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[114U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[115U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[116U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[117U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[118U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[119U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.rst_n = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.b = (vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[3U] 
+                   >> 0x00000018U);
+    vlSelfRef.w[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[120U];
+    vlSelfRef.w[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[121U];
+    vlSelfRef.w[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[122U];
+    vlSelfRef.w[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[123U];
+    vlSelfRef.w[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[124U];
+    vlSelfRef.w[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[125U];
+    vlSelfRef.w[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[126U];
+    vlSelfRef.w[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[127U];
+    vlSelfRef.x[0U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U];
+    vlSelfRef.x[1U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U];
+    vlSelfRef.x[2U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U];
+    vlSelfRef.x[3U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U];
+    vlSelfRef.x[4U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U];
+    vlSelfRef.x[5U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U];
+    vlSelfRef.x[6U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U];
+    vlSelfRef.x[7U] = vlSymsp->TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U];
+    vlSelfRef.pre_activation__DOT__b = vlSelfRef.b;
+    vlSelfRef.w_arr[0U] = (0x000000ffU & vlSelfRef.w[0U]);
+    vlSelfRef.w_arr[1U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[2U] = (0x000000ffU & (vlSelfRef.w[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[3U] = (vlSelfRef.w[0U] >> 0x00000018U);
+    vlSelfRef.w_arr[4U] = (0x000000ffU & vlSelfRef.w[1U]);
+    vlSelfRef.w_arr[5U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[6U] = (0x000000ffU & (vlSelfRef.w[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.w_arr[7U] = (vlSelfRef.w[1U] >> 0x00000018U);
+    vlSelfRef.w_arr[8U] = (0x000000ffU & vlSelfRef.w[2U]);
+    vlSelfRef.w_arr[9U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                          >> 8U));
+    vlSelfRef.w_arr[10U] = (0x000000ffU & (vlSelfRef.w[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[11U] = (vlSelfRef.w[2U] >> 0x00000018U);
+    vlSelfRef.w_arr[12U] = (0x000000ffU & vlSelfRef.w[3U]);
+    vlSelfRef.w_arr[13U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[14U] = (0x000000ffU & (vlSelfRef.w[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[15U] = (vlSelfRef.w[3U] >> 0x00000018U);
+    vlSelfRef.w_arr[16U] = (0x000000ffU & vlSelfRef.w[4U]);
+    vlSelfRef.w_arr[17U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[18U] = (0x000000ffU & (vlSelfRef.w[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[19U] = (vlSelfRef.w[4U] >> 0x00000018U);
+    vlSelfRef.w_arr[20U] = (0x000000ffU & vlSelfRef.w[5U]);
+    vlSelfRef.w_arr[21U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[22U] = (0x000000ffU & (vlSelfRef.w[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[23U] = (vlSelfRef.w[5U] >> 0x00000018U);
+    vlSelfRef.w_arr[24U] = (0x000000ffU & vlSelfRef.w[6U]);
+    vlSelfRef.w_arr[25U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[26U] = (0x000000ffU & (vlSelfRef.w[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[27U] = (vlSelfRef.w[6U] >> 0x00000018U);
+    vlSelfRef.w_arr[28U] = (0x000000ffU & vlSelfRef.w[7U]);
+    vlSelfRef.w_arr[29U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 8U));
+    vlSelfRef.w_arr[30U] = (0x000000ffU & (vlSelfRef.w[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.w_arr[31U] = (vlSelfRef.w[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w[0U] = vlSelfRef.w[0U];
+    vlSelfRef.pre_activation__DOT__w[1U] = vlSelfRef.w[1U];
+    vlSelfRef.pre_activation__DOT__w[2U] = vlSelfRef.w[2U];
+    vlSelfRef.pre_activation__DOT__w[3U] = vlSelfRef.w[3U];
+    vlSelfRef.pre_activation__DOT__w[4U] = vlSelfRef.w[4U];
+    vlSelfRef.pre_activation__DOT__w[5U] = vlSelfRef.w[5U];
+    vlSelfRef.pre_activation__DOT__w[6U] = vlSelfRef.w[6U];
+    vlSelfRef.pre_activation__DOT__w[7U] = vlSelfRef.w[7U];
+    vlSelfRef.x_arr[0U] = (0x000000ffU & vlSelfRef.x[0U]);
+    vlSelfRef.x_arr[1U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[2U] = (0x000000ffU & (vlSelfRef.x[0U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[3U] = (vlSelfRef.x[0U] >> 0x00000018U);
+    vlSelfRef.x_arr[4U] = (0x000000ffU & vlSelfRef.x[1U]);
+    vlSelfRef.x_arr[5U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[6U] = (0x000000ffU & (vlSelfRef.x[1U] 
+                                          >> 0x00000010U));
+    vlSelfRef.x_arr[7U] = (vlSelfRef.x[1U] >> 0x00000018U);
+    vlSelfRef.x_arr[8U] = (0x000000ffU & vlSelfRef.x[2U]);
+    vlSelfRef.x_arr[9U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                          >> 8U));
+    vlSelfRef.x_arr[10U] = (0x000000ffU & (vlSelfRef.x[2U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[11U] = (vlSelfRef.x[2U] >> 0x00000018U);
+    vlSelfRef.x_arr[12U] = (0x000000ffU & vlSelfRef.x[3U]);
+    vlSelfRef.x_arr[13U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[14U] = (0x000000ffU & (vlSelfRef.x[3U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[15U] = (vlSelfRef.x[3U] >> 0x00000018U);
+    vlSelfRef.x_arr[16U] = (0x000000ffU & vlSelfRef.x[4U]);
+    vlSelfRef.x_arr[17U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[18U] = (0x000000ffU & (vlSelfRef.x[4U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[19U] = (vlSelfRef.x[4U] >> 0x00000018U);
+    vlSelfRef.x_arr[20U] = (0x000000ffU & vlSelfRef.x[5U]);
+    vlSelfRef.x_arr[21U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[22U] = (0x000000ffU & (vlSelfRef.x[5U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[23U] = (vlSelfRef.x[5U] >> 0x00000018U);
+    vlSelfRef.x_arr[24U] = (0x000000ffU & vlSelfRef.x[6U]);
+    vlSelfRef.x_arr[25U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[26U] = (0x000000ffU & (vlSelfRef.x[6U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[27U] = (vlSelfRef.x[6U] >> 0x00000018U);
+    vlSelfRef.x_arr[28U] = (0x000000ffU & vlSelfRef.x[7U]);
+    vlSelfRef.x_arr[29U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 8U));
+    vlSelfRef.x_arr[30U] = (0x000000ffU & (vlSelfRef.x[7U] 
+                                           >> 0x00000010U));
+    vlSelfRef.x_arr[31U] = (vlSelfRef.x[7U] >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x[0U] = vlSelfRef.x[0U];
+    vlSelfRef.pre_activation__DOT__x[1U] = vlSelfRef.x[1U];
+    vlSelfRef.pre_activation__DOT__x[2U] = vlSelfRef.x[2U];
+    vlSelfRef.pre_activation__DOT__x[3U] = vlSelfRef.x[3U];
+    vlSelfRef.pre_activation__DOT__x[4U] = vlSelfRef.x[4U];
+    vlSelfRef.pre_activation__DOT__x[5U] = vlSelfRef.x[5U];
+    vlSelfRef.pre_activation__DOT__x[6U] = vlSelfRef.x[6U];
+    vlSelfRef.pre_activation__DOT__x[7U] = vlSelfRef.x[7U];
+    vlSelfRef.pre_activation__DOT__w_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[0U]);
+    vlSelfRef.pre_activation__DOT__w_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[3U] = (vlSelfRef.pre_activation__DOT__w[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[1U]);
+    vlSelfRef.pre_activation__DOT__w_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[7U] = (vlSelfRef.pre_activation__DOT__w[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__w[2U]);
+    vlSelfRef.pre_activation__DOT__w_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[11U] = (vlSelfRef.pre_activation__DOT__w[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[3U]);
+    vlSelfRef.pre_activation__DOT__w_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[15U] = (vlSelfRef.pre_activation__DOT__w[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[4U]);
+    vlSelfRef.pre_activation__DOT__w_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[19U] = (vlSelfRef.pre_activation__DOT__w[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[5U]);
+    vlSelfRef.pre_activation__DOT__w_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[23U] = (vlSelfRef.pre_activation__DOT__w[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[6U]);
+    vlSelfRef.pre_activation__DOT__w_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[27U] = (vlSelfRef.pre_activation__DOT__w[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__w_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__w[7U]);
+    vlSelfRef.pre_activation__DOT__w_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__w_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__w_arr[31U] = (vlSelfRef.pre_activation__DOT__w[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[0U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[0U]);
+    vlSelfRef.pre_activation__DOT__x_arr[1U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[2U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[3U] = (vlSelfRef.pre_activation__DOT__x[0U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[4U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[1U]);
+    vlSelfRef.pre_activation__DOT__x_arr[5U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[6U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                   >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[7U] = (vlSelfRef.pre_activation__DOT__x[1U] 
+                                                >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[8U] = (0x000000ffU 
+                                                & vlSelfRef.pre_activation__DOT__x[2U]);
+    vlSelfRef.pre_activation__DOT__x_arr[9U] = (0x000000ffU 
+                                                & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                   >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[10U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[11U] = (vlSelfRef.pre_activation__DOT__x[2U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[12U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[3U]);
+    vlSelfRef.pre_activation__DOT__x_arr[13U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[14U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[15U] = (vlSelfRef.pre_activation__DOT__x[3U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[16U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[4U]);
+    vlSelfRef.pre_activation__DOT__x_arr[17U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[18U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[19U] = (vlSelfRef.pre_activation__DOT__x[4U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[20U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[5U]);
+    vlSelfRef.pre_activation__DOT__x_arr[21U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[22U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[23U] = (vlSelfRef.pre_activation__DOT__x[5U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[24U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[6U]);
+    vlSelfRef.pre_activation__DOT__x_arr[25U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[26U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[27U] = (vlSelfRef.pre_activation__DOT__x[6U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__x_arr[28U] = (0x000000ffU 
+                                                 & vlSelfRef.pre_activation__DOT__x[7U]);
+    vlSelfRef.pre_activation__DOT__x_arr[29U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 8U));
+    vlSelfRef.pre_activation__DOT__x_arr[30U] = (0x000000ffU 
+                                                 & (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                    >> 0x00000010U));
+    vlSelfRef.pre_activation__DOT__x_arr[31U] = (vlSelfRef.pre_activation__DOT__x[7U] 
+                                                 >> 0x00000018U);
+    vlSelfRef.pre_activation__DOT__dp = 0U;
+    vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i = 0U;
+    while (VL_GTS_III(32, 0x00000020U, vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)) {
+        vlSelfRef.pre_activation__DOT__dp = (0x001fffffU 
+                                             & (vlSelfRef.pre_activation__DOT__dp 
+                                                + VL_MULS_III(21, 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__x_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])), 
+                                                              (0x001fffffU 
+                                                               & VL_EXTENDS_II(21,8, vlSelfRef.pre_activation__DOT__w_arr
+                                                                               [
+                                                                               (0x0000001fU 
+                                                                                & vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i)])))));
+        vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i 
+            = ((IData)(1U) + vlSelfRef.pre_activation__DOT__unnamedblk1__DOT__i);
+    }
+    vlSelfRef.pre_activation__DOT__pre = (0x001fffffU 
+                                          & (vlSelfRef.pre_activation__DOT__dp 
+                                             + ((0x001fff00U 
+                                                 & ((- (IData)(
+                                                               (1U 
+                                                                & ((IData)(vlSelfRef.pre_activation__DOT__b) 
+                                                                   >> 7U)))) 
+                                                    << 8U)) 
+                                                | (IData)(vlSelfRef.pre_activation__DOT__b))));
+    vlSelfRef.pre = vlSelfRef.pre_activation__DOT__pre;
+    vlSelfRef.clamp__DOT__in = vlSelfRef.pre;
+    vlSelfRef.clamp__DOT__out = (VL_LTS_III(32, 0x0000007fU, 
+                                            VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                  ? 0x0000007fU : (
+                                                   VL_GTS_III(32, 0xffffff80U, 
+                                                              VL_EXTENDS_II(32,21, vlSelfRef.clamp__DOT__in))
+                                                    ? 0x00000080U
+                                                    : 
+                                                   (0x000000ffU 
+                                                    & vlSelfRef.clamp__DOT__in)));
+    vlSelfRef.pre_clamped = vlSelfRef.clamp__DOT__out;
+    vlSelfRef.act__DOT__in = vlSelfRef.pre_clamped;
+    vlSelfRef.act__DOT__out = ((IData)(vlSelfRef.act__DOT__in) 
+                               & (- (IData)(VL_LTES_III(32, 0U, 
+                                                        VL_EXTENDS_II(32,8, (IData)(vlSelfRef.act__DOT__in))))));
+    vlSelfRef.relu_out = vlSelfRef.act__DOT__out;
+}
@@ -0,0 +1,39 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop_Perceptron__N20_A15
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::N;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::pre_activation__DOT__N;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::pre_activation__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::pre_activation__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::clamp__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::clamp__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::clamp__DOT__MIN_VAL;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::clamp__DOT__MAX_VAL;
+constexpr IData/*31:0*/ Vtop_Perceptron__N20_A15::act__DOT__DATA_WIDTH;
+
+
+void Vtop_Perceptron__N20_A15___ctor_var_reset(Vtop_Perceptron__N20_A15* vlSelf);
+
+Vtop_Perceptron__N20_A15::Vtop_Perceptron__N20_A15() = default;
+Vtop_Perceptron__N20_A15::~Vtop_Perceptron__N20_A15() = default;
+
+void Vtop_Perceptron__N20_A15::ctor(Vtop__Syms* symsp, const char* namep) {
+    vlSymsp = symsp;
+    vlNamep = strdup(Verilated::catName(vlSymsp->name(), namep));
+    // Reset structure values
+    Vtop_Perceptron__N20_A15___ctor_var_reset(this);
+}
+
+void Vtop_Perceptron__N20_A15::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+void Vtop_Perceptron__N20_A15::dtor() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
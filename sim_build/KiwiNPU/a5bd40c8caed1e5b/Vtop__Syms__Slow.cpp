@@ -0,0 +1,3107 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(410);
+    // Setup sub module instances
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron");
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.ctor(this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron");
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-9);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron;
+    TOP.__PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron = &TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron;
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.__Vconfigure(true);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.__Vconfigure(true);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.__Vconfigure(false);
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.__Vconfigure(false);
+    // Setup scopes
+    __Vscopep_KiwiNPU = new VerilatedScope{this, "KiwiNPU", "KiwiNPU", "KiwiNPU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1]", "gen_layers[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst", "u_layer_inst", "Layer", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0]", "gen_neurons[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10]", "gen_neurons[10]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11]", "gen_neurons[11]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12]", "gen_neurons[12]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13]", "gen_neurons[13]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14]", "gen_neurons[14]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15]", "gen_neurons[15]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16]", "gen_neurons[16]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17]", "gen_neurons[17]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18]", "gen_neurons[18]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19]", "gen_neurons[19]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1]", "gen_neurons[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20]", "gen_neurons[20]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21]", "gen_neurons[21]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22]", "gen_neurons[22]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23]", "gen_neurons[23]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24]", "gen_neurons[24]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25]", "gen_neurons[25]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26]", "gen_neurons[26]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27]", "gen_neurons[27]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28]", "gen_neurons[28]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29]", "gen_neurons[29]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2]", "gen_neurons[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30]", "gen_neurons[30]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31]", "gen_neurons[31]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3]", "gen_neurons[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4]", "gen_neurons[4]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5]", "gen_neurons[5]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6]", "gen_neurons[6]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7]", "gen_neurons[7]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8]", "gen_neurons[8]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9]", "gen_neurons[9]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2]", "gen_layers[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst", "u_layer_inst", "Layer", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0]", "gen_neurons[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10]", "gen_neurons[10]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11]", "gen_neurons[11]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12]", "gen_neurons[12]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13]", "gen_neurons[13]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14]", "gen_neurons[14]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15]", "gen_neurons[15]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1]", "gen_neurons[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2]", "gen_neurons[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3]", "gen_neurons[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4]", "gen_neurons[4]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5]", "gen_neurons[5]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6]", "gen_neurons[6]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7]", "gen_neurons[7]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8]", "gen_neurons[8]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__ = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9]", "gen_neurons[9]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron", "u_neuron", "Perceptron", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron.act", "act", "ReLU", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron.clamp", "clamp", "Clamper", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron.pre_activation", "pre_activation", "PreActivation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1 = new VerilatedScope{this, "KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron.pre_activation.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_TOP = new VerilatedScope{this, "TOP", "TOP", "<null>", 0, VerilatedScope::SCOPE_OTHER};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_KiwiNPU);
+    __Vhier.add(__Vscopep_KiwiNPU, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation);
+    __Vhier.add(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_KiwiNPU->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("LAYER_SIZES", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__LAYER_SIZES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,23,0);
+    __Vscopep_KiwiNPU->varInsert("NUM_LAYERS", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__NUM_LAYERS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("bias_offset__Vstatic__acc", &(TOP.KiwiNPU__DOT__bias_offset__Vstatic__acc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("bias_offset__Vstatic__k", &(TOP.KiwiNPU__DOT__bias_offset__Vstatic__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("bias_offset__Vstatic__s_k", &(TOP.KiwiNPU__DOT__bias_offset__Vstatic__s_k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("biases_flat", &(TOP.KiwiNPU__DOT__biases_flat), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,383,0);
+    __Vscopep_KiwiNPU->varInsert("calc_biases_bits__Vstatic__j", &(TOP.KiwiNPU__DOT__calc_biases_bits__Vstatic__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("calc_biases_bits__Vstatic__sum", &(TOP.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("calc_biases_bits__Vstatic__sz_j", &(TOP.KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("calc_weights_bits__Vstatic__j", &(TOP.KiwiNPU__DOT__calc_weights_bits__Vstatic__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("calc_weights_bits__Vstatic__sum", &(TOP.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("calc_weights_bits__Vstatic__sz_j", &(TOP.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("calc_weights_bits__Vstatic__sz_jm1", &(TOP.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("clk", &(TOP.KiwiNPU__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU->varInsert("get_layer_size__Vstatic__offset", &(TOP.KiwiNPU__DOT__get_layer_size__Vstatic__offset), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("in_vec", &(TOP.KiwiNPU__DOT__in_vec), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU->varInsert("out_vec", &(TOP.KiwiNPU__DOT__out_vec), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU->varInsert("rst_n", &(TOP.KiwiNPU__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU->varInsert("weight_offset__Vstatic__acc", &(TOP.KiwiNPU__DOT__weight_offset__Vstatic__acc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("weight_offset__Vstatic__k", &(TOP.KiwiNPU__DOT__weight_offset__Vstatic__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("weight_offset__Vstatic__s_k", &(TOP.KiwiNPU__DOT__weight_offset__Vstatic__s_k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("weight_offset__Vstatic__s_km1", &(TOP.KiwiNPU__DOT__weight_offset__Vstatic__s_km1), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU->varInsert("weights_flat", &(TOP.KiwiNPU__DOT__weights_flat), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,8191,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("BIAS_SZ", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__BIAS_SZ))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("IN_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__IN_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("LSIZE_IN", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("LSIZE_OUT", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_OUT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("OFFSET_BIAS", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_BIAS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("OFFSET_WEIGHTS", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_WEIGHTS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("OUT_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OUT_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("WEIGHT_SZ", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__WEIGHT_SZ))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("layer_biases", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("layer_in", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("layer_out", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__->varInsert("layer_weights", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,4095,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("IN_N", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__IN_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("OUT_N", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__OUT_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("biases", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("clk", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("in_vec", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("out_vec", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("rst_n", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst->varInsert("weights", &(TOP.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,4095,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,19,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,15 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("BIAS_SZ", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__BIAS_SZ))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("IN_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__IN_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("LSIZE_IN", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("LSIZE_OUT", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_OUT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("OFFSET_BIAS", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_BIAS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("OFFSET_WEIGHTS", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_WEIGHTS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("OUT_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OUT_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("WEIGHT_SZ", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__WEIGHT_SZ))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("layer_biases", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("layer_in", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("layer_out", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__->varInsert("layer_weights", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,4095,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("IN_N", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__IN_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("OUT_N", const_cast<void*>(static_cast<const void*>(&(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__OUT_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("biases", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("clk", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("in_vec", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("out_vec", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("rst_n", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst->varInsert("weights", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,4095,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.w), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.x), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("dp", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__dp), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,20,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,255,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,31 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1->varInsert("i", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.pre_activation__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("biases_flat", &(TOP.biases_flat), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,383,0);
+    __Vscopep_TOP->varInsert("clk", &(TOP.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("in_vec", &(TOP.in_vec), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_TOP->varInsert("out_vec", &(TOP.out_vec), false, VLVT_WDATA, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,127,0);
+    __Vscopep_TOP->varInsert("rst_n", &(TOP.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("weights_flat", &(TOP.weights_flat), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,8191,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_KiwiNPU);
+    __Vhier.remove(__Vscopep_KiwiNPU, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU, __Vscopep_KiwiNPU = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__16__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__17__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__18__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__19__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__20__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__21__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__22__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__23__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__24__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__25__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__26__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__27__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__28__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__29__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__30__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__31__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__0__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__10__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__11__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__12__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__13__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__14__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__15__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__1__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__2__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__3__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__4__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__5__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__6__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__7__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__8__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_neurons__BRA__9__KET____u_neuron__pre_activation__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_TOP, __Vscopep_TOP = nullptr);
+    // Tear down sub module instances
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.dtor();
+}
@@ -0,0 +1,273 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+class Vtop_Perceptron__N10_A14;
+class Vtop_Perceptron__N20_A15;
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+    // CELLS
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron;
+    Vtop_Perceptron__N10_A14* __PVT__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron;
+    Vtop_Perceptron__N20_A15* __PVT__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron;
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        VL_IN8(clk,0,0);
+        VL_IN8(rst_n,0,0);
+        CData/*0:0*/ KiwiNPU__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__rst_n__0;
+    };
+    struct {
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+        VL_INW(in_vec,127,0,4);
+        VL_INW(weights_flat,8191,0,256);
+        VL_INW(biases_flat,383,0,12);
+        VL_OUTW(out_vec,127,0,4);
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__in_vec;
+        VlWide<256>/*8191:0*/ KiwiNPU__DOT__weights_flat;
+        VlWide<12>/*383:0*/ KiwiNPU__DOT__biases_flat;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__out_vec;
+        IData/*31:0*/ KiwiNPU__DOT__get_layer_size__Vstatic__offset;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__k;
+    };
+    struct {
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPU__DOT__weight_offset__Vstatic__s_km1;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPU__DOT__bias_offset__Vstatic__s_k;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+        VlWide<128>/*4095:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+        VlWide<128>/*4095:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec;
+        VlWide<128>/*4095:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+        VlWide<8>/*255:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+        VlWide<128>/*4095:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases;
+        VlWide<4>/*127:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+        IData/*31:0*/ __VactIterCount;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 2> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 2> __VnbaTriggered;
+    };
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__NUM_LAYERS = 3U;
+    static constexpr IData/*23:0*/ KiwiNPU__DOT__LAYER_SIZES = 0x00102010U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_IN = 0x00000010U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_OUT = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__IN_WIDTH = 0x00000080U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OUT_WIDTH = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__WEIGHT_SZ = 0x00001000U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__BIAS_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_WEIGHTS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_BIAS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_IN = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_OUT = 0x00000010U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__IN_WIDTH = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OUT_WIDTH = 0x00000080U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__WEIGHT_SZ = 0x00001000U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__BIAS_SZ = 0x00000080U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_WEIGHTS = 0x00001000U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_BIAS = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__IN_N = 0x00000010U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__OUT_N = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000014U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__IN_N = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__OUT_N = 0x00000010U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000015U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,1610 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __Vilp1;
+    IData/*31:0*/ __Vilp2;
+    IData/*31:0*/ __Vilp3;
+    IData/*31:0*/ __Vilp4;
+    IData/*31:0*/ __Vilp5;
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[0U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[1U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[2U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[3U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.KiwiNPU__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.KiwiNPU__DOT__biases_flat[0U] = vlSelfRef.biases_flat[0U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[1U] = vlSelfRef.biases_flat[1U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[2U] = vlSelfRef.biases_flat[2U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[3U] = vlSelfRef.biases_flat[3U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[4U] = vlSelfRef.biases_flat[4U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[5U] = vlSelfRef.biases_flat[5U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[6U] = vlSelfRef.biases_flat[6U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[7U] = vlSelfRef.biases_flat[7U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[8U] = vlSelfRef.biases_flat[8U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[9U] = vlSelfRef.biases_flat[9U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[10U] = vlSelfRef.biases_flat[10U];
+    vlSelfRef.KiwiNPU__DOT__biases_flat[11U] = vlSelfRef.biases_flat[11U];
+    vlSelfRef.KiwiNPU__DOT__in_vec[0U] = vlSelfRef.in_vec[0U];
+    vlSelfRef.KiwiNPU__DOT__in_vec[1U] = vlSelfRef.in_vec[1U];
+    vlSelfRef.KiwiNPU__DOT__in_vec[2U] = vlSelfRef.in_vec[2U];
+    vlSelfRef.KiwiNPU__DOT__in_vec[3U] = vlSelfRef.in_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[0U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[1U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[2U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[3U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[4U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[5U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[6U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[7U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    __Vilp1 = 0U;
+    while ((__Vilp1 <= 0x000000ffU)) {
+        vlSelfRef.KiwiNPU__DOT__weights_flat[__Vilp1] 
+            = vlSelfRef.weights_flat[__Vilp1];
+        __Vilp1 = ((IData)(1U) + __Vilp1);
+    }
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPU__DOT__clk;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPU__DOT__rst_n;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[0U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[8U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[1U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[9U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[2U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[10U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[3U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[11U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[0U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[1U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[2U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[3U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[4U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[5U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[6U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[7U] 
+        = vlSelfRef.KiwiNPU__DOT__biases_flat[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[0U] 
+        = vlSelfRef.KiwiNPU__DOT__in_vec[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[1U] 
+        = vlSelfRef.KiwiNPU__DOT__in_vec[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[2U] 
+        = vlSelfRef.KiwiNPU__DOT__in_vec[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[3U] 
+        = vlSelfRef.KiwiNPU__DOT__in_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[7U];
+    __Vilp2 = 0U;
+    while ((__Vilp2 <= 0x0000007fU)) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[__Vilp2] 
+            = vlSelfRef.KiwiNPU__DOT__weights_flat[__Vilp2];
+        __Vilp2 = ((IData)(1U) + __Vilp2);
+    }
+    __Vilp3 = 0U;
+    while ((__Vilp3 <= 0x0000007fU)) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[__Vilp3] 
+            = vlSelfRef.KiwiNPU__DOT__weights_flat[
+            (__Vilp3 + (IData)(0x00000080U))];
+        __Vilp3 = ((IData)(1U) + __Vilp3);
+    }
+    vlSelfRef.KiwiNPU__DOT__out_vec[0U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[0U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[1U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[1U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[2U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[2U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[3U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[7U];
+    __Vilp4 = 0U;
+    while ((__Vilp4 <= 0x0000007fU)) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[__Vilp4] 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights
+            [__Vilp4];
+        __Vilp4 = ((IData)(1U) + __Vilp4);
+    }
+    __Vilp5 = 0U;
+    while ((__Vilp5 <= 0x0000007fU)) {
+        vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[__Vilp5] 
+            = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights
+            [__Vilp5];
+        __Vilp5 = ((IData)(1U) + __Vilp5);
+    }
+    vlSelfRef.out_vec[0U] = vlSelfRef.KiwiNPU__DOT__out_vec[0U];
+    vlSelfRef.out_vec[1U] = vlSelfRef.KiwiNPU__DOT__out_vec[1U];
+    vlSelfRef.out_vec[2U] = vlSelfRef.KiwiNPU__DOT__out_vec[2U];
+    vlSelfRef.out_vec[3U] = vlSelfRef.KiwiNPU__DOT__out_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[7U];
+}
+
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron));
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VactTriggered[0U] = (((QData)((IData)(
+                                                      ((((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.rst_n)) 
+                                                               & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__rst_n__0)) 
+                                                              << 3U) 
+                                                             | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__clk__0))) 
+                                                                << 2U)) 
+                                                            | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 1U) 
+                                                               | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__clk__0))))) 
+                                                           << 0x0000000cU) 
+                                                          | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 3U) 
+                                                               | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__clk__0))) 
+                                                                  << 2U)) 
+                                                              | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 1U) 
+                                                                 | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__clk__0))))) 
+                                                             << 8U)) 
+                                                         | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 3U) 
+                                                               | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__clk__0))) 
+                                                                  << 2U)) 
+                                                              | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 1U) 
+                                                                 | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__clk__0))))) 
+                                                             << 4U) 
+                                                            | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 3U) 
+                                                                | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 2U)) 
+                                                               | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 1U) 
+                                                                  | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__clk__0))))))) 
+                                                        << 0x00000010U) 
+                                                       | ((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__clk__0))))) 
+                                                            << 0x0000000cU) 
+                                                           | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 3U) 
+                                                                | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 2U)) 
+                                                               | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 1U) 
+                                                                  | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__clk__0))))) 
+                                                              << 8U)) 
+                                                          | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 3U) 
+                                                                | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 2U)) 
+                                                               | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 1U) 
+                                                                  | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__clk__0))))) 
+                                                              << 4U) 
+                                                             | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 3U) 
+                                                                 | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__clk__0))) 
+                                                                    << 2U)) 
+                                                                | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__rst_n__0)) 
+                                                                    << 1U) 
+                                                                   | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__clk__0)))))))))) 
+                                      << 0x00000020U) 
+                                     | (QData)((IData)(
+                                                       ((((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0))))) 
+                                                            << 0x0000000cU) 
+                                                           | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 3U) 
+                                                                | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 2U)) 
+                                                               | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 1U) 
+                                                                  | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0))))) 
+                                                              << 8U)) 
+                                                          | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 3U) 
+                                                                | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 2U)) 
+                                                               | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 1U) 
+                                                                  | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0))))) 
+                                                              << 4U) 
+                                                             | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 3U) 
+                                                                 | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0))) 
+                                                                    << 2U)) 
+                                                                | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0)) 
+                                                                    << 1U) 
+                                                                   | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0))))))) 
+                                                         << 0x00000010U) 
+                                                        | ((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 3U) 
+                                                               | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0))) 
+                                                                  << 2U)) 
+                                                              | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 1U) 
+                                                                 | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0))))) 
+                                                             << 0x0000000cU) 
+                                                            | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 3U) 
+                                                                 | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0))) 
+                                                                    << 2U)) 
+                                                                | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0)) 
+                                                                    << 1U) 
+                                                                   | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0))))) 
+                                                               << 8U)) 
+                                                           | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 3U) 
+                                                                 | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0))) 
+                                                                    << 2U)) 
+                                                                | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0)) 
+                                                                    << 1U) 
+                                                                   | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0))))) 
+                                                               << 4U) 
+                                                              | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 3U) 
+                                                                  | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0))) 
+                                                                     << 2U)) 
+                                                                 | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n)) 
+                                                                      & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0)) 
+                                                                     << 1U) 
+                                                                    | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk) 
+                                                                       & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0)))))))))));
+    vlSelfRef.__VactTriggered[1U] = (QData)((IData)(
+                                                    ((((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n)) 
+                                                             & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0)) 
+                                                            << 3U) 
+                                                           | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0))) 
+                                                              << 2U)) 
+                                                          | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n)) 
+                                                               & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0)) 
+                                                              << 1U) 
+                                                             | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0))))) 
+                                                         << 0x0000000cU) 
+                                                        | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n)) 
+                                                               & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0)) 
+                                                              << 3U) 
+                                                             | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0))) 
+                                                                << 2U)) 
+                                                            | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 1U) 
+                                                               | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0))))) 
+                                                           << 8U)) 
+                                                       | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n)) 
+                                                               & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0)) 
+                                                              << 3U) 
+                                                             | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0))) 
+                                                                << 2U)) 
+                                                            | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 1U) 
+                                                               | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0))))) 
+                                                           << 4U) 
+                                                          | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0))))))) 
+                                                      << 0x00000010U) 
+                                                     | ((((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n)) 
+                                                              & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0)) 
+                                                             << 3U) 
+                                                            | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0))) 
+                                                               << 2U)) 
+                                                           | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 1U) 
+                                                              | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0))))) 
+                                                          << 0x0000000cU) 
+                                                         | ((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0))))) 
+                                                            << 8U)) 
+                                                        | (((((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0)) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0))))) 
+                                                            << 4U) 
+                                                           | (((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n)) 
+                                                                 & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0)) 
+                                                                << 3U) 
+                                                               | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0))) 
+                                                                  << 2U)) 
+                                                              | ((((~ (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0)) 
+                                                                  << 1U) 
+                                                                 | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0))))))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 2> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((2U > n));
+    return (0U);
+}
+
+void Vtop___024root___nba_comb__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[0U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[1U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[2U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[3U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[0U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[0U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[1U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[1U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[2U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[2U];
+    vlSelfRef.KiwiNPU__DOT__out_vec[3U] = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out[3U];
+    vlSelfRef.out_vec[0U] = vlSelfRef.KiwiNPU__DOT__out_vec[0U];
+    vlSelfRef.out_vec[1U] = vlSelfRef.KiwiNPU__DOT__out_vec[1U];
+    vlSelfRef.out_vec[2U] = vlSelfRef.KiwiNPU__DOT__out_vec[2U];
+    vlSelfRef.out_vec[3U] = vlSelfRef.KiwiNPU__DOT__out_vec[3U];
+}
+
+void Vtop___024root___nba_comb__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[0U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[1U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[2U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[3U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[4U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[5U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[6U] 
+        = (IData)((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.y) 
+                                       << 0x00000018U) 
+                                      | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.y) 
+                                         << 0x00000010U)) 
+                                     | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.y) 
+                                         << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.y))))) 
+                    << 0x00000020U) | (QData)((IData)(
+                                                      ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.y) 
+                                                         << 0x00000018U) 
+                                                        | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.y) 
+                                                           << 0x00000010U)) 
+                                                       | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.y) 
+                                                           << 8U) 
+                                                          | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.y)))))));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[7U] 
+        = (IData)(((((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.y) 
+                                        << 0x00000018U) 
+                                       | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.y) 
+                                          << 0x00000010U)) 
+                                      | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.y) 
+                                          << 8U) | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.y))))) 
+                     << 0x00000020U) | (QData)((IData)(
+                                                       ((((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.y) 
+                                                          << 0x00000018U) 
+                                                         | ((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.y) 
+                                                            << 0x00000010U)) 
+                                                        | (((IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.y) 
+                                                            << 8U) 
+                                                           | (IData)(vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.y)))))) 
+                   >> 0x00000020U));
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out[7U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[0U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[0U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[1U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[1U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[2U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[2U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[3U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[3U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[4U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[4U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[5U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[5U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[6U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[6U];
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec[7U] 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in[7U];
+}
+
+void Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((3ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+    }
+    if ((0x000000000000000cULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000030ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+    }
+    if ((0x00000000000000c0ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000300ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000c00ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000003000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+    }
+    if ((0x000000000000c000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000030000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+    }
+    if ((0x00000000000c0000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000300000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000c00000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+    }
+    if ((0x0000000003000000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+    }
+    if ((0x000000000c000000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+    }
+    if ((0x0000000030000000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+    }
+    if ((0x00000000c0000000ULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop_Perceptron__N20_A15___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+    }
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+    }
+    if ((0x000000000000000cULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000030ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+    }
+    if ((0x00000000000000c0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000300ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000c00ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000003000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+    }
+    if ((0x000000000000c000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000030000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+    }
+    if ((0x00000000000c0000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000300000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000c00000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+    }
+    if ((0x0000000003000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+    }
+    if ((0x000000000c000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+    }
+    if ((0x0000000030000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+    }
+    if ((0x00000000c0000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+    }
+    if ((0x0000000300000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron));
+    }
+    if ((0x0000000c00000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron));
+    }
+    if ((0x0000003000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron));
+    }
+    if ((0x000000c000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron));
+    }
+    if ((0x0000030000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron));
+    }
+    if ((0x00000c0000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron));
+    }
+    if ((0x0000300000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron));
+    }
+    if ((0x0000c00000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron));
+    }
+    if ((0x0003000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron));
+    }
+    if ((0x000c000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron));
+    }
+    if ((0x0030000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron));
+    }
+    if ((0x00c0000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron));
+    }
+    if ((0x0300000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron));
+    }
+    if ((0x0c00000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron));
+    }
+    if ((0x3000000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron));
+    }
+    if ((0xc000000000000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__N10_A14___nba_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron));
+    }
+    if ((0x00000000ffffffffULL & vlSelfRef.__VnbaTriggered[1U])) {
+        Vtop___024root___nba_comb__TOP__0(vlSelf);
+    }
+    if (vlSelfRef.__VnbaTriggered[0U]) {
+        Vtop___024root___nba_comb__TOP__1(vlSelf);
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___nba_comb__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_vec(VlUnpacked<QData/*63:0*/, 2> &out, const VlUnpacked<QData/*63:0*/, 2> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((1U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 2> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    return (0U);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 2> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((2U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                         + vlSelfRef.__VactIterCount);
+            vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+        } while (vlSelfRef.__VactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (VL_UNLIKELY(((vlSelfRef.clk & 0xfeU)))) {
+        Verilated::overWidthError("clk");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.rst_n & 0xfeU)))) {
+        Verilated::overWidthError("rst_n");
+    }
+}
+#endif  // VL_DEBUG
@@ -0,0 +1,913 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPU__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6532751874159864346ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1742478424908541970ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17897251015886240299ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15586208202128722591ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 514789550500795949ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13408463765750731481ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10680724174772596631ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4684162191132766879ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 11687461658285027376ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15713973834903494983ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3305263118041591338ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3806958282115377501ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14460629766670832452ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6306350784941529936ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7800984428660529765ull);
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron.rst_n;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_static__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPU__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6532751874159864346ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1742478424908541970ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17897251015886240299ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15586208202128722591ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 514789550500795949ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13408463765750731481ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10680724174772596631ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4684162191132766879ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 11687461658285027376ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15713973834903494983ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3305263118041591338ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3806958282115377501ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14460629766670832452ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6306350784941529936ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7800984428660529765ull);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0(Vtop_Perceptron__N20_A15* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+void Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__0(Vtop_Perceptron__N10_A14* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+        Vtop_Perceptron__N20_A15___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron));
+        Vtop_Perceptron__N10_A14___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron));
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 2> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 2> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 4 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 5 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 6 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 7 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 8 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 9 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[4].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 10 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 11 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[5].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 12 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 13 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[6].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 14 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 15 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[7].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000010U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 16 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000011U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 17 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[8].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000012U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 18 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000013U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 19 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[9].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000014U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 20 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000015U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 21 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[10].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000016U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 22 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000017U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 23 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[11].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000018U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 24 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000019U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 25 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[12].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 26 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 27 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[13].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 28 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 29 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[14].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 30 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 31 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[15].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000020U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 32 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000021U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 33 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[16].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000022U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 34 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000023U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 35 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[17].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000024U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 36 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000025U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 37 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[18].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000026U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 38 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000027U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 39 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[19].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000028U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 40 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000029U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 41 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[20].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000002aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 42 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000002bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 43 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[21].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000002cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 44 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000002dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 45 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[22].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000002eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 46 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000002fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 47 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[23].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000030U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 48 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000031U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 49 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[24].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000032U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 50 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000033U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 51 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[25].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000034U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 52 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000035U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 53 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[26].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000036U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 54 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000037U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 55 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[27].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000038U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 56 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000039U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 57 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[28].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000003aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 58 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000003bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 59 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[29].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000003cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 60 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000003dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 61 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[30].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000003eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 62 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000003fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 63 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_neurons[31].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)(triggers[1U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 64 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 65 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 66 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 67 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 68 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 69 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 70 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 71 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 72 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 73 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[4].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 74 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 75 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[5].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 76 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 77 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[6].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 78 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000000fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 79 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[7].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000010U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 80 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000011U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 81 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[8].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000012U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 82 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000013U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 83 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[9].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000014U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 84 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000015U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 85 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[10].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000016U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 86 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000017U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 87 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[11].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000018U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 88 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x00000019U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 89 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[12].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000001aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 90 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000001bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 91 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[13].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000001cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 92 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000001dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 93 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[14].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000001eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 94 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 0x0000001fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 95 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_neurons[15].u_neuron.rst_n)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->in_vec, __VscopeHash, 14514620031066118736ull);
+    VL_SCOPED_RAND_RESET_W(8192, vlSelf->weights_flat, __VscopeHash, 7281237363156479805ull);
+    VL_SCOPED_RAND_RESET_W(384, vlSelf->biases_flat, __VscopeHash, 4961876817153477982ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->out_vec, __VscopeHash, 13025239842288100510ull);
+    vlSelf->KiwiNPU__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5063780984336332758ull);
+    vlSelf->KiwiNPU__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14090602771392734443ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__in_vec, __VscopeHash, 1575674597081114644ull);
+    VL_SCOPED_RAND_RESET_W(8192, vlSelf->KiwiNPU__DOT__weights_flat, __VscopeHash, 8991633052071420028ull);
+    VL_SCOPED_RAND_RESET_W(384, vlSelf->KiwiNPU__DOT__biases_flat, __VscopeHash, 15604781266724902930ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__out_vec, __VscopeHash, 2472900835353944141ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in, __VscopeHash, 16553416117285054588ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out, __VscopeHash, 1622769584364346726ull);
+    VL_SCOPED_RAND_RESET_W(4096, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights, __VscopeHash, 16496043317995005663ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases, __VscopeHash, 4810044069176435598ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in, __VscopeHash, 15041669807583202918ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out, __VscopeHash, 6248452857584709186ull);
+    VL_SCOPED_RAND_RESET_W(4096, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights, __VscopeHash, 14262982707140251532ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases, __VscopeHash, 16538731732423511042ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12444810275778615962ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8703963591528304203ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec, __VscopeHash, 10420251144184843214ull);
+    VL_SCOPED_RAND_RESET_W(4096, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 8796660585539064659ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases, __VscopeHash, 7535665318671116516ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec, __VscopeHash, 4439260106168241426ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7016776448813978970ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8109155939668749341ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec, __VscopeHash, 4520696913582338881ull);
+    VL_SCOPED_RAND_RESET_W(4096, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 3525434327222442606ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases, __VscopeHash, 1320262098224249392ull);
+    VL_SCOPED_RAND_RESET_W(128, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec, __VscopeHash, 17250718937599774452ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__16__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__17__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__18__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__19__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__20__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__21__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__22__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__23__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__24__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__25__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__26__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__27__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__28__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__29__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__30__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__31__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__8__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__9__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__10__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__11__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__12__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__13__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__14__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_neurons__BRA__15__KET____DOT__u_neuron__rst_n__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
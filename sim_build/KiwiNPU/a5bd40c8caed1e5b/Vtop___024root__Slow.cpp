@@ -0,0 +1,53 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop___024root
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__NUM_LAYERS;
+constexpr IData/*23:0*/ Vtop___024root::KiwiNPU__DOT__LAYER_SIZES;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_IN;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_OUT;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__IN_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OUT_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__WEIGHT_SZ;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__BIAS_SZ;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_WEIGHTS;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_BIAS;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_IN;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_OUT;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__IN_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OUT_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__WEIGHT_SZ;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__BIAS_SZ;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_WEIGHTS;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_BIAS;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__IN_N;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__OUT_N;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__IN_N;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__OUT_N;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__ACC_WIDTH;
+
+
+void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf);
+
+Vtop___024root::Vtop___024root(Vtop__Syms* symsp, const char* namep)
+ {
+    vlSymsp = symsp;
+    vlNamep = strdup(namep);
+    // Reset structure values
+    Vtop___024root___ctor_var_reset(this);
+}
+
+void Vtop___024root::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+Vtop___024root::~Vtop___024root() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
@@ -0,0 +1,111 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron(Vtop_Perceptron__A12* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.int4 = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+}
+
+VL_ATTR_COLD void Vtop_Perceptron__A12___ctor_var_reset(Vtop_Perceptron__A12* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+          Vtop_Perceptron__A12___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    vlSelf->en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7710216835639188562ull);
+    vlSelf->int4 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11286590249482074291ull);
+    vlSelf->x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9409450202036847209ull);
+    vlSelf->w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 2482183445564601373ull);
+    vlSelf->b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16900879642891266615ull);
+    vlSelf->y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11123243248953317070ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6993073837475875754ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9131122053381400934ull);
+    }
+    vlSelf->pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 5030441938748210240ull);
+    vlSelf->pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3317201933935267813ull);
+    vlSelf->act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3492424077448558534ull);
+    vlSelf->relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17589453413709702011ull);
+    vlSelf->pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16682812670805397419ull);
+    vlSelf->pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6577443073505738809ull);
+    vlSelf->pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9739648085976820700ull);
+    vlSelf->pre_activation__DOT__int4 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10273774256997888138ull);
+    vlSelf->pre_activation__DOT__x = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8569219317619434053ull);
+    vlSelf->pre_activation__DOT__w = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8960955919027285184ull);
+    vlSelf->pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16063847634226918097ull);
+    vlSelf->pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 8673453595209914649ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6574967772067896672ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1441310708108914510ull);
+    }
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 115176197556615566ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14531335983310531305ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2373417096394152942ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15521154066741963059ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 12906811113665259980ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 10300312860892763015ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4960774672326763898ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2352764488982939379ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 9705321634156211786ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 18264330170354000929ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1249392820530541236ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3760735799600567404ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 10339822094473752463ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 4250544539531917228ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7531587747808909801ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17007984158049112124ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 793295992067563797ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 10951088666338238755ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11066641062779784661ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 11546134659791399802ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 417899394283122721ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 6870911214197045309ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 17865901874667020187ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 7677093363996120469ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 2294024231120809811ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 3794397844097172967ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 18270347460978575713ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 15487029160001596389ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 15035214236228057128ull);
+    vlSelf->pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 14631505717562478927ull);
+    vlSelf->clamp__DOT__in = VL_SCOPED_RAND_RESET_I(18, __VscopeHash, 7798333535249344728ull);
+    vlSelf->clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10867968380403618745ull);
+    vlSelf->act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13528716278640066619ull);
+    vlSelf->act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5764329140672425732ull);
+}
@@ -0,0 +1,291 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+void Vtop__Syms::Vtop__Syms__ctor__1() {
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("act_in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("en", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.en), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("int4", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.int4), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w), false, VLVT_UINT64, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x), false, VLVT_UINT64, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("H", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__H))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("LEVELS", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__LEVELS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("OUT_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__OUT_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("TREE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__TREE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("ZERO_GATING", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__ZERO_GATING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("en", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__en), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("int4", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__int4), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("act_in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.b), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("en", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.en), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("int4", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.int4), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("pre_clamped", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_clamped), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("relu_out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.relu_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w), false, VLVT_UINT64, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x), false, VLVT_UINT64, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron->varInsert("y", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("MAX_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__MAX_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("MIN_VAL", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__MIN_VAL))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("in", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__in), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp->varInsert("out", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("ACC_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__ACC_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("H", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__H))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("INT4_PACKING", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__INT4_PACKING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("LEVELS", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__LEVELS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("OUT_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__OUT_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("PIPE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__PIPE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("TREE_STAGES", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__TREE_STAGES))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("ZERO_GATING", const_cast<void*>(static_cast<const void*>(&(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__ZERO_GATING))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("b", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__b), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("clk", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("en", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__en), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("int4", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__int4), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("pre", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__pre), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("rst_n", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("w", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("w_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("x", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation->varInsert("x_arr", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 1, 1 ,0,7 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product->varInsert("w_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product->varInsert("x_op", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,7,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__->varInsert("node", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__->varInsert("sum", &(TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,18,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk1->varInsert("k", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk2->varInsert("k", &(TOP.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_TOP->varInsert("bank", &(TOP.bank), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 1 ,0,0);
+    __Vscopep_TOP->varInsert("biases_flat", &(TOP.biases_flat), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,95,0);
+    __Vscopep_TOP->varInsert("clk", &(TOP.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("in_ready", &(TOP.in_ready), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_TOP->varInsert("in_valid", &(TOP.in_valid), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("in_vec", &(TOP.in_vec), false, VLVT_UINT64, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_TOP->varInsert("out_ready", &(TOP.out_ready), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("out_valid", &(TOP.out_valid), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_TOP->varInsert("out_vec", &(TOP.out_vec), false, VLVT_UINT64, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY|VLVF_SIGNED, 0, 1 ,63,0);
+    __Vscopep_TOP->varInsert("rst_n", &(TOP.rst_n), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("weights_flat", &(TOP.weights_flat), false, VLVT_WDATA, VLVD_IN|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,511,0);
+}
@@ -0,0 +1,1743 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+void Vtop__Syms::Vtop__Syms__dtor__0() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_KiwiNPU);
+    __Vhier.remove(__Vscopep_KiwiNPU, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU, __Vscopep_KiwiNPU = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____unnamedblk2, __Vscopep_KiwiNPU__gen_layers__BRA__1__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__act = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__clamp = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__1__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk1, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk2, __Vscopep_KiwiNPU__gen_layers__BRA__2__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_TOP, __Vscopep_TOP = nullptr);
+    // Tear down sub module instances
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__1__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.dtor();
+    TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.dtor();
+}
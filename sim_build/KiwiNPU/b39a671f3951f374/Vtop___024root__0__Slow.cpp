@@ -0,0 +1,1288 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPU__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6532751874159864346ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1742478424908541970ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17897251015886240299ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15586208202128722591ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 514789550500795949ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13408463765750731481ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10680724174772596631ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4684162191132766879ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 11687461658285027376ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15713973834903494983ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3305263118041591338ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3806958282115377501ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14460629766670832452ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6306350784941529936ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7800984428660529765ull);
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_static__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPU__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6532751874159864346ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1742478424908541970ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17897251015886240299ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15586208202128722591ull);
+    vlSelf->KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 514789550500795949ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13408463765750731481ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10680724174772596631ull);
+    vlSelf->KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4684162191132766879ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 11687461658285027376ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15713973834903494983ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3305263118041591338ull);
+    vlSelf->KiwiNPU__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3806958282115377501ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14460629766670832452ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6306350784941529936ull);
+    vlSelf->KiwiNPU__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7800984428660529765ull);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf);
+VL_ATTR_COLD void Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron(Vtop_Perceptron__A12* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_initial__TOP(vlSelf);
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__1__Vfuncout;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__1__Vfuncout = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__1__idx;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__1__idx = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__2__Vfuncout;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__2__Vfuncout = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__2__idx;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__2__idx = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__4__Vfuncout;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__4__Vfuncout = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__4__idx;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__4__idx = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__6__Vfuncout;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__6__Vfuncout = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__6__idx;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__6__idx = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__7__Vfuncout;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__7__Vfuncout = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__7__idx;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__7__idx = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__9__Vfuncout;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__9__Vfuncout = 0;
+    IData/*31:0*/ __Vfunc_KiwiNPU__DOT__get_layer_size__9__idx;
+    __Vfunc_KiwiNPU__DOT__get_layer_size__9__idx = 0;
+    // Body
+    vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j)) {
+        __Vfunc_KiwiNPU__DOT__get_layer_size__1__idx 
+            = vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - __Vfunc_KiwiNPU__DOT__get_layer_size__1__idx));
+        __Vfunc_KiwiNPU__DOT__get_layer_size__1__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j 
+            = __Vfunc_KiwiNPU__DOT__get_layer_size__1__Vfuncout;
+        __Vfunc_KiwiNPU__DOT__get_layer_size__2__idx 
+            = (vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - __Vfunc_KiwiNPU__DOT__get_layer_size__2__idx));
+        __Vfunc_KiwiNPU__DOT__get_layer_size__2__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = __Vfunc_KiwiNPU__DOT__get_layer_size__2__Vfuncout;
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j);
+    }
+    vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j)) {
+        __Vfunc_KiwiNPU__DOT__get_layer_size__4__idx 
+            = vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - __Vfunc_KiwiNPU__DOT__get_layer_size__4__idx));
+        __Vfunc_KiwiNPU__DOT__get_layer_size__4__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j 
+            = __Vfunc_KiwiNPU__DOT__get_layer_size__4__Vfuncout;
+        vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j);
+    }
+    vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j)) {
+        __Vfunc_KiwiNPU__DOT__get_layer_size__6__idx 
+            = vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - __Vfunc_KiwiNPU__DOT__get_layer_size__6__idx));
+        __Vfunc_KiwiNPU__DOT__get_layer_size__6__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j 
+            = __Vfunc_KiwiNPU__DOT__get_layer_size__6__Vfuncout;
+        __Vfunc_KiwiNPU__DOT__get_layer_size__7__idx 
+            = (vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - __Vfunc_KiwiNPU__DOT__get_layer_size__7__idx));
+        __Vfunc_KiwiNPU__DOT__get_layer_size__7__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = __Vfunc_KiwiNPU__DOT__get_layer_size__7__Vfuncout;
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__calc_weights_bits__Vstatic__j);
+    }
+    vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j)) {
+        __Vfunc_KiwiNPU__DOT__get_layer_size__9__idx 
+            = vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - __Vfunc_KiwiNPU__DOT__get_layer_size__9__idx));
+        __Vfunc_KiwiNPU__DOT__get_layer_size__9__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPU__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j 
+            = __Vfunc_KiwiNPU__DOT__get_layer_size__9__Vfuncout;
+        vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPU__DOT__calc_biases_bits__Vstatic__j);
+    }
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_bank = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_bank = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPU.sv", 3, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge KiwiNPU.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(negedge KiwiNPU.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 4 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 5 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 6 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 7 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 8 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 9 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 10 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 11 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 12 is active: @(posedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 13 is active: @(negedge KiwiNPU.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 14 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 15 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000010U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 16 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000011U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 17 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000012U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 18 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000013U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 19 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000014U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 20 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000015U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 21 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000016U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 22 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[4].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000017U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 23 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[4].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000018U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 24 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[5].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000019U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 25 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[5].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 26 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[6].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 27 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[6].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 28 is active: @(posedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[7].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 29 is active: @(negedge KiwiNPU.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[7].u_neuron.rst_n)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    vlSelf->bank = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16427521209079334980ull);
+    vlSelf->in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2339549897027650563ull);
+    vlSelf->in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1122049356863891575ull);
+    vlSelf->in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14514620031066118736ull);
+    VL_SCOPED_RAND_RESET_W(512, vlSelf->weights_flat, __VscopeHash, 7281237363156479805ull);
+    VL_SCOPED_RAND_RESET_W(96, vlSelf->biases_flat, __VscopeHash, 4961876817153477982ull);
+    vlSelf->out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2886291494070200219ull);
+    vlSelf->out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17332470166291283643ull);
+    vlSelf->out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13025239842288100510ull);
+    vlSelf->KiwiNPU__DOT____Vlvbound_h5f6b4e08__0 = 0;
+    vlSelf->KiwiNPU__DOT____Vlvbound_h7236681e__0 = 0;
+    vlSelf->KiwiNPU__DOT____Vlvbound_h99e8e462__0 = 0;
+    vlSelf->KiwiNPU__DOT____Vlvbound_h4e8b1913__0 = 0;
+    vlSelf->KiwiNPU__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5063780984336332758ull);
+    vlSelf->KiwiNPU__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14090602771392734443ull);
+    vlSelf->KiwiNPU__DOT__bank = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9526917405684052247ull);
+    vlSelf->KiwiNPU__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3445665571200726056ull);
+    vlSelf->KiwiNPU__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14407551385006916414ull);
+    vlSelf->KiwiNPU__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1575674597081114644ull);
+    VL_SCOPED_RAND_RESET_W(512, vlSelf->KiwiNPU__DOT__weights_flat, __VscopeHash, 8991633052071420028ull);
+    VL_SCOPED_RAND_RESET_W(96, vlSelf->KiwiNPU__DOT__biases_flat, __VscopeHash, 15604781266724902930ull);
+    vlSelf->KiwiNPU__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16107019123664550582ull);
+    vlSelf->KiwiNPU__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18072004404152553792ull);
+    vlSelf->KiwiNPU__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 2472900835353944141ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16553416117285054588ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 1622769584364346726ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3977984194441801469ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11900543181593919689ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15323578228294696564ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18217557674867852632ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_bank = 0U;
+    ;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__bank_q[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13776316460415894499ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 18264924816970981568ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 12660668088731322023ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_weights, __VscopeHash, 16496043317995005663ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__layer_biases = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4810044069176435598ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 15041669807583202918ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6248452857584709186ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11213442644481464011ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17873054264600150727ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14243354012643832758ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11450336117429236124ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_bank = 0U;
+    ;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__bank_q[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7697365916131907278ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 402537693535641429ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1359525586291760954ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_weights, __VscopeHash, 14262982707140251532ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__layer_biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16538731732423511042ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12444810275778615962ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8703963591528304203ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16669905243312544141ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5320896782770923392ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10420251144184843214ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 8796660585539064659ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 7535665318671116516ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2429282278129646102ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17252975014522232755ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4439260106168241426ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15742661863699449424ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7016776448813978970ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8109155939668749341ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11732135175823783983ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3771730294335630148ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4520696913582338881ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 3525434327222442606ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1320262098224249392ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5330134064783639042ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5548146694892644836ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17250718937599774452ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11910968288753551385ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3514597778598750734ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18381435599005441017ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12162035731800756267ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 887220748503419143ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 5689883396346527038ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15133660744847902904ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11893752916111750411ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16115527080761563593ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2615401097431963969ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 966886954145150698ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14724957801204344475ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12644299907154341324ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8348792335014986551ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16376492533992326376ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 471412606005264505ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10831775004731588232ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 6104972407724137729ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 17840148874316529285ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1674987263613093751ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13999704155785185103ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15932264146397307308ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4140677873258103363ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4000343175158258240ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2469481695939668241ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 788885396724960864ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10420368721695889770ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13823288151382268378ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7738985328683050839ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17108353242767645242ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15613130608413538968ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17868726654238520723ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14729854108996854043ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16916829371260412226ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13418155573161507718ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 305335858525088075ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12375676421140255844ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2559050966939143844ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12902690252879624594ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8695813368291408824ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12775699450661270045ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15735424375724665126ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3737910326023625812ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11207260684997181870ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14816066016559790283ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4382088430010260515ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3339839145787152928ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16736028726611062468ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11262249207699303295ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14061492790620176395ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 356335098788711774ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7065364276482692384ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5187025228727662702ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7860258853181556151ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8321393331315486320ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5463469604979776865ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5047812791265442930ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18015225225713725713ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2079770543826679027ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10910848715419112740ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13706327632727261313ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5529456064757157703ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16822574651442099827ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1687655756600645730ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14707965088755200674ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13817234108160162779ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8332572153509225095ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14212145888984969008ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10668693995898431617ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9983149768984602816ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4351325922586378790ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10395787224017741035ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15354171086833250050ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15441389767178945410ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7956776510552425465ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10809805083871394133ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2908482253596701638ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4685196398925040736ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7663519171786476213ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16052796349966913132ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9754027258771004052ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 558973769875094327ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2507539554003283445ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17562491688044802151ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 841509124125219846ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2920005316596209824ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 16782207147901742910ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 9583651524085311821ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16920787731553536825ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5587346160596733937ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7024177603326646711ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17927434931654966023ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15351746926200907112ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6731360337770366686ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16511191530899471798ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3672962615524304590ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2301603939118392207ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2384023008358947581ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13026513312209000640ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3152335809921918955ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 10661903586261301197ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16103450212725074002ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12927678634574955601ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10951305208470394130ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9651168964007964558ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14332989352801254111ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3968300244447176314ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4166519889606030799ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3613669937134015322ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10811135282047032089ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10086934977235761339ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15129708052215404306ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5698587875359831302ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3859675850898076915ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7144508916082583535ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17946255814630181552ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1478780240023449377ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8742446416250668792ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4983518250155025416ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11464413881058605839ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7022038276088127092ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2820531682492349590ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14985426191531497891ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16295971855342037993ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14759166432475331599ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17059423092882351506ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9068203404584102899ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7608593031556905597ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14890102659848952947ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15299852565133199349ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6204993986505498064ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14030190533439636777ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17090663939862829633ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16855276615003431387ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3739021104107349568ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4165264026722858949ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15844155097527593275ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10594000418667958583ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12054580091144209357ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9629340366661774746ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2667550688939902423ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9772688989146007461ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 463732368454795227ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9614430491195671880ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16689295628892142009ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12228742103622920975ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11934382354380275773ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5360551355445922723ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10229998608203277288ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11749122251194586672ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14642358348978566008ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12361446308352409542ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7304672407019151054ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17062793736044117852ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14933200426719726675ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15511066318681007975ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10864309421198005344ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7147242512430201649ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1787375382296588143ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17850929497624304366ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9126768386700074026ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17135107918430863154ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10869958234974647539ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7514030275392307450ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 236516841975325104ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13262613646410026358ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6871051641795489594ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16820347588901344515ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 959135389507118170ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 1386057265384954758ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2778498209196740330ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5534578511915109390ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7086548916196089797ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 307685689640100261ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4364645964461874561ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16475711941628802844ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1383947560415559945ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11082143819985733410ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9464973214906333305ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 113876541680166234ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3269304239864390496ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 16135586897375769606ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 15130021458970112456ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9854293997105701518ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4180680926597121745ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 593929649931524082ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2589982259143120227ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5565790572712107304ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10441108773606206762ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14840122093800018055ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9827113297582707861ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11287325728334839451ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7159556064449537471ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10564094150610125159ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10758796768799526487ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12807171968529832770ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5895962521559025292ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4932841134451960159ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15661566399375151015ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12571688829305045910ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7320940256450202254ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 610814541534979227ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6316335820807845642ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9440338365568710993ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3154690077021250592ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9155382360033829188ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10406673510473189182ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13677475417194266955ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13874840960456827260ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4364064150630843325ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3444939206416518074ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7633640141951683122ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5668498949508305852ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7971050014369692013ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9402143053155564213ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6198613893217349894ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17952539749614622694ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6997266494885586297ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8440251273537908216ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2238771641219389230ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15310041757366350027ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 888110731234436852ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16555208754937432960ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2158831987459560124ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9930248138955165165ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10957496057654411113ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14764134708349646419ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16232042452255451830ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8262250765586605164ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14499030314885607839ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16114265376018664454ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15287100152919106381ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18200391773562359165ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18306103976891045294ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4800289777171524068ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16072957974963129097ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17355142418119532275ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9262487247675067707ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13313456847298677167ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4856228278582968306ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5583337569175734777ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7349637708757769266ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2308761704185028751ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5022273655074104596ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17843096536300760685ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1712822948541597898ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11573358496367101420ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6229643240701515664ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16200242853123218358ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4554737245098753955ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 5504446444753087614ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 15803060898806612477ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16755118572816639806ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2909603280154083155ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11903061800240231172ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4188813504628861277ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12747878883186376891ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7912450852675532227ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10492408307199242813ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17675272301849322294ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15095394533168723965ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6075049390908652309ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3344383998786276633ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3097820103107346657ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 17897265174531993260ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16245320947163309253ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5063349165653088475ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 181936934311609475ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8137000698485216875ull);
+    }
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7333371233921578395ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 467044960853925410ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4544124651121725470ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2620462714970631084ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2215424836350778772ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6441472067933339512ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1165378896548988055ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 65607688383986598ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4746765900600960534ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12476119776650214826ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12851620428769178880ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7795377927008358766ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2922227608411064846ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12542698321351046960ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8252838103350262734ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2814359324422730012ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13141101236601299193ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11502185087963982868ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7404387043633731841ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8973302192804690290ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8838620716415228648ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7790388876861061692ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11011958373475661379ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15753408494399732877ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1067228202245733046ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9995461786537398042ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3352997492950980936ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 914381305656672203ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6221767892692879265ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16491967171940021214ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10261804700214237651ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17915407038376514073ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5560749308099587853ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 700719217236439141ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7146828654710612730ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10461711362460297021ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6789232442129365868ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16779760467594072635ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10307595138580872224ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7539209737135575901ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2975266845104666940ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17219845429202860963ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16002824131008383252ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11305940592055727151ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3780108572652869500ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 325345401914515770ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13438437478029820448ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2081808298994257773ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5853891863522115747ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14030260528322418881ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10203704396933865942ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16541632363197310430ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5548056066078225317ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 904132530046843140ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18221703698979109212ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 484697623614679743ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9510013347720471890ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6504579739297585051ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13732688157298619641ull);
+    vlSelf->KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8519323936228697915ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPU__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
@@ -0,0 +1,28 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Precompiled header
+//
+// Internal details; most user sources do not need this header,
+// unless using verilator public meta comments.
+// Suggest use Vtop.h instead.
+
+#ifndef VERILATED_VTOP__PCH_H_
+#define VERILATED_VTOP__PCH_H_  // guard
+
+// GCC and Clang only will precompile headers (PCH) for the first header.
+// So, make sure this is the one and only PCH.
+// If multiple module's includes are needed, use individual includes.
+#ifdef VL_PCH_INCLUDED
+# error "Including multiple precompiled header files"
+#endif
+#define VL_PCH_INCLUDED
+
+
+#include "verilated.h"
+#include "verilated_dpi.h"
+
+#include "Vtop__Syms.h"
+#include "Vtop.h"
+
+// Additional include files added using '--compiler-include'
+
+#endif  // guard
@@ -0,0 +1,48 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop_Perceptron__A12
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::N;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::PIPE_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::INT4_PACKING;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__N;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__PIPE_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__ZERO_GATING;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__INT4_PACKING;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__LEVELS;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__TREE_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__OUT_STAGES;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::pre_activation__DOT__H;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::clamp__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::clamp__DOT__ACC_WIDTH;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::clamp__DOT__MIN_VAL;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::clamp__DOT__MAX_VAL;
+constexpr IData/*31:0*/ Vtop_Perceptron__A12::act__DOT__DATA_WIDTH;
+
+
+void Vtop_Perceptron__A12___ctor_var_reset(Vtop_Perceptron__A12* vlSelf);
+
+Vtop_Perceptron__A12::Vtop_Perceptron__A12() = default;
+Vtop_Perceptron__A12::~Vtop_Perceptron__A12() = default;
+
+void Vtop_Perceptron__A12::ctor(Vtop__Syms* symsp, const char* namep) {
+    vlSymsp = symsp;
+    vlNamep = strdup(Verilated::catName(vlSymsp->name(), namep));
+    // Reset structure values
+    Vtop_Perceptron__A12___ctor_var_reset(this);
+}
+
+void Vtop_Perceptron__A12::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+void Vtop_Perceptron__A12::dtor() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
@@ -0,0 +1,93 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Constant pool
+
+#include "verilated.h"
+
+extern const VlWide<38>/*1215:0*/ Vtop__ConstPool__CONST_h6155dc76_0 = VlWide<38>{{
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h037aa0bf_0 = {{
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h737affed_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*2:0*/, 128> Vtop__ConstPool__TABLE_hdfa1cf36_0 = {{
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 3U, 7U, 3U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_he9f9863e_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 1U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 1U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
@@ -0,0 +1,956 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+class Vtop_Perceptron__A12;
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+    // CELLS
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12* __PVT__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        VL_IN8(clk,0,0);
+        VL_IN8(rst_n,0,0);
+        VL_IN8(load,0,0);
+        VL_OUT8(loaded,0,0);
+        VL_IN8(swap,0,0);
+        VL_OUT8(shadow_ready,0,0);
+        VL_IN8(in_valid,0,0);
+        VL_OUT8(in_ready,0,0);
+        VL_OUT8(out_valid,0,0);
+        VL_IN8(out_ready,0,0);
+        VL_OUT8(flash_csb,0,0);
+        VL_OUT8(flash_clk,0,0);
+        VL_OUT8(flash_io0_oe,0,0);
+        VL_OUT8(flash_io1_oe,0,0);
+        VL_OUT8(flash_io2_oe,0,0);
+        VL_OUT8(flash_io3_oe,0,0);
+        VL_OUT8(flash_io0_do,0,0);
+        VL_OUT8(flash_io1_do,0,0);
+        VL_OUT8(flash_io2_do,0,0);
+        VL_OUT8(flash_io3_do,0,0);
+        VL_IN8(flash_io0_di,0,0);
+        VL_IN8(flash_io1_di,0,0);
+        VL_IN8(flash_io2_di,0,0);
+        VL_IN8(flash_io3_di,0,0);
+        CData/*0:0*/ KiwiNPUFlash__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__load;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loaded;
+        CData/*0:0*/ KiwiNPUFlash__DOT__swap;
+        CData/*0:0*/ KiwiNPUFlash__DOT__shadow_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__in_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__out_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__out_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_csb;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io0_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io1_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io2_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io3_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io0_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io1_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io2_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io3_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io0_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io1_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io2_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash_io3_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__mem_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__mem_ready;
+        CData/*3:0*/ KiwiNPUFlash__DOT__cfgreg_we;
+        CData/*0:0*/ KiwiNPUFlash__DOT__configured;
+        CData/*0:0*/ KiwiNPUFlash__DOT__active;
+        CData/*0:0*/ KiwiNPUFlash__DOT__shadow_loading;
+        CData/*0:0*/ KiwiNPUFlash__DOT__booted;
+        CData/*0:0*/ KiwiNPUFlash__DOT__serving;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu_in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__resetn;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_csb;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe;
+    };
+    struct {
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io0_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io1_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io2_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io3_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io0_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io1_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io2_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__flash_io3_di;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__cfgreg_we;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_resetn;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__din_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__din_ready;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__din_data;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__din_tag;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__din_cont;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__din_qspi;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__din_ddr;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__din_rd;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__dout_valid;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__dout_data;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__dout_tag;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__rd_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__rd_wait;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__rd_inc;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__jump;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__softreset;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__config_en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__config_ddr;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__config_qspi;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__config_cont;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__config_dummy;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__config_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__config_csb;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__config_clk;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__config_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_csb;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_dspi;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer_ddr;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__state;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi;
+    };
+    struct {
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_cont;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer;
+        CData/*7:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer;
+        CData/*3:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch;
+        CData/*0:0*/ KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__load;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__bank;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__mem_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__loaded;
+        CData/*4:0*/ KiwiNPUFlash__DOT__loader__DOT__word;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__target;
+        CData/*0:0*/ KiwiNPUFlash__DOT__loader__DOT__last_word;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h5f6b4e08__0;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h7236681e__0;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h99e8e462__0;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h4e8b1913__0;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__bank;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__in_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__out_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__out_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+    };
+    struct {
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+    };
+    struct {
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n;
+    };
+    struct {
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en;
+        CData/*0:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in;
+        CData/*7:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+    };
+    struct {
+        VL_IN(in_vec,31,0);
+        VL_OUT(out_vec,31,0);
+        IData/*31:0*/ KiwiNPUFlash__DOT__in_vec;
+        IData/*31:0*/ KiwiNPUFlash__DOT__out_vec;
+        IData/*31:0*/ KiwiNPUFlash__DOT__image_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPUFlash__DOT__image_bits__Vstatic__j;
+        IData/*23:0*/ KiwiNPUFlash__DOT__mem_addr;
+        IData/*31:0*/ KiwiNPUFlash__DOT__mem_rdata;
+        IData/*31:0*/ KiwiNPUFlash__DOT__cfgreg_di;
+        VlWide<38>/*1215:0*/ KiwiNPUFlash__DOT__image;
+        IData/*23:0*/ KiwiNPUFlash__DOT__flash__DOT__addr;
+        IData/*31:0*/ KiwiNPUFlash__DOT__flash__DOT__rdata;
+        IData/*31:0*/ KiwiNPUFlash__DOT__flash__DOT__cfgreg_di;
+        IData/*31:0*/ KiwiNPUFlash__DOT__flash__DOT__cfgreg_do;
+        IData/*23:0*/ KiwiNPUFlash__DOT__flash__DOT__buffer;
+        IData/*23:0*/ KiwiNPUFlash__DOT__flash__DOT__rd_addr;
+        IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT____Vlvbound_h8986c447__0;
+        IData/*23:0*/ KiwiNPUFlash__DOT__loader__DOT__mem_addr;
+        IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT__mem_rdata;
+        VlWide<38>/*1215:0*/ KiwiNPUFlash__DOT__loader__DOT__image;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__in_vec;
+        VlWide<32>/*1023:0*/ KiwiNPUFlash__DOT__npu__DOT__weights_flat;
+        VlWide<6>/*191:0*/ KiwiNPUFlash__DOT__npu__DOT__biases_flat;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__out_vec;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_km1;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__acc;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__k;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__s_k;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k;
+        VlWide<8>/*255:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k;
+        VlWide<8>/*255:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec;
+        VlWide<8>/*255:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights;
+        VlWide<8>/*255:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases;
+        IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    };
+    struct {
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*18:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout;
+    };
+    struct {
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout;
+        IData/*31:0*/ __Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx;
+        IData/*31:0*/ __VactIterCount;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x;
+        QData/*63:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w;
+        VlUnpacked<CData/*0:0*/, 1> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q;
+        VlUnpacked<CData/*0:0*/, 1> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 8> KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+    };
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 1>, false, CData/*0:0*/, 1> __VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q;
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 1>, false, CData/*0:0*/, 1> __VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr CData/*0:0*/ KiwiNPUFlash__DOT__QSPI = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__NUM_LAYERS = 3U;
+    static constexpr IData/*23:0*/ KiwiNPUFlash__DOT__LAYER_SIZES = 0x00040804U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__FLASH_BASE = 0x00010000U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__DUMMY_CYCLES = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__WEIGHT_BITS = 0x00000200U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__BIAS_BITS = 0x00000060U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__WEIGHT_WORDS = 0x00000010U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__BIAS_WORDS = 3U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__BANK_BITS = 0x00000260U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT__WORDS = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT__FLASH_BASE = 0x00010000U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT__BANKS = 2U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT__WORD_W = 5U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__loader__DOT__BANK_W = 1U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__NUM_LAYERS = 3U;
+    static constexpr IData/*23:0*/ KiwiNPUFlash__DOT__npu__DOT__LAYER_SIZES = 0x00040804U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__BANKS = 2U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__BATCH = 1U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_IN = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__LSIZE_OUT = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__IN_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__OUT_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__WEIGHT_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__BIAS_SZ = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_WEIGHTS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__OFFSET_BIAS = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_IN = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__LSIZE_OUT = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__IN_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__OUT_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__WEIGHT_SZ = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__BIAS_SZ = 0x00000020U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_WEIGHTS = 0x00000100U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__OFFSET_BIAS = 0x00000040U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__IN_N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__OUT_N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__BATCH = 1U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__IN_N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__OUT_N = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__BATCH = 1U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__N = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__LEVELS = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__ACC_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
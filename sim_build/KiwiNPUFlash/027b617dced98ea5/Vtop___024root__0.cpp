@@ -0,0 +1,6107 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits;
+    IData/*31:0*/ __VExpandSel_WordIdx_1;
+    IData/*31:0*/ __VExpandSel_LoShift_1;
+    CData/*0:0*/ __VExpandSel_Aligned_1;
+    IData/*31:0*/ __VExpandSel_HiShift_1;
+    IData/*31:0*/ __VExpandSel_HiMask_1;
+    IData/*31:0*/ __VExpandSel_WordIdx_2;
+    IData/*31:0*/ __VExpandSel_LoShift_2;
+    CData/*0:0*/ __VExpandSel_Aligned_2;
+    IData/*31:0*/ __VExpandSel_HiShift_2;
+    IData/*31:0*/ __VExpandSel_HiMask_2;
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__swap = vlSelfRef.swap;
+    vlSelfRef.shadow_ready = vlSelfRef.KiwiNPUFlash__DOT__shadow_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__bank 
+        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__active)));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__last_word 
+        = (0x12U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_cont;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd;
+    vlSelfRef.KiwiNPUFlash__DOT__load = vlSelfRef.load;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_rdata = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rdata;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi 
+        = ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi)) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__in_valid = vlSelfRef.in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+        = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+             << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                << 0x00000010U)) | 
+           (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+             << 8U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__loaded = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_valid = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr 
+        = (0x00ffffffU & ((IData)(0x00010000U) + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word) 
+                                                  << 2U)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_di = vlSelfRef.flash_io0_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_di = vlSelfRef.flash_io1_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_di = vlSelfRef.flash_io2_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_di = vlSelfRef.flash_io3_di;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPUFlash__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.KiwiNPUFlash__DOT__out_ready = vlSelfRef.out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPUFlash__DOT__in_vec = vlSelfRef.in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank = vlSelfRef.KiwiNPUFlash__DOT__active;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec 
+        = (((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                               << 0x00000018U) | ((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                                  << 0x00000010U)) 
+                             | (((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                 << 8U) | (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+            << 0x00000020U) | (QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                 << 0x00000018U) 
+                                                | ((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                   << 0x00000010U)) 
+                                               | (((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                   << 8U) 
+                                                  | (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[0U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[1U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[2U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[3U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[4U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[5U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[6U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[7U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[8U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[8U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[9U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[9U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[10U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[10U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[11U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[11U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[12U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[12U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[13U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[13U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[14U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[14U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[15U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[15U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[16U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[16U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[17U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[17U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[18U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[18U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[19U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[19U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[20U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[20U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[21U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[21U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[22U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[22U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[23U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[23U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[24U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[24U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[25U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[25U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[26U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[26U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[27U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[27U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[28U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[28U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[29U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[29U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[30U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[30U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[31U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[31U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[32U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[32U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[33U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[33U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[34U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[34U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[35U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[35U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[36U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[36U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[37U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[37U];
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__load 
+        = vlSelfRef.KiwiNPUFlash__DOT__load;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_rdata 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_rdata;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                            = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                              << 2U));
+                    }
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 7U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 6U));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 4U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 5U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 4U));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 7U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 6U));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+            } else {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 4U));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 5U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 4U));
+            }
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                      << 2U));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                         >> 7U));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                         >> 6U));
+        } else {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = (0x000000feU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                      << 1U));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                         >> 7U));
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do;
+    vlSelfRef.loaded = vlSelfRef.KiwiNPUFlash__DOT__loaded;
+    vlSelfRef.KiwiNPUFlash__DOT__serving = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__loaded) 
+                                            | (IData)(vlSelfRef.KiwiNPUFlash__DOT__booted));
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                            = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                              - ((0U 
+                                                  != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                                 << 1U)));
+                    }
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                        = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 2U)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                        = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = 0U;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            } else {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 2U)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                      - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                         << 1U)));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+        } else {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                      - (0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count))));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+        }
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+              & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q)
+               ? ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch)) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch))
+               : ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch)) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch))));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_addr = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                = (1U & ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi))) 
+                         || (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)))));
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe;
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe;
+    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk;
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90));
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do));
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe));
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_clk;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 3U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 2U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 1U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 3U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 2U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 1U));
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_di;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__resetn 
+        = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__clk = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_vec = vlSelfRef.KiwiNPUFlash__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[16U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[17U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[18U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[35U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[36U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[37U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[8U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[8U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[9U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[9U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[10U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[10U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[11U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[11U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[12U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[12U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[13U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[13U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[14U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[14U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[15U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[15U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[16U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[19U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[17U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[20U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[18U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[21U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[19U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[22U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[20U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[23U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[21U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[24U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[22U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[25U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[23U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[26U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[24U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[27U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[25U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[28U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[26U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[29U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[27U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[30U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[28U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[31U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[29U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[32U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[30U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[33U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[31U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[34U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__in_valid) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__serving));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr = vlSelfRef.KiwiNPUFlash__DOT__mem_addr;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases 
+        = ((0xbfU >= (0x000000ffU & ((IData)(0x40U) 
+                                     + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                        * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits))))
+            ? (((0U == (0x0000001fU & ((IData)(0x40U) 
+                                       + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                          * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits))))
+                 ? 0U : (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                         [(((IData)(0x0000001fU) + 
+                            (0x000000ffU & ((IData)(0x40U) 
+                                            + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                               * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))) 
+                           >> 5U)] << ((IData)(0x00000020U) 
+                                       - (0x0000001fU 
+                                          & ((IData)(0x40U) 
+                                             + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))))) 
+               | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                  [(7U & (((IData)(0x40U) + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)) 
+                          >> 5U))] >> (0x0000001fU 
+                                       & ((IData)(0x40U) 
+                                          + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))))
+            : 0U);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases 
+        = ((0xbfU >= (0x000000ffU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+            ? (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                [(((IData)(0x0000003fU) 
+                                   + (0x000000ffU & 
+                                      ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                       * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))) 
+                                  >> 5U)])) << ((0U 
+                                                 == 
+                                                 (0x0000001fU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+                                                 ? 0x00000020U
+                                                 : 
+                                                ((IData)(0x00000040U) 
+                                                 - 
+                                                 (0x0000001fU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))))) 
+               | (((0U == (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                          * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+                    ? 0ULL : ((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                              [(((IData)(0x0000001fU) 
+                                                 + 
+                                                 (0x000000ffU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))) 
+                                                >> 5U)])) 
+                              << ((IData)(0x00000020U) 
+                                  - (0x0000001fU & 
+                                     ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                      * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))))) 
+                  | ((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                     [(7U & (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                              * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits) 
+                                             >> 5U))])) 
+                     >> (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                        * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))))
+            : 0ULL);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout;
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+    __VExpandSel_WordIdx_1 = (0x0000001fU & (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                              * KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits) 
+                                             >> 5U));
+    __VExpandSel_LoShift_1 = (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits));
+    __VExpandSel_Aligned_1 = (0U == __VExpandSel_LoShift_1);
+    if (__VExpandSel_Aligned_1) {
+        __VExpandSel_HiShift_1 = 0U;
+        __VExpandSel_HiMask_1 = 0U;
+    } else {
+        __VExpandSel_HiShift_1 = ((IData)(0x00000020U) 
+                                  - __VExpandSel_LoShift_1);
+        __VExpandSel_HiMask_1 = 0xffffffffU;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [__VExpandSel_WordIdx_1] >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U] 
+        = (((((0x00000018U <= __VExpandSel_WordIdx_1)
+               ? 0U : vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(8U) + __VExpandSel_WordIdx_1)]) 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout;
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+    __VExpandSel_WordIdx_2 = (0x0000001fU & (((IData)(0x0100U) 
+                                              + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                 * KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits)) 
+                                             >> 5U));
+    __VExpandSel_LoShift_2 = (0x0000001fU & ((IData)(0x0100U) 
+                                             + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                * KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits)));
+    __VExpandSel_Aligned_2 = (0U == __VExpandSel_LoShift_2);
+    if (__VExpandSel_Aligned_2) {
+        __VExpandSel_HiShift_2 = 0U;
+        __VExpandSel_HiMask_2 = 0U;
+    } else {
+        __VExpandSel_HiShift_2 = ((IData)(0x00000020U) 
+                                  - __VExpandSel_LoShift_2);
+        __VExpandSel_HiMask_2 = 0xffffffffU;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(1U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [__VExpandSel_WordIdx_2] >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(2U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(1U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(3U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(2U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(4U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(3U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(5U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(4U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(6U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(5U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(7U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(6U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U] 
+        = (((((0x00000018U <= __VExpandSel_WordIdx_2)
+               ? 0U : vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(8U) + __VExpandSel_WordIdx_2)]) 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(7U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__out_vec = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid;
+    vlSelfRef.flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash_csb;
+    vlSelfRef.flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid) 
+              & (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+                 == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_do 
+        = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) 
+             << 0x0000001fU) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) 
+                                 << 0x00000016U) | 
+                                (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi) 
+                                  << 0x00000015U) | 
+                                 (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont) 
+                                   << 0x00000014U) 
+                                  | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy) 
+                                     << 0x00000010U))))) 
+           | ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe) 
+                  << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe) 
+                            << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe) 
+                                        << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe))) 
+               << 8U) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb) 
+                           << 5U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk) 
+                                     << 4U)) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di) 
+                                                  << 3U) 
+                                                 | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di) 
+                                                    << 2U)) 
+                                                | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di) 
+                                                    << 1U) 
+                                                   | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di))))));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                            = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                               << 2U)) 
+                               | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                   << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                    }
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 4U)) 
+                           | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di) 
+                                << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di) 
+                                          << 2U)) | 
+                              (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di))));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+            } else if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = ((0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                       << 4U)) | ((
+                                                   ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di) 
+                                                    << 3U) 
+                                                   | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di) 
+                                                      << 2U)) 
+                                                  | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                                      << 1U) 
+                                                     | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di))));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                       << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                                   << 1U) 
+                                                  | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+            }
+        } else if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                = ((0x000000feU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                   << 1U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di));
+        }
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__out_valid = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U];
+    vlSelfRef.out_vec = vlSelfRef.KiwiNPUFlash__DOT__out_vec;
+    vlSelfRef.flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do;
+    vlSelfRef.flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do;
+    vlSelfRef.flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do;
+    vlSelfRef.flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_ready = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__jump = 
+        ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+         & ((~ ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready) 
+                | (((IData)(4U) + vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr) 
+                   == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr))) 
+            & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid)));
+    vlSelfRef.flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe;
+    vlSelfRef.flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe;
+    vlSelfRef.flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe;
+    vlSelfRef.flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.out_valid = vlSelfRef.KiwiNPUFlash__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 8U));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 0x00000010U));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b 
+        = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+           >> 0x00000018U);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U])));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__in_ready = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__serving) 
+                                             & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.in_ready = vlSelfRef.KiwiNPUFlash__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+}
+
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VactTriggered[0U] = (((QData)((IData)(
+                                                      ((((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n)) 
+                                                         & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0)) 
+                                                        << 4U) 
+                                                       | (((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk) 
+                                                             & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0))) 
+                                                            << 3U) 
+                                                           | (((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n)) 
+                                                               & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0)) 
+                                                              << 2U)) 
+                                                          | ((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0))) 
+                                                              << 1U) 
+                                                             | ((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n)) 
+                                                                & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0))))))) 
+                                      << 0x00000020U) 
+                                     | (QData)((IData)(
+                                                       ((((((((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0))) 
+                                                               << 3U) 
+                                                              | (((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n)) 
+                                                                  & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0)) 
+                                                                 << 2U)) 
+                                                             | ((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 1U) 
+                                                                | ((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0)))) 
+                                                            << 0x0000000cU) 
+                                                           | ((((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 3U) 
+                                                                | (((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 2U)) 
+                                                               | ((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 1U) 
+                                                                  | ((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0)))) 
+                                                              << 8U)) 
+                                                          | (((((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0))) 
+                                                                 << 3U) 
+                                                                | (((~ (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0)) 
+                                                                   << 2U)) 
+                                                               | ((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0))) 
+                                                                   << 1U) 
+                                                                  | ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0)))) 
+                                                              << 4U) 
+                                                             | (((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0))) 
+                                                                  << 3U) 
+                                                                 | (((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0)) 
+                                                                    << 2U)) 
+                                                                | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0))) 
+                                                                    << 1U) 
+                                                                   | ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                      & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0)))))) 
+                                                         << 0x00000010U) 
+                                                        | ((((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0))) 
+                                                                << 3U) 
+                                                               | (((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n)) 
+                                                                   & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0)) 
+                                                                  << 2U)) 
+                                                              | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0))) 
+                                                                  << 1U) 
+                                                                 | ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0)))) 
+                                                             << 0x0000000cU) 
+                                                            | ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0))) 
+                                                                  << 3U) 
+                                                                 | (((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0)) 
+                                                                    << 2U)) 
+                                                                | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0))) 
+                                                                    << 1U) 
+                                                                   | ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n)) 
+                                                                      & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__rst_n__0)))) 
+                                                               << 8U)) 
+                                                           | (((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__clk__0))) 
+                                                                  << 3U) 
+                                                                 | (((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n)) 
+                                                                     & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__rst_n__0)) 
+                                                                    << 2U)) 
+                                                                | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__clk) 
+                                                                     & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__clk__0))) 
+                                                                    << 1U) 
+                                                                   | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk__0))))) 
+                                                               << 4U) 
+                                                              | (((((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk)) 
+                                                                    & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__clk__0)) 
+                                                                   << 3U) 
+                                                                  | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk) 
+                                                                      & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__clk__0))) 
+                                                                     << 2U)) 
+                                                                 | ((((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__rst_n)) 
+                                                                      & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__rst_n__0)) 
+                                                                     << 1U) 
+                                                                    | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__clk) 
+                                                                       & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__clk__0)))))))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+extern const VlWide<38>/*1215:0*/ Vtop__ConstPool__CONST_h6155dc76_0;
+
+void Vtop___024root___nba_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+    __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid = 0;
+    CData/*4:0*/ __Vdly__KiwiNPUFlash__DOT__loader__DOT__word;
+    __Vdly__KiwiNPUFlash__DOT__loader__DOT__word = 0;
+    // Body
+    __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+    __Vdly__KiwiNPUFlash__DOT__loader__DOT__word = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word;
+    if (vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n) {
+        if ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid) 
+              & (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready)) 
+             & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__load)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__loader__DOT____Vlvbound_h8986c447__0 
+                = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_rdata;
+            if ((0x04bfU >= (0x000007ffU & VL_SHIFTL_III(11,32,32, 
+                                                         (((IData)(0x00000013U) 
+                                                           * (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__target)) 
+                                                          + (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word)), 5U)))) {
+                VL_ASSIGNSEL_WI(1216, 32, (0x000007ffU 
+                                           & VL_SHIFTL_III(11,32,32, 
+                                                           (((IData)(0x00000013U) 
+                                                             * (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__target)) 
+                                                            + (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word)), 5U)), vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image, vlSelfRef.KiwiNPUFlash__DOT__loader__DOT____Vlvbound_h8986c447__0);
+            }
+        }
+        if (vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__load) {
+            __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid = 1U;
+            vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded = 0U;
+            __Vdly__KiwiNPUFlash__DOT__loader__DOT__word = 0U;
+            vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__target 
+                = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__bank;
+        } else if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid) 
+                    & (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready))) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__last_word) {
+                __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded = 1U;
+            } else {
+                __Vdly__KiwiNPUFlash__DOT__loader__DOT__word 
+                    = (0x0000001fU & ((IData)(1U) + (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word)));
+            }
+        }
+    } else {
+        __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid = 1U;
+        vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded = 0U;
+        __Vdly__KiwiNPUFlash__DOT__loader__DOT__word = 0U;
+        VL_ASSIGN_W(1216, vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image, Vtop__ConstPool__CONST_h6155dc76_0);
+        vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__target = 0U;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid 
+        = __Vdly__KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word 
+        = __Vdly__KiwiNPUFlash__DOT__loader__DOT__word;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_valid = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__last_word 
+        = (0x12U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr 
+        = (0x00ffffffU & ((IData)(0x00010000U) + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word) 
+                                                  << 2U)));
+    vlSelfRef.KiwiNPUFlash__DOT__image[0U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[1U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[2U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[3U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[4U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[5U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[6U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[7U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[8U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[8U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[9U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[9U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[10U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[10U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[11U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[11U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[12U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[12U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[13U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[13U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[14U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[14U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[15U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[15U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[16U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[16U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[17U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[17U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[18U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[18U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[19U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[19U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[20U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[20U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[21U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[21U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[22U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[22U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[23U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[23U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[24U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[24U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[25U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[25U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[26U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[26U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[27U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[27U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[28U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[28U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[29U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[29U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[30U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[30U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[31U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[31U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[32U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[32U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[33U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[33U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[34U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[34U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[35U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[35U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[36U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[36U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[37U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[37U];
+    vlSelfRef.KiwiNPUFlash__DOT__mem_addr = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[16U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[17U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[18U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[35U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[36U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[37U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[8U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[8U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[9U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[9U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[10U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[10U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[11U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[11U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[12U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[12U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[13U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[13U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[14U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[14U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[15U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[15U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[16U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[19U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[17U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[20U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[18U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[21U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[19U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[22U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[20U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[23U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[21U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[24U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[22U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[25U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[23U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[26U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[24U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[27U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[25U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[28U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[26U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[29U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[27U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[30U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[28U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[31U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[29U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[32U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[30U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[33U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[31U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[34U];
+}
+
+void Vtop___024root___nba_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*3:0*/ __Vdly__KiwiNPUFlash__DOT__flash__DOT__state;
+    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 0;
+    CData/*0:0*/ __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc;
+    __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc = 0;
+    // Body
+    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state;
+    __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_inc;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn = 1U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+    if ((1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__resetn)) 
+               | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__softreset)))) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_cont = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid = 0U;
+        __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd = 0U;
+    } else {
+        if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) 
+             & (4U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid = 1U;
+            __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc = 1U;
+        }
+        if (((((((((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state)) 
+                   | (1U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) 
+                  | (2U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) 
+                 | (3U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) 
+                | (4U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) 
+               | (5U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) 
+              | (6U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) 
+             | (7U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state)))) {
+            if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data = 0xffU;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 1U;
+                }
+            } else if ((1U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 2U;
+                }
+            } else if ((2U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data = 0xabU;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 3U;
+                }
+            } else if ((3U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 4U;
+                }
+            } else if ((4U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data 
+                    = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr)
+                        ? ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi)
+                            ? 0xedU : 0xbbU) : ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi)
+                                                 ? 0xebU
+                                                 : 3U));
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 5U;
+                }
+            } else if ((5U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+                     & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data 
+                        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+                                          >> 0x10U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi 
+                        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi;
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr 
+                        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr;
+                    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                        __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 6U;
+                    }
+                }
+            } else if ((6U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data 
+                    = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+                                      >> 8U));
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 7U;
+                }
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data 
+                    = (0x000000ffU & vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr);
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state 
+                        = (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi) 
+                            | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr))
+                            ? 8U : 9U);
+                }
+            }
+        } else if ((8U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 0U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data 
+                = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont)
+                    ? 0xa5U : 0xffU);
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 9U;
+            }
+        } else if ((9U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 1U;
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 0x0aU;
+            }
+        } else if ((0x0aU == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data = 0U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 2U;
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 0x0bU;
+            }
+        } else if ((0x0bU == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 3U;
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 0x0cU;
+            }
+        } else if ((0x0cU == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state))) {
+            if ((1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_wait)) 
+                       | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag = 4U;
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid = 0U;
+                    __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 9U;
+                }
+            }
+        }
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__jump) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid = 0U;
+            __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc = 0U;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn = 0U;
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont) {
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 5U;
+            } else {
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__state = 4U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr = 0U;
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd = 0U;
+        }
+    }
+    if ((1U & (~ ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__resetn)) 
+                  | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__softreset))))) {
+        if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) 
+             & (4U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rdata 
+                = (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data) 
+                    << 0x00000018U) | vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer);
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_inc) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr 
+                    = (0x00ffffffU & ((IData)(4U) + vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_wait = 1U;
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr 
+                    = (0x00ffffffU & vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr);
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_wait = 0U;
+            }
+        }
+        if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) 
+             & (1U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer 
+                = ((0x00ffff00U & vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer) 
+                   | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data));
+        }
+        if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) 
+             & (2U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer 
+                = ((0x00ff00ffU & vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer) 
+                   | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data) 
+                      << 8U));
+        }
+        if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid) 
+             & (3U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer 
+                = ((0x0000ffffU & vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer) 
+                   | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data) 
+                      << 0x00000010U));
+        }
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_wait = 0U;
+        }
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state 
+        = __Vdly__KiwiNPUFlash__DOT__flash__DOT__state;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_rdata = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rdata;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi 
+        = ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi)) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_rdata 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_rdata;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_inc 
+        = __Vdly__KiwiNPUFlash__DOT__flash__DOT__rd_inc;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__softreset 
+        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en)));
+    if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__resetn)))) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_csb = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_clk = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy = 8U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__softreset = 1U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en = 1U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+    __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk = 0;
+    // Body
+    __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch 
+        = ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn))) 
+           || ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr)
+                ? (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch))
+                : 1U));
+    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) {
+        if ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+            __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk 
+                = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)) 
+                         & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb))));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count 
+                = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count) 
+                                  - (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)));
+        } else if ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count))) {
+            __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk 
+                = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)) 
+                         & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb))));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count;
+        }
+        if (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid) 
+             & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_cont 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont;
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd = 1U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi;
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count = 8U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count 
+                    = (0x0000000fU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi;
+                __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk = 0U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count = 8U;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count = 0U;
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb = 0U;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_cont = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi = 0U;
+        __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb = 1U;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk 
+        = __Vdly__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch 
+        = ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn))) 
+           || (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe = 0U;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                            = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                              << 2U));
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                            = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                              - ((0U 
+                                                  != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                                 << 1U)));
+                    }
+                    if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                            = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                               << 2U)) 
+                               | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                   << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                    }
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 7U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 6U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                        = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 4U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 4U)) 
+                           | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di) 
+                                << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di) 
+                                          << 2U)) | 
+                              (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di))));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 5U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 4U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 2U)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                        = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 7U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 6U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = 0U;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            } else {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 4U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 2U)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 4U)) 
+                           | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di) 
+                                << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di) 
+                                          << 2U)) | 
+                              (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di))));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 5U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 4U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        } else {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            } else {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000feU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 1U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - (0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count))));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000feU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 1U)) 
+                           | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                = (1U & ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi))) 
+                         || (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)))));
+        }
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe;
+}
+
+extern const VlUnpacked<CData/*2:0*/, 128> Vtop__ConstPool__TABLE_hdfa1cf36_0;
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h037aa0bf_0;
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h737affed_0;
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_he9f9863e_0;
+
+void Vtop___024root___nba_sequent__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*6:0*/ __Vtableidx1;
+    __Vtableidx1 = 0;
+    // Body
+    __Vtableidx1 = ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__active) 
+                        << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__shadow_ready) 
+                                  << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__swap) 
+                                              << 1U) 
+                                             | (IData)(vlSelfRef.KiwiNPUFlash__DOT__loaded))) 
+                     << 3U) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__shadow_loading) 
+                                << 2U) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__load) 
+                                           << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__rst_n))));
+    if ((1U & Vtop__ConstPool__TABLE_hdfa1cf36_0[__Vtableidx1])) {
+        vlSelfRef.KiwiNPUFlash__DOT__shadow_loading 
+            = Vtop__ConstPool__TABLE_h037aa0bf_0[__Vtableidx1];
+    }
+    if ((2U & Vtop__ConstPool__TABLE_hdfa1cf36_0[__Vtableidx1])) {
+        vlSelfRef.KiwiNPUFlash__DOT__shadow_ready = Vtop__ConstPool__TABLE_h737affed_0
+            [__Vtableidx1];
+    }
+    if ((4U & Vtop__ConstPool__TABLE_hdfa1cf36_0[__Vtableidx1])) {
+        vlSelfRef.KiwiNPUFlash__DOT__active = Vtop__ConstPool__TABLE_he9f9863e_0
+            [__Vtableidx1];
+    }
+    if (vlSelfRef.KiwiNPUFlash__DOT__rst_n) {
+        vlSelfRef.KiwiNPUFlash__DOT__configured = 1U;
+        if (vlSelfRef.KiwiNPUFlash__DOT__loaded) {
+            vlSelfRef.KiwiNPUFlash__DOT__booted = 1U;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__configured = 0U;
+        vlSelfRef.KiwiNPUFlash__DOT__booted = 0U;
+    }
+    vlSelfRef.shadow_ready = vlSelfRef.KiwiNPUFlash__DOT__shadow_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank = vlSelfRef.KiwiNPUFlash__DOT__active;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__bank 
+        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__active)));
+}
+
+void Vtop___024root___nba_sequent__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do;
+}
+
+void Vtop___024root___nba_sequent__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__8(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__8\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__9(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__9\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+}
+
+void Vtop___024root___nba_sequent__TOP__10(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__10\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid;
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__out_valid = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.out_valid = vlSelfRef.KiwiNPUFlash__DOT__out_valid;
+}
+
+void Vtop___024root___nba_sequent__TOP__11(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__11\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v0;
+    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v0 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1;
+    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1;
+    __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2;
+    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2;
+    __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v0;
+    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v0 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1;
+    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1;
+    __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 = 0;
+    CData/*0:0*/ __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2;
+    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2;
+    __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 = 0;
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready) {
+            __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v0 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank;
+            vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v0, 0U);
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k = 1U;
+            while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k)) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h7236681e__0 
+                    = ((0U >= (1U & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k 
+                                     - (IData)(1U)))) 
+                       && vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q
+                       [(1U & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k 
+                               - (IData)(1U)))]);
+                if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k))))) {
+                    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 
+                        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h7236681e__0;
+                    __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1 
+                        = (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k);
+                    vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1, (IData)(__VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v1));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k 
+                    = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k);
+            }
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k = 0U;
+        while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k)) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h5f6b4e08__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k))))) {
+                __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h5f6b4e08__0;
+                __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2 
+                    = (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k);
+                vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2, (IData)(__VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q__v2));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k 
+                = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k);
+        }
+    }
+    if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready) {
+            __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v0 
+                = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank;
+            vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v0, 0U);
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k = 1U;
+            while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k)) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h4e8b1913__0 
+                    = ((0U >= (1U & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k 
+                                     - (IData)(1U)))) 
+                       && vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q
+                       [(1U & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k 
+                               - (IData)(1U)))]);
+                if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k))))) {
+                    __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 
+                        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h4e8b1913__0;
+                    __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1 
+                        = (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k);
+                    vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1, (IData)(__VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v1));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k 
+                    = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k);
+            }
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k = 0U;
+        while (VL_GTES_III(32, 0U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k)) {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h99e8e462__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k))))) {
+                __VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h99e8e462__0;
+                __VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2 
+                    = (1U & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k);
+                vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q.enqueue(__VdlyVal__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2, (IData)(__VdlyDim0__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q__v2));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k 
+                = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k);
+        }
+    }
+    vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q.commit(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q);
+    vlSelfRef.__VdlyCommitQueueKiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q.commit(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q[0U];
+}
+
+void Vtop___024root___nba_sequent__TOP__12(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__12\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr = vlSelfRef.KiwiNPUFlash__DOT__mem_addr;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__loaded = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded;
+    vlSelfRef.loaded = vlSelfRef.KiwiNPUFlash__DOT__loaded;
+}
+
+void Vtop___024root___nba_sequent__TOP__13(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__13\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_cont;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn;
+}
+
+void Vtop___024root___nba_comb__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe));
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_clk;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 3U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 2U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 1U));
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+              & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q)
+               ? ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch)) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch))
+               : ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch)) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch))));
+    vlSelfRef.KiwiNPUFlash__DOT__flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_do 
+        = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) 
+             << 0x0000001fU) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) 
+                                 << 0x00000016U) | 
+                                (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi) 
+                                  << 0x00000015U) | 
+                                 (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont) 
+                                   << 0x00000014U) 
+                                  | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy) 
+                                     << 0x00000010U))))) 
+           | ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe) 
+                  << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe) 
+                            << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe) 
+                                        << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe))) 
+               << 8U) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb) 
+                           << 5U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk) 
+                                     << 4U)) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di) 
+                                                  << 3U) 
+                                                 | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di) 
+                                                    << 2U)) 
+                                                | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di) 
+                                                    << 1U) 
+                                                   | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di))))));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid;
+    vlSelfRef.flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash_clk;
+    vlSelfRef.flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash_csb;
+    vlSelfRef.flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe;
+    vlSelfRef.flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe;
+    vlSelfRef.flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe;
+    vlSelfRef.flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe;
+}
+
+void Vtop___024root___nba_sequent__TOP__14(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__14\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+}
+
+void Vtop___024root___nba_comb__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+        = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+             << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                << 0x00000010U)) | 
+           (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+             << 8U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPUFlash__DOT__out_vec = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec;
+    vlSelfRef.out_vec = vlSelfRef.KiwiNPUFlash__DOT__out_vec;
+}
+
+void Vtop___024root___nba_sequent__TOP__15(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__15\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+}
+
+void Vtop___024root___nba_sequent__TOP__16(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__16\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+}
+
+void Vtop___024root___nba_sequent__TOP__17(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__17\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank;
+}
+
+void Vtop___024root___nba_comb__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits;
+    IData/*31:0*/ __VExpandSel_WordIdx_1;
+    IData/*31:0*/ __VExpandSel_LoShift_1;
+    CData/*0:0*/ __VExpandSel_Aligned_1;
+    IData/*31:0*/ __VExpandSel_HiShift_1;
+    IData/*31:0*/ __VExpandSel_HiMask_1;
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases 
+        = ((0xbfU >= (0x000000ffU & ((IData)(0x40U) 
+                                     + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                        * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits))))
+            ? (((0U == (0x0000001fU & ((IData)(0x40U) 
+                                       + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                          * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits))))
+                 ? 0U : (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                         [(((IData)(0x0000001fU) + 
+                            (0x000000ffU & ((IData)(0x40U) 
+                                            + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                               * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))) 
+                           >> 5U)] << ((IData)(0x00000020U) 
+                                       - (0x0000001fU 
+                                          & ((IData)(0x40U) 
+                                             + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))))) 
+               | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                  [(7U & (((IData)(0x40U) + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)) 
+                          >> 5U))] >> (0x0000001fU 
+                                       & ((IData)(0x40U) 
+                                          + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))))
+            : 0U);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout;
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+    __VExpandSel_WordIdx_1 = (0x0000001fU & (((IData)(0x0100U) 
+                                              + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                 * KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits)) 
+                                             >> 5U));
+    __VExpandSel_LoShift_1 = (0x0000001fU & ((IData)(0x0100U) 
+                                             + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                * KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits)));
+    __VExpandSel_Aligned_1 = (0U == __VExpandSel_LoShift_1);
+    if (__VExpandSel_Aligned_1) {
+        __VExpandSel_HiShift_1 = 0U;
+        __VExpandSel_HiMask_1 = 0U;
+    } else {
+        __VExpandSel_HiShift_1 = ((IData)(0x00000020U) 
+                                  - __VExpandSel_LoShift_1);
+        __VExpandSel_HiMask_1 = 0xffffffffU;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [__VExpandSel_WordIdx_1] >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U] 
+        = (((((0x00000018U <= __VExpandSel_WordIdx_1)
+               ? 0U : vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(8U) + __VExpandSel_WordIdx_1)]) 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 8U));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 0x00000010U));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b 
+        = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+           >> 0x00000018U);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+}
+
+void Vtop___024root___nba_comb__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec 
+        = (((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                               << 0x00000018U) | ((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                                  << 0x00000010U)) 
+                             | (((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                 << 8U) | (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+            << 0x00000020U) | (QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                 << 0x00000018U) 
+                                                | ((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                   << 0x00000010U)) 
+                                               | (((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                   << 8U) 
+                                                  | (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+}
+
+void Vtop___024root___nba_comb__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid) 
+              & (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+                 == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr)));
+    vlSelfRef.KiwiNPUFlash__DOT__mem_ready = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__jump = 
+        ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+         & ((~ ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready) 
+                | (((IData)(4U) + vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr) 
+                   == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr))) 
+            & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid)));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_ready;
+}
+
+void Vtop___024root___nba_comb__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits;
+    IData/*31:0*/ __VExpandSel_WordIdx_1;
+    IData/*31:0*/ __VExpandSel_LoShift_1;
+    CData/*0:0*/ __VExpandSel_Aligned_1;
+    IData/*31:0*/ __VExpandSel_HiShift_1;
+    IData/*31:0*/ __VExpandSel_HiMask_1;
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__serving = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__loaded) 
+                                            | (IData)(vlSelfRef.KiwiNPUFlash__DOT__booted));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases 
+        = ((0xbfU >= (0x000000ffU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+            ? (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                [(((IData)(0x0000003fU) 
+                                   + (0x000000ffU & 
+                                      ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                       * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))) 
+                                  >> 5U)])) << ((0U 
+                                                 == 
+                                                 (0x0000001fU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+                                                 ? 0x00000020U
+                                                 : 
+                                                ((IData)(0x00000040U) 
+                                                 - 
+                                                 (0x0000001fU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))))) 
+               | (((0U == (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                          * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+                    ? 0ULL : ((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                              [(((IData)(0x0000001fU) 
+                                                 + 
+                                                 (0x000000ffU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))) 
+                                                >> 5U)])) 
+                              << ((IData)(0x00000020U) 
+                                  - (0x0000001fU & 
+                                     ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                      * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))))) 
+                  | ((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                     [(7U & (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                              * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits) 
+                                             >> 5U))])) 
+                     >> (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                        * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))))
+            : 0ULL);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout;
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+    __VExpandSel_WordIdx_1 = (0x0000001fU & (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                              * KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits) 
+                                             >> 5U));
+    __VExpandSel_LoShift_1 = (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits));
+    __VExpandSel_Aligned_1 = (0U == __VExpandSel_LoShift_1);
+    if (__VExpandSel_Aligned_1) {
+        __VExpandSel_HiShift_1 = 0U;
+        __VExpandSel_HiMask_1 = 0U;
+    } else {
+        __VExpandSel_HiShift_1 = ((IData)(0x00000020U) 
+                                  - __VExpandSel_LoShift_1);
+        __VExpandSel_HiMask_1 = 0xffffffffU;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [__VExpandSel_WordIdx_1] >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U] 
+        = (((((0x00000018U <= __VExpandSel_WordIdx_1)
+               ? 0U : vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(8U) + __VExpandSel_WordIdx_1)]) 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__in_valid) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__serving));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid;
+}
+
+void Vtop___024root___nba_comb__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90));
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do));
+        }
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 1U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 2U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 3U));
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do;
+    vlSelfRef.flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do;
+    vlSelfRef.flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do;
+    vlSelfRef.flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do;
+    vlSelfRef.flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do;
+}
+
+void Vtop___024root___nba_comb__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready;
+}
+
+void Vtop___024root___nba_comb__TOP__8(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__8\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+}
+
+void Vtop___024root___nba_comb__TOP__9(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__9\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__in_ready = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__serving) 
+                                             & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready));
+    vlSelfRef.in_ready = vlSelfRef.KiwiNPUFlash__DOT__in_ready;
+}
+
+void Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1(Vtop_Perceptron__A12* vlSelf);
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*6:0*/ __Vinline__nba_sequent__TOP__3___Vtableidx1;
+    __Vinline__nba_sequent__TOP__3___Vtableidx1 = 0;
+    // Body
+    if ((0x0000000000000060ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__0(vlSelf);
+    }
+    if ((4ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__1(vlSelf);
+    }
+    if ((0x0000000000000010ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__2(vlSelf);
+    }
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        __Vinline__nba_sequent__TOP__3___Vtableidx1 
+            = ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__active) 
+                   << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__shadow_ready) 
+                             << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__swap) 
+                                         << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__loaded))) 
+                << 3U) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__shadow_loading) 
+                           << 2U) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__load) 
+                                      << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__rst_n))));
+        if ((1U & Vtop__ConstPool__TABLE_hdfa1cf36_0
+             [__Vinline__nba_sequent__TOP__3___Vtableidx1])) {
+            vlSelfRef.KiwiNPUFlash__DOT__shadow_loading 
+                = Vtop__ConstPool__TABLE_h037aa0bf_0
+                [__Vinline__nba_sequent__TOP__3___Vtableidx1];
+        }
+        if ((2U & Vtop__ConstPool__TABLE_hdfa1cf36_0
+             [__Vinline__nba_sequent__TOP__3___Vtableidx1])) {
+            vlSelfRef.KiwiNPUFlash__DOT__shadow_ready 
+                = Vtop__ConstPool__TABLE_h737affed_0
+                [__Vinline__nba_sequent__TOP__3___Vtableidx1];
+        }
+        if ((4U & Vtop__ConstPool__TABLE_hdfa1cf36_0
+             [__Vinline__nba_sequent__TOP__3___Vtableidx1])) {
+            vlSelfRef.KiwiNPUFlash__DOT__active = Vtop__ConstPool__TABLE_he9f9863e_0
+                [__Vinline__nba_sequent__TOP__3___Vtableidx1];
+        }
+        if (vlSelfRef.KiwiNPUFlash__DOT__rst_n) {
+            vlSelfRef.KiwiNPUFlash__DOT__configured = 1U;
+            if (vlSelfRef.KiwiNPUFlash__DOT__loaded) {
+                vlSelfRef.KiwiNPUFlash__DOT__booted = 1U;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__configured = 0U;
+            vlSelfRef.KiwiNPUFlash__DOT__booted = 0U;
+        }
+        vlSelfRef.shadow_ready = vlSelfRef.KiwiNPUFlash__DOT__shadow_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank 
+            = vlSelfRef.KiwiNPUFlash__DOT__active;
+        vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__bank 
+            = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__active)));
+    }
+    if ((8ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do;
+    }
+    if ((0x0000000000006000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000018000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000060000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000180000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = 0U;
+        }
+    }
+    if ((0x0000000000000600ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+    }
+    if ((0x0000000000001800ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready) {
+                vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q 
+                    = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid;
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q = 0U;
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+            = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                     | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__out_valid = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+        vlSelfRef.out_valid = vlSelfRef.KiwiNPUFlash__DOT__out_valid;
+    }
+    if ((0x0000000000000180ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__11(vlSelf);
+    }
+    if ((0x0000000000600000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+    }
+    if ((0x0000000001800000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+    }
+    if ((0x0000000006000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+    }
+    if ((0x0000000018000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+    }
+    if ((0x0000000060000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+    }
+    if ((0x0000000180000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+    }
+    if ((0x0000000600000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+    }
+    if ((0x0000001800000000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop_Perceptron__A12___nba_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x0000000000000060ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+            = vlSelfRef.KiwiNPUFlash__DOT__mem_addr;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__mem_valid;
+        vlSelfRef.KiwiNPUFlash__DOT__loaded = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded;
+        vlSelfRef.loaded = vlSelfRef.KiwiNPUFlash__DOT__loaded;
+    }
+    if ((4ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_cont;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn;
+    }
+    if ((0x0000000000000014ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe));
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_clk;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+                = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_csb;
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                         >> 3U));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                         >> 2U));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                         >> 1U));
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready 
+            = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid) 
+               & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch)));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid 
+            = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+               & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q)
+                   ? ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch)) 
+                      & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch))
+                   : ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch)) 
+                      & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch))));
+        vlSelfRef.KiwiNPUFlash__DOT__flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_do 
+            = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) 
+                 << 0x0000001fU) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) 
+                                     << 0x00000016U) 
+                                    | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi) 
+                                        << 0x00000015U) 
+                                       | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont) 
+                                           << 0x00000014U) 
+                                          | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy) 
+                                             << 0x00000010U))))) 
+               | ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe) 
+                      << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe) 
+                                << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe) 
+                                            << 1U) 
+                                           | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe))) 
+                   << 8U) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb) 
+                               << 5U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk) 
+                                         << 4U)) | 
+                             ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di) 
+                                << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di) 
+                                          << 2U)) | 
+                              (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di) 
+                                << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di))))));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid;
+        vlSelfRef.flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash_clk;
+        vlSelfRef.flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash_csb;
+        vlSelfRef.flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe;
+        vlSelfRef.flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe;
+        vlSelfRef.flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe;
+        vlSelfRef.flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe;
+    }
+    if ((0x0000000000000010ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+    }
+    if ((0x00000000001fe000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+            = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+                 << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                    << 0x00000010U)) 
+               | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+                   << 8U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+        vlSelfRef.KiwiNPUFlash__DOT__out_vec = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec;
+        vlSelfRef.out_vec = vlSelfRef.KiwiNPUFlash__DOT__out_vec;
+    }
+    if ((0x0000000000000600ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+    }
+    if ((0x0000000000001800ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+    }
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank;
+    }
+    if ((0x00000000000001e0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_comb__TOP__2(vlSelf);
+    }
+    if ((0x0000001fffe00000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_comb__TOP__3(vlSelf);
+    }
+    if ((0x0000000000000064ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready 
+            = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+               & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid) 
+                  & (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+                     == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr)));
+        vlSelfRef.KiwiNPUFlash__DOT__mem_ready = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__jump 
+            = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+               & ((~ ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready) 
+                      | (((IData)(4U) + vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr) 
+                         == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr))) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid)));
+        vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__mem_ready;
+    }
+    if ((0x0000000000000063ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_comb__TOP__5(vlSelf);
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x000000000000001cULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                    = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do));
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                         >> 1U));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                         >> 2U));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                         >> 3U));
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do;
+        vlSelfRef.flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do;
+        vlSelfRef.flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do;
+        vlSelfRef.flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do;
+        vlSelfRef.flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do;
+    }
+    if ((0x0000000000001e00ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+            = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                     | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+        vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready;
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___nba_comb__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__1((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+    if ((0x0000001fffe001e0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_comb__TOP__8(vlSelf);
+    }
+    if ((0x0000000000001e63ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.KiwiNPUFlash__DOT__in_ready = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__serving) 
+                                                 & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready));
+        vlSelfRef.in_ready = vlSelfRef.KiwiNPUFlash__DOT__in_ready;
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_vec(VlUnpacked<QData/*63:0*/, 1> &out, const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((0U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    return (0U);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 1> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPUFlash.sv", 18, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPUFlash.sv", 18, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                VL_FATAL_MT("/root/package/rtl/KiwiNPUFlash.sv", 18, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                         + vlSelfRef.__VactIterCount);
+            vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+        } while (vlSelfRef.__VactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (VL_UNLIKELY(((vlSelfRef.clk & 0xfeU)))) {
+        Verilated::overWidthError("clk");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.rst_n & 0xfeU)))) {
+        Verilated::overWidthError("rst_n");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.load & 0xfeU)))) {
+        Verilated::overWidthError("load");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.swap & 0xfeU)))) {
+        Verilated::overWidthError("swap");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.in_valid & 0xfeU)))) {
+        Verilated::overWidthError("in_valid");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.out_ready & 0xfeU)))) {
+        Verilated::overWidthError("out_ready");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.flash_io0_di & 0xfeU)))) {
+        Verilated::overWidthError("flash_io0_di");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.flash_io1_di & 0xfeU)))) {
+        Verilated::overWidthError("flash_io1_di");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.flash_io2_di & 0xfeU)))) {
+        Verilated::overWidthError("flash_io2_di");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.flash_io3_di & 0xfeU)))) {
+        Verilated::overWidthError("flash_io3_di");
+    }
+}
+#endif  // VL_DEBUG
@@ -0,0 +1,3710 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPUFlash__DOT__image_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3457937073518133969ull);
+    vlSelf->KiwiNPUFlash__DOT__image_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9396743648567988529ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 5499615432251503897ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 5054006531347414723ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15603588244326169710ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14743141087024175161ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8282866500407809674ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13722971165550179916ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3158232738079419634ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6523522420565556245ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14209792947507302020ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9817179553719881079ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17835575142244795433ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14814572572782486221ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7183672887075953161ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7907527825599524556ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6810378597654010660ull);
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 
+        = vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_static__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->KiwiNPUFlash__DOT__image_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3457937073518133969ull);
+    vlSelf->KiwiNPUFlash__DOT__image_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9396743648567988529ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 5499615432251503897ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 5054006531347414723ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15603588244326169710ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14743141087024175161ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8282866500407809674ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13722971165550179916ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3158232738079419634ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6523522420565556245ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14209792947507302020ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9817179553719881079ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 17835575142244795433ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_km1 = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14814572572782486221ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__acc = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7183672887075953161ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7907527825599524556ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__s_k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 6810378597654010660ull);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf);
+VL_ATTR_COLD void Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron(Vtop_Perceptron__A12* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_initial__TOP(vlSelf);
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+    Vtop_Perceptron__A12___eval_initial__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__cfgreg_we = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__cfgreg_di = 0x00080000U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_we = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_di = 0x00080000U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/rtl/KiwiNPUFlash.sv", 18, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+VL_ATTR_COLD void Vtop___024root___stl_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___stl_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits;
+    IData/*31:0*/ KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits;
+    IData/*31:0*/ __VExpandSel_WordIdx_1;
+    IData/*31:0*/ __VExpandSel_LoShift_1;
+    CData/*0:0*/ __VExpandSel_Aligned_1;
+    IData/*31:0*/ __VExpandSel_HiShift_1;
+    IData/*31:0*/ __VExpandSel_HiMask_1;
+    IData/*31:0*/ __VExpandSel_WordIdx_2;
+    IData/*31:0*/ __VExpandSel_LoShift_2;
+    CData/*0:0*/ __VExpandSel_Aligned_2;
+    IData/*31:0*/ __VExpandSel_HiShift_2;
+    IData/*31:0*/ __VExpandSel_HiMask_2;
+    // Body
+    vlSelfRef.KiwiNPUFlash__DOT__swap = vlSelfRef.swap;
+    vlSelfRef.shadow_ready = vlSelfRef.KiwiNPUFlash__DOT__shadow_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__bank 
+        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__active)));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__last_word 
+        = (0x12U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_cont;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd;
+    vlSelfRef.KiwiNPUFlash__DOT__load = vlSelfRef.load;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_rdata = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rdata;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi 
+        = ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi)) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__in_valid = vlSelfRef.in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec 
+        = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y) 
+             << 0x00000018U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y) 
+                                << 0x00000010U)) | 
+           (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y) 
+             << 8U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__loaded = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_valid = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr 
+        = (0x00ffffffU & ((IData)(0x00010000U) + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word) 
+                                                  << 2U)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_di = vlSelfRef.flash_io0_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_di = vlSelfRef.flash_io1_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_di = vlSelfRef.flash_io2_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_di = vlSelfRef.flash_io3_di;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPUFlash__DOT__rst_n = vlSelfRef.rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.KiwiNPUFlash__DOT__out_ready = vlSelfRef.out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q;
+    vlSelfRef.KiwiNPUFlash__DOT__in_vec = vlSelfRef.in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank = vlSelfRef.KiwiNPUFlash__DOT__active;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec 
+        = (((QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y) 
+                               << 0x00000018U) | ((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y) 
+                                                  << 0x00000010U)) 
+                             | (((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y) 
+                                 << 8U) | (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y))))) 
+            << 0x00000020U) | (QData)((IData)(((((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y) 
+                                                 << 0x00000018U) 
+                                                | ((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y) 
+                                                   << 0x00000010U)) 
+                                               | (((IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y) 
+                                                   << 8U) 
+                                                  | (IData)(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[0U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[1U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[2U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[3U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[4U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[5U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[6U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[7U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[8U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[8U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[9U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[9U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[10U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[10U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[11U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[11U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[12U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[12U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[13U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[13U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[14U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[14U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[15U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[15U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[16U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[16U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[17U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[17U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[18U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[18U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[19U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[19U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[20U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[20U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[21U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[21U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[22U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[22U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[23U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[23U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[24U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[24U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[25U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[25U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[26U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[26U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[27U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[27U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[28U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[28U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[29U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[29U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[30U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[30U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[31U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[31U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[32U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[32U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[33U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[33U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[34U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[34U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[35U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[35U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[36U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[36U];
+    vlSelfRef.KiwiNPUFlash__DOT__image[37U] = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image[37U];
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__load 
+        = vlSelfRef.KiwiNPUFlash__DOT__load;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_rdata 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_rdata;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                            = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                              << 2U));
+                    }
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 7U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 6U));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 4U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 5U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 4U));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 7U));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do 
+                        = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                 >> 6U));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 2U));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+            } else {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                        = (0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                          << 4U));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 5U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 4U));
+            }
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 7U));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do 
+                    = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                             >> 6U));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = (0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                      << 2U));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                         >> 7U));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                         >> 6U));
+        } else {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer 
+                    = (0x000000feU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                                      << 1U));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do 
+                = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer) 
+                         >> 7U));
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do;
+    vlSelfRef.loaded = vlSelfRef.KiwiNPUFlash__DOT__loaded;
+    vlSelfRef.KiwiNPUFlash__DOT__serving = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__loaded) 
+                                            | (IData)(vlSelfRef.KiwiNPUFlash__DOT__booted));
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                            = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                              - ((0U 
+                                                  != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                                 << 1U)));
+                    }
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                        = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 2U)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                        = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count;
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = 0U;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 1U)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            } else {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                        = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                          - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                             << 2U)));
+                }
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                    = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                      - ((0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count)) 
+                                         << 1U)));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+        } else {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count 
+                    = (0x0000000fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count) 
+                                      - (0U != (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count))));
+            }
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch 
+                = (0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count));
+        }
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+              & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q)
+               ? ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch)) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch))
+               : ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch)) 
+                  & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch))));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_addr = vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                }
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe 
+                        = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe 
+                = (1U & ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi))) 
+                         || (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)))));
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe 
+                    = (1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd)));
+            }
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe;
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe;
+    if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk;
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90));
+        } else {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do));
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+                = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do));
+        }
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe));
+    } else {
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_csb;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk 
+            = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_clk;
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 3U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 2U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do) 
+                     >> 1U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe 
+            = (1U & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 3U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 2U));
+        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe 
+            = (1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe) 
+                     >> 1U));
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_di;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__resetn 
+        = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n = vlSelfRef.KiwiNPUFlash__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__clk = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk = vlSelfRef.KiwiNPUFlash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_vec = vlSelfRef.KiwiNPUFlash__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[16U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[17U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[18U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[35U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[36U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[37U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[8U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[8U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[9U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[9U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[10U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[10U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[11U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[11U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[12U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[12U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[13U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[13U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[14U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[14U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[15U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[15U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[16U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[19U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[17U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[20U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[18U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[21U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[19U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[22U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[20U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[23U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[21U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[24U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[22U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[25U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[23U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[26U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[24U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[27U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[25U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[28U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[26U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[29U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[27U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[30U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[28U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[31U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[29U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[32U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[30U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[33U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat[31U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__image[34U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__in_valid) 
+           & (IData)(vlSelfRef.KiwiNPUFlash__DOT__serving));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr = vlSelfRef.KiwiNPUFlash__DOT__mem_addr;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases 
+        = ((0xbfU >= (0x000000ffU & ((IData)(0x40U) 
+                                     + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                        * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits))))
+            ? (((0U == (0x0000001fU & ((IData)(0x40U) 
+                                       + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                          * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits))))
+                 ? 0U : (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                         [(((IData)(0x0000001fU) + 
+                            (0x000000ffU & ((IData)(0x40U) 
+                                            + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                               * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))) 
+                           >> 5U)] << ((IData)(0x00000020U) 
+                                       - (0x0000001fU 
+                                          & ((IData)(0x40U) 
+                                             + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))))) 
+               | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                  [(7U & (((IData)(0x40U) + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)) 
+                          >> 5U))] >> (0x0000001fU 
+                                       & ((IData)(0x40U) 
+                                          + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_3__calc_biases_bits)))))
+            : 0U);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases 
+        = ((0xbfU >= (0x000000ffU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+            ? (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                [(((IData)(0x0000003fU) 
+                                   + (0x000000ffU & 
+                                      ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                       * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))) 
+                                  >> 5U)])) << ((0U 
+                                                 == 
+                                                 (0x0000001fU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+                                                 ? 0x00000020U
+                                                 : 
+                                                ((IData)(0x00000040U) 
+                                                 - 
+                                                 (0x0000001fU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))))) 
+               | (((0U == (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                          * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))
+                    ? 0ULL : ((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                              [(((IData)(0x0000001fU) 
+                                                 + 
+                                                 (0x000000ffU 
+                                                  & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                                     * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))) 
+                                                >> 5U)])) 
+                              << ((IData)(0x00000020U) 
+                                  - (0x0000001fU & 
+                                     ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                      * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits))))) 
+                  | ((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat
+                                     [(7U & (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                              * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits) 
+                                             >> 5U))])) 
+                     >> (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                        * KiwiNPUFlash__DOT__npu__DOT____VlemCall_1__calc_biases_bits)))))
+            : 0ULL);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout;
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+    __VExpandSel_WordIdx_1 = (0x0000001fU & (((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                              * KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits) 
+                                             >> 5U));
+    __VExpandSel_LoShift_1 = (0x0000001fU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank) 
+                                             * KiwiNPUFlash__DOT__npu__DOT____VlemCall_0__calc_weights_bits));
+    __VExpandSel_Aligned_1 = (0U == __VExpandSel_LoShift_1);
+    if (__VExpandSel_Aligned_1) {
+        __VExpandSel_HiShift_1 = 0U;
+        __VExpandSel_HiMask_1 = 0U;
+    } else {
+        __VExpandSel_HiShift_1 = ((IData)(0x00000020U) 
+                                  - __VExpandSel_LoShift_1);
+        __VExpandSel_HiMask_1 = 0xffffffffU;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [__VExpandSel_WordIdx_1] >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(1U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(2U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(3U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(4U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(5U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(6U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U] 
+        = (((((0x00000018U <= __VExpandSel_WordIdx_1)
+               ? 0U : vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(8U) + __VExpandSel_WordIdx_1)]) 
+             << __VExpandSel_HiShift_1) & __VExpandSel_HiMask_1) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(7U) + __VExpandSel_WordIdx_1)] 
+              >> __VExpandSel_LoShift_1));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum = 0U;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j = 1U;
+    while (VL_GTS_III(32, 3U, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j)) {
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx 
+            = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout;
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+               - (IData)(1U));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset 
+            = VL_MULS_III(32, (IData)(8U), ((IData)(2U) 
+                                            - vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx));
+        vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout 
+            = ((0x17U >= (0x0000001fU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset))
+                ? (0x000000ffU & (0x00040804U >> (0x0000001fU 
+                                                  & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset)))
+                : 0U);
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1 
+            = vlSelfRef.__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout;
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+            = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum 
+               + VL_MULS_III(32, (IData)(8U), VL_MULS_III(32, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1)));
+        vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j 
+            = ((IData)(1U) + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j);
+    }
+    KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum;
+    __VExpandSel_WordIdx_2 = (0x0000001fU & (((IData)(0x0100U) 
+                                              + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                 * KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits)) 
+                                             >> 5U));
+    __VExpandSel_LoShift_2 = (0x0000001fU & ((IData)(0x0100U) 
+                                             + ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank) 
+                                                * KiwiNPUFlash__DOT__npu__DOT____VlemCall_2__calc_weights_bits)));
+    __VExpandSel_Aligned_2 = (0U == __VExpandSel_LoShift_2);
+    if (__VExpandSel_Aligned_2) {
+        __VExpandSel_HiShift_2 = 0U;
+        __VExpandSel_HiMask_2 = 0U;
+    } else {
+        __VExpandSel_HiShift_2 = ((IData)(0x00000020U) 
+                                  - __VExpandSel_LoShift_2);
+        __VExpandSel_HiMask_2 = 0xffffffffU;
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(1U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [__VExpandSel_WordIdx_2] >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(2U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(1U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(3U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(2U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(4U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(3U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(5U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(4U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(6U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(5U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U] 
+        = (((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+             [((IData)(7U) + __VExpandSel_WordIdx_2)] 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(6U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U] 
+        = (((((0x00000018U <= __VExpandSel_WordIdx_2)
+               ? 0U : vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(8U) + __VExpandSel_WordIdx_2)]) 
+             << __VExpandSel_HiShift_2) & __VExpandSel_HiMask_2) 
+           | (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat
+              [((IData)(7U) + __VExpandSel_WordIdx_2)] 
+              >> __VExpandSel_LoShift_2));
+    vlSelfRef.KiwiNPUFlash__DOT__out_vec = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid;
+    vlSelfRef.flash_csb = vlSelfRef.KiwiNPUFlash__DOT__flash_csb;
+    vlSelfRef.flash_clk = vlSelfRef.KiwiNPUFlash__DOT__flash_clk;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+           & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid) 
+              & (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr 
+                 == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr)));
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_do 
+        = ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en) 
+             << 0x0000001fU) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr) 
+                                 << 0x00000016U) | 
+                                (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi) 
+                                  << 0x00000015U) | 
+                                 (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont) 
+                                   << 0x00000014U) 
+                                  | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy) 
+                                     << 0x00000010U))))) 
+           | ((((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe) 
+                  << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe) 
+                            << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe) 
+                                        << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe))) 
+               << 8U) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb) 
+                           << 5U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk) 
+                                     << 4U)) | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di) 
+                                                  << 3U) 
+                                                 | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di) 
+                                                    << 2U)) 
+                                                | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di) 
+                                                    << 1U) 
+                                                   | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di))))));
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+        = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+    if ((0U == (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count))) {
+        if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+                if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                    if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                        vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                            = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                               << 2U)) 
+                               | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                   << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                    }
+                } else {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 4U)) 
+                           | ((((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di) 
+                                << 3U) | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di) 
+                                          << 2U)) | 
+                              (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di))));
+                }
+            } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+            } else {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer;
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi) {
+            if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+                if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                        = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                           << 2U)) 
+                           | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                               << 1U) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+                }
+            } else if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = ((0x000000f0U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                       << 4U)) | ((
+                                                   ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di) 
+                                                    << 3U) 
+                                                   | ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di) 
+                                                      << 2U)) 
+                                                  | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                                      << 1U) 
+                                                     | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di))));
+            }
+        } else if (vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi) {
+            if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+                vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                    = ((0x000000fcU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                       << 2U)) | (((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di) 
+                                                   << 1U) 
+                                                  | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di)));
+            }
+        } else if ((1U & (~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk)))) {
+            vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer 
+                = ((0x000000feU & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer) 
+                                   << 1U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di));
+        }
+    }
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__out_valid = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U] 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights[7U];
+    vlSelfRef.out_vec = vlSelfRef.KiwiNPUFlash__DOT__out_vec;
+    vlSelfRef.flash_io3_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do;
+    vlSelfRef.flash_io2_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do;
+    vlSelfRef.flash_io1_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do;
+    vlSelfRef.flash_io0_do = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__mem_ready = vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready;
+    vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__jump = 
+        ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid) 
+         & ((~ ((IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready) 
+                | (((IData)(4U) + vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr) 
+                   == vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr))) 
+            & (IData)(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid)));
+    vlSelfRef.flash_io0_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe;
+    vlSelfRef.flash_io3_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe;
+    vlSelfRef.flash_io2_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe;
+    vlSelfRef.flash_io1_oe = vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.out_valid = vlSelfRef.KiwiNPUFlash__DOT__out_valid;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 8U));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b 
+        = (0x000000ffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+                          >> 0x00000010U));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b 
+        = (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases 
+           >> 0x00000018U);
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[1U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[0U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[3U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[2U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[5U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[4U])));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+        = (((QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[7U])) 
+            << 0x00000020U) | (QData)((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights[6U])));
+    vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__mem_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum 
+        = ((0x0007ff00U & ((- (IData)((1U & ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b) 
+                                             >> 7U)))) 
+                           << 8U)) | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U] 
+        = (0x000000ffU & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 8U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000010U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000018U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000020U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000028U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000030U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U] 
+        = (0x000000ffU & (IData)((vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w 
+                                  >> 0x00000038U)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7U];
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready 
+        = (1U & ((~ (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid)) 
+                 | (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum 
+        = (0x0007ffffU & VL_MULS_III(19, (0x0007ffffU 
+                                          & VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op))), 
+                                     (0x0007ffffU & 
+                                      VL_EXTENDS_II(19,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op)))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__in_ready = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__serving) 
+                                             & (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu_in_ready));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node));
+    vlSelfRef.in_ready = vlSelfRef.KiwiNPUFlash__DOT__in_ready;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum 
+        = (0x0007ffffU & (vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+                          + vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out 
+        = (VL_LTS_III(32, 0x0000007fU, VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+            ? 0x0000007fU : (VL_GTS_III(32, 0xffffff80U, 
+                                        VL_EXTENDS_II(32,19, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in))
+                              ? 0x00000080U : (0x000000ffU 
+                                               & vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in)));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out 
+        = ((IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in) 
+           & (- (IData)(VL_LTES_III(32, 0U, VL_EXTENDS_II(32,8, (IData)(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in))))));
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out;
+    vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out 
+        = vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out;
+}
+
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+void Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0(Vtop_Perceptron__A12* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___stl_sequent__TOP__0(vlSelf);
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron));
+        Vtop_Perceptron__A12___ico_sequent__TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__0((&vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron));
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge KiwiNPUFlash.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(negedge KiwiNPUFlash.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge KiwiNPUFlash.flash.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @(negedge KiwiNPUFlash.flash.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 4 is active: @(posedge KiwiNPUFlash.flash.xfer.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 5 is active: @(posedge KiwiNPUFlash.loader.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 6 is active: @(negedge KiwiNPUFlash.loader.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 7 is active: @(posedge KiwiNPUFlash.npu.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 8 is active: @(negedge KiwiNPUFlash.npu.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 9 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 10 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 11 is active: @(posedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 12 is active: @(negedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 13 is active: @(posedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 14 is active: @(negedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 15 is active: @(posedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000010U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 16 is active: @(negedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000011U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 17 is active: @(posedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000012U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 18 is active: @(negedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000013U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 19 is active: @(posedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000014U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 20 is active: @(negedge KiwiNPUFlash.npu.gen_layers[2].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000015U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 21 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000016U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 22 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[0].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000017U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 23 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000018U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 24 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[1].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000019U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 25 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 26 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[2].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 27 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 28 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[3].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 29 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[4].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 30 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[4].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000001fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 31 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[5].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000020U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 32 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[5].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000021U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 33 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[6].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000022U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 34 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[6].u_neuron.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000023U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 35 is active: @(posedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[7].u_neuron.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000024U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 36 is active: @(negedge KiwiNPUFlash.npu.gen_layers[1].u_layer_inst.gen_lanes[0].gen_neurons[7].u_neuron.rst_n)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1638864771569018232ull);
+    vlSelf->load = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1148748992964133306ull);
+    vlSelf->loaded = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7444686915493248351ull);
+    vlSelf->swap = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17263893192133048920ull);
+    vlSelf->shadow_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6805178464265966483ull);
+    vlSelf->in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2339549897027650563ull);
+    vlSelf->in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1122049356863891575ull);
+    vlSelf->in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14514620031066118736ull);
+    vlSelf->out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2886291494070200219ull);
+    vlSelf->out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17332470166291283643ull);
+    vlSelf->out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13025239842288100510ull);
+    vlSelf->flash_csb = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11652635938908002525ull);
+    vlSelf->flash_clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5365918822141393572ull);
+    vlSelf->flash_io0_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7992000548419258741ull);
+    vlSelf->flash_io1_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 833550893663747958ull);
+    vlSelf->flash_io2_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 253635620883081809ull);
+    vlSelf->flash_io3_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 666999977852569074ull);
+    vlSelf->flash_io0_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12097878962020516563ull);
+    vlSelf->flash_io1_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4371169400096010035ull);
+    vlSelf->flash_io2_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15827547581063797618ull);
+    vlSelf->flash_io3_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3007244467304995466ull);
+    vlSelf->flash_io0_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8663723135578253499ull);
+    vlSelf->flash_io1_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8645945056777449673ull);
+    vlSelf->flash_io2_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11046001250468611993ull);
+    vlSelf->flash_io3_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1756153310491463462ull);
+    vlSelf->KiwiNPUFlash__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17890275329870560361ull);
+    vlSelf->KiwiNPUFlash__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3122766037193194919ull);
+    vlSelf->KiwiNPUFlash__DOT__load = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 123268839449771424ull);
+    vlSelf->KiwiNPUFlash__DOT__loaded = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 886102749429106153ull);
+    vlSelf->KiwiNPUFlash__DOT__swap = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2423524726746714419ull);
+    vlSelf->KiwiNPUFlash__DOT__shadow_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15667011629225928773ull);
+    vlSelf->KiwiNPUFlash__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2393500276100661415ull);
+    vlSelf->KiwiNPUFlash__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1874833735824872567ull);
+    vlSelf->KiwiNPUFlash__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16997362216770636115ull);
+    vlSelf->KiwiNPUFlash__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15179076723602341833ull);
+    vlSelf->KiwiNPUFlash__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 448527556965896615ull);
+    vlSelf->KiwiNPUFlash__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15962568190808750571ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_csb = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6619267639356442761ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17060200782645171479ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io0_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11643291154578681882ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io1_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10962477081333513198ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io2_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11249901688201532092ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io3_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9041230485684360286ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io0_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11463314705125964324ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io1_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3643908189590292693ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io2_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16596685125970294705ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io3_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2295078781255702904ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io0_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12666851490821996082ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io1_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17159722057969762109ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io2_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16099797755844494962ull);
+    vlSelf->KiwiNPUFlash__DOT__flash_io3_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13432798073905943279ull);
+    vlSelf->KiwiNPUFlash__DOT__mem_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7923965688313539030ull);
+    vlSelf->KiwiNPUFlash__DOT__mem_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7798114168147534109ull);
+    vlSelf->KiwiNPUFlash__DOT__mem_addr = VL_SCOPED_RAND_RESET_I(24, __VscopeHash, 13932581289285998084ull);
+    vlSelf->KiwiNPUFlash__DOT__mem_rdata = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 16576004404089272942ull);
+    vlSelf->KiwiNPUFlash__DOT__cfgreg_we = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__cfgreg_di = 524288U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__configured = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12069388946284340675ull);
+    vlSelf->KiwiNPUFlash__DOT__active = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8935633735095826371ull);
+    vlSelf->KiwiNPUFlash__DOT__shadow_loading = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9026967076694636701ull);
+    vlSelf->KiwiNPUFlash__DOT__booted = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6237218670061168884ull);
+    vlSelf->KiwiNPUFlash__DOT__serving = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15731834209122911810ull);
+    vlSelf->KiwiNPUFlash__DOT__npu_in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11288810382652151234ull);
+    VL_SCOPED_RAND_RESET_W(1216, vlSelf->KiwiNPUFlash__DOT__image, __VscopeHash, 11295550491207340133ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15381158248364290106ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__resetn = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1482271186697285746ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8961717681193527ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4787602953583881553ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__addr = VL_SCOPED_RAND_RESET_I(24, __VscopeHash, 4432913604262952913ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__rdata = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10982452830168263513ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_csb = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4293737945587542534ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2208090142695904220ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 540091280058333467ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13122751792847426899ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5304003190401745846ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11154375697099410433ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io0_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16539506245641786850ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io1_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4971974792359733877ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io2_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2856674082275653828ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io3_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3003598696611722232ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io0_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11400174270293096549ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io1_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18279386890720689867ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io2_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 316635806341764704ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__flash_io3_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10944631277605509639ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__cfgreg_we = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__cfgreg_di = 524288U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__cfgreg_do = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3896593953178592796ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_resetn = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6454113947175889066ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16026075575497058776ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6693961182955762346ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_data = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8283997295155836512ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_tag = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 13547241393843589551ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_cont = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8882557842390151114ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_qspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11724947072009543315ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_ddr = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10727048026642581204ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__din_rd = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17762441931457387324ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__dout_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2819641298112113700ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__dout_data = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2961972090561310717ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__dout_tag = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 11618288944436346103ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__buffer = VL_SCOPED_RAND_RESET_I(24, __VscopeHash, 704018015233929477ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__rd_addr = VL_SCOPED_RAND_RESET_I(24, __VscopeHash, 9473515464024254757ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__rd_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4109775096918790297ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__rd_wait = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7509644786502960933ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__rd_inc = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1959192976824688902ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__jump = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12292813633689634981ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__softreset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1127404398994119513ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8719251953388463682ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_ddr = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4327453259213245329ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_qspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4963913023797627562ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_cont = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10830258943528984645ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_dummy = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 6791417845978997200ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_oe = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 18240656878467527459ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_csb = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4285961215811791286ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14655378774932365835ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__config_do = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 8950296422367878760ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_csb = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5675068193754042153ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8789277326175593986ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17144509659023854000ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18153477166917675385ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7979353756332455376ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2542071551470891793ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9038510095062095444ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1498454701253661246ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16257152950347000278ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2648910078536403531ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9225037838515732947ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16302192824411750453ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11410552871924909286ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9802804361068298724ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_dspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6702173690003298537ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer_ddr = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9279545785206595895ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__state = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 9186191207754973411ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10776290705495288455ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15577466897758724079ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5307316972166891055ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17687606042220020237ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10472212940952124020ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 7873957251932591411ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7828677166158804109ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5404147336801994157ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14652266099214894979ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14648822410926420923ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8880937186469695037ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11913305856948681522ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8194509715402693137ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 7352276638515494970ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5956116834366189012ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4172253256089482554ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1879571879944963116ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7243303151789869359ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12216532535594214016ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2756706041480707259ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16796690912283404186ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14544115784515944649ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12689251701963088771ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6364925511338520114ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15679322908567794858ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5045446107831984199ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 976065194650027644ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 631401068739809315ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15494524281775549438ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17092194041997652097ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 1013699488578945298ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 13216612288021610251ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_cont = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 119303937396438102ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 992667763929651374ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3251414308028874931ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17197324180257316422ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 308471614615442802ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3152683766039470083ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 1545502499007342302ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 7511829957029567594ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9193011181431646043ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12479489734328943951ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 3970228407957227159ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 487020723220988419ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14633188161729811028ull);
+    vlSelf->KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11973983443927767064ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT____Vlvbound_h8986c447__0 = 0;
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11244175125070847623ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15339344027169642769ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__load = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6166531620490385567ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__bank = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1435365081627450710ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__mem_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6408421474752131648ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__mem_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6924631269936029892ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__mem_addr = VL_SCOPED_RAND_RESET_I(24, __VscopeHash, 5494680788327403256ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__mem_rdata = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 1025750137176997985ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__loaded = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5971994165048314857ull);
+    VL_SCOPED_RAND_RESET_W(1216, vlSelf->KiwiNPUFlash__DOT__loader__DOT__image, __VscopeHash, 13914191619463835497ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__word = VL_SCOPED_RAND_RESET_I(5, __VscopeHash, 6077369792146354376ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__target = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6440327015034193596ull);
+    vlSelf->KiwiNPUFlash__DOT__loader__DOT__last_word = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11926314158354912305ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h5f6b4e08__0 = 0;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h7236681e__0 = 0;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h99e8e462__0 = 0;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT____Vlvbound_h4e8b1913__0 = 0;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5713657110961380324ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11974123459199785794ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__bank = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11405207213249917571ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7419854203132673673ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8228428346376739685ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3358727687500657975ull);
+    VL_SCOPED_RAND_RESET_W(1024, vlSelf->KiwiNPUFlash__DOT__npu__DOT__weights_flat, __VscopeHash, 6128168645378860666ull);
+    VL_SCOPED_RAND_RESET_W(192, vlSelf->KiwiNPUFlash__DOT__npu__DOT__biases_flat, __VscopeHash, 9863351630686510603ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 76853113461092349ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10547013316324693648ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 7915437413776955622ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13658091494677271368ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 13704067172233252172ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1791550991961104910ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2650493394852414135ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 823412813998071556ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13071139540850164436ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 542622563148527327ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16972034882225898030ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk2__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 4415186869385197912ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__unnamedblk1__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8972294382858307171ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights, __VscopeHash, 5815685477164148260ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 8517499348477425878ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3432203732281068426ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13311076886983487109ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12470994595420113576ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11588246234458871205ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8992860805782734450ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6046359124811160550ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12814507820614860270ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11880896337927051790ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk2__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 18159065049508085085ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__unnamedblk1__DOT__k = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 9976997121337223443ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights, __VscopeHash, 7344096697896462608ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14262872573004983127ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11632355510735943253ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14948900843065526507ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12076166344218300674ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11091692518250033192ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 14377014214236297571ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 3228390115658515453ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 14839245937407889596ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1888944651512361590ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11284784120096126913ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 9186248166285783982ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7096218414574063644ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7107872361348174525ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6930251271594234012ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1832248571367210696ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8417292404939338646ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 5332180776391617198ull);
+    VL_SCOPED_RAND_RESET_W(256, vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights, __VscopeHash, 18062312497153636480ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 2314384646366890009ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10830209572407154985ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14145125922656651852ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 15313824068235278730ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18007297394706017060ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12950534166260995649ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17954259998537983255ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9510766542316237020ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 2247043136071296316ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 13672276977165570279ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11738099482898350429ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11641751799235051256ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14061626776443402408ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16237760720754059955ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3499307175408126580ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17524722710086047505ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13478229334080264361ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4492248071595685498ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11521635164972960887ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 228775700917729581ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12864534672991452274ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3596481653728131451ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 13699682642735222727ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11776158972009763427ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9091479527969669076ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6063243994552063355ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15411079585412795276ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14243103615011773712ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14263036138002667580ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16533426863844067894ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1420811540833756651ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15979268281503518937ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13915788191711059755ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1495615352321609765ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5359909283585554110ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9962202453075509978ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6341655527116132677ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6406007824366955431ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9049064290820664853ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3629343951848547793ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1073697679914791243ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17388894118788644440ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11737728753800702337ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1058900568083443199ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13369729317144970638ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 511837471730469064ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12761144419498300541ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7613183087800523687ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10389249972716974970ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 833189465083557562ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9759512309222792343ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13692995936533917832ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5346392145357148208ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18425492577723693730ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3288815398397647500ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18065687871506915536ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7872986735382970091ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3759032213113918169ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17194026147248120560ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18017839324124608879ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18367645130050978056ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1989067469158930052ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17344856852099848133ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15914337872240816781ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12071176913844898804ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14900027856095752984ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15027572008077081597ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1805387497292059069ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3938600798304712365ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4384334331712991879ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3007729799143381964ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9110804133288532982ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13536491804730420367ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16914063578768887479ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16192180796339586682ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17816634639306471694ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3419975314114166342ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3281707914802997911ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11419871489077517152ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13618133899097511467ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10757992989658140813ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14364136386082164108ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5265742735314772521ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11513303292523391598ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6187200839225580427ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16356405156097276974ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1501575385976647646ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15152712013175672202ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15546501533427291522ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 281504172453157317ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 116206155340539007ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 10694619418714250703ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17040457506732060723ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16140188207155788379ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14911708810717901439ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4766983059550943339ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10050482436654713667ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9585536659731085145ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16990201912897908258ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17564330930211314262ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17677667288681066157ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6574129492010774276ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14133841436636372154ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3763595367109809631ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 13987608786441265908ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17078133866453275152ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4981751751220971261ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16716718845848425742ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11978413236289369554ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16429694717880401330ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13912426816663791770ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2247660786590594453ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1818586503704989477ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10677492911719443747ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14353050064143223ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8617027741214405904ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12256966718906414734ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16478095957729825841ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15258746072531733229ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11252280673394513581ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15650580787526890296ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18197811288811333831ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1074404888882372596ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10433114905655162397ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15237119186175713420ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2185593120421823725ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15012617022918595227ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 70689646378800998ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4625569748125088462ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 342103959812177341ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18093579114505214331ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16180211272323566430ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9211811924575433694ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10529960755990365710ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1727006764358812467ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1227372168650406417ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3699643469439892611ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5183426375440919889ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4479417909310779181ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10160590378044386922ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15085244402604673362ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2684565379964558030ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9615489831032219325ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6715855693207010497ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1669479715799455087ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4559046033555734945ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3365930120652251577ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15990303661346812674ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3835135961093947373ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16377301603551156967ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3752775321619710848ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13190506405938275575ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6136882550732484132ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1449125041965649769ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1112712132561457176ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4394465639034274210ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13191886538265850170ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4449942472871508615ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5129053214344498669ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10319344142749587935ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4260438966377355206ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13845844707952328009ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1973436679111723180ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15885728092502819772ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12424872366102418828ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 201567436392191289ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9086269031299976314ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15844381007792427421ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5475927450305238434ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1939450001294398982ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13735928109541759541ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11649030541924695906ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4960082299781043404ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 15741633956371031578ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9991479156102954078ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5056442638251332826ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7091098838932265087ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8059392232095649028ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13260238785289397640ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9078449118491436549ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4893097995139949808ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3835550914286355186ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3324847384341685271ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10684277041005021063ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16148274106980830698ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 12422648272973601733ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 4278517186820138154ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13810515344864079827ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10352621436267974374ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15985255313704451856ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10535887361849854742ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17369175446441501890ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2175055172806055836ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16869411155214590724ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5565224455127725175ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10076646642382416833ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2666921691354355353ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7613598655715760365ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4757997362936608625ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15536082595616320553ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14111491196498652158ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2528068043087324328ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16721434325451367140ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14240468858296824628ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6847513635861615829ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15798216618582718994ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16272676470203850023ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15278530522892828476ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4700277917523557147ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13813039371141325367ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 100523848073008604ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16402164665401779709ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13461363133547716444ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8469728906965004343ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3787504294573547581ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12789242749951781986ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9401597721085076830ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1927061294873854655ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1844516936229700731ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12252486690659219758ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10520346636138276017ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14087378995728832377ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5551511741210094327ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6766893587234468708ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17008745367863010446ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14910754347575443503ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6967940020033227892ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15535160796527953441ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11314303794238764708ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1807745550862141239ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5395149825419552176ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 280365675451493040ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11404816658816969462ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9001425708189304627ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9086807020897660956ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15135079457992138113ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14098408078602323835ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6406347516449730324ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4118668415016599417ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14899811322696658906ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2144127507450493742ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 342725805370062448ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15048197753711459619ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2828291368146914083ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4925133660420378428ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 108728609691084767ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7311095763409991994ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1578484651201999739ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5044181696645108552ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13414951999906778100ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5287530617943500306ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16157551470473347993ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7629489577980629062ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5312926427234542798ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 11238029628604858747ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 3981058934690994068ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18339404586066953693ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10777792199332374481ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5749996927673377119ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11186713562302733092ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17916447264695782731ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4114000740594098485ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6243387700697340529ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5984867038237859234ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6924286360220851982ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15355247777311179084ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12316931455666690893ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__int4 = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 12927520843136163055ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 848036581197240145ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1562101068403164459ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11152118949435143005ull);
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5317332611226449474ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 8; ++__Vi0) {
+        vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6753223880846069102ull);
+    }
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 18190389624272508071ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11725001132741032813ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11551140272815266421ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13919587306157602696ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6922822636806345179ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7727480704507613138ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12927470918046836074ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9910538721592901280ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 374685473297766533ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1332790702871645025ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6250617264039904889ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17417813524355592649ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3113723961134381519ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13847569165450387738ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9997780395187958103ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1510656261102258596ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6918802280262863433ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 911919352143021731ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11673110025857591776ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14196973814602827774ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6926553907231716504ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1816334490947222450ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8452531393552335857ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18040244006690604342ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5831870541452713126ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14353550181027936996ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9162948650155836217ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 612847968828325653ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9673704120613464518ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4203069371708215196ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7099852779367733173ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5029600882553572895ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10427814972955069088ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5473242337476802605ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__9__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__10__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__11__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__12__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__13__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__14__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__15__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11981099573067581540ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11799494539670751823ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6100208502671132554ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6685672441711315905ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2598407956744058690ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 617760871355558180ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4496793995369942698ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17986462465728517240ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3325012455731796164ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2436083047480962324ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__5__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__6__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__7__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2154098821883345741ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5600318220613975556ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9421061930729465106ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9770131656791993368ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17613386017916269344ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6563875414611274023ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__sum = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__3__KET____DOT__node = 0U;
+    ;
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14915518563053229741ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8662322605560464843ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13081134918335899427ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12217658563642145021ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5776355889930223173ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5043761381256468926ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11873359241205678665ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17882571310172462486ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12742672868084974556ull);
+    vlSelf->KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12417444624446389791ull);
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__Vfuncout = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__1__idx = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__Vfuncout = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__2__idx = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__Vfuncout = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__4__idx = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__Vfuncout = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__6__idx = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__Vfuncout = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__7__idx = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__Vfuncout = 0;
+    vlSelf->__Vfunc_KiwiNPUFlash__DOT__npu__DOT__get_layer_size__9__idx = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__loader__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron__rst_n__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
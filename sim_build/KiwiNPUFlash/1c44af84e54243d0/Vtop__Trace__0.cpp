@@ -0,0 +1,1317 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Tracing implementation internals
+
+#include "verilated_vcd_c.h"
+#include "Vtop__Syms.h"
+
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp);
+
+void Vtop___024root__trace_chg_0(void* voidSelf, VerilatedVcd::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    if (VL_UNLIKELY(!vlSymsp->__Vm_activity)) return;
+    Vtop___024root__trace_chg_0_sub_0((&vlSymsp->TOP), bufp);
+}
+
+void Vtop___024root__trace_chg_dtype____0(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp, uint32_t offset, const VlUnpacked<CData/*0:0*/, 1>& __VdtypeVar);
+void Vtop___024root__trace_chg_dtype____1(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp, uint32_t offset, const VlUnpacked<CData/*0:0*/, 1>& __VdtypeVar);
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0_sub_0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode + 0);
+    bufp->chgBit(oldp+0,(vlSelfRef.clk));
+    bufp->chgBit(oldp+1,(vlSelfRef.rst_n));
+    bufp->chgBit(oldp+2,(vlSelfRef.load));
+    bufp->chgBit(oldp+3,(vlSelfRef.loaded));
+    bufp->chgBit(oldp+4,(vlSelfRef.swap));
+    bufp->chgBit(oldp+5,(vlSelfRef.shadow_ready));
+    bufp->chgBit(oldp+6,(vlSelfRef.in_valid));
+    bufp->chgBit(oldp+7,(vlSelfRef.in_ready));
+    bufp->chgIData(oldp+8,(vlSelfRef.in_vec),32);
+    bufp->chgBit(oldp+9,(vlSelfRef.out_valid));
+    bufp->chgBit(oldp+10,(vlSelfRef.out_ready));
+    bufp->chgIData(oldp+11,(vlSelfRef.out_vec),32);
+    bufp->chgBit(oldp+12,(vlSelfRef.flash_csb));
+    bufp->chgBit(oldp+13,(vlSelfRef.flash_clk));
+    bufp->chgBit(oldp+14,(vlSelfRef.flash_io0_oe));
+    bufp->chgBit(oldp+15,(vlSelfRef.flash_io1_oe));
+    bufp->chgBit(oldp+16,(vlSelfRef.flash_io2_oe));
+    bufp->chgBit(oldp+17,(vlSelfRef.flash_io3_oe));
+    bufp->chgBit(oldp+18,(vlSelfRef.flash_io0_do));
+    bufp->chgBit(oldp+19,(vlSelfRef.flash_io1_do));
+    bufp->chgBit(oldp+20,(vlSelfRef.flash_io2_do));
+    bufp->chgBit(oldp+21,(vlSelfRef.flash_io3_do));
+    bufp->chgBit(oldp+22,(vlSelfRef.flash_io0_di));
+    bufp->chgBit(oldp+23,(vlSelfRef.flash_io1_di));
+    bufp->chgBit(oldp+24,(vlSelfRef.flash_io2_di));
+    bufp->chgBit(oldp+25,(vlSelfRef.flash_io3_di));
+    bufp->chgBit(oldp+26,(vlSelfRef.KiwiNPUFlash__DOT__clk));
+    bufp->chgBit(oldp+27,(vlSelfRef.KiwiNPUFlash__DOT__rst_n));
+    bufp->chgBit(oldp+28,(vlSelfRef.KiwiNPUFlash__DOT__load));
+    bufp->chgBit(oldp+29,(vlSelfRef.KiwiNPUFlash__DOT__loaded));
+    bufp->chgBit(oldp+30,(vlSelfRef.KiwiNPUFlash__DOT__swap));
+    bufp->chgBit(oldp+31,(vlSelfRef.KiwiNPUFlash__DOT__shadow_ready));
+    bufp->chgBit(oldp+32,(vlSelfRef.KiwiNPUFlash__DOT__in_valid));
+    bufp->chgBit(oldp+33,(vlSelfRef.KiwiNPUFlash__DOT__in_ready));
+    bufp->chgIData(oldp+34,(vlSelfRef.KiwiNPUFlash__DOT__in_vec),32);
+    bufp->chgBit(oldp+35,(vlSelfRef.KiwiNPUFlash__DOT__out_valid));
+    bufp->chgBit(oldp+36,(vlSelfRef.KiwiNPUFlash__DOT__out_ready));
+    bufp->chgIData(oldp+37,(vlSelfRef.KiwiNPUFlash__DOT__out_vec),32);
+    bufp->chgBit(oldp+38,(vlSelfRef.KiwiNPUFlash__DOT__flash_csb));
+    bufp->chgBit(oldp+39,(vlSelfRef.KiwiNPUFlash__DOT__flash_clk));
+    bufp->chgBit(oldp+40,(vlSelfRef.KiwiNPUFlash__DOT__flash_io0_oe));
+    bufp->chgBit(oldp+41,(vlSelfRef.KiwiNPUFlash__DOT__flash_io1_oe));
+    bufp->chgBit(oldp+42,(vlSelfRef.KiwiNPUFlash__DOT__flash_io2_oe));
+    bufp->chgBit(oldp+43,(vlSelfRef.KiwiNPUFlash__DOT__flash_io3_oe));
+    bufp->chgBit(oldp+44,(vlSelfRef.KiwiNPUFlash__DOT__flash_io0_do));
+    bufp->chgBit(oldp+45,(vlSelfRef.KiwiNPUFlash__DOT__flash_io1_do));
+    bufp->chgBit(oldp+46,(vlSelfRef.KiwiNPUFlash__DOT__flash_io2_do));
+    bufp->chgBit(oldp+47,(vlSelfRef.KiwiNPUFlash__DOT__flash_io3_do));
+    bufp->chgBit(oldp+48,(vlSelfRef.KiwiNPUFlash__DOT__flash_io0_di));
+    bufp->chgBit(oldp+49,(vlSelfRef.KiwiNPUFlash__DOT__flash_io1_di));
+    bufp->chgBit(oldp+50,(vlSelfRef.KiwiNPUFlash__DOT__flash_io2_di));
+    bufp->chgBit(oldp+51,(vlSelfRef.KiwiNPUFlash__DOT__flash_io3_di));
+    bufp->chgIData(oldp+52,(vlSelfRef.KiwiNPUFlash__DOT__image_bits__Vstatic__sum),32);
+    bufp->chgIData(oldp+53,(vlSelfRef.KiwiNPUFlash__DOT__image_bits__Vstatic__j),32);
+    bufp->chgBit(oldp+54,(vlSelfRef.KiwiNPUFlash__DOT__mem_valid));
+    bufp->chgBit(oldp+55,(vlSelfRef.KiwiNPUFlash__DOT__mem_ready));
+    bufp->chgIData(oldp+56,(vlSelfRef.KiwiNPUFlash__DOT__mem_addr),24);
+    bufp->chgIData(oldp+57,(vlSelfRef.KiwiNPUFlash__DOT__mem_rdata),32);
+    bufp->chgCData(oldp+58,(vlSelfRef.KiwiNPUFlash__DOT__cfgreg_we),4);
+    bufp->chgBit(oldp+59,(vlSelfRef.KiwiNPUFlash__DOT__configured));
+    bufp->chgBit(oldp+60,(vlSelfRef.KiwiNPUFlash__DOT__active));
+    bufp->chgBit(oldp+61,(vlSelfRef.KiwiNPUFlash__DOT__shadow_loading));
+    bufp->chgWData(oldp+62,(vlSelfRef.KiwiNPUFlash__DOT__image),1216);
+    bufp->chgBit(oldp+100,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__clk));
+    bufp->chgBit(oldp+101,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__resetn));
+    bufp->chgBit(oldp+102,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__valid));
+    bufp->chgBit(oldp+103,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__ready));
+    bufp->chgIData(oldp+104,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__addr),24);
+    bufp->chgIData(oldp+105,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rdata),32);
+    bufp->chgBit(oldp+106,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_csb));
+    bufp->chgBit(oldp+107,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_clk));
+    bufp->chgBit(oldp+108,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_oe));
+    bufp->chgBit(oldp+109,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_oe));
+    bufp->chgBit(oldp+110,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_oe));
+    bufp->chgBit(oldp+111,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_oe));
+    bufp->chgBit(oldp+112,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_do));
+    bufp->chgBit(oldp+113,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_do));
+    bufp->chgBit(oldp+114,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_do));
+    bufp->chgBit(oldp+115,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_do));
+    bufp->chgBit(oldp+116,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io0_di));
+    bufp->chgBit(oldp+117,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io1_di));
+    bufp->chgBit(oldp+118,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io2_di));
+    bufp->chgBit(oldp+119,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__flash_io3_di));
+    bufp->chgCData(oldp+120,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_we),4);
+    bufp->chgIData(oldp+121,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__cfgreg_do),32);
+    bufp->chgBit(oldp+122,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_resetn));
+    bufp->chgBit(oldp+123,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_valid));
+    bufp->chgBit(oldp+124,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ready));
+    bufp->chgCData(oldp+125,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_data),8);
+    bufp->chgCData(oldp+126,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_tag),4);
+    bufp->chgBit(oldp+127,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_cont));
+    bufp->chgBit(oldp+128,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_qspi));
+    bufp->chgBit(oldp+129,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_ddr));
+    bufp->chgBit(oldp+130,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__din_rd));
+    bufp->chgBit(oldp+131,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_valid));
+    bufp->chgCData(oldp+132,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_data),8);
+    bufp->chgCData(oldp+133,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__dout_tag),4);
+    bufp->chgIData(oldp+134,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__buffer),24);
+    bufp->chgIData(oldp+135,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_addr),24);
+    bufp->chgBit(oldp+136,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_valid));
+    bufp->chgBit(oldp+137,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_wait));
+    bufp->chgBit(oldp+138,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__rd_inc));
+    bufp->chgBit(oldp+139,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__jump));
+    bufp->chgBit(oldp+140,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__softreset));
+    bufp->chgBit(oldp+141,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_en));
+    bufp->chgBit(oldp+142,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_ddr));
+    bufp->chgBit(oldp+143,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_qspi));
+    bufp->chgBit(oldp+144,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_cont));
+    bufp->chgCData(oldp+145,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_dummy),4);
+    bufp->chgCData(oldp+146,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_oe),4);
+    bufp->chgBit(oldp+147,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_csb));
+    bufp->chgBit(oldp+148,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_clk));
+    bufp->chgCData(oldp+149,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__config_do),4);
+    bufp->chgBit(oldp+150,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_csb));
+    bufp->chgBit(oldp+151,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_clk));
+    bufp->chgBit(oldp+152,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_oe));
+    bufp->chgBit(oldp+153,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_oe));
+    bufp->chgBit(oldp+154,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_oe));
+    bufp->chgBit(oldp+155,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_oe));
+    bufp->chgBit(oldp+156,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_do));
+    bufp->chgBit(oldp+157,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_do));
+    bufp->chgBit(oldp+158,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_do));
+    bufp->chgBit(oldp+159,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_do));
+    bufp->chgBit(oldp+160,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io0_90));
+    bufp->chgBit(oldp+161,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io1_90));
+    bufp->chgBit(oldp+162,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io2_90));
+    bufp->chgBit(oldp+163,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_io3_90));
+    bufp->chgBit(oldp+164,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_dspi));
+    bufp->chgBit(oldp+165,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer_ddr));
+    bufp->chgCData(oldp+166,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__state),4);
+    bufp->chgBit(oldp+167,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__clk));
+    bufp->chgBit(oldp+168,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__resetn));
+    bufp->chgBit(oldp+169,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_valid));
+    bufp->chgBit(oldp+170,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ready));
+    bufp->chgCData(oldp+171,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_data),8);
+    bufp->chgCData(oldp+172,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_tag),4);
+    bufp->chgBit(oldp+173,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_cont));
+    bufp->chgBit(oldp+174,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_dspi));
+    bufp->chgBit(oldp+175,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_qspi));
+    bufp->chgBit(oldp+176,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_ddr));
+    bufp->chgBit(oldp+177,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__din_rd));
+    bufp->chgBit(oldp+178,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_valid));
+    bufp->chgCData(oldp+179,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_data),8);
+    bufp->chgCData(oldp+180,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dout_tag),4);
+    bufp->chgBit(oldp+181,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_csb));
+    bufp->chgBit(oldp+182,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_clk));
+    bufp->chgBit(oldp+183,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_oe));
+    bufp->chgBit(oldp+184,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_oe));
+    bufp->chgBit(oldp+185,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_oe));
+    bufp->chgBit(oldp+186,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_oe));
+    bufp->chgBit(oldp+187,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_do));
+    bufp->chgBit(oldp+188,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_do));
+    bufp->chgBit(oldp+189,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_do));
+    bufp->chgBit(oldp+190,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_do));
+    bufp->chgBit(oldp+191,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io0_di));
+    bufp->chgBit(oldp+192,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io1_di));
+    bufp->chgBit(oldp+193,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io2_di));
+    bufp->chgBit(oldp+194,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__flash_io3_di));
+    bufp->chgCData(oldp+195,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__obuffer),8);
+    bufp->chgCData(oldp+196,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__ibuffer),8);
+    bufp->chgCData(oldp+197,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__count),4);
+    bufp->chgCData(oldp+198,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__dummy_count),4);
+    bufp->chgBit(oldp+199,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_cont));
+    bufp->chgBit(oldp+200,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_dspi));
+    bufp->chgBit(oldp+201,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_qspi));
+    bufp->chgBit(oldp+202,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr));
+    bufp->chgBit(oldp+203,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_ddr_q));
+    bufp->chgBit(oldp+204,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_rd));
+    bufp->chgCData(oldp+205,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag),4);
+    bufp->chgCData(oldp+206,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__xfer_tag_q),4);
+    bufp->chgCData(oldp+207,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_obuffer),8);
+    bufp->chgCData(oldp+208,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_ibuffer),8);
+    bufp->chgCData(oldp+209,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_count),4);
+    bufp->chgBit(oldp+210,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__fetch));
+    bufp->chgBit(oldp+211,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__next_fetch));
+    bufp->chgBit(oldp+212,(vlSelfRef.KiwiNPUFlash__DOT__flash__DOT__xfer__DOT__last_fetch));
+    bufp->chgBit(oldp+213,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__clk));
+    bufp->chgBit(oldp+214,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__rst_n));
+    bufp->chgBit(oldp+215,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__load));
+    bufp->chgBit(oldp+216,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__bank));
+    bufp->chgBit(oldp+217,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_valid));
+    bufp->chgBit(oldp+218,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_ready));
+    bufp->chgIData(oldp+219,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_addr),24);
+    bufp->chgIData(oldp+220,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__mem_rdata),32);
+    bufp->chgBit(oldp+221,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__loaded));
+    bufp->chgWData(oldp+222,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__image),1216);
+    bufp->chgCData(oldp+260,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__word),5);
+    bufp->chgBit(oldp+261,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__target));
+    bufp->chgBit(oldp+262,(vlSelfRef.KiwiNPUFlash__DOT__loader__DOT__last_word));
+    bufp->chgBit(oldp+263,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__clk));
+    bufp->chgBit(oldp+264,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__rst_n));
+    bufp->chgBit(oldp+265,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bank));
+    bufp->chgBit(oldp+266,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_valid));
+    bufp->chgBit(oldp+267,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_ready));
+    bufp->chgIData(oldp+268,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__in_vec),32);
+    bufp->chgWData(oldp+269,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weights_flat),1024);
+    bufp->chgWData(oldp+301,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__biases_flat),192);
+    bufp->chgBit(oldp+307,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_valid));
+    bufp->chgBit(oldp+308,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_ready));
+    bufp->chgIData(oldp+309,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__out_vec),32);
+    bufp->chgIData(oldp+310,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__get_layer_size__Vstatic__offset),32);
+    bufp->chgIData(oldp+311,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sum),32);
+    bufp->chgIData(oldp+312,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__j),32);
+    bufp->chgIData(oldp+313,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_j),32);
+    bufp->chgIData(oldp+314,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_weights_bits__Vstatic__sz_jm1),32);
+    bufp->chgIData(oldp+315,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sum),32);
+    bufp->chgIData(oldp+316,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__j),32);
+    bufp->chgIData(oldp+317,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__calc_biases_bits__Vstatic__sz_j),32);
+    bufp->chgIData(oldp+318,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__acc),32);
+    bufp->chgIData(oldp+319,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__k),32);
+    bufp->chgIData(oldp+320,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_k),32);
+    bufp->chgIData(oldp+321,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__weight_offset__Vstatic__s_km1),32);
+    bufp->chgIData(oldp+322,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__acc),32);
+    bufp->chgIData(oldp+323,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__k),32);
+    bufp->chgIData(oldp+324,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__bias_offset__Vstatic__s_k),32);
+    bufp->chgIData(oldp+325,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in),32);
+    bufp->chgQData(oldp+326,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out),64);
+    bufp->chgBit(oldp+328,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_valid));
+    bufp->chgBit(oldp+329,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_in_ready));
+    bufp->chgBit(oldp+330,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_valid));
+    bufp->chgBit(oldp+331,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_out_ready));
+    bufp->chgBit(oldp+332,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_bank));
+    Vtop___024root__trace_chg_dtype____0(vlSelf, bufp, 333, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__bank_q);
+    bufp->chgWData(oldp+334,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_weights),256);
+    bufp->chgQData(oldp+342,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__layer_biases),64);
+    bufp->chgBit(oldp+344,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__clk));
+    bufp->chgBit(oldp+345,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__rst_n));
+    bufp->chgBit(oldp+346,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_valid));
+    bufp->chgBit(oldp+347,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_ready));
+    bufp->chgIData(oldp+348,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__in_vec),32);
+    bufp->chgWData(oldp+349,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__weights),256);
+    bufp->chgQData(oldp+357,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__biases),64);
+    bufp->chgBit(oldp+359,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_valid));
+    bufp->chgBit(oldp+360,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_ready));
+    bufp->chgQData(oldp+361,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__out_vec),64);
+    bufp->chgBit(oldp+363,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__valid_q));
+    bufp->chgQData(oldp+364,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in),64);
+    bufp->chgIData(oldp+366,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out),32);
+    bufp->chgBit(oldp+367,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_valid));
+    bufp->chgBit(oldp+368,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_in_ready));
+    bufp->chgBit(oldp+369,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_valid));
+    bufp->chgBit(oldp+370,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_out_ready));
+    bufp->chgBit(oldp+371,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_bank));
+    Vtop___024root__trace_chg_dtype____1(vlSelf, bufp, 372, vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__bank_q);
+    bufp->chgWData(oldp+373,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_weights),256);
+    bufp->chgIData(oldp+381,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__layer_biases),32);
+    bufp->chgBit(oldp+382,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__clk));
+    bufp->chgBit(oldp+383,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__rst_n));
+    bufp->chgBit(oldp+384,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_valid));
+    bufp->chgBit(oldp+385,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_ready));
+    bufp->chgQData(oldp+386,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__in_vec),64);
+    bufp->chgWData(oldp+388,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__weights),256);
+    bufp->chgIData(oldp+396,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__biases),32);
+    bufp->chgBit(oldp+397,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_valid));
+    bufp->chgBit(oldp+398,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_ready));
+    bufp->chgIData(oldp+399,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__out_vec),32);
+    bufp->chgBit(oldp+400,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__valid_q));
+    bufp->chgBit(oldp+401,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clk));
+    bufp->chgBit(oldp+402,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__rst_n));
+    bufp->chgBit(oldp+403,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__en));
+    bufp->chgQData(oldp+404,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x),64);
+    bufp->chgQData(oldp+406,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w),64);
+    bufp->chgCData(oldp+408,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__b),8);
+    bufp->chgCData(oldp+409,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__y),8);
+    bufp->chgCData(oldp+410,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+411,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+412,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+413,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+414,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+415,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+416,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+417,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+418,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+419,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+420,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+421,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+422,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+423,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+424,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+425,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+426,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre),19);
+    bufp->chgCData(oldp+427,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_clamped),8);
+    bufp->chgCData(oldp+428,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act_in),8);
+    bufp->chgCData(oldp+429,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__relu_out),8);
+    bufp->chgCData(oldp+430,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__in),8);
+    bufp->chgCData(oldp+431,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__act__DOT__out),8);
+    bufp->chgIData(oldp+432,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__in),19);
+    bufp->chgCData(oldp+433,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__clamp__DOT__out),8);
+    bufp->chgBit(oldp+434,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk));
+    bufp->chgBit(oldp+435,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+436,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__en));
+    bufp->chgQData(oldp+437,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x),64);
+    bufp->chgQData(oldp+439,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w),64);
+    bufp->chgCData(oldp+441,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+442,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre),19);
+    bufp->chgCData(oldp+443,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+444,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+445,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+446,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+447,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+448,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+449,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+450,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+451,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+452,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+453,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+454,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+455,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+456,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+457,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+458,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+459,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+460,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgCData(oldp+461,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+462,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+463,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+464,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgCData(oldp+465,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+466,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+467,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+468,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgCData(oldp+469,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+470,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+471,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+472,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgCData(oldp+473,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+474,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+475,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+476,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgCData(oldp+477,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+478,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+479,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum),19);
+    bufp->chgIData(oldp+480,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node),19);
+    bufp->chgCData(oldp+481,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+482,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+483,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum),19);
+    bufp->chgIData(oldp+484,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node),19);
+    bufp->chgCData(oldp+485,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+486,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+487,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum),19);
+    bufp->chgIData(oldp+488,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node),19);
+    bufp->chgCData(oldp+489,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+490,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+491,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum),19);
+    bufp->chgIData(oldp+492,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node),19);
+    bufp->chgIData(oldp+493,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+494,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+495,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+496,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+497,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+498,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+499,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+500,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgIData(oldp+501,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+502,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgIData(oldp+503,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+504,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+505,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+506,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+507,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+508,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+509,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+510,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+511,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+512,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+513,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+514,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgBit(oldp+515,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clk));
+    bufp->chgBit(oldp+516,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__rst_n));
+    bufp->chgBit(oldp+517,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__en));
+    bufp->chgQData(oldp+518,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x),64);
+    bufp->chgQData(oldp+520,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w),64);
+    bufp->chgCData(oldp+522,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__b),8);
+    bufp->chgCData(oldp+523,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__y),8);
+    bufp->chgCData(oldp+524,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+525,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+526,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+527,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+528,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+529,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+530,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+531,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+532,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+533,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+534,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+535,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+536,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+537,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+538,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+539,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+540,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre),19);
+    bufp->chgCData(oldp+541,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_clamped),8);
+    bufp->chgCData(oldp+542,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act_in),8);
+    bufp->chgCData(oldp+543,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__relu_out),8);
+    bufp->chgCData(oldp+544,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__in),8);
+    bufp->chgCData(oldp+545,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__act__DOT__out),8);
+    bufp->chgIData(oldp+546,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__in),19);
+    bufp->chgCData(oldp+547,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__clamp__DOT__out),8);
+    bufp->chgBit(oldp+548,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk));
+    bufp->chgBit(oldp+549,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+550,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__en));
+    bufp->chgQData(oldp+551,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x),64);
+    bufp->chgQData(oldp+553,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w),64);
+    bufp->chgCData(oldp+555,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+556,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre),19);
+    bufp->chgCData(oldp+557,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+558,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+559,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+560,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+561,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+562,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+563,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+564,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+565,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+566,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+567,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+568,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+569,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+570,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+571,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+572,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+573,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+574,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgCData(oldp+575,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+576,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+577,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+578,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgCData(oldp+579,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+580,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+581,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+582,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgCData(oldp+583,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+584,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+585,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+586,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgCData(oldp+587,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+588,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+589,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+590,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgCData(oldp+591,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+592,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+593,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum),19);
+    bufp->chgIData(oldp+594,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node),19);
+    bufp->chgCData(oldp+595,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+596,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+597,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum),19);
+    bufp->chgIData(oldp+598,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node),19);
+    bufp->chgCData(oldp+599,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+600,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+601,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum),19);
+    bufp->chgIData(oldp+602,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node),19);
+    bufp->chgCData(oldp+603,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+604,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+605,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum),19);
+    bufp->chgIData(oldp+606,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node),19);
+    bufp->chgIData(oldp+607,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+608,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+609,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+610,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+611,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+612,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+613,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+614,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgIData(oldp+615,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+616,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgIData(oldp+617,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+618,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+619,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+620,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+621,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+622,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+623,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+624,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+625,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+626,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+627,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+628,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgBit(oldp+629,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clk));
+    bufp->chgBit(oldp+630,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__rst_n));
+    bufp->chgBit(oldp+631,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__en));
+    bufp->chgQData(oldp+632,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x),64);
+    bufp->chgQData(oldp+634,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w),64);
+    bufp->chgCData(oldp+636,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__b),8);
+    bufp->chgCData(oldp+637,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__y),8);
+    bufp->chgCData(oldp+638,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+639,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+640,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+641,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+642,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+643,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+644,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+645,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+646,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+647,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+648,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+649,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+650,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+651,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+652,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+653,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+654,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre),19);
+    bufp->chgCData(oldp+655,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_clamped),8);
+    bufp->chgCData(oldp+656,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act_in),8);
+    bufp->chgCData(oldp+657,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__relu_out),8);
+    bufp->chgCData(oldp+658,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__in),8);
+    bufp->chgCData(oldp+659,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__act__DOT__out),8);
+    bufp->chgIData(oldp+660,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__in),19);
+    bufp->chgCData(oldp+661,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__clamp__DOT__out),8);
+    bufp->chgBit(oldp+662,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk));
+    bufp->chgBit(oldp+663,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+664,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__en));
+    bufp->chgQData(oldp+665,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x),64);
+    bufp->chgQData(oldp+667,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w),64);
+    bufp->chgCData(oldp+669,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+670,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre),19);
+    bufp->chgCData(oldp+671,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+672,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+673,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+674,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+675,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+676,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+677,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+678,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+679,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+680,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+681,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+682,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+683,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+684,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+685,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+686,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+687,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+688,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgCData(oldp+689,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+690,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+691,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+692,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgCData(oldp+693,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+694,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+695,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+696,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgCData(oldp+697,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+698,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+699,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+700,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgCData(oldp+701,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+702,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+703,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+704,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgCData(oldp+705,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+706,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+707,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum),19);
+    bufp->chgIData(oldp+708,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node),19);
+    bufp->chgCData(oldp+709,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+710,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+711,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum),19);
+    bufp->chgIData(oldp+712,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node),19);
+    bufp->chgCData(oldp+713,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+714,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+715,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum),19);
+    bufp->chgIData(oldp+716,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node),19);
+    bufp->chgCData(oldp+717,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+718,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+719,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum),19);
+    bufp->chgIData(oldp+720,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node),19);
+    bufp->chgIData(oldp+721,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+722,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+723,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+724,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+725,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+726,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+727,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+728,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgIData(oldp+729,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+730,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgIData(oldp+731,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+732,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+733,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+734,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+735,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+736,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+737,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+738,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+739,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+740,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+741,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+742,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgBit(oldp+743,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clk));
+    bufp->chgBit(oldp+744,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__rst_n));
+    bufp->chgBit(oldp+745,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__en));
+    bufp->chgQData(oldp+746,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x),64);
+    bufp->chgQData(oldp+748,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w),64);
+    bufp->chgCData(oldp+750,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__b),8);
+    bufp->chgCData(oldp+751,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__y),8);
+    bufp->chgCData(oldp+752,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+753,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+754,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+755,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+756,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+757,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+758,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+759,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+760,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+761,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+762,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+763,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+764,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+765,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+766,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+767,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+768,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre),19);
+    bufp->chgCData(oldp+769,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_clamped),8);
+    bufp->chgCData(oldp+770,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act_in),8);
+    bufp->chgCData(oldp+771,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__relu_out),8);
+    bufp->chgCData(oldp+772,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__in),8);
+    bufp->chgCData(oldp+773,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__act__DOT__out),8);
+    bufp->chgIData(oldp+774,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__in),19);
+    bufp->chgCData(oldp+775,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__clamp__DOT__out),8);
+    bufp->chgBit(oldp+776,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__clk));
+    bufp->chgBit(oldp+777,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+778,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__en));
+    bufp->chgQData(oldp+779,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x),64);
+    bufp->chgQData(oldp+781,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w),64);
+    bufp->chgCData(oldp+783,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+784,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__pre),19);
+    bufp->chgCData(oldp+785,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+786,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+787,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+788,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+789,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[4]),8);
+    bufp->chgCData(oldp+790,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[5]),8);
+    bufp->chgCData(oldp+791,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[6]),8);
+    bufp->chgCData(oldp+792,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__x_arr[7]),8);
+    bufp->chgCData(oldp+793,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+794,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+795,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+796,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[3]),8);
+    bufp->chgCData(oldp+797,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[4]),8);
+    bufp->chgCData(oldp+798,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[5]),8);
+    bufp->chgCData(oldp+799,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[6]),8);
+    bufp->chgCData(oldp+800,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__w_arr[7]),8);
+    bufp->chgIData(oldp+801,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+802,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgCData(oldp+803,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+804,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+805,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+806,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgCData(oldp+807,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+808,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+809,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+810,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgCData(oldp+811,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+812,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+813,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+814,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgCData(oldp+815,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+816,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+817,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+818,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgCData(oldp+819,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+820,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+821,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum),19);
+    bufp->chgIData(oldp+822,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node),19);
+    bufp->chgCData(oldp+823,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+824,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+825,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum),19);
+    bufp->chgIData(oldp+826,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node),19);
+    bufp->chgCData(oldp+827,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+828,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+829,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum),19);
+    bufp->chgIData(oldp+830,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node),19);
+    bufp->chgCData(oldp+831,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+832,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+833,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__sum),19);
+    bufp->chgIData(oldp+834,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__8__KET____DOT__node),19);
+    bufp->chgIData(oldp+835,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+836,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+837,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+838,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+839,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+840,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+841,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum),19);
+    bufp->chgIData(oldp+842,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node),19);
+    bufp->chgIData(oldp+843,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__sum),19);
+    bufp->chgIData(oldp+844,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__4__KET____DOT__node),19);
+    bufp->chgIData(oldp+845,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+846,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+847,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+848,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+849,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__sum),19);
+    bufp->chgIData(oldp+850,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__2__KET____DOT__node),19);
+    bufp->chgIData(oldp+851,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+852,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgIData(oldp+853,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__sum),19);
+    bufp->chgIData(oldp+854,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__1__KET____DOT__node),19);
+    bufp->chgIData(oldp+855,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__sum),19);
+    bufp->chgIData(oldp+856,(vlSelfRef.KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__2__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron__DOT__pre_activation__DOT__gen_level__BRA__4__KET____DOT__gen_node__BRA__0__KET____DOT__node),19);
+    bufp->chgBit(oldp+857,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+858,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+859,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+860,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+861,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+862,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+863,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+864,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+865,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+866,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+867,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+868,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+869,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+870,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+871,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+872,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+873,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+874,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+875,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+876,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+877,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+878,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+879,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+880,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+881,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+882,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+883,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+884,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+885,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+886,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+887,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+888,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+889,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+890,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+891,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+892,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+893,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+894,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+895,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+896,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+897,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+898,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+899,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+900,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+901,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+902,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+903,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+904,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+905,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+906,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+907,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+908,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+909,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+910,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+911,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+912,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+913,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+914,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+915,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+916,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+917,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+918,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+919,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+920,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+921,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+922,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+923,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+924,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+925,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+926,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+927,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+928,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+929,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+930,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+931,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+932,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+933,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+934,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+935,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+936,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+937,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+938,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+939,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+940,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+941,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+942,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+943,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+944,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+945,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+946,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+947,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+948,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+949,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+950,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+951,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+952,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+953,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+954,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+955,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+956,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+957,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+958,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+959,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+960,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+961,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+962,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+963,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+964,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+965,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+966,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+967,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+968,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+969,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+970,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+971,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+972,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+973,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+974,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+975,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+976,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+977,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+978,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+979,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+980,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+981,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+982,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+983,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+984,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+985,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+986,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+987,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+988,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+989,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+990,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+991,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+992,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+993,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+994,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+995,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+996,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+997,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+998,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+999,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+1000,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+1001,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+1002,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+1003,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+1004,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+1005,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+1006,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+1007,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+1008,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+1009,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+1010,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+1011,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+1012,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+1013,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+1014,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+1015,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+1016,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+1017,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+1018,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+1019,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+1020,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+1021,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+1022,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+1023,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+1024,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+1025,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+1026,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+1027,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+1028,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+1029,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+1030,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+1031,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+1032,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+1033,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+1034,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+1035,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+1036,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+1037,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1038,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+1039,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1040,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1041,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1042,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+1043,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1044,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1045,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1046,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+1047,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1048,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1049,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1050,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+1051,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1052,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1053,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1054,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+1055,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1056,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1057,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1058,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1059,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1060,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+1061,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1062,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1063,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1064,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1065,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1066,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+1067,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+1068,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+1069,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+1070,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+1071,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+1072,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+1073,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+1074,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+1075,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+1076,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+1077,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+1078,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+1079,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+1080,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+1081,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+1082,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+1083,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+1084,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+1085,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+1086,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+1087,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+1088,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+1089,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+1090,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+1091,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+1092,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+1093,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+1094,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+1095,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+1096,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+1097,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+1098,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+1099,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+1100,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+1101,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+1102,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+1103,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+1104,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+1105,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+1106,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+1107,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1108,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+1109,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1110,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1111,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1112,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+1113,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1114,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1115,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1116,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+1117,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1118,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1119,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1120,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+1121,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1122,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1123,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1124,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+1125,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1126,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1127,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1128,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1129,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1130,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+1131,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1132,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1133,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1134,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1135,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1136,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+1137,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+1138,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+1139,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+1140,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+1141,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+1142,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+1143,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+1144,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+1145,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+1146,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+1147,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+1148,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+1149,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+1150,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+1151,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+1152,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+1153,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+1154,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+1155,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+1156,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+1157,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+1158,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+1159,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+1160,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+1161,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+1162,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+1163,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+1164,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+1165,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+1166,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+1167,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+1168,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+1169,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+1170,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+1171,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+1172,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+1173,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+1174,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+1175,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+1176,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+1177,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1178,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+1179,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1180,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1181,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1182,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+1183,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1184,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1185,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1186,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+1187,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1188,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1189,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1190,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+1191,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1192,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1193,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1194,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+1195,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1196,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1197,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1198,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1199,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1200,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+1201,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1202,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1203,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1204,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1205,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1206,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+1207,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+1208,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+1209,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+1210,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+1211,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+1212,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+1213,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+1214,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+1215,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+1216,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+1217,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+1218,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+1219,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+1220,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+1221,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+1222,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+1223,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+1224,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+1225,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+1226,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+1227,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+1228,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+1229,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+1230,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+1231,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+1232,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+1233,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+1234,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+1235,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+1236,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+1237,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+1238,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+1239,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+1240,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+1241,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+1242,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+1243,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+1244,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+1245,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+1246,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+1247,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1248,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+1249,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1250,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1251,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1252,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+1253,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1254,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1255,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1256,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+1257,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1258,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1259,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1260,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+1261,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1262,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1263,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1264,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+1265,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1266,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1267,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1268,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1269,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1270,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+1271,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1272,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1273,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1274,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1275,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1276,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+1277,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+1278,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+1279,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+1280,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+1281,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+1282,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+1283,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+1284,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+1285,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+1286,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+1287,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+1288,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+1289,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+1290,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+1291,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+1292,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+1293,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+1294,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+1295,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+1296,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+1297,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+1298,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+1299,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+1300,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+1301,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+1302,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+1303,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+1304,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+1305,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+1306,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+1307,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+1308,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+1309,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+1310,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+1311,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+1312,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+1313,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+1314,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+1315,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+1316,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+1317,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1318,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+1319,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1320,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1321,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1322,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+1323,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1324,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1325,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1326,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+1327,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1328,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1329,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1330,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+1331,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1332,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1333,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1334,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+1335,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1336,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1337,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1338,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1339,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1340,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+1341,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1342,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1343,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1344,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1345,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1346,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgBit(oldp+1347,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clk));
+    bufp->chgBit(oldp+1348,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.rst_n));
+    bufp->chgBit(oldp+1349,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.en));
+    bufp->chgBit(oldp+1350,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.int4));
+    bufp->chgIData(oldp+1351,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x),32);
+    bufp->chgIData(oldp+1352,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w),32);
+    bufp->chgCData(oldp+1353,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.b),8);
+    bufp->chgCData(oldp+1354,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.y),8);
+    bufp->chgCData(oldp+1355,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x_arr[0]),8);
+    bufp->chgCData(oldp+1356,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x_arr[1]),8);
+    bufp->chgCData(oldp+1357,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x_arr[2]),8);
+    bufp->chgCData(oldp+1358,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.x_arr[3]),8);
+    bufp->chgCData(oldp+1359,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w_arr[0]),8);
+    bufp->chgCData(oldp+1360,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w_arr[1]),8);
+    bufp->chgCData(oldp+1361,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w_arr[2]),8);
+    bufp->chgCData(oldp+1362,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.w_arr[3]),8);
+    bufp->chgIData(oldp+1363,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre),18);
+    bufp->chgCData(oldp+1364,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_clamped),8);
+    bufp->chgCData(oldp+1365,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act_in),8);
+    bufp->chgCData(oldp+1366,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.relu_out),8);
+    bufp->chgCData(oldp+1367,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__in),8);
+    bufp->chgCData(oldp+1368,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.act__DOT__out),8);
+    bufp->chgIData(oldp+1369,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__in),18);
+    bufp->chgCData(oldp+1370,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.clamp__DOT__out),8);
+    bufp->chgBit(oldp+1371,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__clk));
+    bufp->chgBit(oldp+1372,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__rst_n));
+    bufp->chgBit(oldp+1373,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__en));
+    bufp->chgBit(oldp+1374,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__int4));
+    bufp->chgIData(oldp+1375,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x),32);
+    bufp->chgIData(oldp+1376,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w),32);
+    bufp->chgCData(oldp+1377,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__b),8);
+    bufp->chgIData(oldp+1378,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__pre),18);
+    bufp->chgCData(oldp+1379,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x_arr[0]),8);
+    bufp->chgCData(oldp+1380,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x_arr[1]),8);
+    bufp->chgCData(oldp+1381,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x_arr[2]),8);
+    bufp->chgCData(oldp+1382,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__x_arr[3]),8);
+    bufp->chgCData(oldp+1383,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w_arr[0]),8);
+    bufp->chgCData(oldp+1384,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w_arr[1]),8);
+    bufp->chgCData(oldp+1385,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w_arr[2]),8);
+    bufp->chgCData(oldp+1386,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__w_arr[3]),8);
+    bufp->chgIData(oldp+1387,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1388,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgCData(oldp+1389,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1390,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1391,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1392,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgCData(oldp+1393,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1394,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1395,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1396,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgCData(oldp+1397,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1398,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1399,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1400,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node),18);
+    bufp->chgCData(oldp+1401,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op),8);
+    bufp->chgCData(oldp+1402,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op),8);
+    bufp->chgIData(oldp+1403,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1404,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node),18);
+    bufp->chgIData(oldp+1405,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1406,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1407,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1408,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1409,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1410,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node),18);
+    bufp->chgIData(oldp+1411,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1412,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+    bufp->chgIData(oldp+1413,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1414,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node),18);
+    bufp->chgIData(oldp+1415,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum),18);
+    bufp->chgIData(oldp+1416,(vlSymsp->TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron.pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node),18);
+}
+
+void Vtop___024root__trace_chg_dtype____0(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp, uint32_t offset, const VlUnpacked<CData/*0:0*/, 1>& __VdtypeVar) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_dtype____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode +  offset);
+    bufp->chgBit(oldp+0,(__VdtypeVar[0]));
+}
+
+void Vtop___024root__trace_chg_dtype____1(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp, uint32_t offset, const VlUnpacked<CData/*0:0*/, 1>& __VdtypeVar) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_dtype____1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode +  offset);
+    bufp->chgBit(oldp+0,(__VdtypeVar[0]));
+}
+
+void Vtop___024root__trace_cleanup(void* voidSelf, VerilatedVcd* /*unused*/) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_cleanup\n"); );
+    // Locals
+    VlUnpacked<CData/*0:0*/, 1> __Vm_traceActivity;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        __Vm_traceActivity[__Vi0] = 0;
+    }
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    vlSymsp->__Vm_activity = false;
+    __Vm_traceActivity[0U] = 0U;
+}
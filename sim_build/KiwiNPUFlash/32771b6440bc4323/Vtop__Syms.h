@@ -0,0 +1,490 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table internal header
+//
+// Internal details; most calling programs do not need this header,
+// unless using verilator public meta comments.
+
+#ifndef VERILATED_VTOP__SYMS_H_
+#define VERILATED_VTOP__SYMS_H_  // guard
+
+#include "verilated.h"
+
+// INCLUDE MODEL CLASS
+
+#include "Vtop.h"
+
+// INCLUDE MODULE CLASSES
+#include "Vtop___024root.h"
+#include "Vtop_Perceptron__A12.h"
+
+// DPI TYPES for DPI Export callbacks (Internal use)
+
+// SYMS CLASS (contains all model state)
+class alignas(VL_CACHE_LINE_BYTES) Vtop__Syms final : public VerilatedSyms {
+  public:
+    // INTERNAL STATE
+    Vtop* const __Vm_modelp;
+    VlDeleter __Vm_deleter;
+    bool __Vm_didInit = false;
+
+    // MODULE INSTANCE STATE
+    Vtop___024root                 TOP;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__0__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__1__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__2__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__3__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__4__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__5__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__6__KET____DOT__u_neuron;
+    Vtop_Perceptron__A12           TOP__KiwiNPUFlash__DOT__npu__DOT__gen_layers__BRA__1__KET____DOT__u_layer_inst__DOT__gen_lanes__BRA__0__KET____DOT__gen_neurons__BRA__7__KET____DOT__u_neuron;
+
+    // SCOPE NAMES
+    VerilatedScope* __Vscopep_KiwiNPUFlash;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__flash;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__flash__xfer;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__loader;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__4__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__5__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__6__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__7__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__1__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__0__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__1__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__2__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__act;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__clamp;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__0__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__10__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__11__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__12__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__13__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__14__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__15__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__1__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__2__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__3__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__4__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__5__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__6__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__7__KET____gen_product;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__8__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__0__KET____gen_node__BRA__9__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__5__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__6__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__1__KET____gen_node__BRA__7__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__2__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__2__KET____gen_node__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__3__KET____gen_node__BRA__1__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____u_layer_inst__gen_lanes__BRA__0__KET____gen_neurons__BRA__3__KET____u_neuron__pre_activation__gen_level__BRA__4__KET____gen_node__BRA__0__KET__;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_KiwiNPUFlash__npu__gen_layers__BRA__2__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_TOP;
+
+    // SCOPE HIERARCHY
+    VerilatedHierarchy __Vhier;
+
+    // CONSTRUCTORS
+    Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp);
+    ~Vtop__Syms();
+
+    // METHODS
+    const char* name() const { return TOP.vlNamep; }
+};
+
+#endif  // guard
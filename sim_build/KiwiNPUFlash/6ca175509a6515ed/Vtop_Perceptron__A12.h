@@ -0,0 +1,127 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP_PERCEPTRON__A12_H_
+#define VERILATED_VTOP_PERCEPTRON__A12_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop_Perceptron__A12 final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        CData/*0:0*/ clk;
+        CData/*0:0*/ rst_n;
+        CData/*0:0*/ en;
+        CData/*0:0*/ int4;
+        CData/*7:0*/ b;
+        CData/*7:0*/ y;
+        CData/*7:0*/ pre_clamped;
+        CData/*7:0*/ act_in;
+        CData/*7:0*/ relu_out;
+        CData/*0:0*/ pre_activation__DOT__clk;
+        CData/*0:0*/ pre_activation__DOT__rst_n;
+        CData/*0:0*/ pre_activation__DOT__en;
+        CData/*0:0*/ pre_activation__DOT__int4;
+        CData/*7:0*/ pre_activation__DOT__b;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__x_op;
+        CData/*7:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__gen_product__DOT__w_op;
+        CData/*7:0*/ clamp__DOT__out;
+        CData/*7:0*/ act__DOT__in;
+        CData/*7:0*/ act__DOT__out;
+        IData/*31:0*/ x;
+        IData/*31:0*/ w;
+        IData/*17:0*/ pre;
+        IData/*31:0*/ pre_activation__DOT__x;
+        IData/*31:0*/ pre_activation__DOT__w;
+        IData/*17:0*/ pre_activation__DOT__pre;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__4__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__5__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__6__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__0__KET____DOT__gen_node__BRA__7__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__2__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__1__KET____DOT__gen_node__BRA__3__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__2__KET____DOT__gen_node__BRA__1__KET____DOT__node;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__sum;
+        IData/*17:0*/ pre_activation__DOT__gen_level__BRA__3__KET____DOT__gen_node__BRA__0__KET____DOT__node;
+        IData/*17:0*/ clamp__DOT__in;
+        VlUnpacked<CData/*7:0*/, 4> x_arr;
+        VlUnpacked<CData/*7:0*/, 4> w_arr;
+    };
+    struct {
+        VlUnpacked<CData/*7:0*/, 4> pre_activation__DOT__x_arr;
+        VlUnpacked<CData/*7:0*/, 4> pre_activation__DOT__w_arr;
+    };
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ N = 4U;
+    static constexpr IData/*31:0*/ DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__N = 4U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__PIPE_STAGES = 0U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__ZERO_GATING = 0U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__INT4_PACKING = 0U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__LEVELS = 3U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__TREE_STAGES = 0U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__OUT_STAGES = 0U;
+    static constexpr IData/*31:0*/ pre_activation__DOT__H = 4U;
+    static constexpr IData/*31:0*/ clamp__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ clamp__DOT__ACC_WIDTH = 0x00000012U;
+    static constexpr IData/*31:0*/ clamp__DOT__MIN_VAL = 0xffffff80U;
+    static constexpr IData/*31:0*/ clamp__DOT__MAX_VAL = 0x0000007fU;
+    static constexpr IData/*31:0*/ act__DOT__DATA_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop_Perceptron__A12();
+    ~Vtop_Perceptron__A12();
+    void ctor(Vtop__Syms* symsp, const char* namep);
+    void dtor();
+    VL_UNCOPYABLE(Vtop_Perceptron__A12);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,170 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Constant pool
+
+#include "verilated.h"
+
+extern const VlWide<38>/*1215:0*/ Vtop__ConstPool__CONST_h6155dc76_0 = VlWide<38>{{
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h037aa0bf_0 = {{
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U,
+    0U, 0U, 0U, 1U, 0U, 0U, 0U, 1U
+}};
+
+extern const VlUnpacked<CData/*3:0*/, 64> Vtop__ConstPool__TABLE_h35ef0553_0 = {{
+    8U, 8U, 8U, 8U, 8U, 8U, 8U, 8U,
+    8U, 8U, 8U, 8U, 8U, 8U, 8U, 8U,
+    8U, 8U, 8U, 8U, 8U, 8U, 8U, 8U,
+    8U, 8U, 8U, 8U, 8U, 8U, 8U, 8U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    8U, 8U, 8U, 8U, 8U, 8U, 8U, 8U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    8U, 8U, 8U, 8U, 8U, 8U, 8U, 8U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_h42536f7d_0 = {{
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 0U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_h5b4065cb_0 = {{
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<SData/*9:0*/, 64> Vtop__ConstPool__TABLE_h69564de3_0 = {{
+    0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU,
+    0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU,
+    0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU,
+    0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU, 0x03ffU,
+    1U, 1U, 0x000fU, 0x000fU, 0x0011U, 0x0011U, 0x001fU, 0x001fU,
+    0x01e1U, 0x01e1U, 0x01efU, 0x01efU, 0x01f1U, 0x01f1U, 0x01ffU, 0x01ffU,
+    0x0201U, 0x0201U, 0x020fU, 0x020fU, 0x0211U, 0x0211U, 0x021fU, 0x021fU,
+    0x03e1U, 0x03e1U, 0x03efU, 0x03efU, 0x03f1U, 0x03f1U, 0x03ffU, 0x03ffU
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_h737affed_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 1U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*3:0*/, 64> Vtop__ConstPool__TABLE_h7c6c7f25_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_hbe545fc6_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    1U, 1U, 1U, 1U, 1U, 1U, 1U, 1U
+}};
+
+extern const VlUnpacked<CData/*2:0*/, 128> Vtop__ConstPool__TABLE_hdfa1cf36_0 = {{
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 0U, 7U, 3U, 7U, 3U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 0U, 7U, 3U,
+    7U, 4U, 7U, 3U, 7U, 3U, 7U, 3U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 64> Vtop__ConstPool__TABLE_hdfd45526_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};
+
+extern const VlUnpacked<CData/*0:0*/, 128> Vtop__ConstPool__TABLE_he9f9863e_0 = {{
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 1U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 1U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U,
+    0U, 0U, 0U, 0U, 0U, 0U, 0U, 0U
+}};